@@ -1,11 +1,14 @@
 import os
 import uuid
-from typing import Dict, List, Optional, Any
-from pathlib import Path
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 
 from agents import IssueDetectionAgent, RouterAgent
-from config import UPLOAD_DIR, DEFAULT_MODEL, CONTEXT_TURNS, CONTEXT_CHAR_LIMIT
+from config import UPLOAD_DIR, DEFAULT_MODEL, SPECULATIVE_ROUTING_ENABLED
 from memory_store import get_memory_store
+from turn_context import get_turn_context_builder
+from speculation import get_speculation_tracker, estimate_wasted_tokens
+from image_preprocessing import get_image_preprocessor
 
 class ConversationHistoryManager:
     """Manages conversation history for sessions."""
@@ -13,6 +16,7 @@ class ConversationHistoryManager:
     def __init__(self):
         """Initialize the conversation history manager."""
         self.memory_store = get_memory_store()
+        self.context_builder = get_turn_context_builder()
     
     def get_formatted_history(self, session_id: str, max_messages: int = 5) -> str:
         """Get formatted conversation history for a session.
@@ -27,20 +31,7 @@ class ConversationHistoryManager:
         try:
             # Get messages with a smaller limit to avoid performance issues
             messages = self.memory_store.get_messages(session_id, max_messages)
-            if not messages:
-                return ""
-            
-            formatted_history = "\n--- Previous Conversation History ---\n"
-            for msg in messages:
-                role = msg.get("role", "unknown")
-                content = msg.get("content", "")
-                if role == "user":
-                    formatted_history += f"User: {content}\n"
-                elif role == "assistant":
-                    formatted_history += f"Assistant: {content}\n"
-            formatted_history += "--- End of History ---\n\n"
-            
-            return formatted_history
+            return self._format_history(messages)
         except Exception as e:
             print(f"Error getting conversation history: {str(e)}")
             import traceback
@@ -48,6 +39,58 @@ class ConversationHistoryManager:
             # Return empty history on error to avoid blocking
             return ""
     
+    def _format_history(self, messages: List[Dict[str, Any]]) -> str:
+        """Format stored messages as a conversation history block.
+        
+        Args:
+            messages: Messages in chronological order
+            
+        Returns:
+            A formatted string containing the conversation history
+        """
+        if not messages:
+            return ""
+        
+        formatted_history = "\n--- Previous Conversation History ---\n"
+        for msg in messages:
+            role = msg.get("role", "unknown")
+            content = msg.get("content", "")
+            if role == "user":
+                formatted_history += f"User: {content}\n"
+            elif role == "assistant":
+                formatted_history += f"Assistant: {content}\n"
+        formatted_history += "--- End of History ---\n\n"
+        
+        return formatted_history
+    
+    def _build_message(self, message: str, is_user: bool = True, image_path: str = None) -> Dict[str, Any]:
+        """Build a stored message record.
+        
+        Args:
+            message: The message content
+            is_user: Whether this is a user message (True) or assistant message (False)
+            image_path: Optional image path to associate with this message
+            
+        Returns:
+            The message record to store
+        """
+        role = "user" if is_user else "assistant"
+        import datetime
+        
+        # Truncate very long messages to avoid storage issues
+        max_message_length = 2000  # Reasonable limit for message length
+        if len(message) > max_message_length:
+            message = message[:max_message_length] + " [...truncated...]"
+        
+        msg = {
+            "role": role,
+            "content": message,
+            "timestamp": datetime.datetime.now().isoformat()
+        }
+        if image_path:
+            msg["image_path"] = image_path
+        return msg
+    
     def add_message(self, session_id: str, message: str, is_user: bool = True, image_path: str = None) -> None:
         """Add a message to the conversation history.
         
@@ -58,26 +101,40 @@ class ConversationHistoryManager:
             image_path: Optional image path to associate with this message
         """
         try:
-            role = "user" if is_user else "assistant"
-            import datetime
-            
-            # Truncate very long messages to avoid storage issues
-            max_message_length = 2000  # Reasonable limit for message length
-            if len(message) > max_message_length:
-                message = message[:max_message_length] + " [...truncated...]"
-            
-            msg = {
-                "role": role,
-                "content": message,
-                "timestamp": datetime.datetime.now().isoformat()
-            }
-            if image_path:
-                msg["image_path"] = image_path
-            self.memory_store.add_message(session_id, msg)
+            self.memory_store.add_message(session_id, self._build_message(message, is_user, image_path))
         except Exception as e:
             print(f"Error adding message to history: {str(e)}")
             import traceback
             traceback.print_exc()
+    
+    async def aadd_message(self, session_id: str, message: str, is_user: bool = True, image_path: str = None) -> None:
+        """Async version of add_message that does not block the event loop."""
+        try:
+            msg = self._build_message(message, is_user, image_path)
+            await self.memory_store.aadd_message(session_id, msg)
+            self.context_builder.record(session_id, msg)
+        except Exception as e:
+            print(f"Error adding message to history: {str(e)}")
+            import traceback
+            traceback.print_exc()
+    
+    async def aget_turn_context(self, session_id: str) -> Tuple[str, Optional[str]]:
+        """Get the bounded history text and the last shared image for this turn.
+        
+        Args:
+            session_id: The session ID
+            
+        Returns:
+            The history text and the most recent image path, if any
+        """
+        try:
+            return await self.context_builder.get_turn_context(session_id)
+        except Exception as e:
+            print(f"Error getting turn context: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            # Return empty context on error to avoid blocking
+            return "", None
 
 # Import the real TenancyFAQAgent
 try:
@@ -114,47 +171,60 @@ class AgentManager:
         
         # Initialize the conversation history manager
         self.history_manager = ConversationHistoryManager()
+        
+        # Predicts the specialist to start while the router is still deciding
+        self.speculation = get_speculation_tracker()
     
-    async def process_query(
-        self, 
+    async def _prepare_turn(
+        self,
         message: str,
-        session_id: Optional[str] = None,
+        session_id: str,
         image_file = None,
+        image_path: Optional[str] = None,
         location: Optional[str] = None,
+        speculate: bool = False,
     ) -> Dict[str, Any]:
-        """Process a user query and route it to the appropriate agent.
+        """Record the user message, build the turn context and route the query.
         
         Args:
             message: The user message
-            session_id: Optional session ID for memory continuity
+            session_id: The session ID
             image_file: Optional uploaded image file
+            image_path: Optional path of an image that was already saved
             location: Optional user location for tenancy questions
+            speculate: Whether the predicted specialist may start while the router decides
             
         Returns:
-            A dictionary containing the response and metadata
+            A dictionary with the turn context, the routing decision and, if the
+            prediction matched the route, the running speculative task
         """
+        # Speculative specialist run started alongside the router, if any
+        speculative_task = None
+        predicted_agent_name = None
+        speculative_run_messages = None
+        enhanced_message = f"Current message: {message}"
+        last_image_path = None
+        
+        # Handle image upload if provided. A rejected upload (ImageUploadError) is
+        # raised to the caller instead of being routed as a text-only turn.
+        if image_file:
+            print(f"Processing image upload for session: {session_id}")
+            # Save the uploaded image
+            image_path = await self.save_uploaded_image(image_file, session_id)
+        
         try:
-            # Generate a session ID if none provided
-            if not session_id:
-                session_id = str(uuid.uuid4())
-            
             # Track this session
             self.active_sessions.add(session_id)
             print(f"Processing message for session: {session_id}")
             
-            # Handle image upload if provided
-            image_path = None
-            if image_file:
-                print(f"Processing image upload for session: {session_id}")
-                # Save the uploaded image
-                image_path = await self._save_uploaded_image(image_file, session_id)
+            if image_path:
                 # Store the last image path
                 self.last_image_path = image_path
                 print(f"Image saved at: {image_path}")
                 # Add the user message to conversation history, with image_path
                 try:
                     print(f"Adding user message to history for session: {session_id} (with image)")
-                    self.history_manager.add_message(session_id, message, is_user=True, image_path=image_path)
+                    await self.history_manager.aadd_message(session_id, message, is_user=True, image_path=image_path)
                     print(f"Successfully added user message to history (with image)")
                 except Exception as history_error:
                     print(f"Error adding message to history: {str(history_error)}")
@@ -164,69 +234,60 @@ class AgentManager:
                 # Add the user message to conversation history (no image)
                 try:
                     print(f"Adding user message to history for session: {session_id}")
-                    self.history_manager.add_message(session_id, message, is_user=True)
+                    await self.history_manager.aadd_message(session_id, message, is_user=True)
                     print(f"Successfully added user message to history")
                 except Exception as history_error:
                     print(f"Error adding message to history: {str(history_error)}")
                     import traceback
                     traceback.print_exc()
             
-            # Get conversation history with a shorter limit and timeout protection
-            conversation_history = ""
-            try:
-                print(f"Getting formatted history for session: {session_id}")
-                # Use a smaller limit for history to avoid performance issues
-                conversation_history = self.history_manager.get_formatted_history(session_id, max_messages=3)
-                print(f"History retrieved, length: {len(conversation_history)}")
-            except Exception as history_error:
-                print(f"Error getting history: {str(history_error)}")
-                conversation_history = ""
-                import traceback
-                traceback.print_exc()
-            
-            # Create the enhanced message with conversation history
-            # Always include at least the last CONTEXT_TURNS user+assistant turns, or up to CONTEXT_CHAR_LIMIT chars
-            history_messages = self.history_manager.memory_store.get_messages(session_id, limit=CONTEXT_TURNS*2)
-            history_text = ""
-            char_count = 0
-            turns = 0
-            for msg in reversed(history_messages):
-                if msg["role"] == "user":
-                    turns += 1
-                line = f'{msg["role"].capitalize()}: {msg["content"]}\n'
-                if char_count + len(line) > CONTEXT_CHAR_LIMIT and turns >= CONTEXT_TURNS:
-                    break
-                history_text = line + history_text
-                char_count += len(line)
+            # Build the history text and find the last shared image in one pass over the
+            # session's rolling context window (at least the last CONTEXT_TURNS turns, or up
+            # to CONTEXT_CHAR_LIMIT chars)
+            history_text, recent_image_path = await self.history_manager.aget_turn_context(session_id)
             enhanced_message = f"{history_text}Current message: {message}"
             print(f"Added truncated conversation history to message for session: {session_id}")
             
             # Only set has_image=True if the user just uploaded a new image
-            last_image_path = None
-            if not image_file:
-                # Look for the last image in the session history
-                history = self.history_manager.memory_store.get_messages(session_id, limit=10)
-                for msg in reversed(history):
-                    if msg.get("image_path"):
-                        last_image_path = msg["image_path"]
-                        break
+            if not image_path:
+                # Reuse the last image in the session history for follow-up questions
+                last_image_path = recent_image_path
             # Only set has_image True if this message has a new image
             has_image = bool(image_path)
 
+            # Optionally start the most likely specialist while the router decides
+            if speculate and SPECULATIVE_ROUTING_ENABLED and not has_image:
+                predicted_agent_name = self.speculation.predict(self.router, message, session_id)
+                if predicted_agent_name in self.agents and predicted_agent_name != "router":
+                    print(f"Speculatively starting agent: {predicted_agent_name}")
+                    speculative_run_messages = self.agents[predicted_agent_name].agent.run_messages
+                    speculative_task = asyncio.create_task(
+                        self._run_agent(predicted_agent_name, enhanced_message, session_id, image_path, last_image_path, location)
+                    )
+            
             print(f"Determining route for message: {message[:50]}...")
             
             # Determine which agent should handle this query
             route = await self.router.determine_route(
                 message=enhanced_message,
                 has_image=has_image,
-                session_id=session_id
+                session_id=session_id,
+                query=message
             )
             
             target_agent_name = route["agent"]
             explanation = route["explanation"]
+            route_method = route.get("method", "llm")
+            route_confidence = route.get("confidence")
+            route_cached = route.get("cached", False)
             
-            print(f"Router determined agent: {target_agent_name}, explanation: {explanation}")
+            print(f"Router determined agent: {target_agent_name} via {route_method}{' (cached)' if route_cached else ''}, explanation: {explanation}")
             
+        except asyncio.CancelledError:
+            # Don't leave a speculative run going on an agent that is about to be reused
+            if speculative_task is not None:
+                speculative_task.cancel()
+            raise
         except Exception as router_error:
             # If router fails, default to tenancy_faq for text and issue_detection for images
             print(f"Error in router: {str(router_error)}")
@@ -236,35 +297,75 @@ class AgentManager:
             else:
                 target_agent_name = "tenancy_faq"
                 explanation = "Default routing (router error) - text only"
+            route_method = "fallback"
+            route_confidence = None
+            route_cached = False
             
             print(f"Falling back to agent: {target_agent_name}")
         
-        # Get the target agent
-        target_agent = self.agents[target_agent_name]
+        self.speculation.record_route(session_id, target_agent_name)
+        
+        # Keep the speculative run if the router agreed with it, otherwise cancel it
+        if speculative_task is not None and predicted_agent_name != target_agent_name:
+            speculative_task.cancel()
+            await asyncio.wait([speculative_task])
+            wasted_tokens = estimate_wasted_tokens(self.agents[predicted_agent_name], speculative_run_messages, enhanced_message)
+            self.speculation.record_outcome(hit=False, wasted_tokens=wasted_tokens)
+            print(f"Cancelled speculative agent '{predicted_agent_name}', wasted ~{wasted_tokens} tokens")
+            speculative_task = None
+        elif speculative_task is not None:
+            self.speculation.record_outcome(hit=True)
         
         print(f"Routing to agent '{target_agent_name}' with session_id: {session_id}")
         
+        return {
+            "session_id": session_id,
+            "enhanced_message": enhanced_message,
+            "image_path": image_path,
+            "last_image_path": last_image_path,
+            "agent": target_agent_name,
+            "speculative_task": speculative_task,
+            "router": {
+                "target_agent": target_agent_name,
+                "explanation": explanation,
+                "method": route_method,
+                "confidence": route_confidence,
+                "cached": route_cached,
+            },
+        }
+    
+    async def process_query(
+        self, 
+        message: str,
+        session_id: Optional[str] = None,
+        image_file = None,
+        location: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Process a user query and route it to the appropriate agent.
+        
+        Args:
+            message: The user message
+            session_id: Optional session ID for memory continuity
+            image_file: Optional uploaded image file
+            location: Optional user location for tenancy questions
+            
+        Returns:
+            A dictionary containing the response and metadata
+        """
+        # Generate a session ID if none provided
+        if not session_id:
+            session_id = str(uuid.uuid4())
+        
+        turn = await self._prepare_turn(message, session_id, image_file=image_file, location=location, speculate=True)
+        target_agent_name = turn["agent"]
+        
         # Process the query with the appropriate agent
         try:
-            if target_agent_name == "issue_detection" and (image_path or last_image_path):
-                # Process with image for the issue detection agent (pass last image if available)
-                response = await self.issue_detection.process_with_image(
-                    message=enhanced_message,
-                    image_path=image_path or last_image_path,
-                    session_id=session_id
-                )
-            elif target_agent_name == "tenancy_faq" and location:
-                # Add location context for the tenancy FAQ agent
-                response = await self.tenancy_faq.process(
-                    message=enhanced_message,
-                    session_id=session_id,
-                    location=location
-                )
+            if turn["speculative_task"] is not None:
+                response = await turn["speculative_task"]
             else:
-                # Standard processing for other cases
-                response = await target_agent.process(
-                    message=enhanced_message,
-                    session_id=session_id
+                response = await self._run_agent(
+                    target_agent_name, turn["enhanced_message"], session_id, turn["image_path"], turn["last_image_path"], location
                 )
                 
             # Extract just the response text and normalize it
@@ -292,14 +393,7 @@ class AgentManager:
                 response_text = str(response_text)
             
             # Add the assistant's response to conversation history
-            try:
-                print(f"Adding assistant response to history for session: {session_id}")
-                self.history_manager.add_message(session_id, response_text, is_user=False)
-                print(f"Successfully added assistant response to history")
-            except Exception as history_error:
-                print(f"Error adding assistant response to history: {str(history_error)}")
-                import traceback
-                traceback.print_exc()
+            await self._save_assistant_message(session_id, response_text)
             
             # Add routing information to the response
             clean_response = {
@@ -307,10 +401,7 @@ class AgentManager:
                 "session_id": session_id,
                 "agent": target_agent_name,
                 "model": getattr(response, "model", DEFAULT_MODEL),
-                "router": {
-                    "target_agent": target_agent_name,
-                    "explanation": explanation,
-                }
+                "router": turn["router"]
             }
             
             # Add tool calls if they exist
@@ -334,34 +425,196 @@ class AgentManager:
                 "session_id": session_id,
                 "agent": target_agent_name,
                 "model": DEFAULT_MODEL,
-                "router": {
-                    "target_agent": target_agent_name,
-                    "explanation": explanation + " (error occurred)",
+                "router": dict(turn["router"], explanation=turn["router"]["explanation"] + " (error occurred)")
+            }
+    
+    async def stream_query(
+        self,
+        message: str,
+        session_id: Optional[str] = None,
+        image_path: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Process a user query and stream the response as the model produces it.
+        
+        The assistant's message is added to the conversation history once the
+        stream completes.
+        
+        Args:
+            message: The user message
+            session_id: Optional session ID for memory continuity
+            image_path: Optional path of an image saved with save_uploaded_image
+            location: Optional user location for tenancy questions
+            
+        Yields:
+            Events in order: one "routing", any number of "chunk", then
+            "complete" or "error"
+        """
+        # Generate a session ID if none provided
+        if not session_id:
+            session_id = str(uuid.uuid4())
+        
+        turn = await self._prepare_turn(message, session_id, image_path=image_path, location=location)
+        target_agent_name = turn["agent"]
+        
+        yield {
+            "event": "routing",
+            "data": {
+                "agent": target_agent_name,
+                "explanation": turn["router"]["explanation"],
+                "session_id": session_id,
+                "router": turn["router"],
+            }
+        }
+        
+        chunks = []
+        try:
+            async for chunk in self._stream_agent(
+                target_agent_name, turn["enhanced_message"], session_id, turn["image_path"], turn["last_image_path"], location
+            ):
+                chunks.append(chunk)
+                yield {"event": "chunk", "data": {"text": chunk, "done": False}}
+        except Exception as agent_error:
+            print(f"Error streaming from agent {target_agent_name}: {str(agent_error)}")
+            import traceback
+            traceback.print_exc()
+            
+            yield {
+                "event": "error",
+                "data": {
+                    "message": f"I'm sorry, I encountered an error while processing your request with the {target_agent_name} agent. Please try again later.",
+                    "session_id": session_id,
+                    "agent": target_agent_name,
                 }
             }
+            return
+        
+        # Persist the full message only once the stream has finished
+        response_text = "".join(chunks)
+        await self._save_assistant_message(session_id, response_text)
+        
+        yield {
+            "event": "complete",
+            "data": {
+                "response": response_text,
+                "session_id": session_id,
+                "agent": target_agent_name,
+                "model": self.agents[target_agent_name].model_id,
+                "router": turn["router"],
+            }
+        }
+    
+    async def _save_assistant_message(self, session_id: str, response_text: str) -> None:
+        """Add the assistant's response to the conversation history."""
+        try:
+            print(f"Adding assistant response to history for session: {session_id}")
+            await self.history_manager.aadd_message(session_id, response_text, is_user=False)
+            print(f"Successfully added assistant response to history")
+        except Exception as history_error:
+            print(f"Error adding assistant response to history: {str(history_error)}")
+            import traceback
+            traceback.print_exc()
+    
+    async def _run_agent(
+        self,
+        agent_name: str,
+        message: str,
+        session_id: str,
+        image_path: Optional[str] = None,
+        last_image_path: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> Any:
+        """Run a specialist agent on the current turn.
+        
+        Args:
+            agent_name: The agent to run
+            message: The message with conversation history
+            session_id: The session ID
+            image_path: Image uploaded with this message, if any
+            last_image_path: Image shared earlier in the session, if any
+            location: Optional user location for tenancy questions
+            
+        Returns:
+            The agent's raw response
+        """
+        if agent_name == "issue_detection" and (image_path or last_image_path):
+            # Process with image for the issue detection agent (pass last image if available)
+            return await self.issue_detection.process_with_image(
+                message=message,
+                image_path=image_path or last_image_path,
+                session_id=session_id
+            )
+        if agent_name == "tenancy_faq" and location:
+            # Add location context for the tenancy FAQ agent
+            return await self.tenancy_faq.process(
+                message=message,
+                session_id=session_id,
+                location=location
+            )
+        # Standard processing for other cases
+        return await self.agents[agent_name].process(
+            message=message,
+            session_id=session_id
+        )
     
-    async def _save_uploaded_image(self, image_file, session_id: str) -> str:
+    async def _stream_agent(
+        self,
+        agent_name: str,
+        message: str,
+        session_id: str,
+        image_path: Optional[str] = None,
+        last_image_path: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Stream a specialist agent's response to the current turn.
+        
+        Args:
+            agent_name: The agent to run
+            message: The message with conversation history
+            session_id: The session ID
+            image_path: Image uploaded with this message, if any
+            last_image_path: Image shared earlier in the session, if any
+            location: Optional user location for tenancy questions
+            
+        Yields:
+            Chunks of response text, in order
+        """
+        if agent_name == "issue_detection" and (image_path or last_image_path):
+            stream = self.issue_detection.process_with_image_stream(
+                message=message,
+                image_path=image_path or last_image_path,
+                session_id=session_id
+            )
+        elif agent_name == "tenancy_faq" and location:
+            stream = self.tenancy_faq.process_stream(
+                message=message,
+                session_id=session_id,
+                location=location
+            )
+        else:
+            stream = self.agents[agent_name].process_stream(
+                message=message,
+                session_id=session_id
+            )
+        async for chunk in stream:
+            yield chunk
+    
+    @staticmethod
+    async def save_uploaded_image(image_file, session_id: str) -> str:
         """Save an uploaded image to the uploads directory.
         
+        The upload is streamed to disk in chunks off the event loop and encoded
+        for the vision model once, so the issue detection agent does not read
+        the file again.
+        
         Args:
             image_file: The uploaded image file
             session_id: Session ID for organizing uploads
             
         Returns:
             The path to the saved image
+            
+        Raises:
+            ImageUploadError: If the upload is too large or not an image
         """
-        # Create a directory for this session's uploads
-        session_dir = UPLOAD_DIR / session_id
-        session_dir.mkdir(exist_ok=True)
-        
-        # Generate a unique filename for the image
-        file_ext = Path(image_file.filename).suffix
-        filename = f"{uuid.uuid4()}{file_ext}"
-        file_path = session_dir / filename
-        
-        # Save the file
-        with open(file_path, "wb") as f:
-            contents = await image_file.read()
-            f.write(contents)
-        
-        return str(file_path) 
\ No newline at end of file
+        return await get_image_preprocessor().asave_upload(image_file, UPLOAD_DIR / session_id)
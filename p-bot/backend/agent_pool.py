@@ -0,0 +1,143 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from agent_manager import AgentManager
+from config import AGENT_POOL_MAX_SIZE, AGENT_POOL_SIZE
+
+class AgentPool:
+    """
+    A pool of AgentManager instances that are built once and reused.
+
+    Agno agents keep per-run state (run_id, session_id, run_response) on the
+    instance, so a single AgentManager cannot safely serve two requests at the
+    same time. Instead of building a fresh manager for every request, the pool
+    hands out one complete agent set per in-flight request and takes it back
+    when the request finishes.
+
+    `size` agent sets are built at startup. When all of them are busy, the pool
+    builds another set for the request instead of making it wait, up to
+    `max_size` sets, after which requests wait for a free set. Sets are built
+    in a worker thread so building one never blocks the event loop, and sets
+    built on demand are dropped again once `size` sets are idle.
+    """
+
+    def __init__(self, size: int = AGENT_POOL_SIZE, max_size: int = AGENT_POOL_MAX_SIZE):
+        """Initialize the agent pool.
+
+        Args:
+            size: Number of agent sets to build at startup
+            max_size: Most agent sets to keep at once, 0 for no limit
+        """
+        self.size = max(1, size)
+        self.max_size = max(self.size, max_size) if max_size > 0 else 0
+        self.managers: List[AgentManager] = []
+        self._available: Optional[asyncio.Queue] = None
+        # Agent sets being built, counted against max_size before they exist
+        self._building = 0
+
+        # Counters exposed through stats()
+        self.checkouts = 0
+        self.grown = 0
+        self.trimmed = 0
+        self.waits = 0
+        self.total_wait_time = 0.0
+
+    @property
+    def started(self) -> bool:
+        """Whether the pool has built its agent sets."""
+        return self._available is not None
+
+    async def start(self) -> None:
+        """Build all agent sets up front so requests never pay for construction."""
+        if self.started:
+            return
+
+        start_time = time.perf_counter()
+        # Requests arriving while the sets are built wait on the queue instead of starting again
+        self._available = asyncio.Queue()
+        self._building += self.size
+        managers = await asyncio.gather(*(self._build() for _ in range(self.size)))
+        for manager in managers:
+            self._available.put_nowait(manager)
+        print(f"AgentPool started with {self.size} agent sets in {time.perf_counter() - start_time:.3f}s")
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[AgentManager]:
+        """Borrow an agent set for the duration of a request.
+
+        Yields:
+            An AgentManager that is not used by any other request until it is returned
+        """
+        if not self.started:
+            await self.start()
+
+        start_time = time.perf_counter()
+        if self._available.empty() and self._can_grow():
+            # Every agent set is busy: build one more rather than queue the request
+            self._building += 1
+            manager = await self._build()
+            self.grown += 1
+        else:
+            if self._available.empty():
+                self.waits += 1
+            manager = await self._available.get()
+        self.total_wait_time += time.perf_counter() - start_time
+        self.checkouts += 1
+
+        try:
+            yield manager
+        finally:
+            if len(self.managers) > self.size and self._available.qsize() >= self.size:
+                # The burst is over: drop the extra set instead of keeping it idle
+                self.managers.remove(manager)
+                self.trimmed += 1
+            else:
+                # Clear per-request state before the next borrower sees it
+                manager.last_image_path = None
+                self._available.put_nowait(manager)
+
+    def _can_grow(self) -> bool:
+        """Whether another agent set may be built."""
+        return self.max_size == 0 or len(self.managers) + self._building < self.max_size
+
+    async def _build(self) -> AgentManager:
+        """Build an agent set in a worker thread and track it as part of the pool.
+
+        The caller reserves the set by incrementing _building first.
+        """
+        try:
+            manager = await asyncio.to_thread(AgentManager)
+        finally:
+            self._building -= 1
+        self.managers.append(manager)
+        return manager
+
+    def stats(self) -> Dict[str, Any]:
+        """Get usage statistics for the pool.
+
+        Returns:
+            A dictionary with pool size, availability and wait counters
+        """
+        return {
+            "size": self.size,
+            "max_size": self.max_size,
+            "managers": len(self.managers),
+            "grown": self.grown,
+            "trimmed": self.trimmed,
+            "available": self._available.qsize() if self.started else 0,
+            "checkouts": self.checkouts,
+            "waits": self.waits,
+            "avg_wait_ms": (self.total_wait_time / self.checkouts * 1000) if self.checkouts else 0.0,
+        }
+
+# Create a singleton instance
+_agent_pool = None
+
+def get_agent_pool() -> AgentPool:
+    """Get the global agent pool instance."""
+    global _agent_pool
+    if _agent_pool is None:
+        _agent_pool = AgentPool()
+    return _agent_pool
@@ -3,7 +3,8 @@ from agno.models.openai import OpenAIChat
 from agno.models.anthropic import Claude
 from agno.tools.reasoning import ReasoningTools
 from agno.memory import AgentMemory
-from typing import Dict, List, Optional, Any
+from agno.run.response import RunEvent
+from typing import AsyncIterator, Dict, List, Optional, Any
 
 from config import OPENAI_API_KEY, ANTHROPIC_API_KEY
 from custom_memory import CustomSessionMemory
@@ -59,22 +60,37 @@ class BaseAgent:
             self.memory = CustomSessionMemory(max_messages=30)  # Increase to 30 messages for better retention
         
         # Create the agent
-        self.agent = Agent(
+        self.agent = self._create_agent(self.instructions, self.tools)
+    
+    def _create_agent(self, instructions: List[str], tools: List[Any]) -> Agent:
+        """Create an agno Agent that shares this agent's model and memory.
+        
+        Args:
+            instructions: List of instructions for the agent
+            tools: Tools for the agent
+            
+        Returns:
+            The configured agent
+        """
+        return Agent(
             model=self.model,
             description=self.description,
-            instructions=self.instructions,
-            tools=self.tools,
+            instructions=instructions,
+            tools=tools,
             memory=self.memory,
             markdown=True,
             show_tool_calls=True,
         )
     
-    async def process(self, message: str, session_id: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    async def process(
+        self, message: str, session_id: Optional[str] = None, agent: Optional[Agent] = None, **kwargs
+    ) -> Dict[str, Any]:
         """Process a message and return the response.
         
         Args:
             message: The user message
             session_id: Optional session ID for memory continuity
+            agent: The agno Agent to run, defaults to self.agent
             **kwargs: Additional context to pass to the agent
             
         Returns:
@@ -89,7 +105,7 @@ class BaseAgent:
             session_id = session_id or f"{self.name}_default"
             
             # Get response from agent
-            response = await self.agent.arun(
+            response = await (agent or self.agent).arun(
                 message, 
                 session_id=session_id,
                 **kwargs
@@ -136,4 +152,35 @@ class BaseAgent:
                 "session_id": session_id or f"{self.name}_default",
                 "model": self.model_id,
                 "error": str(e)
-            } 
\ No newline at end of file
+            }
+    
+    async def process_stream(
+        self, message: str, session_id: Optional[str] = None, agent: Optional[Agent] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Process a message and yield the response text as the model produces it.
+        
+        Args:
+            message: The user message
+            session_id: Optional session ID for memory continuity
+            agent: The agno Agent to run, defaults to self.agent
+            **kwargs: Additional context to pass to the agent
+            
+        Yields:
+            Chunks of response text, in order
+        """
+        # Ensure session_id is never None for memory continuity
+        session_id = session_id or f"{self.name}_default"
+        
+        # Get a chunk iterator from the agent instead of the finished response
+        stream = await (agent or self.agent).arun(
+            message,
+            stream=True,
+            session_id=session_id,
+            **kwargs
+        )
+        async for chunk in stream:
+            if getattr(chunk, "event", RunEvent.run_response) != RunEvent.run_response:
+                continue
+            content = getattr(chunk, "content", None)
+            if isinstance(content, str) and content:
+                yield content
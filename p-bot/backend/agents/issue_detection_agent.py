@@ -1,8 +1,4 @@
-import base64
-from pathlib import Path
-from typing import Dict, List, Optional, Any
-import io
-from PIL import Image
+from typing import AsyncIterator, Dict, List, Optional, Any
 import os
 import traceback
 
@@ -12,6 +8,7 @@ from agno.media import Image as AgnoImage
 
 from .base_agent import BaseAgent
 from config import ISSUE_DETECTION_AGENT, UPLOAD_DIR
+from image_preprocessing import get_image_preprocessor
 
 class IssueDetectionAgent(BaseAgent):
     """Agent that can detect issues in property images and provide troubleshooting advice."""
@@ -33,6 +30,9 @@ class IssueDetectionAgent(BaseAgent):
             instructions=ISSUE_DETECTION_AGENT["instructions"],
             tools=tools,
         )
+        
+        # Shared pool and cache for preparing images off the event loop
+        self.image_preprocessor = get_image_preprocessor()
     
     async def process_with_image(
         self, 
@@ -51,12 +51,8 @@ class IssueDetectionAgent(BaseAgent):
             A dictionary containing the response and additional metadata
         """
         try:
-            print(f"Processing image at path: {image_path}")
-            
-            # Encode the image as base64
-            img_path = Path(image_path)
-            if not img_path.exists():
-                print(f"Image file does not exist: {image_path}")
+            image = await self._load_image(image_path)
+            if image is None:
                 return {
                     "agent": self.name,
                     "response": "I couldn't process the image. The file appears to be missing.",
@@ -64,49 +60,11 @@ class IssueDetectionAgent(BaseAgent):
                     "model": self.model_id,
                 }
             
-            # Open and resize the image if needed (to reduce token usage)
-            with Image.open(img_path) as img:
-                print(f"Opened image: {img.format}, size: {img.size}, mode: {img.mode}")
-                
-                # Resize if the image is too large
-                max_size = 1024
-                if max(img.size) > max_size:
-                    ratio = max_size / max(img.size)
-                    new_size = tuple(int(dim * ratio) for dim in img.size)
-                    img = img.resize(new_size, Image.LANCZOS)
-                    print(f"Resized image to: {new_size}")
-                
-                # Convert RGBA to RGB if needed (JPEG doesn't support alpha channel)
-                if img.mode == 'RGBA':
-                    # Create a white background
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    # Paste the image using alpha as mask
-                    background.paste(img, mask=img.split()[3])
-                    img = background
-                    print("Converted RGBA to RGB")
-                elif img.mode != 'RGB':
-                    # Convert any other mode to RGB
-                    img = img.convert('RGB')
-                    print(f"Converted {img.mode} to RGB")
-                
-                # Convert to base64
-                buffer = io.BytesIO()
-                img.save(buffer, format="JPEG", quality=90)
-                img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-                print(f"Encoded image to base64, length: {len(img_base64)}")
-            
-            # Create a message with the image
-            formatted_message = f"{message}\n\nI'm sharing an image of the property issue."
-            
-            # Create an Agno Image object with the base64 data
-            image_data_uri = f"data:image/jpeg;base64,{img_base64}"
-            image = AgnoImage(url=image_data_uri)
-            
             print(f"Sending image to processing")
             
             # Process with the base agent's method, passing the proper Agno Image object
             return await super().process(
-                message=formatted_message, 
+                message=self._format_image_message(message), 
                 session_id=session_id,
                 images=[image]
             )
@@ -122,6 +80,63 @@ class IssueDetectionAgent(BaseAgent):
                 "model": self.model_id,
             }
     
+    async def process_with_image_stream(
+        self,
+        message: str,
+        image_path: str,
+        session_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Stream the response to a user message along with an image.
+        
+        Args:
+            message: The user message
+            image_path: Path to the uploaded image
+            session_id: Optional session ID for memory continuity
+            
+        Yields:
+            Chunks of response text, in order
+        """
+        image = await self._load_image(image_path)
+        if image is None:
+            yield "I couldn't process the image. The file appears to be missing."
+            return
+        
+        async for chunk in super().process_stream(
+            message=self._format_image_message(message),
+            session_id=session_id,
+            images=[image]
+        ):
+            yield chunk
+    
+    def _format_image_message(self, message: str) -> str:
+        """Create a message that goes with the image."""
+        return f"{message}\n\nI'm sharing an image of the property issue."
+    
+    async def _load_image(self, image_path: str) -> Optional[AgnoImage]:
+        """Load, shrink and encode an image for the model.
+        
+        The work runs in the image preprocessor's worker pool and is cached by
+        content, so follow-up turns about the same photo reuse the payload.
+        Uploads are encoded when they are saved, so this finds them in the cache.
+        
+        Args:
+            image_path: Path to the uploaded image
+            
+        Returns:
+            An Agno Image with the base64 JPEG data, or None if the file is missing
+        """
+        print(f"Processing image at path: {image_path}")
+        
+        img_base64 = await self.image_preprocessor.aprepare(image_path)
+        if img_base64 is None:
+            print(f"Image file does not exist: {image_path}")
+            return None
+        print(f"Encoded image to base64, length: {len(img_base64)}")
+        
+        # Create an Agno Image object with the base64 data
+        image_data_uri = f"data:image/jpeg;base64,{img_base64}"
+        return AgnoImage(url=image_data_uri)
+    
     async def process(self, message: str, session_id: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """Process a text-only message (no image).
         
@@ -0,0 +1,126 @@
+from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+import re
+import threading
+import time
+
+from config import ROUTER_CACHE_MAX_ENTRIES, ROUTER_CACHE_TTL
+
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so trivially different phrasings share a cache key.
+
+    Lowercases, drops punctuation and collapses whitespace, so "How much notice
+    do I need to give?" and "how much notice do i need to give" are the same.
+
+    Args:
+        query: The user's current message
+
+    Returns:
+        The normalized query
+    """
+    query = _PUNCTUATION_PATTERN.sub(" ", query.lower())
+    return _WHITESPACE_PATTERN.sub(" ", query).strip()
+
+class RouteCache:
+    """
+    Bounded TTL cache of routing decisions.
+
+    Keyed on the normalized current user message and the has-image flag, never
+    on the history-enhanced message, so repeated questions hit the cache no
+    matter what came before them in the conversation.
+    """
+
+    def __init__(self, max_entries: int = ROUTER_CACHE_MAX_ENTRIES, ttl: float = ROUTER_CACHE_TTL):
+        """Initialize the route cache.
+
+        Args:
+            max_entries: Maximum number of decisions kept, least recently used are dropped first
+            ttl: Seconds a decision stays valid
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.entries: "OrderedDict[Tuple[str, bool], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Counters exposed through stats()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(query: str, has_image: bool) -> Tuple[str, bool]:
+        """Build the cache key for a query."""
+        return normalize_query(query), bool(has_image)
+
+    def get(self, query: str, has_image: bool = False) -> Optional[Dict[str, Any]]:
+        """Look up a cached routing decision.
+
+        Args:
+            query: The user's current message
+            has_image: Whether the request includes an image
+
+        Returns:
+            A copy of the cached decision, or None if missing or expired
+        """
+        key = self.make_key(query, has_image)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                del self.entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, query: str, has_image: bool, decision: Dict[str, Any]) -> None:
+        """Store a routing decision.
+
+        Args:
+            query: The user's current message
+            has_image: Whether the request includes an image
+            decision: The routing decision returned by the router
+        """
+        key = self.make_key(query, has_image)
+        if not key[0]:
+            return
+        with self._lock:
+            self.entries[key] = (time.monotonic(), dict(decision))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached decision."""
+        with self._lock:
+            self.entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get usage statistics for the cache.
+
+        Returns:
+            A dictionary with size, hit and miss counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+# Create a singleton instance shared by every router in the agent pool
+_route_cache = None
+
+def get_route_cache() -> RouteCache:
+    """Get the global route cache instance."""
+    global _route_cache
+    if _route_cache is None:
+        _route_cache = RouteCache()
+    return _route_cache
@@ -0,0 +1,189 @@
+from typing import Dict, List, Optional, Tuple
+from collections import Counter
+import json
+import math
+import re
+from pathlib import Path
+
+# Labelled example queries used to train the local routing model
+ROUTE_EXAMPLES = {
+    "issue_detection": [
+        "There is a crack running up my living room wall",
+        "My ceiling has a brown water stain that keeps growing",
+        "Is this black stuff in the bathroom mold?",
+        "The kitchen faucet keeps dripping even when it's off",
+        "My toilet won't stop running",
+        "There's a leak under the sink",
+        "The paint is peeling and bubbling near the window",
+        "The heater is making a loud banging noise",
+        "My air conditioner is blowing warm air",
+        "The outlet sparked when I plugged something in",
+        "The lights keep flickering in the hallway",
+        "The floorboards are sagging in the bedroom",
+        "There's a damp musty smell in the basement",
+        "Water is coming through the roof when it rains",
+        "The shower drain is clogged and slow",
+        "How do I fix a hole in drywall?",
+        "The front door is sticking and won't close properly",
+        "The bricks on the outside wall are crumbling",
+        "There is condensation on the inside of my windows",
+        "Our boiler pressure keeps dropping",
+        "What's causing these cracks in the foundation?",
+        "The grout between the tiles is falling out",
+        "I found termite damage on the porch",
+        "The pipes are making a knocking sound",
+        "My window frame is rotting",
+        "The smoke detector keeps beeping",
+        "Is this damp patch on the wall serious?",
+        "The garbage disposal is jammed",
+    ],
+    "tenancy_faq": [
+        "How much notice do I need to give before moving out?",
+        "Can my landlord increase rent during the lease term?",
+        "What should I do if my landlord won't return my deposit?",
+        "How long does my landlord have to return my security deposit?",
+        "Can my landlord enter my apartment without notice?",
+        "Is my landlord allowed to evict me without a court order?",
+        "Can I break my lease early?",
+        "What are my rights as a tenant?",
+        "Can I sublet my apartment?",
+        "Who is responsible for repairs, the landlord or the tenant?",
+        "How much can my landlord raise the rent?",
+        "What happens when my fixed-term lease ends?",
+        "Do I have to pay rent if the landlord won't fix things?",
+        "Can my landlord keep my deposit for normal wear and tear?",
+        "What notice period does a landlord have to give for eviction?",
+        "Is a verbal rental agreement legally binding?",
+        "Can my landlord refuse to renew my lease?",
+        "What is rent control and does it apply to me?",
+        "Can the landlord charge a late fee on rent?",
+        "What should be included in a lease agreement?",
+        "My landlord is trying to evict me, what can I do?",
+        "Am I entitled to interest on my security deposit?",
+        "Can a landlord discriminate against tenants with children?",
+        "Do I need my landlord's permission to have a pet?",
+        "What are the tenant laws in California?",
+        "How do I dispute deductions from my deposit?",
+        "Can my landlord change the locks?",
+        "What is a month-to-month tenancy?",
+    ],
+}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+# Common words that carry no routing signal
+_STOP_WORDS = {
+    "a", "an", "the", "and", "or", "but", "if", "is", "are", "was", "were", "be", "been",
+    "to", "of", "in", "on", "at", "for", "with", "by", "from", "as", "it", "its", "it's",
+    "i", "me", "my", "we", "our", "you", "your", "this", "that", "these", "those", "there",
+    "what", "how", "do", "does", "did", "can", "could", "should", "would", "will", "have",
+    "has", "had", "so", "not", "no", "when", "up", "out", "about", "any", "some", "just",
+    "keep", "keeps", "get", "got",
+}
+
+def _stem(word: str) -> str:
+    """Strip common English suffixes so that e.g. "leaking" and "leaks" match "leak"."""
+    for suffix in ("ing", "ed", "es", "s"):
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            return word[:-len(suffix)]
+    return word
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase stemmed word unigrams and bigrams, dropping stop words.
+
+    Args:
+        text: The text to tokenize
+
+    Returns:
+        List of features
+    """
+    words = [_stem(word) for word in _TOKEN_PATTERN.findall(text.lower()) if word not in _STOP_WORDS]
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+class RouteClassifier:
+    """
+    Local TF-IDF nearest-centroid classifier for routing queries.
+
+    Settles clear-cut routing decisions without a model call. Each agent is
+    represented by the normalized TF-IDF centroid of its labelled examples,
+    and a query is scored by cosine similarity against every centroid.
+    """
+
+    def __init__(self, examples: Optional[Dict[str, List[str]]] = None, examples_file: Optional[Path] = None):
+        """Train the classifier.
+
+        Args:
+            examples: Labelled example queries per agent, defaults to ROUTE_EXAMPLES
+            examples_file: Optional JSON file with more examples in the same shape
+        """
+        examples = {label: list(queries) for label, queries in (examples or ROUTE_EXAMPLES).items()}
+        if examples_file and Path(examples_file).exists():
+            with open(examples_file, "r") as f:
+                for label, queries in json.load(f).items():
+                    examples.setdefault(label, []).extend(queries)
+
+        documents = [(label, tokenize(query)) for label, queries in examples.items() for query in queries]
+
+        # Smoothed inverse document frequency over all examples
+        document_frequency = Counter()
+        for _, features in documents:
+            document_frequency.update(set(features))
+        total = len(documents)
+        self.idf = {feature: math.log((1 + total) / (1 + count)) + 1.0 for feature, count in document_frequency.items()}
+
+        self.centroids: Dict[str, Dict[str, float]] = {}
+        for label in examples:
+            centroid = Counter()
+            for document_label, features in documents:
+                if document_label == label:
+                    for feature, weight in self._vectorize(features).items():
+                        centroid[feature] += weight
+            self.centroids[label] = self._normalize(centroid)
+
+    def _vectorize(self, features: List[str]) -> Dict[str, float]:
+        """Turn features into a normalized TF-IDF vector, ignoring unknown features."""
+        counts = Counter(feature for feature in features if feature in self.idf)
+        return self._normalize({feature: count * self.idf[feature] for feature, count in counts.items()})
+
+    @staticmethod
+    def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+        """Scale a sparse vector to unit length."""
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if norm == 0:
+            return {}
+        return {feature: weight / norm for feature, weight in vector.items()}
+
+    def scores(self, query: str) -> Dict[str, float]:
+        """Score a query against every agent.
+
+        Args:
+            query: The user's current message
+
+        Returns:
+            Cosine similarity to each agent's centroid
+        """
+        vector = self._vectorize(tokenize(query))
+        return {
+            label: sum(weight * centroid.get(feature, 0.0) for feature, weight in vector.items())
+            for label, centroid in self.centroids.items()
+        }
+
+    def classify(self, query: str) -> Tuple[str, float, Dict[str, float]]:
+        """Pick the most likely agent for a query.
+
+        Confidence is the top score's share of the two best scores, so 0.5
+        means the query is a coin flip and 1.0 means only one agent matched.
+
+        Args:
+            query: The user's current message
+
+        Returns:
+            The best agent, the confidence and the raw scores
+        """
+        scores = self.scores(query)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        best_label, best_score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if best_score <= 0:
+            return best_label, 0.0, scores
+        return best_label, best_score / (best_score + runner_up), scores
@@ -1,7 +1,15 @@
 from typing import Dict, List, Optional, Any, Literal, Union
 
 from .base_agent import BaseAgent
-from config import ROUTER_AGENT
+from .route_classifier import RouteClassifier
+from .route_cache import get_route_cache
+from config import (
+    ROUTER_AGENT,
+    ROUTER_FAST_PATH_ENABLED,
+    ROUTER_FAST_PATH_CONFIDENCE,
+    ROUTER_FAST_PATH_MIN_SCORE,
+    ROUTER_EXAMPLES_FILE,
+)
 
 class RouterAgent(BaseAgent):
     """Agent that routes user queries to the appropriate specialized agent."""
@@ -15,22 +23,36 @@ class RouterAgent(BaseAgent):
             instructions=ROUTER_AGENT["instructions"],
             use_reasoning=True,
         )
+        
+        # Local classifier that settles clear-cut queries before the LLM is asked
+        self.classifier = RouteClassifier(examples_file=ROUTER_EXAMPLES_FILE) if ROUTER_FAST_PATH_ENABLED else None
+        # Decisions are shared by every router in the agent pool
+        self.cache = get_route_cache()
     
     async def determine_route(
         self, 
         message: str, 
         has_image: bool = False,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        query: Optional[str] = None
     ) -> Dict[str, Any]:
         """Determine which agent should handle this query.
         
+        Repeated queries are answered from the route cache, keyed on the
+        current message only so that history does not defeat it. Otherwise
+        clear-cut text queries are routed by the local classifier, and the LLM
+        is only asked when the classifier is disabled or not confident enough.
+        
         Args:
-            message: The user message
+            message: The user message, possibly with conversation history
             has_image: Whether the request includes an image
             session_id: Optional session ID for memory continuity
+            query: The current user message on its own, defaults to message
             
         Returns:
-            A dictionary containing the routing decision and explanation
+            A dictionary containing the routing decision, explanation and the
+            method that produced it ("image", "fast_path" or "llm"), with
+            "cached" set when it came from the route cache
         """
         # If the message has an image, route to the issue detection agent
         if has_image:
@@ -38,8 +60,30 @@ class RouterAgent(BaseAgent):
                 "agent": "issue_detection",
                 "confidence": 1.0,
                 "explanation": "Query includes an image, routing to Issue Detection Agent",
+                "method": "image",
             }
         
+        # Reuse an earlier decision for the same question
+        query = query or message
+        cached = self.cache.get(query, has_image)
+        if cached is not None:
+            cached["cached"] = True
+            return cached
+        
+        # Try the local classifier on the current message before paying for an LLM call
+        fast_path_confidence = None
+        if self.classifier is not None:
+            label, fast_path_confidence, scores = self.classifier.classify(query)
+            if scores[label] >= ROUTER_FAST_PATH_MIN_SCORE and fast_path_confidence >= ROUTER_FAST_PATH_CONFIDENCE:
+                decision = {
+                    "agent": label,
+                    "confidence": fast_path_confidence,
+                    "explanation": f"Matched {label} examples (similarity {scores[label]:.2f})",
+                    "method": "fast_path",
+                }
+                self.cache.put(query, has_image, decision)
+                return decision
+        
         # Create a context with the routing task
         routing_context = {
             "task": "routing",
@@ -103,11 +147,18 @@ class RouterAgent(BaseAgent):
             # Clean up explanation
             explanation = explanation.lstrip(" -:.")
             
-            return {
+            decision = {
                 "agent": target_agent,
                 "confidence": 0.9,  # We're fairly confident in the router's decision
-                "explanation": explanation
+                "explanation": explanation,
+                "method": "llm",
+                "fast_path_confidence": fast_path_confidence,
             }
+            
+            # Don't remember guesses made after the model call failed
+            if not (isinstance(response, dict) and response.get("error")):
+                self.cache.put(query, has_image, decision)
+            return decision
         
         except Exception as e:
             print(f"Error in router: {str(e)}")
@@ -118,5 +169,7 @@ class RouterAgent(BaseAgent):
             return {
                 "agent": "issue_detection",
                 "confidence": 0.5,
-                "explanation": "Defaulting to Issue Detection Agent due to routing error"
+                "explanation": "Defaulting to Issue Detection Agent due to routing error",
+                "method": "fallback",
+                "fast_path_confidence": fast_path_confidence,
             } 
\ No newline at end of file
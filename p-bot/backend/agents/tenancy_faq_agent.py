@@ -1,70 +1,106 @@
-from typing import Dict, List, Optional, Any
-import os
-import sys
-
-# Workaround for tantivy import issue
-try:
-    import tantivy
-    print("Tantivy module imported successfully")
-except ImportError:
-    print("Tantivy import failed, using fallback implementation")
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 
+from agno.agent import Agent
 from agno.tools.duckduckgo import DuckDuckGoTools
 
 from .base_agent import BaseAgent
-from config import TENANCY_FAQ_AGENT, KNOWLEDGE_DIR
+from config import TENANCY_FAQ_AGENT
+from tenancy_knowledge import get_tenancy_knowledge
 
 class TenancyFAQAgent(BaseAgent):
     """Agent that handles tenancy FAQ questions related to laws, agreements, and responsibilities."""
-    
+
     def __init__(self):
-        """Initialize the TenancyFAQAgent with a simplified implementation."""
-        # Set up tools for the agent
-        tools = [
-            DuckDuckGoTools(),  # For searching information about tenancy laws
-        ]
-        
-        # Initialize the base agent with additional instructions
+        """Initialize the TenancyFAQAgent.
+
+        Questions are first answered from the local tenancy knowledge index. Only when no
+        indexed chunk is similar enough does the agent fall back to a live web search.
+        """
+        # The main agent answers from retrieved references and needs no search tool
         super().__init__(
             name=TENANCY_FAQ_AGENT["name"],
             description=TENANCY_FAQ_AGENT["description"],
             model_id=TENANCY_FAQ_AGENT["model"],
             instructions=TENANCY_FAQ_AGENT["instructions"] + [
-                "NOTE: You are running with general knowledge. Use your built-in knowledge to answer questions."
+                "When the message includes references from the tenancy knowledge base, base your answer on them "
+                "and cite them by number, e.g. [1].",
             ],
-            tools=tools,
         )
-        
-        # Use a simple placeholder for knowledge
-        self.knowledge = None
-        print("Successfully loaded TenancyFAQAgent")
-    
+
+        # Fallback agent for questions the knowledge base does not cover, sharing model and memory
+        self.web_agent = self._create_agent(
+            TENANCY_FAQ_AGENT["instructions"],
+            self.tools + [DuckDuckGoTools()],  # For searching information about tenancy laws
+        )
+
+        # Shared by every TenancyFAQAgent in the agent pool
+        self.knowledge = get_tenancy_knowledge()
+
     async def process(self, message: str, session_id: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """Process a user query about tenancy.
-        
+
         Args:
             message: The user message
             session_id: Optional session ID for memory continuity
-            
+
         Returns:
             A dictionary containing the response and additional metadata
         """
-        # We'll extract any location information to provide more accurate answers
+        prompt, agent, references = await self._prepare(message, **kwargs)
+        response = await super().process(prompt, session_id, agent=agent, **kwargs)
+        response["knowledge_references"] = references
+        return response
+
+    async def process_stream(self, message: str, session_id: Optional[str] = None, **kwargs) -> AsyncIterator[str]:
+        """Stream the answer to a user query about tenancy.
+
+        Args:
+            message: The user message
+            session_id: Optional session ID for memory continuity
+
+        Yields:
+            Chunks of response text, in order
+        """
+        prompt, agent, _ = await self._prepare(message, **kwargs)
+        async for chunk in super().process_stream(prompt, session_id, agent=agent, **kwargs):
+            yield chunk
+
+    async def _prepare(self, message: str, **kwargs) -> Tuple[str, Agent, List[str]]:
+        """Retrieve references for a message and pick the agent that should answer it.
+
+        Returns:
+            The prompt, the agent to run and the titles of the references used
+        """
+        results = await self.knowledge.asearch(message)
+        prompt = self._format_message(message, **kwargs)
+        if not self.knowledge.is_confident(results):
+            return prompt, self.web_agent, []
+
+        references = self.knowledge.format_references(results)
+        prompt = f"{prompt}\n\nReferences from the tenancy knowledge base:\n\n{references}"
+        titles = [document.meta_data.get("title") or document.name for document, _ in results]
+        return prompt, self.agent, titles
+
+    def _format_message(self, message: str, **kwargs) -> str:
+        """Add any location information to the message to provide more accurate answers."""
         location = kwargs.get("location", "")
-        
+
         if location:
             # If location is provided, add it to the context
-            formatted_message = f"{message}\n\nUser location: {location}"
-        else:
-            formatted_message = message
-        
-        # Process with the base agent's method
-        return await super().process(formatted_message, session_id, **kwargs)
-    
+            return f"{message}\n\nUser location: {location}"
+        return message
+
     def add_knowledge_text(self, id: str, title: str, content: str) -> None:
-        """Simplified add_knowledge_text method that just logs the addition."""
-        print(f"Added knowledge from {id}.txt")
-    
+        """Queue a document for the tenancy knowledge index.
+
+        Args:
+            id: Identifier of the document
+            title: Title of the document
+            content: The document text
+        """
+        self.knowledge.add_text(id, title, content)
+
     def load_knowledge(self) -> None:
-        """Simplified load_knowledge method that does nothing."""
-        print("Using simplified knowledge implementation without vector database") 
\ No newline at end of file
+        """Index the tenancy documents, embedding only new or changed chunks and removing outdated ones."""
+        count = self.knowledge.load()
+        print(f"Indexed {count} tenancy knowledge chunks")
@@ -1,27 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any, List, AsyncGenerator
+from typing import Optional, Dict, Any, List, AsyncGenerator, Union
 from uuid import uuid4
 import json
 import asyncio
 import os
 
 from agent_manager import AgentManager
+from agent_pool import get_agent_pool
 from config import UPLOAD_DIR
+from image_preprocessing import ImageUploadError
 
 router = APIRouter()
 
-# Singleton instance of the agent manager
-_agent_manager = None
-
-def get_agent_manager() -> AgentManager:
-    """Get or create a singleton instance of the agent manager."""
-    global _agent_manager
-    if _agent_manager is None:
-        _agent_manager = AgentManager()
-    return _agent_manager
-
 class ChatRequest(BaseModel):
     """Chat request model for text-only queries."""
     message: str
@@ -40,8 +32,13 @@ class ChatResponse(BaseModel):
     image_url: Optional[str] = None
 
 @router.post("/chat", response_model=ChatResponse)
-async def chat(req: ChatRequest, agent_manager: AgentManager = Depends(get_agent_manager)) -> ChatResponse:
-    """Process a text-only chat message and return the response."""
+async def chat(req: ChatRequest) -> Union[ChatResponse, StreamingResponse]:
+    """Process a text-only chat message and return the response.
+    
+    Agent sets are borrowed from the pool where they are used: streamed
+    responses check out their own in stream_response, so a stream never
+    holds two pool slots.
+    """
     try:
         # Create a new session ID if none provided
         session_id = req.session_id or str(uuid4())
@@ -50,18 +47,18 @@ async def chat(req: ChatRequest, agent_manager: AgentManager = Depends(get_agent
         
         # Check if streaming is requested
         if req.streaming:
-            # Redirect to streaming endpoint by raising an exception
-            raise HTTPException(
-                status_code=307,  # Temporary redirect
-                headers={"Location": f"/api/v1/chat/stream?message={req.message}&session_id={session_id}"}
+            return StreamingResponse(
+                stream_response(req.message, session_id, req.location),
+                media_type="text/event-stream"
             )
         
         # Process the query
-        result = await agent_manager.process_query(
-            message=req.message,
-            session_id=session_id,
-            location=req.location
-        )
+        async with get_agent_pool().checkout() as agent_manager:
+            result = await agent_manager.process_query(
+                message=req.message,
+                session_id=session_id,
+                location=req.location
+            )
         
         print(f"Got result: {str(result)[:100]}...")
         
@@ -94,81 +91,33 @@ async def chat(req: ChatRequest, agent_manager: AgentManager = Depends(get_agent
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=error_msg)
 
-async def stream_response(message: str, session_id: str, location: Optional[str] = None) -> AsyncGenerator[str, None]:
-    """Stream a response as server-sent events."""
+def format_sse(event: Dict[str, Any]) -> str:
+    """Format an event as a server-sent event line."""
+    return f"data: {json.dumps(event)}\n\n"
+
+async def stream_response(
+    message: str,
+    session_id: str,
+    location: Optional[str] = None,
+    image_path: Optional[str] = None,
+    image_url: Optional[str] = None,
+) -> AsyncGenerator[str, None]:
+    """Stream a response as server-sent events.
+    
+    Borrows its own agent set for the lifetime of the stream, since the
+    response body is produced after the endpoint (and its dependencies) return.
+    """
     try:
-        agent_manager = get_agent_manager()
-        
-        # First, determine the route
-        route = await agent_manager.router.determine_route(
-            message=message,
-            has_image=False,
-            session_id=session_id
-        )
-        
-        target_agent_name = route["agent"]
-        explanation = route["explanation"]
-        
-        # Yield the initial routing information
-        routing_info = {
-            "event": "routing",
-            "data": {
-                "agent": target_agent_name,
-                "explanation": explanation
-            }
-        }
-        yield f"data: {json.dumps(routing_info)}\n\n"
-        await asyncio.sleep(0.1)  # Short delay for client processing
-        
-        # Get the target agent
-        target_agent = agent_manager.agents[target_agent_name]
-        
-        # Start the streaming process
-        response_text = ""
-        chunk_size = 10  # Adjust based on your needs
-        
-        # Process with the agent
-        response = await target_agent.process(
-            message=message,
-            session_id=session_id,
-            location=location
-        )
-        
-        # Extract the response text
-        if isinstance(response, dict) and "response" in response:
-            response_text = response.get("response", "")
-        elif hasattr(response, "content") and response.content:
-            response_text = response.content
-        elif hasattr(response, "response") and response.response:
-            response_text = response.response
-        else:
-            response_text = str(response)
-        
-        # Stream the response in chunks
-        words = response_text.split()
-        for i in range(0, len(words), chunk_size):
-            chunk = " ".join(words[i:i+chunk_size])
-            chunk_data = {
-                "event": "chunk",
-                "data": {
-                    "text": chunk,
-                    "done": i + chunk_size >= len(words)
-                }
-            }
-            yield f"data: {json.dumps(chunk_data)}\n\n"
-            await asyncio.sleep(0.1)  # Short delay for realistic streaming
-        
-        # Send the complete message at the end
-        final_data = {
-            "event": "complete",
-            "data": {
-                "response": response_text,
-                "agent": target_agent_name,
-                "session_id": session_id,
-                "model": getattr(response, "model", "unknown")
-            }
-        }
-        yield f"data: {json.dumps(final_data)}\n\n"
+        async with get_agent_pool().checkout() as agent_manager:
+            async for event in agent_manager.stream_query(
+                message=message,
+                session_id=session_id,
+                image_path=image_path,
+                location=location
+            ):
+                if event["event"] == "complete" and image_url:
+                    event["data"]["image_url"] = image_url
+                yield format_sse(event)
     
     except Exception as e:
         error_data = {
@@ -177,7 +126,7 @@ async def stream_response(message: str, session_id: str, location: Optional[str]
                 "message": str(e)
             }
         }
-        yield f"data: {json.dumps(error_data)}\n\n"
+        yield format_sse(error_data)
 
 @router.get("/chat/stream")
 async def chat_stream(message: str, session_id: Optional[str] = None, location: Optional[str] = None):
@@ -195,23 +144,39 @@ async def chat_with_image(
     message: str = Form(...),
     session_id: Optional[str] = Form(None),
     location: Optional[str] = Form(None),
-    image: UploadFile = File(...),
-    agent_manager: AgentManager = Depends(get_agent_manager)
-) -> ChatResponse:
-    """Process a chat message with an image and return the response."""
+    streaming: Optional[bool] = Form(False),
+    image: UploadFile = File(...)
+) -> Union[ChatResponse, StreamingResponse]:
+    """Process a chat message with an image and return the response.
+    
+    As in chat(), a streamed response borrows its agent set in stream_response.
+    """
     try:
         # Create a new session ID if none provided
         session_id = session_id or str(uuid4())
         
         print(f"Processing chat-with-image request: message='{message[:50]}...', session_id={session_id}")
         
-        # Process the query with the image
-        result = await agent_manager.process_query(
-            message=message,
-            session_id=session_id,
-            image_file=image,
-            location=location
-        )
+        # Check if streaming is requested
+        if streaming:
+            # Save the upload now, it is closed before the stream runs
+            image_path = await AgentManager.save_uploaded_image(image, session_id)
+            rel_path = os.path.relpath(image_path, UPLOAD_DIR)
+            return StreamingResponse(
+                stream_response(message, session_id, location, image_path=image_path, image_url=f"/uploads/{rel_path.replace(os.sep, '/')}"),
+                media_type="text/event-stream"
+            )
+        
+        # Process the query with the image, reading the saved image path
+        # before the agent set goes back to the pool
+        async with get_agent_pool().checkout() as agent_manager:
+            result = await agent_manager.process_query(
+                message=message,
+                session_id=session_id,
+                image_file=image,
+                location=location
+            )
+            image_path = getattr(agent_manager, "last_image_path", None)
         
         print(f"Got result: {str(result)[:100]}...")
         
@@ -226,8 +191,6 @@ async def chat_with_image(
                 "router": {"target_agent": "unknown", "explanation": ""}
             }
         
-        # Get the saved image path from the agent_manager if available
-        image_path = getattr(agent_manager, "last_image_path", None)
         image_url = None
         
         if image_path:
@@ -247,6 +210,9 @@ async def chat_with_image(
         }
         
         return ChatResponse(**response)
+    except ImageUploadError as e:
+        # Too large or not an image: tell the client instead of reporting a server error
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         error_msg = f"Error processing message with image: {str(e)}"
         print(error_msg)
@@ -255,7 +221,7 @@ async def chat_with_image(
         raise HTTPException(status_code=500, detail=error_msg)
 
 @router.get("/agents")
-def get_available_agents(agent_manager: AgentManager = Depends(get_agent_manager)):
+def get_available_agents():
     """Get the list of available specialized agents."""
     print(f"GET /agents endpoint called")
     try:
@@ -31,7 +31,7 @@ def get_session(session_id: str):
     memory_store = get_memory_store()
     
     # Check if session exists
-    if session_id not in memory_store.sessions:
+    if not memory_store.has_session(session_id):
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
     
     session = memory_store.get_session(session_id)
@@ -50,7 +50,7 @@ def delete_session(session_id: str):
     memory_store = get_memory_store()
     
     # Check if session exists
-    if session_id not in memory_store.sessions:
+    if not memory_store.has_session(session_id):
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
     
     memory_store.delete_session(session_id)
@@ -62,7 +62,7 @@ def clear_session_messages(session_id: str):
     memory_store = get_memory_store()
     
     # Check if session exists
-    if session_id not in memory_store.sessions:
+    if not memory_store.has_session(session_id):
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
     
     memory_store.clear_session(session_id)
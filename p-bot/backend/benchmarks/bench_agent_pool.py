@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request AgentManager construction against the shared AgentPool.
+
+Model calls are replaced with a fixed sleep so the numbers only reflect the
+setup work each request does before it can talk to a model.
+
+Usage:
+    python benchmarks/bench_agent_pool.py --requests 200 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Allow running from the backend directory or the benchmarks directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent_manager import AgentManager
+from agent_pool import AgentPool
+
+async def fake_model_call(latency: float) -> None:
+    """Stand-in for a model round trip."""
+    await asyncio.sleep(latency)
+
+async def per_request(semaphore: asyncio.Semaphore, latency: float, setup_times: list) -> None:
+    """Build a brand-new AgentManager for the request, as main.py used to."""
+    async with semaphore:
+        start_time = time.perf_counter()
+        AgentManager()
+        setup_times.append(time.perf_counter() - start_time)
+        await fake_model_call(latency)
+
+async def pooled(pool: AgentPool, semaphore: asyncio.Semaphore, latency: float, setup_times: list) -> None:
+    """Borrow an agent set from the pool."""
+    async with semaphore:
+        start_time = time.perf_counter()
+        async with pool.checkout():
+            setup_times.append(time.perf_counter() - start_time)
+            await fake_model_call(latency)
+
+def report(name: str, setup_times: list, wall_time: float) -> None:
+    """Print a summary line for one benchmark mode."""
+    setup_ms = sorted(t * 1000 for t in setup_times)
+    p95 = setup_ms[int(len(setup_ms) * 0.95) - 1]
+    print(
+        f"{name:<12} requests={len(setup_ms):<5} wall={wall_time:.3f}s "
+        f"setup_mean={statistics.mean(setup_ms):.3f}ms setup_p95={p95:.3f}ms"
+    )
+
+async def main(requests: int, concurrency: int, latency: float, pool_size: int) -> None:
+    """Run both modes with the same load."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    setup_times = []
+    start_time = time.perf_counter()
+    await asyncio.gather(*(per_request(semaphore, latency, setup_times) for _ in range(requests)))
+    report("per-request", setup_times, time.perf_counter() - start_time)
+
+    pool = AgentPool(size=pool_size)
+    await pool.start()
+    setup_times = []
+    start_time = time.perf_counter()
+    await asyncio.gather(*(pooled(pool, semaphore, latency, setup_times) for _ in range(requests)))
+    report("pooled", setup_times, time.perf_counter() - start_time)
+    print(f"pool stats: {pool.stats()}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated model latency in seconds")
+    parser.add_argument("--pool-size", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.latency, args.pool_size))
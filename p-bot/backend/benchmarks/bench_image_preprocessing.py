@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark image preparation for the vision model on phone-sized photos.
+
+Compares the old inline path (full decode, LANCZOS resize and re-encode on
+the event loop) with the ImagePreprocessor (draft/reduce downscaling in a
+worker pool, cached by content hash). Event loop lag is measured with a
+ticker task that runs while images are being prepared.
+
+Usage:
+    python benchmarks/bench_image_preprocessing.py --photos 4 --rounds 3
+"""
+
+import argparse
+import asyncio
+import base64
+import io
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running from the backend directory or the benchmarks directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import Image
+
+from image_preprocessing import ImagePreprocessor
+
+def make_photo(path: Path, width: int, height: int, seed: int) -> None:
+    """Write a noisy gradient JPEG that compresses like a real photo."""
+    noise = Image.effect_noise((width // 4, height // 4), 40 + seed).resize((width, height))
+    gradient = Image.linear_gradient("L").resize((width, height))
+    Image.merge("RGB", (noise, gradient, noise.transpose(Image.FLIP_LEFT_RIGHT))).save(path, format="JPEG", quality=92)
+
+def inline_prepare(image_path: str, max_size: int = 1024) -> str:
+    """The old IssueDetectionAgent image handling."""
+    with Image.open(image_path) as img:
+        if max(img.size) > max_size:
+            ratio = max_size / max(img.size)
+            new_size = tuple(int(dim * ratio) for dim in img.size)
+            img = img.resize(new_size, Image.LANCZOS)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=90)
+        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+async def measure(prepare, paths, rounds: int) -> dict:
+    """Prepare every photo concurrently, round after round, while tracking loop lag."""
+    lags = []
+    stop = asyncio.Event()
+
+    async def ticker() -> None:
+        interval = 0.005
+        while not stop.is_set():
+            start_time = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - start_time - interval)
+
+    ticker_task = asyncio.create_task(ticker())
+    round_times = []
+    for _ in range(rounds):
+        start_time = time.perf_counter()
+        await asyncio.gather(*(prepare(path) for path in paths))
+        round_times.append(time.perf_counter() - start_time)
+    stop.set()
+    await ticker_task
+
+    return {
+        "first_round_s": round_times[0],
+        "later_rounds_s": statistics.mean(round_times[1:]) if len(round_times) > 1 else float("nan"),
+        "max_loop_lag_ms": max(lags) * 1000 if lags else 0.0,
+    }
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--photos", type=int, default=4, help="Distinct photos per round")
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds; later rounds are follow-up turns")
+    parser.add_argument("--width", type=int, default=4032)
+    parser.add_argument("--height", type=int, default=3024)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--processes", action="store_true", help="Use a process pool")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.photos):
+            path = Path(tmp) / f"photo_{i}.jpg"
+            make_photo(path, args.width, args.height, i)
+            paths.append(str(path))
+        size_mb = sum(Path(path).stat().st_size for path in paths) / len(paths) / 1e6
+        print(f"{args.photos} photos of {args.width}x{args.height} ({size_mb:.1f} MB each), {args.rounds} rounds")
+
+        async def inline(path: str) -> str:
+            return inline_prepare(path)
+
+        preprocessor = ImagePreprocessor(max_workers=args.workers, use_processes=args.processes)
+        results = {
+            "inline": await measure(inline, paths, args.rounds),
+            "preprocessor": await measure(preprocessor.aprepare, paths, args.rounds),
+        }
+        preprocessor.shutdown()
+
+    for name, result in results.items():
+        print(
+            f"{name:>12}: first round {result['first_round_s'] * 1000:8.1f} ms, "
+            f"follow-up rounds {result['later_rounds_s'] * 1000:8.1f} ms, "
+            f"max loop lag {result['max_loop_lag_ms']:8.1f} ms"
+        )
+    print(f"cache: {preprocessor.stats()}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
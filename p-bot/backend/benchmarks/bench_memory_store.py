@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Contention benchmark for SessionMemoryStore.
+
+Many sessions append messages in parallel through the async API, the way
+concurrent chats do. The store is then reopened from disk and every session is
+checked for lost messages. Running with --stripes 1 approximates the old single
+global lock.
+
+Usage:
+    python benchmarks/bench_memory_store.py --sessions 200 --messages 20 --stripes 64
+"""
+
+import argparse
+import asyncio
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running from the backend directory or the benchmarks directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from memory_store import SessionMemoryStore
+
+async def chat(store: SessionMemoryStore, session_id: str, messages: int) -> None:
+    """Simulate one conversation: alternate user and assistant messages, reading history each turn."""
+    for i in range(messages):
+        role = "user" if i % 2 == 0 else "assistant"
+        await store.aadd_message(session_id, {"role": role, "content": f"{session_id} message {i}"})
+        await store.aget_messages(session_id, limit=10)
+
+async def run(storage_dir: str, mode: str, stripes: int, sessions: int, messages: int) -> None:
+    """Run the benchmark once and verify the result."""
+    store = SessionMemoryStore(storage_dir, storage_mode=mode, lock_stripes=stripes, max_cached_sessions=sessions)
+    session_ids = [f"bench-{i}" for i in range(sessions)]
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(chat(store, session_id, messages) for session_id in session_ids))
+    elapsed = time.perf_counter() - start_time
+    store.close()
+
+    # Reopen from disk so lost writes cannot hide in memory
+    reopened = SessionMemoryStore(storage_dir, storage_mode=mode)
+    lost = sum(messages - len(reopened.get_messages(session_id)) for session_id in session_ids)
+    reopened.close()
+
+    total = sessions * messages
+    print(
+        f"mode={mode:<5} stripes={stripes:<3} sessions={sessions} messages={total} "
+        f"elapsed={elapsed:.3f}s throughput={total / elapsed:,.0f} msg/s lost={lost}"
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=20, help="Messages per session")
+    parser.add_argument("--stripes", type=int, nargs="+", default=[1, 64])
+    parser.add_argument("--modes", nargs="+", default=["json", "jsonl"])
+    args = parser.parse_args()
+
+    for mode in args.modes:
+        for stripes in args.stripes:
+            storage_dir = tempfile.mkdtemp(prefix="session_memory_bench_")
+            try:
+                asyncio.run(run(storage_dir, mode, stripes, args.sessions, args.messages))
+            finally:
+                shutil.rmtree(storage_dir, ignore_errors=True)
@@ -111,4 +111,55 @@ KNOWLEDGE_DIR.mkdir(exist_ok=True)
 # New environment variables
 CONTEXT_TURNS = int(os.getenv("CONTEXT_TURNS", 10))
 CONTEXT_CHAR_LIMIT = int(os.getenv("CONTEXT_CHAR_LIMIT", 2000))
-SESSION_MAX_MESSAGES = int(os.getenv("SESSION_MAX_MESSAGES", 30)) 
\ No newline at end of file
+SESSION_MAX_MESSAGES = int(os.getenv("SESSION_MAX_MESSAGES", 30))
+
+# Number of agent sets built at startup and shared by the chat endpoints (per worker process)
+AGENT_POOL_SIZE = int(os.getenv("AGENT_POOL_SIZE", 4))
+# Most agent sets a worker process keeps: when all are busy, another one is built for the
+# request up to this limit, after which requests wait for a free set. Set it to the number of
+# concurrent chats one worker is expected to serve; 0 means no limit
+AGENT_POOL_MAX_SIZE = int(os.getenv("AGENT_POOL_MAX_SIZE", 16))
+
+# Session storage: "json" rewrites one JSON file per session on every change,
+# "jsonl" appends each message to a per-session log written in the background
+SESSION_STORAGE_MODE = os.getenv("SESSION_STORAGE_MODE", "json")
+# Seconds between background flushes of the session log (the most a crash can lose)
+SESSION_FLUSH_INTERVAL = float(os.getenv("SESSION_FLUSH_INTERVAL", 1.0))
+# Sessions kept in memory at once; older ones are reloaded from disk on access
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", 256))
+SESSION_CACHE_MAX_MESSAGES = int(os.getenv("SESSION_CACHE_MAX_MESSAGES", 20000))
+# Number of locks sessions are striped across in the session memory store
+SESSION_LOCK_STRIPES = int(os.getenv("SESSION_LOCK_STRIPES", 64))
+
+# Local routing classifier that settles clear-cut queries without an LLM call
+ROUTER_FAST_PATH_ENABLED = os.getenv("ROUTER_FAST_PATH_ENABLED", "true").lower() == "true"
+# Minimum classifier confidence (0.5-1.0) and similarity to skip the LLM router
+ROUTER_FAST_PATH_CONFIDENCE = float(os.getenv("ROUTER_FAST_PATH_CONFIDENCE", 0.8))
+ROUTER_FAST_PATH_MIN_SCORE = float(os.getenv("ROUTER_FAST_PATH_MIN_SCORE", 0.05))
+# Optional JSON file of extra labelled routing examples ({"agent_name": ["query", ...]})
+ROUTER_EXAMPLES_FILE = os.getenv("ROUTER_EXAMPLES_FILE")
+
+# Routing decisions cached per normalized message, shared across the agent pool
+ROUTER_CACHE_MAX_ENTRIES = int(os.getenv("ROUTER_CACHE_MAX_ENTRIES", 1024))
+ROUTER_CACHE_TTL = float(os.getenv("ROUTER_CACHE_TTL", 3600))
+
+# Start the predicted specialist while the router is still deciding (may waste tokens)
+SPECULATIVE_ROUTING_ENABLED = os.getenv("SPECULATIVE_ROUTING_ENABLED", "false").lower() == "true"
+
+# Image preparation for the vision model: longest side, JPEG quality, worker pool and cache size
+IMAGE_MAX_SIZE = int(os.getenv("IMAGE_MAX_SIZE", 1024))
+IMAGE_JPEG_QUALITY = int(os.getenv("IMAGE_JPEG_QUALITY", 90))
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", 2))
+IMAGE_USE_PROCESSES = os.getenv("IMAGE_USE_PROCESSES", "false").lower() == "true"
+IMAGE_CACHE_MAX_ENTRIES = int(os.getenv("IMAGE_CACHE_MAX_ENTRIES", 64))
+# Uploaded images: largest accepted file and the chunk size they are copied to disk in
+IMAGE_UPLOAD_MAX_BYTES = int(os.getenv("IMAGE_UPLOAD_MAX_BYTES", 20 * 1024 * 1024))
+IMAGE_UPLOAD_CHUNK_SIZE = int(os.getenv("IMAGE_UPLOAD_CHUNK_SIZE", 1024 * 1024))
+
+# Local retrieval over knowledge/tenancy for the tenancy FAQ agent
+TENANCY_INDEX_DIR = BASE_DIR / "tmp" / "tenancy_index"
+TENANCY_EMBEDDING_MODEL = os.getenv("TENANCY_EMBEDDING_MODEL", "text-embedding-3-small")
+TENANCY_RETRIEVAL_TOP_K = int(os.getenv("TENANCY_RETRIEVAL_TOP_K", 3))
+# Cosine similarity of the best chunk below which the agent falls back to web search
+TENANCY_RETRIEVAL_MIN_SCORE = float(os.getenv("TENANCY_RETRIEVAL_MIN_SCORE", 0.35))
+TENANCY_CHUNK_SIZE = int(os.getenv("TENANCY_CHUNK_SIZE", 1500))
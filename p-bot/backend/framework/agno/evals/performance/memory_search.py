@@ -0,0 +1,92 @@
+"""Compare reloading every user memory per search with the incremental sync and vector index of semantic search.
+
+Run `pip install agno sqlalchemy numpy` to install dependencies, then for example:
+
+    python evals/performance/memory_search.py --memories 100 1000 5000
+
+Memories are stored in a SqliteMemoryDb with their embeddings. The embedder returns random vectors,
+and the query embedding is computed once, so the numbers only measure the lookup itself.
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from sqlalchemy import text
+
+from agno.embedder.base import Embedder
+from agno.memory.v2.db.schema import MemoryRow
+from agno.memory.v2.db.sqlite import SqliteMemoryDb
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.schema import UserMemory
+
+
+class RandomEmbedder(Embedder):
+    def get_embedding(self, text: str) -> List[float]:
+        return [random.random() for _ in range(self.dimensions or 1536)]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], None]:
+        return self.get_embedding(text), None
+
+
+def fill_db(db: SqliteMemoryDb, embedder: Embedder, memories: int) -> None:
+    db.clear()
+    for i in range(memories):
+        memory = UserMemory(memory=f"Memory {i}: the user rents a flat and pays the deposit in instalments")
+        db.upsert_memory(
+            MemoryRow(user_id="bench-user", memory={**memory.to_dict(), "embedding": embedder.get_embedding("")})
+        )
+    # Memories written earlier, not within the second a sync re-reads
+    with db.Session() as session:
+        session.execute(
+            text(f"UPDATE {db.table_name} SET updated_at = datetime('now', '-1 hour', '-' || rowid || ' seconds')")
+        )
+        session.commit()
+
+
+def measure(memories: int, searches: int, db_file: Path) -> Tuple[float, float]:
+    """Returns the median milliseconds per search of a full reload and of the semantic search"""
+    embedder = RandomEmbedder(dimensions=1536)
+    db = SqliteMemoryDb(table_name="bench_memory", db_file=str(db_file))
+    db.create()
+    fill_db(db, embedder, memories)
+    query_embedding = embedder.get_embedding("")
+    embedder.get_embedding = lambda text: query_embedding  # type: ignore
+
+    memory = Memory(db=db, embedder=embedder)
+    reload_timings: List[float] = []
+    for _ in range(searches):
+        start_time = time.perf_counter()
+        memory.search_user_memories(retrieval_method="last_n", limit=5, user_id="bench-user")
+        reload_timings.append((time.perf_counter() - start_time) * 1000)
+
+    # Load and index the memories before timing
+    memory.search_user_memories(query="deposit", retrieval_method="semantic", limit=5, user_id="bench-user")
+    semantic_timings: List[float] = []
+    for _ in range(searches):
+        start_time = time.perf_counter()
+        memory.search_user_memories(query="deposit", retrieval_method="semantic", limit=5, user_id="bench-user")
+        semantic_timings.append((time.perf_counter() - start_time) * 1000)
+    db.drop_table()
+    return statistics.median(reload_timings), statistics.median(semantic_timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--searches", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'memories':>8}  {'full reload':>12}  {'semantic':>12}")
+        for memories in args.memories:
+            reload, semantic = measure(memories, args.searches, Path(tmp) / "memory.db")
+            print(f"{memories:>8}  {reload:>9.2f} ms  {semantic:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
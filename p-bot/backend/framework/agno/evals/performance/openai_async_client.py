@@ -0,0 +1,113 @@
+"""Compare a fresh async HTTP client per request with the shared per-event-loop client used by OpenAIChat.
+
+Run `pip install agno openai` to install dependencies, then for example:
+
+    python evals/performance/openai_async_client.py --requests 500 --concurrency 8
+
+Requests go to a local keep-alive server that answers chat completions immediately,
+so the numbers only measure client setup and connection handling.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List
+
+import httpx
+from openai import AsyncOpenAI
+
+from agno.models.openai import OpenAIChat
+from agno.utils.http import DEFAULT_ASYNC_LIMITS, aclose_async_http_clients, async_http_client_stats
+
+COMPLETION = json.dumps(
+    {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "OK"}, "finish_reason": "stop"}],
+    }
+).encode()
+
+
+class CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(COMPLETION)))
+        self.end_headers()
+        self.wfile.write(COMPLETION)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def measure(get_client: Callable[[], AsyncOpenAI], requests: int, concurrency: int) -> Dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one_request():
+        async with semaphore:
+            start_time = time.perf_counter()
+            await get_client().chat.completions.create(model="gpt-4o", messages=[{"role": "user", "content": "Hi"}])
+            latencies.append((time.perf_counter() - start_time) * 1000)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(requests)))
+    total_time = time.perf_counter() - start_time
+    latencies.sort()
+    return {
+        "requests_per_s": requests / total_time,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+async def run(base_url: str, requests: int, concurrency: int) -> None:
+    model = OpenAIChat(api_key="bench", base_url=base_url, max_retries=0)
+
+    def fresh_client() -> AsyncOpenAI:
+        # What get_async_client did before: a new connection pool for every request
+        return AsyncOpenAI(
+            api_key="bench", base_url=base_url, max_retries=0, http_client=httpx.AsyncClient(limits=DEFAULT_ASYNC_LIMITS)
+        )
+
+    for name, get_client in (("fresh client", fresh_client), ("shared client", model.get_async_client)):
+        result = await measure(get_client, requests, concurrency)
+        print(
+            f"{name:>14}: {result['requests_per_s']:8.0f} req/s, "
+            f"p50 {result['p50_ms']:6.2f} ms, p95 {result['p95_ms']:6.2f} ms"
+        )
+
+    stats = async_http_client_stats()
+    print(
+        f"shared client: {stats['requests']} requests over {stats['connections_opened']} connections "
+        f"({stats['reuse_rate']:.1%} reused)"
+    )
+    await aclose_async_http_clients()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CompletionHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        asyncio.run(run(f"http://127.0.0.1:{server.server_address[1]}/v1", args.requests, args.concurrency))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare in-process PDF ingestion with the worker process pool of PDFReader / PDFImageReader.
+
+Run `pip install agno pypdf pillow rapidocr_onnxruntime` to install dependencies, then for example:
+
+    python evals/performance/pdf_ingestion.py --pages 500 --workers 2 4 8
+
+Without --pdf a scanned PDF is generated: every page is an image of text with no text layer,
+so PDFImageReader has to OCR every page. Use --text to read the text layer with PDFReader instead.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+from agno.document.reader.pdf_reader import PDFImageReader, PDFReader
+
+
+def make_scanned_pdf(path: Path, pages: int) -> None:
+    font = ImageFont.load_default(size=28)
+    images: List[Image.Image] = []
+    for page_number in range(1, pages + 1):
+        image = Image.new("L", (1240, 1754), color=255)
+        draw = ImageDraw.Draw(image)
+        for line in range(20):
+            draw.text((80, 80 + line * 80), f"Page {page_number} clause {line}: rent is due monthly", fill=0, font=font)
+        images.append(image)
+    images[0].save(path, save_all=True, append_images=images[1:], resolution=150)
+
+
+def measure(reader, pdf: Path) -> float:
+    start_time = time.perf_counter()
+    if reader.num_workers:
+        pages = sum(len(documents) for documents in reader.iter_read(pdf))
+    else:
+        pages = len(reader.read(pdf))
+    elapsed = time.perf_counter() - start_time
+    return pages / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", type=Path, help="PDF to read instead of a generated scanned one")
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, nargs="+", default=[os.cpu_count() or 1])
+    parser.add_argument("--pages-per-task", type=int, default=8)
+    parser.add_argument("--text", action="store_true", help="Read the text layer only, without OCR")
+    args = parser.parse_args()
+
+    reader_class = PDFReader if args.text else PDFImageReader
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf: Optional[Path] = args.pdf
+        if pdf is None:
+            pdf = Path(tmp) / "scanned.pdf"
+            print(f"Generating a {args.pages}-page scanned PDF")
+            make_scanned_pdf(pdf, args.pages)
+
+        print(f"{reader_class.__name__} on {pdf.name}")
+        in_process = measure(reader_class(chunk=False), pdf)
+        print(f"{'in process':>12}: {in_process:8.1f} pages/s")
+        for workers in args.workers:
+            reader = reader_class(chunk=False, num_workers=workers, pages_per_task=args.pages_per_task)
+            # Start the worker processes before timing
+            list(reader.iter_read(pdf))
+            pooled = measure(reader, pdf)
+            print(f"{workers:>2} workers  : {pooled:8.1f} pages/s ({pooled / in_process:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Compare the per-turn cost of runs kept in the memory column with normalized runs in SqliteStorage / PostgresStorage.
+
+Run `pip install agno sqlalchemy` to install dependencies, then for example:
+
+    python evals/performance/session_storage.py --session-runs 10 100 1000 5000
+
+A turn is what an Agent with AgentMemory does with storage on every run: Agent.read_from_storage loads the
+session, the run adds its messages and its AgentRun to the memory, and Agent.write_to_storage writes the session
+back. The model is never called. Use --db-url to benchmark PostgresStorage.
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from agno.agent import Agent, AgentMemory, RunResponse
+from agno.memory.agent import AgentRun
+from agno.models.message import Message, MessageMetrics
+from agno.storage.base import Storage
+
+
+def make_messages(index: int) -> List[Message]:
+    question = f"Question {index}: what does clause {index} of my tenancy agreement mean for the deposit?"
+    answer = f"Answer {index}: " + "The landlord must protect the deposit in an approved scheme. " * 12
+    return [
+        Message(role="user", content=question),
+        Message(
+            role="assistant",
+            content=answer,
+            metrics=MessageMetrics(input_tokens=850, output_tokens=120, total_tokens=970, time=1.2),
+        ),
+    ]
+
+
+def add_run(agent: Agent, index: int) -> None:
+    """Adds the messages and the AgentRun of one run to the agent's memory, like Agent.run does"""
+    assert isinstance(agent.memory, AgentMemory)
+    messages = make_messages(index)
+    agent.memory.add_system_message(Message(role="system", content="You answer tenancy questions."))
+    agent.memory.add_messages(messages=messages)
+    response = RunResponse(run_id=f"run-{index}", session_id="bench-session", content=messages[-1].content)
+    response.messages = messages
+    agent.memory.add_run(AgentRun(message=messages[0], response=response))
+    agent.session_metrics = agent.get_session_metrics(agent.memory, messages)
+
+
+def make_storage(normalize_runs: bool, db_file: Path, db_url: Optional[str]) -> Storage:
+    table_name = "bench_sessions_normalized" if normalize_runs else "bench_sessions"
+    if db_url is not None:
+        from agno.storage.postgres import PostgresStorage
+
+        storage: Storage = PostgresStorage(table_name=table_name, db_url=db_url, normalize_runs=normalize_runs)
+    else:
+        from agno.storage.sqlite import SqliteStorage
+
+        storage = SqliteStorage(table_name=table_name, db_file=str(db_file), normalize_runs=normalize_runs)
+    storage.drop()
+    storage.create()
+    return storage
+
+
+def measure(storage: Storage, session_runs: int, turns: int, history_runs: int) -> float:
+    """Returns the median milliseconds per turn for a session that already has `session_runs` runs"""
+    agent = Agent(storage=storage, memory=AgentMemory(), num_history_runs=history_runs)
+    for index in range(session_runs):
+        add_run(agent, index)
+    agent.write_to_storage(session_id="bench-session")
+
+    timings: List[float] = []
+    for turn in range(turns):
+        agent = Agent(storage=storage, memory=AgentMemory(), num_history_runs=history_runs)
+        start_time = time.perf_counter()
+        agent.read_from_storage(session_id="bench-session")
+        add_run(agent, session_runs + turn)
+        agent.write_to_storage(session_id="bench-session")
+        timings.append((time.perf_counter() - start_time) * 1000)
+
+    # Both storage modes keep every message and the same session metrics
+    session = storage.read(session_id="bench-session")
+    assert session is not None and session.memory is not None and session.session_data is not None
+    assert len(session.memory["messages"]) == 1 + 2 * (session_runs + turns)
+    assert session.session_data["session_metrics"]["input_tokens"] == 850 * (session_runs + turns)
+    storage.delete_session("bench-session")
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--session-runs", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--history-runs", type=int, default=3, help="num_history_runs of the agent")
+    parser.add_argument("--db-url", help="Benchmark PostgresStorage on this database instead of SqliteStorage")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = Path(tmp) / "sessions.db"
+        blob_storage = make_storage(False, db_file, args.db_url)
+        normalized_storage = make_storage(True, db_file, args.db_url)
+
+        print(f"{'session runs':>12}  {'memory column':>14}  {'normalized runs':>16}")
+        for session_runs in args.session_runs:
+            blob = measure(blob_storage, session_runs, args.turns, args.history_runs)
+            normalized = measure(normalized_storage, session_runs, args.turns, args.history_runs)
+            print(f"{session_runs:>12}  {blob:>11.2f} ms  {normalized:>13.2f} ms")
+
+        blob_storage.drop()
+        normalized_storage.drop()
+
+
+if __name__ == "__main__":
+    main()
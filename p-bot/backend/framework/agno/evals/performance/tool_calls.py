@@ -0,0 +1,68 @@
+"""Compare running the tool calls of a response sequentially with the concurrent mode of Model.run_function_calls.
+
+Run `pip install agno openai` to install dependencies, then for example:
+
+    python evals/performance/tool_calls.py --calls 2 4 8 --latency 0.2 --max-concurrency 2
+
+The tools sleep for --latency seconds, like a call to a slow API, and the model is never called,
+so the numbers only measure how the tool calls of one response are run.
+"""
+
+import argparse
+import statistics
+import time
+from typing import List, Optional
+
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.tools.function import Function, FunctionCall
+
+
+def make_function(latency: float, max_concurrency: Optional[int]) -> Function:
+    def get_weather(city: str) -> str:
+        time.sleep(latency)
+        return f"It is sunny in {city}"
+
+    function = Function(name=f"get_weather_{max_concurrency}", entrypoint=get_weather, max_concurrency=max_concurrency)
+    function.process_entrypoint()
+    return function
+
+
+def measure(concurrent: bool, function: Function, calls: int, repeats: int) -> float:
+    """Returns the median milliseconds to run `calls` tool calls of one response"""
+    model = OpenAIChat(id="gpt-4o", api_key="bench", concurrent_tool_calls=concurrent)
+    timings: List[float] = []
+    for _ in range(repeats):
+        function_calls = [
+            FunctionCall(function=function, arguments={"city": f"City {i}"}, call_id=f"call_{i}") for i in range(calls)
+        ]
+        results: List[Message] = []
+        start_time = time.perf_counter()
+        for _ in model.run_function_calls(function_calls, results):
+            pass
+        timings.append((time.perf_counter() - start_time) * 1000)
+        assert len(results) == calls
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds each tool call takes")
+    parser.add_argument("--max-concurrency", type=int, default=2, help="Per-tool limit of the limited run")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    unlimited = make_function(args.latency, None)
+    limited = make_function(args.latency, args.max_concurrency)
+    limited_header = f"max_concurrency={args.max_concurrency}"
+    print(f"{'calls':>5}  {'sequential':>12}  {'concurrent':>12}  {limited_header:>20}")
+    for calls in args.calls:
+        sequential = measure(False, unlimited, calls, args.repeats)
+        concurrent = measure(True, unlimited, calls, args.repeats)
+        concurrent_limited = measure(True, limited, calls, args.repeats)
+        print(f"{calls:>5}  {sequential:>9.0f} ms  {concurrent:>9.0f} ms  {concurrent_limited:>17.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
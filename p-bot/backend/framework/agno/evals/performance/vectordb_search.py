@@ -0,0 +1,122 @@
+"""Compare NumpyDb with LanceDb on insert time and search latency.
+
+Run `pip install agno numpy lancedb` to install dependencies, then for example:
+
+    python evals/performance/vectordb_search.py --sizes 10000 100000 1000000 --dimensions 384
+
+Documents get random unit vectors up front so the numbers only measure the vector store.
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.vectordb.lancedb import LanceDb
+from agno.vectordb.numpydb import NumpyDb
+
+
+@dataclass
+class RandomEmbedder(Embedder):
+    """Returns a random unit vector for queries and keeps the embeddings documents already have."""
+
+    dimensions: int = 384
+    seed: int = 0
+
+    def get_embedding(self, text: str) -> List[float]:
+        rng = np.random.default_rng(abs(hash((self.seed, text))) % (2**32))
+        vector = rng.standard_normal(self.dimensions).astype(np.float32)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    def embed_documents(self, documents: List[Document]) -> None:
+        for document in documents:
+            if document.embedding is None:
+                document.embedding = self.get_embedding(document.content)
+
+
+def make_documents(count: int, dimensions: int) -> List[Document]:
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((count, dimensions)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return [
+        Document(
+            content=f"Tenancy chunk {i}",
+            name=f"chunk_{i}",
+            meta_data={"section": f"section_{i % 20}"},
+            embedding=vectors[i].tolist(),
+        )
+        for i in range(count)
+    ]
+
+
+def measure(db, documents: List[Document], queries: List[str], limit: int, batch_size: int) -> Dict[str, float]:
+    start_time = time.perf_counter()
+    for i in range(0, len(documents), batch_size):
+        db.insert(documents[i : i + batch_size])
+    insert_time = time.perf_counter() - start_time
+
+    # Warm up caches and lazily built state
+    db.search(queries[0], limit=limit)
+    latencies = []
+    for query in queries:
+        start_time = time.perf_counter()
+        db.search(query, limit=limit)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+    latencies.sort()
+
+    result = {
+        "insert_s": insert_time,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+    }
+    if isinstance(db, NumpyDb):
+        filtered = []
+        for query in queries:
+            start_time = time.perf_counter()
+            db.search(query, limit=limit, filters={"section": "section_3"})
+            filtered.append((time.perf_counter() - start_time) * 1000)
+        result["filtered_p50_ms"] = statistics.median(filtered)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    embedder = RandomEmbedder(dimensions=args.dimensions)
+    queries = [f"query {i}" for i in range(args.queries)]
+    for size in args.sizes:
+        documents = make_documents(size, args.dimensions)
+        with tempfile.TemporaryDirectory() as tmp:
+            stores = {
+                "NumpyDb": NumpyDb(table_name="bench", path=f"{tmp}/numpy", embedder=embedder),
+                "LanceDb": LanceDb(uri=f"{tmp}/lance", table_name="bench", embedder=embedder),
+            }
+            for name, db in stores.items():
+                db.create()
+                result = measure(db, documents, queries, args.limit, args.batch_size)
+                line = (
+                    f"{size:>9} chunks {name:>8}: insert {result['insert_s']:7.2f} s, "
+                    f"search p50 {result['p50_ms']:7.2f} ms, p95 {result['p95_ms']:7.2f} ms"
+                )
+                if "filtered_p50_ms" in result:
+                    line += f", filtered p50 {result['filtered_p50_ms']:7.2f} ms"
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -136,6 +136,9 @@ class Agent:
     show_tool_calls: bool = True
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # If True, the tool calls of a response run concurrently on a shared thread pool in synchronous runs.
+    # Only enable for tools that are safe to run at the same time.
+    concurrent_tool_calls: Optional[bool] = None
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -298,6 +301,7 @@ class Agent:
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
         tool_call_limit: Optional[int] = None,
+        concurrent_tool_calls: Optional[bool] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         reasoning: bool = False,
         reasoning_model: Optional[Model] = None,
@@ -390,6 +394,7 @@ class Agent:
         self.tools = tools
         self.show_tool_calls = show_tool_calls
         self.tool_call_limit = tool_call_limit
+        self.concurrent_tool_calls = concurrent_tool_calls
         self.tool_choice = tool_choice
 
         self.reasoning = reasoning
@@ -451,6 +456,8 @@ class Agent:
 
         # --- Params not to be set by user ---
         self.session_metrics: Optional[SessionMetrics] = None
+        # Number of stored messages before the first message in memory, set by storages that only load the last runs
+        self._messages_offset: Optional[int] = None
 
         self.run_id: Optional[str] = None
         self.run_input: Optional[Union[str, List, Dict, Message]] = None
@@ -890,7 +897,7 @@ class Agent:
                 self.memory.update_summary()
 
             # 10. Calculate session metrics
-            self.session_metrics = self.calculate_session_metrics(self.memory.messages)
+            self.session_metrics = self.get_session_metrics(self.memory, messages_for_memory)
         elif isinstance(self.memory, Memory):
             # Add AgentRun to memory
             self.memory.add_run(session_id=session_id, run=self.run_response)
@@ -1474,7 +1481,7 @@ class Agent:
             if self.memory.create_session_summary and self.memory.update_session_summary_after_run:
                 await self.memory.aupdate_summary()
 
-            self.session_metrics = self.calculate_session_metrics(self.memory.messages)
+            self.session_metrics = self.get_session_metrics(self.memory, messages_for_memory)
         elif isinstance(self.memory, Memory):
             # Add AgentRun to memory
             self.memory.add_run(session_id=session_id, run=self.run_response)
@@ -1979,6 +1986,10 @@ class Agent:
         if self.tool_call_limit is not None:
             self.model.tool_call_limit = self.tool_call_limit
 
+        # Set concurrent_tool_calls on the Model
+        if self.concurrent_tool_calls is not None:
+            self.model.concurrent_tool_calls = self.concurrent_tool_calls
+
     def resolve_run_context(self) -> None:
         from inspect import signature
 
@@ -2038,6 +2049,9 @@ class Agent:
             if isinstance(self.memory, AgentMemory):
                 self.memory = cast(AgentMemory, self.memory)
                 memory_dict = self.memory.to_dict()
+                if self._messages_offset is not None:
+                    # Tell the storage that the stored messages before this offset were not loaded
+                    memory_dict["messages_offset"] = self._messages_offset
                 # We only persist the runs for the current session ID (not all runs in memory)
                 memory_dict["runs"] = [
                     agent_run.to_dict()
@@ -2252,8 +2266,17 @@ class Agent:
             Optional[AgentSession]: The loaded AgentSession or None if not found.
         """
         if self.storage is not None:
-            # Get a single session from storage
-            self.agent_session = cast(AgentSession, self.storage.read(session_id=session_id))
+            # Get a single session from storage, with only the runs this agent needs if the storage supports it
+            num_runs = self.get_num_runs_to_load()
+            if num_runs is None:
+                self.agent_session = cast(AgentSession, self.storage.read(session_id=session_id))
+            else:
+                self.agent_session = cast(
+                    AgentSession, self.storage.read_last_runs(session_id=session_id, last_n_runs=num_runs)
+                )
+            # Storages that normalize runs only load the latest messages and report how many they left out
+            memory_from_db = self.agent_session.memory if self.agent_session is not None else None
+            self._messages_offset = memory_from_db.get("messages_offset") if memory_from_db is not None else None
             if self.agent_session is not None:
                 # Load the agent session
                 self.load_agent_session(session=self.agent_session)
@@ -2262,6 +2285,14 @@ class Agent:
                 self.session_name = None
         return self.agent_session
 
+    def get_num_runs_to_load(self) -> Optional[int]:
+        """Returns the number of most recent runs needed from storage, or None if every run is needed"""
+        if self.read_chat_history or self.read_tool_call_history or self.enable_session_summaries:
+            return None
+        if isinstance(self.memory, AgentMemory) and self.memory.create_session_summary:
+            return None
+        return self.num_history_runs
+
     def write_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
         """Save the AgentSession to storage
 
@@ -3279,6 +3310,19 @@ class Agent:
             aggregated_metrics = dict(aggregated_metrics)
         return aggregated_metrics
 
+    def get_session_metrics(self, memory: AgentMemory, new_messages: List[Message]) -> SessionMetrics:
+        """Returns the session metrics after new_messages were added to the AgentMemory"""
+        session_data = self.agent_session.session_data if self.agent_session is not None else None
+        if (
+            self._messages_offset is not None
+            and self.session_metrics is not None
+            and session_data is not None
+            and session_data.get("session_metrics") is not None
+        ):
+            # Memory does not hold the messages left out when reading, so add to the stored session metrics
+            return self.session_metrics + self.calculate_session_metrics(new_messages)
+        return self.calculate_session_metrics(memory.messages)
+
     def calculate_session_metrics(self, messages: List[Message]) -> SessionMetrics:
         session_metrics = SessionMetrics()
         assistant_message_role = self.model.assistant_message_role if self.model is not None else "assistant"
@@ -4080,30 +4124,55 @@ class Agent:
     # Api functions
     ###########################################################################
 
+    def _get_event_session(self, session_id: str, user_id: Optional[str] = None) -> AgentSession:
+        """Get the session sent with API events.
+
+        Telemetry only sends the model and timestamps of the session, so its memory is not serialized for it.
+        """
+        if self.agent_session is not None:
+            return self.agent_session
+        if self.monitoring:
+            return self.get_agent_session(session_id=session_id, user_id=user_id)
+
+        from time import time
+
+        return AgentSession(
+            session_id=session_id,
+            agent_id=self.agent_id,
+            user_id=user_id,
+            team_session_id=self.team_session_id,
+            agent_data=self.get_agent_data(),
+            created_at=int(time()),
+        )
+
     def _log_agent_session(self, session_id: str, user_id: Optional[str] = None):
         if not (self.telemetry or self.monitoring):
             return
 
-        from agno.api.agent import AgentSessionCreate, create_agent_session
+        from agno.api.agent import AgentSessionCreate, queue_agent_session
 
         try:
-            agent_session: AgentSession = self.agent_session or self.get_agent_session(
-                session_id=session_id, user_id=user_id
-            )
-            create_agent_session(
-                session=AgentSessionCreate(
+            agent_session = self._get_event_session(session_id=session_id, user_id=user_id)
+            monitoring = self.monitoring
+            queue_agent_session(
+                session_id=agent_session.session_id,
+                session=lambda: AgentSessionCreate(
                     session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
+                    agent_data=agent_session.to_dict() if monitoring else agent_session.telemetry_data(),
                 ),
-                monitor=self.monitoring,
+                monitor=monitoring,
             )
         except Exception as e:
             log_debug(f"Could not create agent monitor: {e}")
 
-    def _create_run_data(self) -> Dict[str, Any]:
-        """Create and return the run data dictionary."""
+    def _create_run_data(self) -> Callable[[], Dict[str, Any]]:
+        """Snapshot the run, and return a function that creates the run data dictionary from it.
+
+        The next run replaces rather than changes the objects in the snapshot, so the function can serialize them
+        on the API dispatcher thread.
+        """
         run_response_format = "text"
-        self.run_response = cast(RunResponse, self.run_response)
+        run_response = cast(RunResponse, self.run_response)
         if self.response_model is not None:
             run_response_format = "json"
         elif self.markdown:
@@ -4111,23 +4180,28 @@ class Agent:
 
         functions = {}
         if self.model is not None and self.model._functions is not None:
-            functions = {
-                f_name: func.to_dict() for f_name, func in self.model._functions.items() if isinstance(func, Function)
+            functions = dict(self.model._functions)
+        run_input = self.run_input
+        monitoring = self.monitoring
+
+        def run_data() -> Dict[str, Any]:
+            data: Dict[str, Any] = {
+                "functions": {
+                    f_name: func.to_dict() for f_name, func in functions.items() if isinstance(func, Function)
+                },
+                "metrics": run_response.metrics,
             }
 
-        run_data: Dict[str, Any] = {
-            "functions": functions,
-            "metrics": self.run_response.metrics,
-        }
+            if monitoring:
+                data.update(
+                    {
+                        "run_input": run_input,
+                        "run_response": run_response.to_dict(),
+                        "run_response_format": run_response_format,
+                    }
+                )
 
-        if self.monitoring:
-            run_data.update(
-                {
-                    "run_input": self.run_input,
-                    "run_response": self.run_response.to_dict(),
-                    "run_response_format": run_response_format,
-                }
-            )
+            return data
 
         return run_data
 
@@ -4137,53 +4211,31 @@ class Agent:
         if not self.telemetry and not self.monitoring:
             return
 
-        from agno.api.agent import AgentRunCreate, create_agent_run
+        from agno.api.agent import AgentRunCreate, queue_agent_run
 
         try:
             run_data = self._create_run_data()
-            agent_session: AgentSession = self.agent_session or self.get_agent_session(
-                session_id=session_id, user_id=user_id
-            )
-
-            create_agent_run(
-                run=AgentRunCreate(
-                    run_id=self.run_id,
-                    run_data=run_data,
+            agent_session = self._get_event_session(session_id=session_id, user_id=user_id)
+            run_id = self.run_id
+            monitoring = self.monitoring
+
+            queue_agent_run(
+                run_id=run_id,
+                run=lambda: AgentRunCreate(
+                    run_id=run_id,
+                    run_data=run_data(),
                     session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
+                    agent_data=agent_session.to_dict() if monitoring else agent_session.telemetry_data(),
                     team_session_id=agent_session.team_session_id,
                 ),
-                monitor=self.monitoring,
+                monitor=monitoring,
             )
         except Exception as e:
             log_debug(f"Could not create agent event: {e}")
 
     async def _alog_agent_run(self, session_id: str, user_id: Optional[str] = None) -> None:
-        self.set_monitoring()
-
-        if not self.telemetry and not self.monitoring:
-            return
-
-        from agno.api.agent import AgentRunCreate, acreate_agent_run
-
-        try:
-            run_data = self._create_run_data()
-            agent_session: AgentSession = self.agent_session or self.get_agent_session(
-                session_id=session_id, user_id=user_id
-            )
-
-            await acreate_agent_run(
-                run=AgentRunCreate(
-                    run_id=self.run_id,
-                    run_data=run_data,
-                    session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
-                    team_session_id=agent_session.team_session_id,
-                ),
-                monitor=self.monitoring,
-            )
-        except Exception as e:
-            log_debug(f"Could not create agent event: {e}")
+        # Sending happens on the background dispatcher, so there is nothing to await
+        self._log_agent_run(session_id=session_id, user_id=user_id)
 
     ###########################################################################
     # Print Response
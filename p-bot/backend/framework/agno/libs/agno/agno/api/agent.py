@@ -1,4 +1,7 @@
+from typing import Callable, Optional
+
 from agno.api.api import api
+from agno.api.dispatcher import api_dispatcher
 from agno.api.routes import ApiRoutes
 from agno.api.schemas.agent import AgentRunCreate, AgentSessionCreate
 from agno.cli.settings import agno_cli_settings
@@ -50,3 +53,28 @@ async def acreate_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
             )
         except Exception as e:
             log_debug(f"Could not create Agent run: {e}")
+
+
+def queue_agent_session(session_id: str, session: Callable[[], AgentSessionCreate], monitor: bool = False) -> None:
+    """Queue an Agent session to be sent by the background dispatcher. Never blocks.
+
+    session is called on the dispatcher thread, which serializes the session it returns.
+    """
+    if not agno_cli_settings.api_enabled:
+        return
+
+    route = ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE
+    api_dispatcher.submit(route, lambda: {"session": session().model_dump(exclude_none=True)}, key=(route, session_id))
+
+
+def queue_agent_run(run_id: Optional[str], run: Callable[[], AgentRunCreate], monitor: bool = False) -> None:
+    """Queue an Agent run to be sent by the background dispatcher. Never blocks.
+
+    run is called on the dispatcher thread, which serializes the run it returns.
+    """
+    if not agno_cli_settings.api_enabled:
+        return
+
+    route = ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE
+    key = (route, run_id) if run_id else None
+    api_dispatcher.submit(route, lambda: {"run": run().model_dump(exclude_none=True)}, key=key)
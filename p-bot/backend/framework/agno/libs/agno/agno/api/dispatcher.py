@@ -0,0 +1,197 @@
+import atexit
+import threading
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from agno.api.api import api, invalid_response
+from agno.utils.log import log_debug
+
+# The JSON body of an event, or a function returning it that is called on the dispatcher thread
+Payload = Union[Dict[str, Any], Callable[[], Dict[str, Any]]]
+
+
+class ApiEventDispatcher:
+    """
+    Sends telemetry and monitoring events to the Agno API from a background thread.
+
+    Events are queued without blocking the caller and sent in batches over one kept-alive
+    HTTP client. An event submitted with the key of an event still waiting in the queue
+    replaces it, so repeated updates of the same run or session are only sent once.
+    A payload can be a function, so the event is only serialized on the background
+    thread, and not at all if a later event replaces it.
+    When the queue is full new events are dropped instead of blocking. Pending events are
+    flushed when the interpreter exits.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 0.5,
+        shutdown_timeout: float = 5.0,
+        client_factory: Callable[[], Any] = api.AuthenticatedClient,
+    ):
+        """
+        Args:
+            max_queue_size: Maximum number of events waiting to be sent
+            batch_size: Maximum number of events sent per batch
+            flush_interval: Seconds to wait for more events before sending a batch
+            shutdown_timeout: Seconds to wait for pending events when the interpreter exits
+            client_factory: Returns the httpx.Client used to send events
+        """
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.client_factory = client_factory
+
+        self._pending: "OrderedDict[Hashable, Tuple[str, Payload]]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._sequence = count()
+        self._in_flight = 0
+        self._flushing = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._client: Any = None
+
+        # Counters exposed through stats()
+        self.submitted = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.sent = 0
+        self.failed = 0
+        self.batches = 0
+        self.flushes = 0
+
+    def submit(self, route: str, payload: Payload, key: Optional[Hashable] = None) -> bool:
+        """
+        Queue an event to be posted to an API route. Never blocks.
+
+        Args:
+            route: The API route to post to
+            payload: The JSON body, or a function returning it
+            key: Identifies the event for coalescing. An event with the same key still in the queue is replaced.
+
+        Returns:
+            bool: False if the event was dropped because the queue is full or the dispatcher is stopped.
+        """
+        with self._condition:
+            if self._stopped:
+                self.dropped += 1
+                return False
+            if key is not None and key in self._pending:
+                self._pending[key] = (route, payload)
+                self.coalesced += 1
+                return True
+            if len(self._pending) >= self.max_queue_size:
+                self.dropped += 1
+                return False
+            self._pending[key if key is not None else ("event", next(self._sequence))] = (route, payload)
+            self.submitted += 1
+            self._start()
+            self._condition.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send all queued events now and wait until they have been sent.
+
+        Args:
+            timeout: Maximum number of seconds to wait. None waits until done.
+
+        Returns:
+            bool: True if the queue was emptied within the timeout.
+        """
+        with self._condition:
+            if self._thread is None:
+                return not self._pending
+            self._flushing = True
+            self.flushes += 1
+            self._condition.notify_all()
+            done = self._condition.wait_for(lambda: not self._pending and self._in_flight == 0, timeout=timeout)
+            self._flushing = False
+            return done
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Flush pending events, then stop the background thread. Later events are dropped."""
+        self.flush(timeout=self.shutdown_timeout if timeout is None else timeout)
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns dispatcher statistics.
+
+        Returns:
+            Dict[str, Any]: Queue size and event counters.
+        """
+        with self._condition:
+            return {
+                "queued": len(self._pending),
+                "submitted": self.submitted,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "sent": self.sent,
+                "failed": self.failed,
+                "batches": self.batches,
+                "flushes": self.flushes,
+            }
+
+    def _start(self) -> None:
+        # Called with the condition held
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="agno-api-dispatcher", daemon=True)
+            self._thread.start()
+            atexit.register(self.shutdown)
+
+    def _next_batch(self) -> Optional[List[Tuple[str, Payload]]]:
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending or self._stopped)
+            if self._stopped and not self._pending:
+                return None
+            # Give more events a moment to arrive, so they are sent together and coalesced
+            self._condition.wait_for(
+                lambda: len(self._pending) >= self.batch_size or self._flushing or self._stopped,
+                timeout=self.flush_interval,
+            )
+            batch = [self._pending.popitem(last=False)[1] for _ in range(min(self.batch_size, len(self._pending)))]
+            self._in_flight = len(batch)
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            sent = self._send(batch)
+            with self._condition:
+                self.sent += sent
+                self.failed += len(batch) - sent
+                self.batches += 1
+                self._in_flight = 0
+                self._condition.notify_all()
+        if self._client is not None:
+            self._client.close()
+
+    def _send(self, batch: List[Tuple[str, Payload]]) -> int:
+        sent = 0
+        for route, payload in batch:
+            try:
+                body = payload() if callable(payload) else payload
+                if self._client is None:
+                    self._client = self.client_factory()
+                response = self._client.post(route, json=body)
+                if invalid_response(response):
+                    log_debug(f"Could not send event to {route}: {response.status_code}")
+                    continue
+                sent += 1
+            except Exception as e:
+                log_debug(f"Could not send event to {route}: {e}")
+        return sent
+
+
+api_dispatcher = ApiEventDispatcher()
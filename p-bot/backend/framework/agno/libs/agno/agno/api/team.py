@@ -1,4 +1,7 @@
+from typing import Callable, Optional
+
 from agno.api.api import api
+from agno.api.dispatcher import api_dispatcher
 from agno.api.routes import ApiRoutes
 from agno.api.schemas.team import TeamRunCreate, TeamSessionCreate
 from agno.cli.settings import agno_cli_settings
@@ -53,3 +56,28 @@ def upsert_team_session(session: TeamSessionCreate, monitor: bool = False) -> No
         except Exception as e:
             log_debug(f"Could not create Agent session: {e}")
     return
+
+
+def queue_team_run(run_id: Optional[str], run: Callable[[], TeamRunCreate], monitor: bool = False) -> None:
+    """Queue a Team run to be sent by the background dispatcher. Never blocks.
+
+    run is called on the dispatcher thread, which serializes the run it returns.
+    """
+    if not agno_cli_settings.api_enabled:
+        return
+
+    route = ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE
+    key = (route, run_id) if run_id else None
+    api_dispatcher.submit(route, lambda: {"run": run().model_dump(exclude_none=True)}, key=key)
+
+
+def queue_team_session(session_id: str, session: Callable[[], TeamSessionCreate], monitor: bool = False) -> None:
+    """Queue a Team session to be sent by the background dispatcher. Never blocks.
+
+    session is called on the dispatcher thread, which serializes the session it returns.
+    """
+    if not agno_cli_settings.api_enabled or not monitor:
+        return
+
+    route = ApiRoutes.TEAM_SESSION_CREATE
+    api_dispatcher.submit(route, lambda: {"session": session().model_dump(exclude_none=True)}, key=(route, session_id))
@@ -1,7 +1,14 @@
 import asyncio
+import atexit
+import multiprocessing
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from time import sleep
-from typing import IO, Any, List, Union
+from typing import IO, Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
 from agno.document.base import Document
 from agno.document.reader.base import Reader
@@ -14,94 +21,253 @@ except ImportError:
     raise ImportError("`pypdf` not installed. Please install it via `pip install pypdf`.")
 
 
-def process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
-    try:
-        import rapidocr_onnxruntime as rapidocr
-    except ImportError:
-        raise ImportError(
-            "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
-        )
-    ocr = rapidocr.RapidOCR()
+_ocr: Any = None
+
+
+def _get_ocr() -> Any:
+    """Returns a RapidOCR instance, loading the OCR models once per process."""
+    global _ocr
+    if _ocr is None:
+        try:
+            import rapidocr_onnxruntime as rapidocr
+        except ImportError:
+            raise ImportError(
+                "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
+            )
+        _ocr = rapidocr.RapidOCR()
+    return _ocr
+
+
+def _extract_page_content(page: Any, extract_images: bool) -> str:
+    """Extract the text of a page and, optionally, the OCR text of its images."""
     page_text = page.extract_text() or ""
-    images_text_list = []
+    if not extract_images:
+        return page_text
 
-    # Extract and process images
+    ocr = _get_ocr()
+    images_text_list: List[str] = []
     for image_object in page.images:
-        image_data = image_object.data
-
         # Perform OCR on the image
-        ocr_result, elapse = ocr(image_data)
+        ocr_result, _ = ocr(image_object.data)
 
         # Extract text from OCR result
         if ocr_result:
             images_text_list += [item[1] for item in ocr_result]
 
-    images_text = "\n".join(images_text_list)
-    content = page_text + "\n" + images_text
+    return page_text + "\n" + "\n".join(images_text_list)
 
-    # Append the document
+
+def process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
     return Document(
         name=doc_name,
         id=f"{doc_name}_{page_number}",
         meta_data={"page": page_number},
-        content=content,
+        content=_extract_page_content(page, extract_images=True),
     )
 
 
 async def async_process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
-    try:
-        import rapidocr_onnxruntime as rapidocr
-    except ImportError:
-        raise ImportError(
-            "`rapidocr_onnxruntime` not installed. Please install it via `pip install rapidocr_onnxruntime`."
-        )
-    ocr = rapidocr.RapidOCR()
+    # Text extraction and OCR are CPU bound, so run them off the event loop
+    return await asyncio.to_thread(process_image_page, doc_name, page_number, page)
 
-    page_text = page.extract_text() or ""
-    images_text_list: List = []
 
-    # Process images in parallel
-    async def process_image(image_data: bytes) -> List[str]:
-        ocr_result, _ = ocr(image_data)
-        return [item[1] for item in ocr_result] if ocr_result else []
+# The PDF each worker process last opened, keyed by (path, mtime, size)
+_worker_pdf: Dict[Tuple[str, int, int], Any] = {}
 
-    image_tasks = [process_image(image.data) for image in page.images]
-    images_results = await asyncio.gather(*image_tasks)
 
-    for result in images_results:
-        images_text_list.extend(result)
+def _extract_pages(path: str, page_numbers: List[int], extract_images: bool) -> List[str]:
+    """Worker process entry point: extract the content of some pages of a PDF file."""
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    doc_reader = _worker_pdf.get(key)
+    if doc_reader is None:
+        # Keep a single open PDF per worker to bound memory
+        _worker_pdf.clear()
+        doc_reader = DocumentReader(path)
+        _worker_pdf[key] = doc_reader
+    return [_extract_page_content(doc_reader.pages[page_number - 1], extract_images) for page_number in page_numbers]
 
-    images_text = "\n".join(images_text_list)
-    content = page_text + "\n" + images_text
 
-    return Document(
-        name=doc_name,
-        id=f"{doc_name}_{page_number}",
-        meta_data={"page": page_number},
-        content=content,
-    )
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
 
 
+def get_pdf_process_pool(num_workers: int) -> ProcessPoolExecutor:
+    """Returns the shared process pool for PDF ingestion with the given number of workers."""
+    pool = _process_pools.get(num_workers)
+    if pool is None:
+        # Spawn instead of fork, so workers never inherit locks held by threads of the parent
+        pool = ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("spawn"))
+        _process_pools[num_workers] = pool
+    return pool
+
+
+@atexit.register
+def shutdown_pdf_process_pools() -> None:
+    """Shut down the PDF ingestion process pools."""
+    for pool in _process_pools.values():
+        pool.shutdown(cancel_futures=True)
+    _process_pools.clear()
+
+
+def _get_doc_name(pdf: Union[str, Path, IO[Any]]) -> str:
+    try:
+        if isinstance(pdf, str):
+            return pdf.split("/")[-1].split(".")[0].replace(" ", "_")
+        return pdf.name.split(".")[0]
+    except Exception:
+        return "pdf"
+
+
+@dataclass
 class BasePDFReader(Reader):
+    # Number of worker processes for text extraction and OCR. None reads in the calling process.
+    num_workers: Optional[int] = None
+    # Number of pages sent to a worker at a time
+    pages_per_task: int = 8
+    # Maximum number of tasks in flight, which bounds memory on very large PDFs. Defaults to 2 * num_workers.
+    max_pending_tasks: Optional[int] = None
+
+    # Whether to OCR the images on each page
+    extract_images = False
+
     def _build_chunked_documents(self, documents: List[Document]) -> List[Document]:
         chunked_documents: List[Document] = []
         for document in documents:
             chunked_documents.extend(self.chunk_document(document))
         return chunked_documents
 
+    def _build_page_documents(self, doc_name: str, page_numbers: List[int], contents: List[str]) -> List[Document]:
+        documents = [
+            Document(
+                name=doc_name,
+                id=f"{doc_name}_{page_number}",
+                meta_data={"page": page_number},
+                content=content,
+            )
+            for page_number, content in zip(page_numbers, contents)
+        ]
+        if self.chunk:
+            return self._build_chunked_documents(documents)
+        return documents
+
+    def _open_local(self, pdf: Union[str, Path, IO[Any]]) -> Tuple[Optional[str], Optional[str]]:
+        """Returns a file path the worker processes can open, and a temporary file to remove afterwards."""
+        if isinstance(pdf, (str, Path)):
+            return str(pdf), None
+        # Spill file objects to disk once instead of sending the bytes with every task
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            pdf.seek(0)
+            tmp.write(pdf.read())
+        return tmp.name, tmp.name
+
+    def _page_groups(self, path: str) -> List[List[int]]:
+        page_count = len(DocumentReader(path).pages)
+        pages_per_task = max(1, self.pages_per_task)
+        return [
+            list(range(first, min(first + pages_per_task, page_count + 1)))
+            for first in range(1, page_count + 1, pages_per_task)
+        ]
+
+    def _submit(self, pool: ProcessPoolExecutor, path: str, page_numbers: List[int]) -> Tuple[List[int], Future]:
+        return page_numbers, pool.submit(_extract_pages, path, page_numbers, self.extract_images)
+
+    def iter_read(self, pdf: Union[str, Path, IO[Any]], doc_name: Optional[str] = None) -> Iterator[List[Document]]:
+        """
+        Read a PDF on the worker process pool, yielding the documents of each group of pages as soon as
+        it is ready. Groups are yielded in page order and at most max_pending_tasks groups are in flight.
+
+        Args:
+            pdf: Path to the PDF or a file object
+            doc_name: Name of the documents. Derived from the file name if not given.
+
+        Returns:
+            Iterator[List[Document]]: Iterator yielding the (chunked) documents of each group of pages
+        """
+        doc_name = doc_name or _get_doc_name(pdf)
+        log_info(f"Reading: {doc_name}")
+        path, tmp_file = self._open_local(pdf)
+        pending: Deque[Tuple[List[int], Future]] = deque()
+        try:
+            try:
+                groups = iter(self._page_groups(path))  # type: ignore
+            except PdfStreamError as e:
+                logger.error(f"Error reading PDF: {e}")
+                return
+
+            num_workers = self.num_workers or os.cpu_count() or 1
+            pool = get_pdf_process_pool(num_workers)
+            max_pending = self.max_pending_tasks or 2 * num_workers
+            for page_numbers in groups:
+                pending.append(self._submit(pool, path, page_numbers))  # type: ignore
+                if len(pending) >= max_pending:
+                    break
+            while pending:
+                page_numbers, future = pending.popleft()
+                contents = future.result()
+                next_group = next(groups, None)
+                if next_group is not None:
+                    pending.append(self._submit(pool, path, next_group))  # type: ignore
+                yield self._build_page_documents(doc_name, page_numbers, contents)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            if tmp_file is not None:
+                os.unlink(tmp_file)
+
+    async def async_iter_read(
+        self, pdf: Union[str, Path, IO[Any]], doc_name: Optional[str] = None
+    ) -> AsyncIterator[List[Document]]:
+        """
+        Async version of iter_read. Pages are processed on the worker process pool, so the event loop
+        is never blocked by text extraction or OCR.
+
+        Args:
+            pdf: Path to the PDF or a file object
+            doc_name: Name of the documents. Derived from the file name if not given.
+
+        Returns:
+            AsyncIterator[List[Document]]: Iterator yielding the (chunked) documents of each group of pages
+        """
+        doc_name = doc_name or _get_doc_name(pdf)
+        log_info(f"Reading: {doc_name}")
+        path, tmp_file = await asyncio.to_thread(self._open_local, pdf)
+        pending: Deque[Tuple[List[int], Future]] = deque()
+        try:
+            try:
+                groups = iter(await asyncio.to_thread(self._page_groups, path))  # type: ignore
+            except PdfStreamError as e:
+                logger.error(f"Error reading PDF: {e}")
+                return
+
+            num_workers = self.num_workers or os.cpu_count() or 1
+            pool = get_pdf_process_pool(num_workers)
+            max_pending = self.max_pending_tasks or 2 * num_workers
+            for page_numbers in groups:
+                pending.append(self._submit(pool, path, page_numbers))  # type: ignore
+                if len(pending) >= max_pending:
+                    break
+            while pending:
+                page_numbers, future = pending.popleft()
+                contents = await asyncio.wrap_future(future)
+                next_group = next(groups, None)
+                if next_group is not None:
+                    pending.append(self._submit(pool, path, next_group))  # type: ignore
+                yield self._build_page_documents(doc_name, page_numbers, contents)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            if tmp_file is not None:
+                os.unlink(tmp_file)
+
 
 class PDFReader(BasePDFReader):
     """Reader for PDF files"""
 
     def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
+        if self.num_workers:
+            return [document for documents in self.iter_read(pdf) for document in documents]
 
+        doc_name = _get_doc_name(pdf)
         log_info(f"Reading: {doc_name}")
 
         try:
@@ -125,14 +291,10 @@ class PDFReader(BasePDFReader):
         return documents
 
     async def async_read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
+        if self.num_workers:
+            return [document async for documents in self.async_iter_read(pdf) for document in documents]
 
+        doc_name = _get_doc_name(pdf)
         log_info(f"Reading: {doc_name}")
 
         try:
@@ -267,18 +429,16 @@ class PDFUrlReader(BasePDFReader):
 class PDFImageReader(BasePDFReader):
     """Reader for PDF files with text and images extraction"""
 
+    extract_images = True
+
     def read(self, pdf: Union[str, Path, IO[Any]]) -> List[Document]:
         if not pdf:
             raise ValueError("No pdf provided")
 
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
+        if self.num_workers:
+            return [document for documents in self.iter_read(pdf) for document in documents]
 
+        doc_name = _get_doc_name(pdf)
         log_info(f"Reading: {doc_name}")
         doc_reader = DocumentReader(pdf)
 
@@ -295,14 +455,10 @@ class PDFImageReader(BasePDFReader):
         if not pdf:
             raise ValueError("No pdf provided")
 
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
+        if self.num_workers:
+            return [document async for documents in self.async_iter_read(pdf) for document in documents]
 
+        doc_name = _get_doc_name(pdf)
         log_info(f"Reading: {doc_name}")
         doc_reader = DocumentReader(pdf)
 
@@ -1,8 +1,8 @@
 from io import BytesIO
-from typing import List
+from typing import Iterator, List
 
 from agno.document.base import Document
-from agno.document.reader.base import Reader
+from agno.document.reader.pdf_reader import BasePDFReader
 from agno.utils.log import log_info
 
 try:
@@ -16,10 +16,20 @@ except ImportError:
     raise ImportError("`pypdf` not installed. Please install it via `pip install pypdf`.")
 
 
-class S3PDFReader(Reader):
+class S3PDFReader(BasePDFReader):
     """Reader for PDF files on S3"""
 
+    def iter_read(self, s3_object: S3Object) -> Iterator[List[Document]]:  # type: ignore[override]
+        """Download a PDF from S3 and read it on the worker process pool, yielding documents per group of pages."""
+        log_info(f"Reading: {s3_object.uri}")
+        object_body = s3_object.get_resource().get()["Body"]
+        doc_name = s3_object.name.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
+        yield from super().iter_read(BytesIO(object_body.read()), doc_name=doc_name)
+
     def read(self, s3_object: S3Object) -> List[Document]:
+        if self.num_workers:
+            return [document for documents in self.iter_read(s3_object) for document in documents]
+
         try:
             log_info(f"Reading: {s3_object.uri}")
 
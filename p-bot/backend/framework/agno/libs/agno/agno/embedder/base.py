@@ -1,5 +1,12 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from agno.utils.log import log_debug, logger
+
+if TYPE_CHECKING:
+    from agno.document.base import Document
 
 
 @dataclass
@@ -7,9 +14,150 @@ class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Most texts sent in one batch embedding request
+    batch_size: int = 100
+    # Most (estimated) tokens sent in one batch embedding request
+    max_batch_tokens: int = 100_000
+    # Most batch embedding requests in flight at once
+    max_concurrency: int = 4
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts, in order."""
+        return self.get_embeddings_and_usage(texts)[0]
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        """Embed several texts, in order, and return the combined usage.
+
+        Embedders whose API accepts many inputs per request override this to
+        make a single request; the default embeds the texts one at a time.
+        """
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for text in texts:
+            embedding, usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            usages.append(usage)
+        return embeddings, sum_usage(usages)
+
+    def get_embeddings_batched(self, texts: List[str]) -> List[List[float]]:
+        """Embed any number of texts, in order, in batches that respect batch_size and max_batch_tokens."""
+        embeddings: List[List[float]] = []
+        for start, end in self.get_batches(texts):
+            embeddings.extend(self.get_embeddings(texts[start:end]))
+        return embeddings
+
+    def get_batches(self, texts: Sequence[str]) -> List[Tuple[int, int]]:
+        """Split texts into batches that respect batch_size and max_batch_tokens.
+
+        Returns:
+            List of (start, end) index ranges, in order
+        """
+        batches: List[Tuple[int, int]] = []
+        start = 0
+        batch_tokens = 0
+        for i, text in enumerate(texts):
+            tokens = estimate_tokens(text)
+            if i > start and (i - start >= self.batch_size or batch_tokens + tokens > self.max_batch_tokens):
+                batches.append((start, i))
+                start = i
+                batch_tokens = 0
+            batch_tokens += tokens
+        if start < len(texts):
+            batches.append((start, len(texts)))
+        return batches
+
+    def _embed_batch(self, documents: List["Document"]) -> None:
+        """Embed one batch of documents, falling back to one request per document if the batch fails."""
+        try:
+            embeddings, usage = self.get_embeddings_and_usage([document.content for document in documents])
+            if len(embeddings) != len(documents):
+                raise ValueError(f"Expected {len(documents)} embeddings, got {len(embeddings)}")
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            logger.warning(f"Batch embedding of {len(documents)} documents failed, embedding one at a time: {e}")
+            for document in documents:
+                document.embed(embedder=self)
+            return
+
+        usages = split_usage(usage, [estimate_tokens(document.content) for document in documents])
+        for document, embedding, document_usage in zip(documents, embeddings, usages):
+            document.embedding = embedding
+            document.usage = document_usage
+
+    def embed_documents(self, documents: List["Document"]) -> None:
+        """Embed documents in token-aware batches, running up to max_concurrency batches at once.
+
+        Each document's usage is its share of its batch's usage.
+        """
+        if not documents:
+            return
+        batches = [
+            documents[start:end] for start, end in self.get_batches([document.content for document in documents])
+        ]
+        log_debug(f"Embedding {len(documents)} documents in {len(batches)} batches")
+        if len(batches) == 1 or self.max_concurrency <= 1:
+            for batch in batches:
+                self._embed_batch(batch)
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as executor:
+            # Consume the results so that errors are raised here
+            list(executor.map(self._embed_batch, batches))
+
+    async def async_embed_documents(self, documents: List["Document"]) -> None:
+        """Embed documents in token-aware batches without blocking the event loop."""
+        if not documents:
+            return
+        batches = [
+            documents[start:end] for start, end in self.get_batches([document.content for document in documents])
+        ]
+        log_debug(f"Embedding {len(documents)} documents in {len(batches)} batches")
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def embed_batch(batch: List["Document"]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(self._embed_batch, batch)
+
+        await asyncio.gather(*(embed_batch(batch) for batch in batches))
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a text, about four characters per token."""
+    return len(text) // 4 + 1
+
+
+def sum_usage(usages: Sequence[Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """Add up the numeric fields of several usage dictionaries."""
+    total: Dict[str, Any] = {}
+    for usage in usages:
+        for key, value in (usage or {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                total[key] = total.get(key, 0) + value
+            elif key not in total:
+                total[key] = value
+    return total or None
+
+
+def split_usage(usage: Optional[Dict[str, Any]], weights: Sequence[int]) -> List[Optional[Dict[str, Any]]]:
+    """Share a batch's usage between its texts in proportion to their weights."""
+    if not usage:
+        return [None] * len(weights)
+    total_weight = sum(weights) or 1
+    shares: List[Optional[Dict[str, Any]]] = []
+    for weight in weights:
+        share: Dict[str, Any] = {}
+        for key, value in usage.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                share[key] = value
+            elif isinstance(value, int):
+                share[key] = round(value * weight / total_weight)
+            else:
+                share[key] = value * weight / total_weight
+        shares.append(share)
+    return shares
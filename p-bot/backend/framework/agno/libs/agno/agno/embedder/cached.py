@@ -0,0 +1,242 @@
+import hashlib
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from agno.embedder.base import Embedder
+from agno.utils.log import log_debug, logger
+
+if TYPE_CHECKING:
+    from agno.document.base import Document
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Embedder that caches the embeddings of another embedder by content.
+
+    Embeddings are keyed by (embedder id, dimensions, text hash). Lookups go to an
+    in-memory LRU first and then to an optional SQLite file, so reloading a
+    knowledge base or repeating a query embeds only text that was never seen before.
+    Several CachedEmbedders, even for different embedders, can share one db_file.
+    """
+
+    embedder: Optional[Embedder] = None
+    # SQLite file holding the cache; if None, embeddings are only cached in memory
+    db_file: Optional[str] = None
+    table_name: str = "embedding_cache"
+    # Most embeddings kept in the in-memory tier
+    max_memory_entries: int = 10_000
+    # Identifies the embedding model in the cache key; derived from the embedder if not set
+    embedder_id: Optional[str] = None
+
+    memory_hits: int = field(default=0, init=False)
+    disk_hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if self.embedder is None:
+            raise ValueError("CachedEmbedder requires an embedder")
+        # Batch like the wrapped embedder would
+        self.dimensions = self.embedder.dimensions
+        self.batch_size = self.embedder.batch_size
+        self.max_batch_tokens = self.embedder.max_batch_tokens
+        self.max_concurrency = self.embedder.max_concurrency
+        if self.embedder_id is None:
+            model_id = getattr(self.embedder, "id", None)
+            self.embedder_id = (
+                f"{type(self.embedder).__name__}:{model_id}" if model_id else type(self.embedder).__name__
+            )
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if self.db_file is not None:
+            db_path = Path(self.db_file).resolve()
+            # Ensure the directory exists
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(db_path), check_same_thread=False)
+            # Let other processes read while one writes
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "embedder_id TEXT NOT NULL, "
+                "dimensions INTEGER NOT NULL, "
+                "text_hash TEXT NOT NULL, "
+                "embedding BLOB NOT NULL, "
+                "PRIMARY KEY (embedder_id, dimensions, text_hash))"
+            )
+            self._connection.commit()
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _memory_key(self, text_hash: str) -> str:
+        return f"{self.embedder_id}:{self.dimensions or 0}:{text_hash}"
+
+    def _get_many(self, text_hashes: Sequence[str]) -> Dict[str, List[float]]:
+        """Look up cached embeddings, checking memory before the SQLite file."""
+        found: Dict[str, List[float]] = {}
+        missing: List[str] = []
+        with self._lock:
+            for text_hash in dict.fromkeys(text_hashes):
+                embedding = self._memory.get(self._memory_key(text_hash))
+                if embedding is None:
+                    missing.append(text_hash)
+                    continue
+                self._memory.move_to_end(self._memory_key(text_hash))
+                found[text_hash] = embedding
+            self.memory_hits += len(found)
+
+            if missing and self._connection is not None:
+                # Stay under SQLite's limit on query parameters
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start : start + 500]
+                    rows = self._connection.execute(
+                        f"SELECT text_hash, embedding FROM {self.table_name} "
+                        f"WHERE embedder_id = ? AND dimensions = ? AND text_hash IN ({', '.join('?' * len(chunk))})",
+                        [self.embedder_id, self.dimensions or 0, *chunk],
+                    ).fetchall()
+                    for text_hash, blob in rows:
+                        embedding = array("d", blob).tolist()
+                        found[text_hash] = embedding
+                        self.disk_hits += 1
+                        self._remember(text_hash, embedding)
+            self.misses += sum(1 for text_hash in missing if text_hash not in found)
+        return found
+
+    def _remember(self, text_hash: str, embedding: List[float]) -> None:
+        """Add an embedding to the in-memory tier. Callers hold the lock."""
+        key = self._memory_key(text_hash)
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _put_many(self, items: Sequence[Tuple[str, List[float]]]) -> None:
+        """Store new embeddings in memory and in the SQLite file."""
+        # Empty embeddings mean the request failed; do not cache them
+        items = [(text_hash, embedding) for text_hash, embedding in items if embedding]
+        if not items:
+            return
+        with self._lock:
+            for text_hash, embedding in items:
+                self._remember(text_hash, embedding)
+            if self._connection is not None:
+                try:
+                    self._connection.executemany(
+                        f"INSERT OR REPLACE INTO {self.table_name} (embedder_id, dimensions, text_hash, embedding) "
+                        "VALUES (?, ?, ?, ?)",
+                        [
+                            (self.embedder_id, self.dimensions or 0, text_hash, array("d", embedding).tobytes())
+                            for text_hash, embedding in items
+                        ],
+                    )
+                    self._connection.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not write embeddings to the cache: {e}")
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        text_hash = self.hash_text(text)
+        cached = self._get_many([text_hash]).get(text_hash)
+        if cached is not None:
+            # A cached embedding costs no tokens
+            return cached, None
+        embedding, usage = self.embedder.get_embedding_and_usage(text)  # type: ignore
+        self._put_many([(text_hash, embedding)])
+        return embedding, usage
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if not texts:
+            return [], None
+        text_hashes = [self.hash_text(text) for text in texts]
+        found = self._get_many(text_hashes)
+
+        # Embed each missing text once, even if it appears several times
+        missing: Dict[str, str] = {}
+        for text, text_hash in zip(texts, text_hashes):
+            if text_hash not in found:
+                missing.setdefault(text_hash, text)
+        usage = None
+        if missing:
+            embeddings, usage = self.embedder.get_embeddings_and_usage(list(missing.values()))  # type: ignore
+            new_items = list(zip(missing.keys(), embeddings))
+            self._put_many(new_items)
+            found.update(new_items)
+        return [found[text_hash] for text_hash in text_hashes], usage
+
+    def _split_cached(self, documents: List["Document"]) -> List["Document"]:
+        """Set the embedding of documents already in the cache and return the others."""
+        found = self._get_many([self.hash_text(document.content) for document in documents])
+        uncached: List["Document"] = []
+        for document in documents:
+            embedding = found.get(self.hash_text(document.content))
+            if embedding is None:
+                uncached.append(document)
+            else:
+                document.embedding = embedding
+                document.usage = None
+        log_debug(f"Embedding cache: {len(documents) - len(uncached)} of {len(documents)} documents cached")
+        return uncached
+
+    def _embed_batch(self, documents: List["Document"]) -> None:
+        """Embed a batch of uncached documents with the wrapped embedder and cache the results."""
+        # Embed each distinct text once and copy the result to its duplicates
+        unique: Dict[str, "Document"] = {}
+        for document in documents:
+            unique.setdefault(document.content, document)
+        self.embedder._embed_batch(list(unique.values()))  # type: ignore
+        for document in documents:
+            if document is not unique[document.content]:
+                document.embedding = unique[document.content].embedding
+                document.usage = None
+        self._put_many([(self.hash_text(content), document.embedding) for content, document in unique.items()])  # type: ignore
+
+    def embed_documents(self, documents: List["Document"]) -> None:
+        """Embed documents, sending only those missing from the cache to the embedder."""
+        if not documents:
+            return
+        super().embed_documents(self._split_cached(documents))
+
+    async def async_embed_documents(self, documents: List["Document"]) -> None:
+        """Embed documents without blocking the event loop, sending only those missing from the cache."""
+        if not documents:
+            return
+        await super().async_embed_documents(self._split_cached(documents))
+
+    def clear(self) -> None:
+        """Remove this embedder's entries from the cache and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            if self._connection is not None:
+                self._connection.execute(
+                    f"DELETE FROM {self.table_name} WHERE embedder_id = ? AND dimensions = ?",
+                    (self.embedder_id, self.dimensions or 0),
+                )
+                self._connection.commit()
+            self.memory_hits = self.disk_hits = self.misses = 0
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit and miss counters."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
@@ -20,6 +20,8 @@ class CohereEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     cohere_client: Optional[CohereClient] = None
+    # Cohere accepts at most 96 texts per embed request
+    batch_size: int = 96
 
     @property
     def client(self) -> CohereClient:
@@ -31,7 +33,9 @@ class CohereEmbedder(Embedder):
         self.cohere_client = CohereClient(**client_params)
         return self.cohere_client
 
-    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+    def response(
+        self, text: Union[str, List[str]]
+    ) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
         request_params: Dict[str, Any] = {}
 
         if self.id:
@@ -42,7 +46,7 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        return self.client.embed(texts=[text] if isinstance(text, str) else text, **request_params)
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -71,3 +75,17 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict[str, Any]]]:
+        if not texts:
+            return [], None
+        response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=texts)
+        embeddings: List[List[float]] = []
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            embeddings = response.embeddings
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            embeddings = response.embeddings.float_ or []
+        usage = response.meta.billed_units if response.meta else None
+        if usage:
+            return embeddings, usage.model_dump()
+        return embeddings, None
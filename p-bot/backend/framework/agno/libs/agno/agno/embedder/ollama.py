@@ -88,3 +88,19 @@ class OllamaEmbedder(Embedder):
         embedding = self.get_embedding(text=text)
         usage = None
         return embedding, usage
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if not texts:
+            return [], None
+        kwargs: Dict[str, Any] = {}
+        if self.options is not None:
+            kwargs["options"] = self.options
+        response = self.client.embed(input=texts, model=self.id, **kwargs)
+        embeddings = response["embeddings"] if response and "embeddings" in response else []
+        results: List[List[float]] = []
+        for embedding in embeddings:
+            if len(embedding) != self.dimensions:
+                logger.warning(f"Expected embedding dimension {self.dimensions}, but got {len(embedding)}")
+                embedding = []
+            results.append(list(embedding))
+        return results, None
@@ -24,10 +24,17 @@ except ImportError:
 class SentenceTransformerEmbedder(Embedder):
     id: str = "sentence-transformers/all-MiniLM-L6-v2"
     sentence_transformer_client: Optional[SentenceTransformer] = None
+    # The model runs locally; batches are encoded one after another
+    max_concurrency: int = 1
+
+    @property
+    def client(self) -> SentenceTransformer:
+        if self.sentence_transformer_client is None:
+            self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.id)
+        return self.sentence_transformer_client
 
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        model = SentenceTransformer(model_name_or_path=self.id)
-        embedding = model.encode(text)
+        embedding = self.client.encode(text)
         try:
             return embedding  # type: ignore
         except Exception as e:
@@ -36,3 +43,9 @@ class SentenceTransformerEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if not texts:
+            return [], None
+        embeddings = self.client.encode(texts, batch_size=self.batch_size)
+        return [embedding.tolist() for embedding in embeddings], None
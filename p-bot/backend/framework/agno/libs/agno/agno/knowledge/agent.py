@@ -1,5 +1,7 @@
 import asyncio
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+import json
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Union
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -22,6 +24,9 @@ class AgentKnowledge(BaseModel):
     num_documents: int = 5
     # Number of documents to optimize the vector db on
     optimize_on: Optional[int] = 1000
+    # JSON file listing the content hashes loaded into the vector db.
+    # If set, load() only inserts documents that are new since the last load and deletes those that were removed.
+    manifest_file: Optional[Union[str, Path]] = None
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
 
@@ -83,6 +88,143 @@ class AgentKnowledge(BaseModel):
             logger.error(f"Error searching for documents: {e}")
             return []
 
+    def search_many(
+        self, queries: List[str], num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Returns relevant documents for each of several queries, in order.
+        The queries are embedded in one batch and searched together where the vector db supports it.
+        """
+        try:
+            if self.vector_db is None:
+                logger.warning("No vector db provided")
+                return [[] for _ in queries]
+
+            _num_documents = num_documents or self.num_documents
+            log_debug(f"Getting {_num_documents} relevant documents for {len(queries)} queries")
+            return self.vector_db.search_many(queries=queries, limit=_num_documents, filters=filters)
+        except Exception as e:
+            logger.error(f"Error searching for documents: {e}")
+            return [[] for _ in queries]
+
+    async def async_search_many(
+        self, queries: List[str], num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Returns relevant documents for each of several queries, in order"""
+        try:
+            if self.vector_db is None:
+                logger.warning("No vector db provided")
+                return [[] for _ in queries]
+
+            _num_documents = num_documents or self.num_documents
+            log_debug(f"Getting {_num_documents} relevant documents for {len(queries)} queries")
+            try:
+                return await self.vector_db.async_search_many(queries=queries, limit=_num_documents, filters=filters)
+            except NotImplementedError:
+                logger.info("Vector db does not support async search")
+                return self.search_many(queries=queries, num_documents=_num_documents, filters=filters)
+        except Exception as e:
+            logger.error(f"Error searching for documents: {e}")
+            return [[] for _ in queries]
+
+    def _filter_existing(self, documents: List[Document]) -> List[Document]:
+        """Returns the documents that are not in the vector db, dropping duplicates.
+        Uses one bulk ids_exist lookup when the vector db supports it.
+        """
+        if self.vector_db is None:
+            return documents
+        hashes = [self.vector_db.content_hash(document) for document in documents]
+        try:
+            existing: Optional[Set[str]] = self.vector_db.ids_exist(list(dict.fromkeys(hashes)))
+        except NotImplementedError:
+            existing = None
+
+        # Use set for O(1) lookups
+        seen_hashes: Set[str] = set()
+        documents_to_load = []
+        for document, content_hash in zip(documents, hashes):
+            if content_hash in seen_hashes:
+                continue
+            seen_hashes.add(content_hash)
+            if existing is not None:
+                if content_hash not in existing:
+                    documents_to_load.append(document)
+            elif not self.vector_db.doc_exists(document):
+                documents_to_load.append(document)
+        return documents_to_load
+
+    async def _async_filter_existing(self, documents: List[Document]) -> List[Document]:
+        """Returns the documents that are not in the vector db, dropping duplicates."""
+        if self.vector_db is None:
+            return documents
+        hashes = [self.vector_db.content_hash(document) for document in documents]
+        try:
+            existing: Set[str] = await self.vector_db.async_ids_exist(list(dict.fromkeys(hashes)))
+        except NotImplementedError:
+            try:
+                existing = self.vector_db.ids_exist(list(dict.fromkeys(hashes)))
+            except NotImplementedError:
+                # Parallelize existence checks using asyncio.gather
+                try:
+                    existence_checks = await asyncio.gather(
+                        *[self.vector_db.async_doc_exists(document) for document in documents], return_exceptions=True
+                    )
+                except NotImplementedError:
+                    logger.warning("Vector db does not support async doc_exists")
+                    existence_checks = [self.vector_db.doc_exists(document) for document in documents]
+                existing = {
+                    content_hash
+                    for content_hash, exists in zip(hashes, existence_checks)
+                    if isinstance(exists, bool) and exists
+                }
+
+        # Use set for O(1) lookups
+        seen_hashes: Set[str] = set()
+        documents_to_load = []
+        for document, content_hash in zip(documents, hashes):
+            if content_hash not in seen_hashes and content_hash not in existing:
+                documents_to_load.append(document)
+            seen_hashes.add(content_hash)
+        return documents_to_load
+
+    def _new_documents(self, documents: List[Document], manifest: Set[str], loaded_hashes: Set[str]) -> List[Document]:
+        """Returns the documents whose content is neither in the manifest nor loaded earlier in this run.
+        Every document's hash is added to loaded_hashes.
+        """
+        if self.vector_db is None:
+            return documents
+        new_documents = []
+        for document in documents:
+            content_hash = self.vector_db.content_hash(document)
+            if content_hash not in manifest and content_hash not in loaded_hashes:
+                new_documents.append(document)
+            loaded_hashes.add(content_hash)
+        return new_documents
+
+    def _read_manifest(self) -> Set[str]:
+        """Returns the content hashes recorded by the last load"""
+        if self.manifest_file is None:
+            return set()
+        manifest_path = Path(self.manifest_file)
+        if not manifest_path.exists():
+            return set()
+        try:
+            return set(json.loads(manifest_path.read_text()).get("content_hashes", []))
+        except Exception as e:
+            logger.warning(f"Could not read manifest {manifest_path}, loading every document: {e}")
+            return set()
+
+    def _write_manifest(self, content_hashes: Set[str]) -> None:
+        """Records the content hashes in the vector db"""
+        if self.manifest_file is None:
+            return
+        manifest_path = Path(self.manifest_file)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so an interrupted load leaves the old manifest intact
+        tmp_path = manifest_path.with_suffix(manifest_path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"content_hashes": sorted(content_hashes)}))
+        tmp_path.replace(manifest_path)
+        log_debug(f"Wrote manifest with {len(content_hashes)} documents to {manifest_path}")
+
     def load(
         self,
         recreate: bool = False,
@@ -107,14 +249,23 @@ class AgentKnowledge(BaseModel):
             log_info("Dropping collection")
             self.vector_db.drop()
 
+        manifest = self._read_manifest() if self.manifest_file is not None else None
         if not self.vector_db.exists():
             log_info("Creating collection")
             self.vector_db.create()
+            # A new collection holds none of the documents in the manifest
+            manifest = set() if manifest is not None else None
 
         log_info("Loading knowledge base")
         num_documents = 0
+        loaded_hashes: Set[str] = set()
         for document_list in self.document_lists:
             documents_to_load = document_list
+            if manifest is not None:
+                # Only load documents that changed since the last load
+                documents_to_load = self._new_documents(document_list, manifest, loaded_hashes)
+                if not documents_to_load:
+                    continue
 
             # Upsert documents if upsert is True and vector db supports upsert
             if upsert and self.vector_db.upsert_available():
@@ -123,17 +274,23 @@ class AgentKnowledge(BaseModel):
             else:
                 # Filter out documents which already exist in the vector db
                 if skip_existing:
-                    # Use set for O(1) lookups
-                    seen_content = set()
-                    documents_to_load = []
-                    for doc in document_list:
-                        if doc.content not in seen_content and not self.vector_db.doc_exists(doc):
-                            seen_content.add(doc.content)
-                            documents_to_load.append(doc)
+                    documents_to_load = self._filter_existing(documents_to_load)
                 self.vector_db.insert(documents=documents_to_load, filters=filters)
             num_documents += len(documents_to_load)
             log_info(f"Added {len(documents_to_load)} documents to knowledge base")
 
+        if manifest is not None:
+            removed = manifest - loaded_hashes
+            if removed:
+                try:
+                    self.vector_db.delete_ids(list(removed))
+                    log_info(f"Removed {len(removed)} documents from knowledge base")
+                    removed = set()
+                except NotImplementedError:
+                    logger.warning("Vector db does not support deleting documents by id")
+            # Keep documents we could not delete in the manifest so they are retried next time
+            self._write_manifest(loaded_hashes | removed)
+
     async def aload(
         self,
         recreate: bool = False,
@@ -158,14 +315,24 @@ class AgentKnowledge(BaseModel):
             log_info("Dropping collection")
             await self.vector_db.async_drop()
 
+        manifest = self._read_manifest() if self.manifest_file is not None else None
         if not await self.vector_db.async_exists():
             log_info("Creating collection")
             await self.vector_db.async_create()
+            # A new collection holds none of the documents in the manifest
+            manifest = set() if manifest is not None else None
 
         log_info("Loading knowledge base")
         num_documents = 0
+        loaded_hashes: Set[str] = set()
         async for document_list in self.async_document_lists:
             documents_to_load = document_list
+            if manifest is not None:
+                # Only load documents that changed since the last load
+                documents_to_load = self._new_documents(document_list, manifest, loaded_hashes)
+                if not documents_to_load:
+                    continue
+
             # Upsert documents if upsert is True and vector db supports upsert
             if upsert and self.vector_db.upsert_available():
                 await self.vector_db.async_upsert(documents=documents_to_load, filters=filters)
@@ -173,17 +340,23 @@ class AgentKnowledge(BaseModel):
             else:
                 # Filter out documents which already exist in the vector db
                 if skip_existing:
-                    # Use set for O(1) lookups
-                    seen_content = set()
-                    documents_to_load = []
-                    for doc in document_list:
-                        if doc.content not in seen_content and not (await self.vector_db.async_doc_exists(doc)):
-                            seen_content.add(doc.content)
-                            documents_to_load.append(doc)
+                    documents_to_load = await self._async_filter_existing(documents_to_load)
                 await self.vector_db.async_insert(documents=documents_to_load, filters=filters)
             num_documents += len(documents_to_load)
             log_info(f"Added {len(documents_to_load)} documents to knowledge base")
 
+        if manifest is not None:
+            removed = manifest - loaded_hashes
+            if removed:
+                try:
+                    await self.vector_db.async_delete_ids(list(removed))
+                    log_info(f"Removed {len(removed)} documents from knowledge base")
+                    removed = set()
+                except NotImplementedError:
+                    logger.warning("Vector db does not support deleting documents by id")
+            # Keep documents we could not delete in the manifest so they are retried next time
+            self._write_manifest(loaded_hashes | removed)
+
     def load_documents(
         self,
         documents: List[Document],
@@ -214,11 +387,7 @@ class AgentKnowledge(BaseModel):
             log_info(f"Loaded {len(documents)} documents to knowledge base")
         else:
             # Filter out documents which already exist in the vector db
-            documents_to_load = (
-                [document for document in documents if not self.vector_db.doc_exists(document)]
-                if skip_existing
-                else documents
-            )
+            documents_to_load = self._filter_existing(documents) if skip_existing else documents
 
             # Insert documents
             if len(documents_to_load) > 0:
@@ -265,20 +434,7 @@ class AgentKnowledge(BaseModel):
         else:
             # Filter out documents which already exist in the vector db
             if skip_existing:
-                try:
-                    # Parallelize existence checks using asyncio.gather
-                    existence_checks = await asyncio.gather(
-                        *[self.vector_db.async_doc_exists(document) for document in documents], return_exceptions=True
-                    )
-
-                    documents_to_load = [
-                        doc
-                        for doc, exists in zip(documents, existence_checks)
-                        if not (isinstance(exists, bool) and exists)
-                    ]
-                except NotImplementedError:
-                    logger.warning("Vector db does not support async doc_exists")
-                    documents_to_load = [document for document in documents if not self.vector_db.doc_exists(document)]
+                documents_to_load = await self._async_filter_existing(documents)
             else:
                 documents_to_load = documents
 
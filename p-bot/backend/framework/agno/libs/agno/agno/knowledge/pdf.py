@@ -15,6 +15,20 @@ class PDFKnowledgeBase(AgentKnowledge):
 
     reader: Union[PDFReader, PDFImageReader] = PDFReader()
 
+    def _read(self, pdf: Path) -> Iterator[List[Document]]:
+        if self.reader.num_workers:
+            # Stream groups of pages from the worker processes instead of holding the whole PDF in memory
+            yield from self.reader.iter_read(pdf)
+        else:
+            yield self.reader.read(pdf=pdf)
+
+    async def _async_read(self, pdf: Path) -> AsyncIterator[List[Document]]:
+        if self.reader.num_workers:
+            async for documents in self.reader.async_iter_read(pdf):
+                yield documents
+        else:
+            yield await self.reader.async_read(pdf=pdf)
+
     @property
     def document_lists(self) -> Iterator[List[Document]]:
         """Iterate over PDFs and yield lists of documents.
@@ -30,11 +44,11 @@ class PDFKnowledgeBase(AgentKnowledge):
             for _pdf in _pdf_path.glob("**/*.pdf"):
                 if _pdf.name in self.exclude_files:
                     continue
-                yield self.reader.read(pdf=_pdf)
+                yield from self._read(_pdf)
         elif _pdf_path.exists() and _pdf_path.is_file() and _pdf_path.suffix == ".pdf":
             if _pdf_path.name in self.exclude_files:
                 return
-            yield self.reader.read(pdf=_pdf_path)
+            yield from self._read(_pdf_path)
 
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
@@ -51,8 +65,10 @@ class PDFKnowledgeBase(AgentKnowledge):
             for _pdf in _pdf_path.glob("**/*.pdf"):
                 if _pdf.name in self.exclude_files:
                     continue
-                yield await self.reader.async_read(pdf=_pdf)
+                async for documents in self._async_read(_pdf):
+                    yield documents
         elif _pdf_path.exists() and _pdf_path.is_file() and _pdf_path.suffix == ".pdf":
             if _pdf_path.name in self.exclude_files:
                 return
-            yield await self.reader.async_read(pdf=_pdf_path)
+            async for documents in self._async_read(_pdf_path):
+                yield documents
@@ -18,4 +18,8 @@ class S3PDFKnowledgeBase(S3KnowledgeBase):
         """
         for s3_object in self.s3_objects:
             if s3_object.name.endswith(".pdf"):
-                yield self.reader.read(s3_object=s3_object)
+                if self.reader.num_workers:
+                    # Stream groups of pages instead of holding the whole PDF in memory
+                    yield from self.reader.iter_read(s3_object=s3_object)
+                else:
+                    yield self.reader.read(s3_object=s3_object)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional
 
 from agno.memory.v2.db.schema import MemoryRow
@@ -21,6 +22,29 @@ class MemoryDb(ABC):
     ) -> List[MemoryRow]:
         raise NotImplementedError
 
+    def read_memories_updated_since(
+        self, user_id: Optional[str] = None, updated_since: Optional[datetime] = None
+    ) -> List[MemoryRow]:
+        """Read the memories updated at or after updated_since, or all memories if it is None.
+
+        The rows have last_updated set. Backends that store an update time override this to only read the changed rows.
+        """
+        memories = self.read_memories(user_id=user_id)
+        if updated_since is None:
+            return memories
+        return [memory for memory in memories if memory.last_updated is None or memory.last_updated >= updated_since]
+
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        """Read the ids of the memories, to find memories deleted since the last read."""
+        return [memory.id for memory in self.read_memories(user_id=user_id) if memory.id is not None]
+
+    def count_memories(self, user_id: Optional[str] = None) -> Optional[int]:
+        """Count the memories, or return None if the backend cannot count them without reading them.
+
+        A sync that holds as many memories as the db has skips read_memory_ids, as none can have been deleted.
+        """
+        return None
+
     @abstractmethod
     def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
         raise NotImplementedError
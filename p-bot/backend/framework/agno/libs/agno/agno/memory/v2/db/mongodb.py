@@ -103,11 +103,57 @@ class MongoMemoryDb(MemoryDb):
             for doc in cursor:
                 # Remove MongoDB _id before converting to MemoryRow
                 doc.pop("_id", None)
-                memories.append(MemoryRow(user_id=doc["user_id"], memory=doc["memory"]))
+                memories.append(self._to_memory_row(doc))
         except PyMongoError as e:
             logger.error(f"Error reading memories: {e}")
         return memories
 
+    def read_memories_updated_since(
+        self, user_id: Optional[str] = None, updated_since: Optional[datetime] = None
+    ) -> List[MemoryRow]:
+        """Read the memories updated at or after updated_since, or all memories if it is None."""
+        memories: List[MemoryRow] = []
+        try:
+            query: Dict[str, Any] = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            if updated_since is not None:
+                # updated_at is stored as a unix timestamp in seconds
+                if updated_since.tzinfo is None:
+                    updated_since = updated_since.replace(tzinfo=timezone.utc)
+                query["updated_at"] = {"$gte": int(updated_since.timestamp())}
+            for doc in self.collection.find(query):
+                memories.append(self._to_memory_row(doc))
+        except PyMongoError as e:
+            logger.error(f"Error reading memories: {e}")
+        return memories
+
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        """Read the ids of the memories"""
+        try:
+            query = {"user_id": user_id} if user_id is not None else {}
+            return [doc["id"] for doc in self.collection.find(query, {"id": 1})]
+        except PyMongoError as e:
+            logger.error(f"Error reading memory ids: {e}")
+            return []
+
+    def count_memories(self, user_id: Optional[str] = None) -> Optional[int]:
+        """Count the memories"""
+        try:
+            query = {"user_id": user_id} if user_id is not None else {}
+            return self.collection.count_documents(query)
+        except PyMongoError as e:
+            logger.error(f"Error counting memories: {e}")
+            return None
+
+    def _to_memory_row(self, doc: Dict[str, Any]) -> MemoryRow:
+        updated_at = doc.get("updated_at") or doc.get("created_at")
+        last_updated = None
+        if updated_at:
+            # Naive UTC, as updated_since is read
+            last_updated = datetime.fromtimestamp(updated_at, tz=timezone.utc).replace(tzinfo=None)
+        return MemoryRow(id=doc.get("id"), user_id=doc["user_id"], memory=doc["memory"], last_updated=last_updated)
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Upsert a memory into the collection
         Args:
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 try:
@@ -6,7 +7,7 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import delete, select, text
+    from sqlalchemy.sql.expression import delete, func, select, text
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed.  Please install using `pip install sqlalchemy 'psycopg[binary]'`")
@@ -120,6 +121,48 @@ class PostgresMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def read_memories_updated_since(
+        self, user_id: Optional[str] = None, updated_since: Optional[datetime] = None
+    ) -> List[MemoryRow]:
+        memories: List[MemoryRow] = []
+        try:
+            with self.Session() as sess, sess.begin():
+                # updated_at is only set once a memory is updated
+                last_updated = func.coalesce(self.table.c.updated_at, self.table.c.created_at)
+                stmt = select(self.table, last_updated.label("last_updated"))
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if updated_since is not None:
+                    stmt = stmt.where(last_updated >= updated_since)
+
+                for row in sess.execute(stmt).fetchall():
+                    memories.append(MemoryRow.model_validate(row))
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+        return memories
+
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(self.table.c.id)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                return [row.id for row in sess.execute(stmt).fetchall()]
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+            return []
+
+    def count_memories(self, user_id: Optional[str] = None) -> Optional[int]:
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(func.count()).select_from(self.table)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                return sess.execute(stmt).scalar()
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+            return None
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Create a new memory if it does not exist, otherwise update the existing memory"""
 
@@ -139,6 +182,8 @@ class PostgresMemoryDb(MemoryDb):
                     set_=dict(
                         user_id=stmt.excluded.user_id,
                         memory=stmt.excluded.memory,
+                        # Column onupdate defaults are not applied to ON CONFLICT updates
+                        updated_at=text("now()"),
                     ),
                 )
 
@@ -1,5 +1,6 @@
 import json
 import time
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 try:
@@ -39,6 +40,8 @@ class RedisMemoryDb(MemoryDb):
             password=password,
             decode_responses=True,  # Automatically decode responses to str
         )
+        # Whether the per-user indexes cover the memories written before they existed
+        self._indexed = False
         log_debug(f"Created RedisMemoryDb with prefix: '{self.prefix}'")
 
     def __dict__(self) -> Dict[str, Any]:
@@ -51,6 +54,38 @@ class RedisMemoryDb(MemoryDb):
         """Generate Redis key for a memory."""
         return f"{self.prefix}:{memory_id}"
 
+    def _get_user_key(self, user_id: str) -> str:
+        """Generate Redis key for the sorted set of a user's memory ids, scored by their updated_at."""
+        return f"{self.prefix}_user:{user_id}"
+
+    def _build_user_indexes(self) -> None:
+        """Index the memories stored before the per-user indexes were kept, once per database."""
+        if self._indexed:
+            return
+        index_key = f"{self.prefix}_user_index"
+        if not self.redis_client.exists(index_key):
+            for key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+                data_str = self.redis_client.get(key)
+                if data_str:
+                    data = json.loads(data_str)  # type: ignore
+                    if data.get("user_id") is not None:
+                        updated_at = data.get("updated_at") or data.get("created_at") or 0
+                        # gt keeps the newer score of a memory upserted while indexing
+                        self.redis_client.zadd(self._get_user_key(data["user_id"]), {data["id"]: updated_at}, gt=True)
+            self.redis_client.set(index_key, 1)
+            log_debug(f"Indexed memories with prefix: {self.prefix}")
+        self._indexed = True
+
+    def _to_memory_row(self, data: Dict[str, Any]) -> MemoryRow:
+        updated_at = data.get("updated_at") or data.get("created_at")
+        last_updated = None
+        if updated_at:
+            # Naive UTC, as updated_since is read
+            last_updated = datetime.fromtimestamp(updated_at, tz=timezone.utc).replace(tzinfo=None)
+        return MemoryRow(
+            id=data.get("id"), user_id=data.get("user_id"), memory=data["memory"], last_updated=last_updated
+        )
+
     def create(self) -> None:
         """
         Test connection to Redis.
@@ -111,6 +146,64 @@ class RedisMemoryDb(MemoryDb):
 
         return memories
 
+    def read_memories_updated_since(
+        self, user_id: Optional[str] = None, updated_since: Optional[datetime] = None
+    ) -> List[MemoryRow]:
+        """Read the memories updated at or after updated_since, or all memories if it is None.
+
+        Reads the ids of the user's changed memories from their index, and only gets those memories.
+        """
+        if user_id is None:
+            return super().read_memories_updated_since(user_id=user_id, updated_since=updated_since)
+
+        memories: List[MemoryRow] = []
+        try:
+            self._build_user_indexes()
+            user_key = self._get_user_key(user_id)
+            min_score = 0
+            if updated_since is not None:
+                # updated_at is stored as a unix timestamp in seconds
+                if updated_since.tzinfo is None:
+                    updated_since = updated_since.replace(tzinfo=timezone.utc)
+                min_score = int(updated_since.timestamp())
+            memory_ids: List[str] = self.redis_client.zrangebyscore(user_key, min_score, "+inf")  # type: ignore
+            if not memory_ids:
+                return memories
+
+            keys = [self._get_key(memory_id) for memory_id in memory_ids]
+            values: List[Optional[str]] = self.redis_client.mget(keys)  # type: ignore
+            for memory_id, data_str in zip(memory_ids, values):
+                if data_str is None:
+                    # Deleted while it was being indexed
+                    self.redis_client.zrem(user_key, memory_id)
+                    continue
+                memories.append(self._to_memory_row(json.loads(data_str)))
+        except Exception as e:
+            logger.error(f"Error reading memories: {e}")
+        return memories
+
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        """Read the ids of the memories"""
+        if user_id is None:
+            return super().read_memory_ids(user_id=user_id)
+        try:
+            self._build_user_indexes()
+            return list(self.redis_client.zrange(self._get_user_key(user_id), 0, -1))  # type: ignore
+        except Exception as e:
+            logger.error(f"Error reading memory ids: {e}")
+            return []
+
+    def count_memories(self, user_id: Optional[str] = None) -> Optional[int]:
+        """Count the memories of a user"""
+        if user_id is None:
+            return None
+        try:
+            self._build_user_indexes()
+            return self.redis_client.zcard(self._get_user_key(user_id))  # type: ignore
+        except Exception as e:
+            logger.error(f"Error counting memories: {e}")
+            return None
+
     def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
         """Upsert a memory in Redis"""
         try:
@@ -129,6 +222,8 @@ class RedisMemoryDb(MemoryDb):
             # Save to Redis
             key = self._get_key(memory.id)  # type: ignore
             self.redis_client.set(key, json.dumps(memory_data))
+            if memory.user_id is not None:
+                self.redis_client.zadd(self._get_user_key(memory.user_id), {memory.id: timestamp})  # type: ignore
             return memory
 
         except Exception as e:
@@ -139,7 +234,12 @@ class RedisMemoryDb(MemoryDb):
         """Delete a memory from Redis"""
         try:
             key = self._get_key(memory_id)
+            data_str = self.redis_client.get(key)
             self.redis_client.delete(key)
+            if data_str:
+                user_id = json.loads(data_str).get("user_id")  # type: ignore
+                if user_id is not None:
+                    self.redis_client.zrem(self._get_user_key(user_id), memory_id)
             log_debug(f"Deleted memory: {memory_id}")
         except Exception as e:
             logger.error(f"Error deleting memory: {e}")
@@ -165,6 +265,10 @@ class RedisMemoryDb(MemoryDb):
         try:
             pattern = f"{self.prefix}:*"
             keys_to_delete = list(self.redis_client.scan_iter(match=pattern))
+            index_keys = list(self.redis_client.scan_iter(match=f"{self.prefix}_user:*"))
+            index_keys.append(f"{self.prefix}_user_index")
+            self.redis_client.delete(*index_keys)
+            self._indexed = False
 
             if keys_to_delete:
                 self.redis_client.delete(*keys_to_delete)
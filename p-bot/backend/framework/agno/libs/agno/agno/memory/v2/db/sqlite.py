@@ -1,3 +1,4 @@
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -11,6 +12,7 @@ try:
         Table,
         create_engine,
         delete,
+        func,
         inspect,
         select,
         text,
@@ -147,6 +149,56 @@ class SqliteMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def read_memories_updated_since(
+        self, user_id: Optional[str] = None, updated_since: Optional[datetime] = None
+    ) -> List[MemoryRow]:
+        memories: List[MemoryRow] = []
+        try:
+            with self.Session() as session:
+                stmt = select(self.table)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if updated_since is not None:
+                    # CURRENT_TIMESTAMP is stored as text with second precision, compare in that format
+                    stmt = stmt.where(
+                        func.datetime(self.table.c.updated_at) >= updated_since.strftime("%Y-%m-%d %H:%M:%S")
+                    )
+
+                for row in session.execute(stmt):
+                    memories.append(
+                        MemoryRow(
+                            id=row.id,
+                            user_id=row.user_id,
+                            memory=eval(row.memory),
+                            last_updated=row.updated_at or row.created_at,
+                        )
+                    )
+        except SQLAlchemyError as e:
+            log_debug(f"Exception reading from table: {e}")
+        return memories
+
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        try:
+            with self.Session() as session:
+                stmt = select(self.table.c.id)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                return [row.id for row in session.execute(stmt)]
+        except SQLAlchemyError as e:
+            log_debug(f"Exception reading from table: {e}")
+            return []
+
+    def count_memories(self, user_id: Optional[str] = None) -> Optional[int]:
+        try:
+            with self.Session() as session:
+                stmt = select(func.count()).select_from(self.table)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                return session.execute(stmt).scalar()
+        except SQLAlchemyError as e:
+            log_debug(f"Exception reading from table: {e}")
+            return None
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         try:
             with self.Session() as session:
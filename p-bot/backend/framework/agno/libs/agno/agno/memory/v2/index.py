@@ -0,0 +1,65 @@
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+
+class UserMemoryIndex:
+    """In-memory vector index of the memories of one user, searched by cosine similarity."""
+
+    def __init__(self):
+        # Memory text each vector was embedded from, to find memories whose text changed
+        self.texts: Dict[str, str] = {}
+        self.vectors: Dict[str, np.ndarray] = {}
+        # Stacked vectors, rebuilt on the first search after a change
+        self._ids: List[str] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    @property
+    def dimensions(self) -> Optional[int]:
+        for vector in self.vectors.values():
+            return len(vector)
+        return None
+
+    def add(self, memory_id: str, text: str, embedding: List[float]) -> None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        self.texts[memory_id] = text
+        self.vectors[memory_id] = vector / norm if norm > 0 else vector
+        self._matrix = None
+
+    def remove(self, memory_id: str) -> None:
+        self.texts.pop(memory_id, None)
+        if self.vectors.pop(memory_id, None) is not None:
+            self._matrix = None
+
+    def clear(self) -> None:
+        self.texts.clear()
+        self.vectors.clear()
+        self._matrix = None
+
+    def search(self, query_embedding: List[float], limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Returns (memory_id, similarity) pairs, most similar first."""
+        if len(self.vectors) == 0:
+            return []
+        if self._matrix is None:
+            self._ids = list(self.vectors.keys())
+            self._matrix = np.stack([self.vectors[memory_id] for memory_id in self._ids])
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+        scores = self._matrix @ query
+
+        if limit is not None and 0 < limit < len(scores):
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            top = top[np.argsort(-scores[top])]
+        else:
+            top = np.argsort(-scores)
+        return [(self._ids[i], float(scores[i])) for i in top]
@@ -2,6 +2,7 @@ from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, cast
 
+from agno.embedder.base import Embedder
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
 from agno.memory.v2.schema import UserMemory
@@ -27,17 +28,22 @@ class MemoryManager:
     # Whether memories were created in the last run
     memories_updated: bool = False
 
+    # Embedder used to store an embedding with each memory, for semantic search
+    embedder: Optional[Embedder] = None
+
     def __init__(
         self,
         model: Optional[Model] = None,
         system_message: Optional[str] = None,
         additional_instructions: Optional[str] = None,
+        embedder: Optional[Embedder] = None,
     ):
         self.model = model
         if self.model is not None and isinstance(self.model, str):
             raise ValueError("Model must be a Model object, not a string")
         self.system_message = system_message
         self.additional_instructions = additional_instructions
+        self.embedder = embedder
 
     def add_tools_to_model(self, model: Model, tools: List[Callable]) -> None:
         model = cast(Model, model)
@@ -318,6 +324,16 @@ class MemoryManager:
         return response.content or "No response from model"
 
     # -*- DB Functions
+    def _get_memory_dict(self, memory: UserMemory) -> Dict[str, Any]:
+        """Get the memory to store, with its embedding if there is an embedder."""
+        memory_dict = memory.to_dict()
+        if self.embedder is not None:
+            try:
+                memory_dict["embedding"] = self.embedder.get_embedding(memory.memory)
+            except Exception as e:
+                log_warning(f"Error embedding memory: {e}")
+        return memory_dict
+
     def _get_db_tools(
         self,
         user_id: str,
@@ -347,13 +363,15 @@ class MemoryManager:
                     MemoryRow(
                         id=memory_id,
                         user_id=user_id,
-                        memory=UserMemory(
-                            memory_id=memory_id,
-                            memory=memory,
-                            topics=topics,
-                            last_updated=last_updated,
-                            input=input_string,
-                        ).to_dict(),
+                        memory=self._get_memory_dict(
+                            UserMemory(
+                                memory_id=memory_id,
+                                memory=memory,
+                                topics=topics,
+                                last_updated=last_updated,
+                                input=input_string,
+                            )
+                        ),
                         last_updated=last_updated,
                     )
                 )
@@ -378,13 +396,15 @@ class MemoryManager:
                     MemoryRow(
                         id=memory_id,
                         user_id=user_id,
-                        memory=UserMemory(
-                            memory_id=memory_id,
-                            memory=memory,
-                            topics=topics,
-                            last_updated=last_updated,
-                            input=input_string,
-                        ).to_dict(),
+                        memory=self._get_memory_dict(
+                            UserMemory(
+                                memory_id=memory_id,
+                                memory=memory,
+                                topics=topics,
+                                last_updated=last_updated,
+                                input=input_string,
+                            )
+                        ),
                         last_updated=last_updated,
                     )
                 )
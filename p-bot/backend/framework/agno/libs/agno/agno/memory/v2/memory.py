@@ -3,10 +3,11 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Set, Union
 
 from pydantic import BaseModel, Field
 
+from agno.embedder.base import Embedder
 from agno.media import AudioArtifact, ImageArtifact, VideoArtifact
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
@@ -21,6 +22,9 @@ from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debu
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
 
+if TYPE_CHECKING:
+    from agno.memory.v2.index import UserMemoryIndex
+
 
 class MemorySearchResponse(BaseModel):
     """Model for Memory Search Response."""
@@ -87,6 +91,9 @@ class Memory:
 
     db: Optional[MemoryDb] = None
 
+    # Embedder for semantic search of user memories. Memories are embedded when written.
+    embedder: Optional[Embedder] = None
+
     # runs per session
     runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None
 
@@ -113,6 +120,7 @@ class Memory:
         debug_mode: bool = False,
         delete_memories: bool = False,
         clear_memories: bool = False,
+        embedder: Optional[Embedder] = None,
     ):
         self.memories = memories or {}
         self.summaries = summaries or {}
@@ -134,13 +142,23 @@ class Memory:
 
         self.db = db
 
+        self.embedder = embedder
+        # Vector index of the memories per user, for semantic search
+        self._memory_indexes: Dict[str, "UserMemoryIndex"] = {}
+        # Users whose index may be missing memories that were loaded without going through it
+        self._stale_memory_indexes: Set[str] = set()
+        # Latest update time of the memories read from the db per user, to only read newer changes
+        self._memories_synced_at: Dict[str, datetime] = {}
+
         # We are making memories
         if self.model is not None:
             if self.memory_manager is None:
-                self.memory_manager = MemoryManager(model=deepcopy(self.model))
+                self.memory_manager = MemoryManager(model=deepcopy(self.model), embedder=self.embedder)
             # Set the model on the memory manager if it is not set
             if self.memory_manager.model is None:
                 self.memory_manager.model = deepcopy(self.model)
+        if self.memory_manager is not None and getattr(self.memory_manager, "embedder", None) is None:
+            self.memory_manager.embedder = self.embedder
 
         # We are making session summaries
         if self.model is not None:
@@ -154,7 +172,7 @@ class Memory:
 
     def set_model(self, model: Model) -> None:
         if self.memory_manager is None:
-            self.memory_manager = MemoryManager(model=deepcopy(model))
+            self.memory_manager = MemoryManager(model=deepcopy(model), embedder=self.embedder)
         if self.memory_manager.model is None:
             self.memory_manager.model = deepcopy(model)
         if self.summary_manager is None:
@@ -175,6 +193,13 @@ class Memory:
             self.model = OpenAIChat(id="gpt-4o")
         return self.model
 
+    def get_embedder(self) -> Embedder:
+        if self.embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            self.embedder = OpenAIEmbedder()
+        return self.embedder
+
     def refresh_from_db(self, user_id: Optional[str] = None):
         if self.db:
             # If no user_id is provided, read all memories
@@ -184,9 +209,58 @@ class Memory:
                 all_memories = self.db.read_memories(user_id=user_id)
             # Reset the memories
             self.memories = {}
+            self._memories_synced_at = {}
+            self._stale_memory_indexes.update(self._memory_indexes.keys())
             for memory in all_memories:
                 if memory.user_id is not None and memory.id is not None:
-                    self.memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
+                    self._load_db_memory(memory)
+
+    def _load_db_memory(self, row: MemoryRow) -> None:
+        """Add a memory read from the db, with its stored embedding if it has one."""
+        memory_dict = dict(row.memory)
+        embedding = memory_dict.pop("embedding", None)
+        memory = UserMemory.from_dict(memory_dict)
+        self.memories.setdefault(row.user_id, {})[row.id] = memory  # type: ignore
+        index = self._memory_indexes.get(row.user_id)  # type: ignore
+        if embedding is not None:
+            self._get_or_create_memory_index(row.user_id).add(row.id, memory.memory, embedding)  # type: ignore
+        elif index is None or index.texts.get(row.id) != memory.memory:  # type: ignore
+            # Embedded on the next semantic search
+            self._stale_memory_indexes.add(row.user_id)  # type: ignore
+
+    def sync_user_memories_from_db(self, user_id: str) -> None:
+        """Update the memories of a user with the memories changed in the db since the last sync.
+
+        The first sync reads all memories of the user. Later syncs only read the memories updated since, and the
+        ids of all memories to drop deleted ones if the db holds fewer memories than are loaded.
+        """
+        if not self.db:
+            return
+        synced_at = self._memories_synced_at.get(user_id)
+        rows = self.db.read_memories_updated_since(user_id=user_id, updated_since=synced_at)
+
+        if self.memories is None:
+            self.memories = {}
+        if synced_at is None:
+            self.memories[user_id] = {}
+            self._stale_memory_indexes.add(user_id)
+        for row in rows:
+            if row.id is None:
+                continue
+            self._load_db_memory(row)
+            if row.last_updated is not None and (synced_at is None or row.last_updated > synced_at):
+                synced_at = row.last_updated
+
+        user_memories = self.memories.setdefault(user_id, {})
+        # Every memory in the db is loaded after the update, so equal counts mean none was deleted
+        if user_id in self._memories_synced_at and self.db.count_memories(user_id=user_id) != len(user_memories):
+            memory_ids = set(self.db.read_memory_ids(user_id=user_id))
+            for memory_id in [memory_id for memory_id in user_memories if memory_id not in memory_ids]:
+                del user_memories[memory_id]
+                if user_id in self._memory_indexes:
+                    self._memory_indexes[user_id].remove(memory_id)
+        if synced_at is not None:
+            self._memories_synced_at[user_id] = synced_at
 
     def set_log_level(self):
         if self.debug_mode or getenv("AGNO_DEBUG", "false").lower() == "true":
@@ -301,12 +375,16 @@ class Memory:
             memory.last_updated = datetime.now()
 
         self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
+        embedding = self._embed_user_memory(user_id=user_id, memory_id=memory_id, memory=memory)
         if self.db:
+            memory_dict = memory.to_dict()
+            if embedding is not None:
+                memory_dict["embedding"] = embedding
             self._upsert_db_memory(
                 memory=MemoryRow(
                     id=memory_id,
                     user_id=user_id,
-                    memory=memory.to_dict(),
+                    memory=memory_dict,
                     last_updated=memory.last_updated or datetime.now(),
                 )
             )
@@ -344,12 +422,16 @@ class Memory:
             return None
 
         self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
+        embedding = self._embed_user_memory(user_id=user_id, memory_id=memory_id, memory=memory)
         if self.db:
+            memory_dict = memory.to_dict()
+            if embedding is not None:
+                memory_dict["embedding"] = embedding
             self._upsert_db_memory(
                 memory=MemoryRow(
                     id=memory_id,
                     user_id=user_id,
-                    memory=memory.to_dict(),
+                    memory=memory_dict,
                     last_updated=memory.last_updated or datetime.now(),
                 )
             )
@@ -375,6 +457,8 @@ class Memory:
             self.refresh_from_db(user_id=user_id)
 
         del self.memories[user_id][memory_id]  # type: ignore
+        if user_id in self._memory_indexes:
+            self._memory_indexes[user_id].remove(memory_id)
         if self.db:
             self._delete_db_memory(memory_id=memory_id)
 
@@ -602,6 +686,71 @@ class Memory:
 
         return response
 
+    # -*- Semantic Search Functions
+    def _embed_user_memory(self, user_id: str, memory_id: str, memory: UserMemory) -> Optional[List[float]]:
+        """Embed a memory being written and add it to the index of the user. Returns None without an embedder."""
+        if self.embedder is None:
+            return None
+        try:
+            embedding = self.embedder.get_embedding(memory.memory)
+        except Exception as e:
+            log_warning(f"Error embedding memory: {e}")
+            return None
+        self._get_or_create_memory_index(user_id).add(memory_id, memory.memory, embedding)
+        return embedding
+
+    def _get_or_create_memory_index(self, user_id: str) -> "UserMemoryIndex":
+        from agno.memory.v2.index import UserMemoryIndex
+
+        if user_id not in self._memory_indexes:
+            self._memory_indexes[user_id] = UserMemoryIndex()
+            # Memories loaded before the index existed are not in it yet
+            self._stale_memory_indexes.add(user_id)
+        return self._memory_indexes[user_id]
+
+    def get_memory_index(self, user_id: str) -> "UserMemoryIndex":
+        """Get the vector index of the memories of a user, embedding the memories that are not in it yet."""
+        index = self._get_or_create_memory_index(user_id)
+        if user_id not in self._stale_memory_indexes:
+            return index
+
+        user_memories = (self.memories or {}).get(user_id, {})
+        for memory_id in [memory_id for memory_id in index.texts if memory_id not in user_memories]:
+            index.remove(memory_id)
+        to_embed = [
+            (memory_id, memory)
+            for memory_id, memory in user_memories.items()
+            if index.texts.get(memory_id) != memory.memory
+        ]
+        if to_embed:
+            log_debug(f"Embedding {len(to_embed)} memories for user {user_id}")
+            embeddings = self.get_embedder().get_embeddings_batched([memory.memory for _, memory in to_embed])
+            for (memory_id, memory), embedding in zip(to_embed, embeddings):
+                index.add(memory_id, memory.memory, embedding)
+        self._stale_memory_indexes.discard(user_id)
+        return index
+
+    def _search_user_memories_semantic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
+        """Search through user memories by similarity of their embeddings to the query."""
+        index = self.get_memory_index(user_id=user_id)
+        if len(index) == 0:
+            return []
+
+        query_embedding = self.get_embedder().get_embedding(query)
+        if index.dimensions != len(query_embedding):
+            # The embedder changed since the memories were embedded
+            log_warning("Memory embeddings do not match the embedder, embedding the memories again")
+            index.clear()
+            self._stale_memory_indexes.add(user_id)
+            index = self.get_memory_index(user_id=user_id)
+
+        user_memories = (self.memories or {}).get(user_id, {})
+        return [
+            user_memories[memory_id]
+            for memory_id, _ in index.search(query_embedding, limit=limit)
+            if memory_id in user_memories
+        ]
+
     # -*- DB Functions
     def _upsert_db_memory(self, memory: MemoryRow) -> str:
         """Use this function to add a memory to the database."""
@@ -732,19 +881,21 @@ class Memory:
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
         refresh_from_db: bool = True,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
                 - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "semantic": Return memories most similar to the query by embedding similarity. Memories are
+                  read incrementally from the db and searched in a local vector index.
             user_id: The user to search for. Optional.
 
         Returns:
@@ -756,6 +907,13 @@ class Memory:
 
         self.set_log_level()
 
+        if retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+            if refresh_from_db:
+                self.sync_user_memories_from_db(user_id=user_id)
+            return self._search_user_memories_semantic(user_id=user_id, query=query, limit=limit)
+
         if refresh_from_db:
             self.refresh_from_db(user_id=user_id)
 
@@ -939,6 +1097,9 @@ class Memory:
             self.db.clear()
         self.memories = {}
         self.summaries = {}
+        self._memory_indexes = {}
+        self._stale_memory_indexes = set()
+        self._memories_synced_at = {}
 
     def deep_copy(self) -> "Memory":
         from copy import deepcopy
@@ -948,7 +1109,7 @@ class Memory:
 
         # Manually deepcopy fields that are known to be safe
         for field_name, field_value in self.__dict__.items():
-            if field_name not in ["db", "memory_manager", "summary_manager"]:
+            if field_name not in ["db", "memory_manager", "summary_manager", "embedder"]:
                 try:
                     setattr(copied_obj, field_name, deepcopy(field_value))
                 except Exception as e:
@@ -958,6 +1119,7 @@ class Memory:
         copied_obj.db = self.db
         copied_obj.memory_manager = self.memory_manager
         copied_obj.summary_manager = self.summary_manager
+        copied_obj.embedder = self.embedder
 
         return copied_obj
 
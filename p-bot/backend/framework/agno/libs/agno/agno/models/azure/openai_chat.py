@@ -2,9 +2,8 @@ from dataclasses import dataclass
 from os import getenv
 from typing import Any, Dict, Optional
 
-import httpx
-
 from agno.models.openai.like import OpenAILike
+from agno.utils.http import get_async_http_client
 
 try:
     from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
@@ -103,6 +102,9 @@ class AzureOpenAI(OpenAILike):
         """
         Returns an asynchronous OpenAI client.
 
+        The underlying HTTP connection pool is shared by all OpenAI-compatible models on the running
+        event loop, so keep-alive connections and TLS sessions are reused across requests.
+
         Returns:
             AsyncAzureOpenAIClient: An instance of the asynchronous OpenAI client.
         """
@@ -114,10 +116,7 @@ class AzureOpenAI(OpenAILike):
         if self.http_client:
             _client_params["http_client"] = self.http_client
         else:
-            # Create a new async HTTP client with custom limits
-            _client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
+            # Share pooled connections with every other model on this event loop
+            _client_params["http_client"] = get_async_http_client()
 
-        self.async_client = AsyncAzureOpenAIClient(**_client_params)
-        return self.async_client
+        return AsyncAzureOpenAIClient(**_client_params)
@@ -10,6 +10,7 @@ from agno.exceptions import AgentRunException
 from agno.media import AudioResponse, ImageArtifact
 from agno.models.message import Citations, Message, MessageMetrics
 from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.tools.executor import in_tool_worker, submit_tool_calls
 from agno.tools.function import Function, FunctionCall
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.timer import Timer
@@ -68,6 +69,9 @@ class Model(ABC):
     show_tool_calls: Optional[bool] = None
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # If True, the tool calls of a response run concurrently on a shared thread pool.
+    # Results are still added in the order the tool calls were made.
+    concurrent_tool_calls: bool = False
 
     # A list of tools provided to the Model.
     # Tools are functions the model may generate JSON inputs for.
@@ -833,6 +837,10 @@ class Model(ABC):
         if self._function_call_stack is None:
             self._function_call_stack = []
 
+        if self.concurrent_tool_calls and len(function_calls) > 1 and not in_tool_worker():
+            yield from self._run_function_calls_concurrently(function_calls, function_call_results)
+            return
+
         # Additional messages from function calls that will be added to the function call results
         additional_messages: List[Message] = []
 
@@ -908,6 +916,106 @@ class Model(ABC):
         if additional_messages:
             function_call_results.extend(additional_messages)
 
+    def _run_function_call(
+        self, function_call: FunctionCall
+    ) -> Tuple[Union[bool, AgentRunException], Timer, FunctionCall]:
+        """Run a function call on a tool executor thread and return its success status, timer and FunctionCall."""
+        function_call_timer = Timer()
+        function_call_timer.start()
+        success: Union[bool, AgentRunException] = False
+        try:
+            success = function_call.execute()
+        except AgentRunException as e:
+            success = e  # Pass the exception through to be handled by caller
+        except Exception as e:
+            log_error(f"Error executing function {function_call.function.name}: {e}")
+            raise e
+        function_call_timer.stop()
+        return success, function_call_timer, function_call
+
+    def _run_function_calls_concurrently(
+        self, function_calls: List[FunctionCall], function_call_results: List[Message]
+    ) -> Iterator[ModelResponse]:
+        if self._function_call_stack is None:
+            self._function_call_stack = []
+
+        # Only run the function calls allowed by the tool call limit, as the sequential loop would
+        if self.tool_call_limit:
+            function_calls = function_calls[: max(self.tool_call_limit - len(self._function_call_stack), 1)]
+
+        # Additional messages from function calls that will be added to the function call results
+        additional_messages: List[Message] = []
+
+        # Yield tool_call_started events for all function calls
+        for fc in function_calls:
+            yield ModelResponse(
+                content=fc.get_call_str(),
+                tool_calls=[
+                    {
+                        "role": self.tool_message_role,
+                        "tool_call_id": fc.call_id,
+                        "tool_name": fc.function.name,
+                        "tool_args": fc.arguments,
+                    }
+                ],
+                event=ModelResponseEvent.tool_call_started.value,
+            )
+
+        # Submit all function calls to the shared executor. Calls over the concurrency limit of their
+        # function wait in a queue, not on a worker, until a call of the same function finishes.
+        futures = submit_tool_calls(self._run_function_call, function_calls)
+
+        # Process results in the order of the function calls
+        for future in futures:
+            try:
+                function_call_success, function_call_timer, fc = future.result()
+            except Exception as e:
+                log_error(f"Error during function call: {e}")
+                raise e
+
+            # Handle AgentRunException
+            if isinstance(function_call_success, AgentRunException):
+                a_exc = function_call_success
+                # Update additional messages from function call
+                self._handle_agent_exception(a_exc, additional_messages)
+                # Set function call success to False if an exception occurred
+                function_call_success = False
+
+            # Process function call output
+            function_call_output: Optional[Union[List[Any], str]] = ""
+            if isinstance(fc.result, (GeneratorType, collections.abc.Iterator)):
+                for item in fc.result:
+                    function_call_output += item
+                    if fc.function.show_result:
+                        yield ModelResponse(content=item)
+            else:
+                function_call_output = fc.result
+                if fc.function.show_result:
+                    yield ModelResponse(content=function_call_output)
+
+            # Create and yield function call result
+            function_call_result = self._create_function_call_result(
+                fc, function_call_success, function_call_output, function_call_timer
+            )
+            yield ModelResponse(
+                content=f"{fc.get_call_str()} completed in {function_call_timer.elapsed:.4f}s.",
+                tool_calls=[function_call_result.to_function_call_dict()],
+                event=ModelResponseEvent.tool_call_completed.value,
+            )
+
+            # Add function call result to function call results
+            function_call_results.append(function_call_result)
+            self._function_call_stack.append(fc)
+
+            # Check function call limit
+            if self.tool_call_limit and len(self._function_call_stack) >= self.tool_call_limit:
+                self.tool_choice = "none"
+                break
+
+        # Add any additional messages at the end
+        if additional_messages:
+            function_call_results.extend(additional_messages)
+
     async def _arun_function_call(
         self, function_call: FunctionCall
     ) -> Tuple[Union[bool, AgentRunException], Timer, FunctionCall]:
@@ -11,6 +11,7 @@ from agno.media import AudioResponse
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
+from agno.utils.http import get_async_http_client
 from agno.utils.log import log_error, log_warning
 from agno.utils.openai import audio_to_message, images_to_message
 
@@ -142,6 +143,9 @@ class OpenAIChat(Model):
         """
         Returns an asynchronous OpenAI client.
 
+        The underlying HTTP connection pool is shared by all OpenAI-compatible models on the running
+        event loop, so keep-alive connections and TLS sessions are reused across requests.
+
         Returns:
             AsyncOpenAIClient: An instance of the asynchronous OpenAI client.
         """
@@ -152,10 +156,8 @@ class OpenAIChat(Model):
         if self.http_client:
             client_params["http_client"] = self.http_client
         else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
+            # Share pooled connections with every other model on this event loop
+            client_params["http_client"] = get_async_http_client()
         return AsyncOpenAIClient(**client_params)
 
     @property
@@ -10,6 +10,7 @@ from agno.media import File
 from agno.models.base import MessageData, Model
 from agno.models.message import Citations, Message, UrlCitation
 from agno.models.response import ModelResponse
+from agno.utils.http import get_async_http_client
 from agno.utils.log import log_error, log_warning
 from agno.utils.models.openai_responses import images_to_message, sanitize_response_schema
 
@@ -133,6 +134,9 @@ class OpenAIResponses(Model):
         """
         Returns an asynchronous OpenAI client.
 
+        The underlying HTTP connection pool is shared by all OpenAI-compatible models on the running
+        event loop, so keep-alive connections and TLS sessions are reused across requests.
+
         Returns:
             AsyncOpenAI: An instance of the asynchronous OpenAI client.
         """
@@ -143,13 +147,10 @@ class OpenAIResponses(Model):
         if self.http_client:
             client_params["http_client"] = self.http_client
         else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
+            # Share pooled connections with every other model on this event loop
+            client_params["http_client"] = get_async_http_client()
 
-        self.async_client = AsyncOpenAI(**client_params)
-        return self.async_client
+        return AsyncOpenAI(**client_params)
 
     def get_request_params(self) -> Dict[str, Any]:
         """
@@ -26,6 +26,11 @@ class Storage(ABC):
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         raise NotImplementedError
 
+    def read_last_runs(self, session_id: str, last_n_runs: int, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session with at least its last `last_n_runs` runs in memory.
+        Storages that keep all runs in the session row return every run."""
+        return self.read(session_id=session_id, user_id=user_id)
+
     @abstractmethod
     def get_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
         raise NotImplementedError
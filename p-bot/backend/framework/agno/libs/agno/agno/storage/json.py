@@ -1,8 +1,10 @@
 import json
+import os
+import threading
 import time
 from dataclasses import asdict
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from agno.storage.base import Storage
 from agno.storage.session import Session
@@ -13,11 +15,169 @@ from agno.utils.log import logger
 
 
 class JsonStorage(Storage):
+    # Name of the file listing the sessions in dir_path. It does not end in .json so it is never read as a session.
+    manifest_name = "sessions.manifest"
+    # Session fields kept in the manifest, which sessions can be listed by
+    manifest_fields = ("user_id", "agent_id", "team_id", "workflow_id")
+
     def __init__(self, dir_path: Union[str, Path], mode: Optional[Literal["agent", "team", "workflow"]] = "agent"):
+        """
+        Store each session in a json file in dir_path.
+
+        Next to the session files an append-only manifest records the user_id and agent / team / workflow id of
+        every session, so listing the sessions of a user only opens that user's files. The manifest is rebuilt from
+        the session files when it is missing, and reconciled with them when files are added or removed by hand.
+        """
         super().__init__(mode)
         self.dir_path = Path(dir_path)
         self.dir_path.mkdir(parents=True, exist_ok=True)
 
+        self._manifest_lock = threading.RLock()
+        # session_id -> indexed fields, as read from the manifest up to _manifest_offset
+        self._manifest: Optional[Dict[str, Dict[str, Any]]] = None
+        self._manifest_offset = 0
+        self._manifest_lines = 0
+        self._manifest_inode: Optional[int] = None
+        self._dir_mtime: Optional[int] = None
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.dir_path / self.manifest_name
+
+    def _get_manifest_entry(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {field: data.get(field) for field in self.manifest_fields if data.get(field) is not None}
+
+    def _reset_manifest(self) -> None:
+        if self._manifest is not None:
+            self._manifest.clear()
+        self._manifest_offset = 0
+        self._manifest_lines = 0
+        self._manifest_inode = None
+
+    def _read_manifest_tail(self) -> bool:
+        """Read the lines appended to the manifest since the last read. Returns False if the manifest is missing."""
+        assert self._manifest is not None
+        try:
+            stat = self.manifest_path.stat()
+        except FileNotFoundError:
+            self._reset_manifest()
+            return False
+        if stat.st_ino != self._manifest_inode or stat.st_size < self._manifest_offset:
+            # Created or compacted by another process, read it again from the start
+            self._reset_manifest()
+            self._manifest_inode = stat.st_ino
+        if stat.st_size == self._manifest_offset:
+            return True
+
+        with open(self.manifest_path, "rb") as f:
+            f.seek(self._manifest_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Partially written line, read it next time
+                    break
+                self._manifest_offset += len(line)
+                self._manifest_lines += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                session_id = record.pop("session_id", None)
+                if session_id is None:
+                    continue
+                if record.pop("deleted", False):
+                    self._manifest.pop(session_id, None)
+                else:
+                    self._manifest[session_id] = record
+        return True
+
+    def _append_manifest(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the manifest and apply them to the in-memory copy."""
+        if len(records) == 0:
+            return
+        with open(self.manifest_path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+        self._read_manifest_tail()
+
+    def _get_dir_mtime(self) -> int:
+        return self.dir_path.stat().st_mtime_ns
+
+    def _reconcile_manifest(self) -> None:
+        """Add sessions missing from the manifest and remove sessions whose file is gone, opening only new files."""
+        assert self._manifest is not None
+        session_ids = set()
+        with os.scandir(self.dir_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    session_ids.add(entry.name[: -len(".json")])
+
+        records: List[Dict[str, Any]] = []
+        for session_id in session_ids - self._manifest.keys():
+            try:
+                with open(self.dir_path / f"{session_id}.json", "r", encoding="utf-8") as f:
+                    data = self.deserialize(f.read())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not index session file {session_id}.json: {e}")
+                continue
+            records.append({"session_id": session_id, **self._get_manifest_entry(data)})
+        for session_id in self._manifest.keys() - session_ids:
+            records.append({"session_id": session_id, "deleted": True})
+        self._append_manifest(records)
+        self._compact_manifest()
+        self._dir_mtime = self._get_dir_mtime()
+
+    def _compact_manifest(self) -> None:
+        """Rewrite the manifest with one line per session once most of its lines are outdated."""
+        assert self._manifest is not None
+        if self._manifest_lines <= 2 * len(self._manifest) + 100:
+            return
+        tmp_path = self.manifest_path.with_name(f"{self.manifest_name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for session_id, entry in self._manifest.items():
+                f.write(json.dumps({"session_id": session_id, **entry}, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.manifest_path)
+        stat = self.manifest_path.stat()
+        self._manifest_offset = stat.st_size
+        self._manifest_lines = len(self._manifest)
+        self._manifest_inode = stat.st_ino
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Get the up to date manifest: session_id -> user_id and agent / team / workflow id."""
+        with self._manifest_lock:
+            if self._manifest is None:
+                self._manifest = {}
+                self._read_manifest_tail()
+                self._reconcile_manifest()
+            elif not self._read_manifest_tail() or self._get_dir_mtime() != self._dir_mtime:
+                # Session files were added or removed outside of this storage
+                self._reconcile_manifest()
+            return self._manifest
+
+    def _get_manifest_session_ids(self, user_id: Optional[str], entity_id: Optional[str]) -> List[str]:
+        """Get the ids of the sessions matching the filters from the manifest."""
+        session_ids = []
+        for session_id, entry in self._load_manifest().items():
+            if user_id and entry.get("user_id") != user_id:
+                continue
+            if entity_id and entry.get(f"{self.mode}_id") != entity_id:
+                continue
+            session_ids.append(session_id)
+        return session_ids
+
+    def _update_manifest(self, session_id: str, data: Optional[Dict[str, Any]]) -> None:
+        """Record a written session, or a deleted one if data is None, in the manifest."""
+        with self._manifest_lock:
+            manifest = self._load_manifest()
+            if data is None:
+                if session_id in manifest:
+                    self._append_manifest([{"session_id": session_id, "deleted": True}])
+            else:
+                entry = self._get_manifest_entry(data)
+                if manifest.get(session_id) != entry:
+                    self._append_manifest([{"session_id": session_id, **entry}])
+            self._compact_manifest()
+            # Our own file changes do not need a reconcile
+            self._dir_mtime = self._get_dir_mtime()
+
     def serialize(self, data: dict) -> str:
         return json.dumps(data, ensure_ascii=False, indent=4)
 
@@ -47,79 +207,32 @@ class JsonStorage(Storage):
 
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """Get all session IDs, optionally filtered by user_id and/or entity_id."""
-        session_ids = []
-        for file in self.dir_path.glob("*.json"):
-            with open(file, "r", encoding="utf-8") as f:
-                data = self.deserialize(f.read())
-                if user_id or entity_id:
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            session_ids.append(data["session_id"])
-                    elif user_id and data["user_id"] == user_id:
-                        session_ids.append(data["session_id"])
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                else:
-                    # No filters applied, add all session_ids
-                    session_ids.append(data["session_id"])
-        return session_ids
+        return self._get_manifest_session_ids(user_id, entity_id)
 
     def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
         """Get all sessions, optionally filtered by user_id and/or entity_id."""
         sessions: List[Session] = []
-        for file in self.dir_path.glob("*.json"):
-            with open(file, "r", encoding="utf-8") as f:
-                data = self.deserialize(f.read())
-                if user_id or entity_id:
-                    _session: Optional[Session] = None
-
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            _session = TeamSession.from_dict(data)
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            _session = WorkflowSession.from_dict(data)
-                    elif user_id and data["user_id"] == user_id:
-                        if self.mode == "agent":
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team":
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow":
-                            _session = WorkflowSession.from_dict(data)
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSession.from_dict(data)
-
-                    if _session:
-                        sessions.append(_session)
-                else:
-                    # No filters applied, add all sessions
-                    if self.mode == "agent":
-                        _session = AgentSession.from_dict(data)
-                    elif self.mode == "team":
-                        _session = TeamSession.from_dict(data)
-                    elif self.mode == "workflow":
-                        _session = WorkflowSession.from_dict(data)
-                    if _session:
-                        sessions.append(_session)
+        for session_id in self._get_manifest_session_ids(user_id, entity_id):
+            try:
+                with open(self.dir_path / f"{session_id}.json", "r", encoding="utf-8") as f:
+                    data = self.deserialize(f.read())
+            except FileNotFoundError:
+                continue
+            # The manifest is written after the session file, check the filters in case it is behind
+            if user_id and data.get("user_id") != user_id:
+                continue
+            if entity_id and data.get(f"{self.mode}_id") != entity_id:
+                continue
+
+            _session: Optional[Session] = None
+            if self.mode == "agent":
+                _session = AgentSession.from_dict(data)
+            elif self.mode == "team":
+                _session = TeamSession.from_dict(data)
+            elif self.mode == "workflow":
+                _session = WorkflowSession.from_dict(data)
+            if _session:
+                sessions.append(_session)
         return sessions
 
     def upsert(self, session: Session) -> Optional[Session]:
@@ -132,6 +245,7 @@ class JsonStorage(Storage):
 
             with open(self.dir_path / f"{session.session_id}.json", "w", encoding="utf-8") as f:
                 f.write(self.serialize(data))
+            self._update_manifest(session.session_id, data)
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -143,6 +257,7 @@ class JsonStorage(Storage):
             return
         try:
             (self.dir_path / f"{session_id}.json").unlink(missing_ok=True)
+            self._update_manifest(session_id, None)
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
@@ -150,6 +265,10 @@ class JsonStorage(Storage):
         """Drop all sessions from storage."""
         for file in self.dir_path.glob("*.json"):
             file.unlink()
+        with self._manifest_lock:
+            self.manifest_path.unlink(missing_ok=True)
+            self._reset_manifest()
+            self._manifest = None
 
     def upgrade_schema(self) -> None:
         """Upgrade the schema of the storage."""
@@ -1,5 +1,7 @@
+import hashlib
+import json
 import time
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from agno.storage.base import Storage
 from agno.storage.session import Session
@@ -12,9 +14,10 @@ try:
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
+    from sqlalchemy.orm import Session as SqlSession
     from sqlalchemy.orm import scoped_session, sessionmaker
-    from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import select, text
+    from sqlalchemy.schema import Column, Index, MetaData, Table, UniqueConstraint
+    from sqlalchemy.sql.expression import func, select, text, update
     from sqlalchemy.types import BigInteger, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
@@ -30,6 +33,7 @@ class PostgresStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        normalize_runs: bool = False,
     ):
         """
         This class provides agent storage using a PostgreSQL table.
@@ -47,6 +51,10 @@ class PostgresStorage(Storage):
             schema_version (int): Version of the schema. Defaults to 1.
             auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
             mode (Optional[Literal["agent", "team", "workflow"]]): The mode of the storage.
+            normalize_runs (bool): Store each run as a row of a `<table_name>_runs` table and each message as a row
+                of a `<table_name>_messages` table instead of in the memory column. A write then only appends new or
+                changed runs and new messages, and read_last_runs() only loads the latest runs and the system
+                message, so the cost of a turn does not grow with the length of the session.
         Raises:
             ValueError: If neither db_url nor db_engine is provided.
         """
@@ -72,10 +80,17 @@ class PostgresStorage(Storage):
         self.auto_upgrade_schema: bool = auto_upgrade_schema
         self._schema_up_to_date: bool = False
 
+        # Store runs and messages in their own tables
+        self.normalize_runs: bool = normalize_runs
+        self._runs_table_created: bool = False
+
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
         # Database table for storage
         self.table: Table = self.get_table()
+        # Database tables for runs and messages, if they are normalized
+        self.runs_table: Optional[Table] = self.get_runs_table() if normalize_runs else None
+        self.messages_table: Optional[Table] = self.get_messages_table() if normalize_runs else None
         log_debug(f"Created PostgresStorage: '{self.schema}.{self.table_name}'")
 
     @property
@@ -155,6 +170,49 @@ class PostgresStorage(Storage):
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
+    def get_runs_table(self) -> Table:
+        """
+        Define the table schema for normalized runs, one row per run ordered by id.
+        The runs table is the same in every mode.
+
+        Returns:
+            Table: SQLAlchemy Table object for the runs table.
+        """
+        return Table(
+            f"{self.table_name}_runs",
+            self.metadata,
+            Column("id", BigInteger, primary_key=True, autoincrement=True),
+            Column("session_id", String, nullable=False),
+            Column("run_id", String, nullable=False),
+            Column("run_data", postgresql.JSONB),
+            Column("created_at", BigInteger, server_default=text("(extract(epoch from now()))::bigint")),
+            Column("updated_at", BigInteger, server_onupdate=text("(extract(epoch from now()))::bigint")),
+            UniqueConstraint("session_id", "run_id"),
+            # Serves loading the last runs of a session in order
+            Index(f"idx_{self.table_name}_runs_session_id_id", "session_id", "id"),
+            schema=self.schema,  # type: ignore
+        )
+
+    def get_messages_table(self) -> Table:
+        """
+        Define the table schema for normalized messages, one row per message ordered by id.
+        The messages table is the same in every mode.
+
+        Returns:
+            Table: SQLAlchemy Table object for the messages table.
+        """
+        return Table(
+            f"{self.table_name}_messages",
+            self.metadata,
+            Column("id", BigInteger, primary_key=True, autoincrement=True),
+            Column("session_id", String, nullable=False),
+            Column("message_data", postgresql.JSONB),
+            Column("created_at", BigInteger, server_default=text("(extract(epoch from now()))::bigint")),
+            # Serves loading the messages of a session in order
+            Index(f"idx_{self.table_name}_messages_session_id_id", "session_id", "id"),
+            schema=self.schema,  # type: ignore
+        )
+
     def table_exists(self) -> bool:
         """
         Check if the table exists in the database.
@@ -239,6 +297,21 @@ class PostgresStorage(Storage):
             except Exception as e:
                 logger.error(f"Could not create table: '{self.table.fullname}': {e}")
                 raise
+        self.create_runs_table()
+
+    def create_runs_table(self) -> None:
+        """
+        Create the runs and messages tables if runs are normalized and they do not exist.
+        """
+        if self.runs_table is None or self.messages_table is None or self._runs_table_created:
+            return
+        if self.schema is not None:
+            with self.Session() as sess, sess.begin():
+                sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
+        for table in (self.runs_table, self.messages_table):
+            log_debug(f"Creating table: {table.fullname}")
+            table.create(self.db_engine, checkfirst=True)
+        self._runs_table_created = True
 
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
@@ -251,18 +324,44 @@ class PostgresStorage(Storage):
         Returns:
             Optional[Session]: Session object if found, None otherwise.
         """
+        return self._read(session_id=session_id, user_id=user_id)
+
+    def read_last_runs(self, session_id: str, last_n_runs: int, user_id: Optional[str] = None) -> Optional[Session]:
+        """
+        Read a Session from the database with only its last runs in memory, if runs are normalized.
+        The memory then only holds the leading system messages, not the messages of earlier runs.
+
+        Args:
+            session_id (str): ID of the session to read.
+            last_n_runs (int): Number of runs to load, starting from the most recent one.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[Session]: Session object if found, None otherwise.
+        """
+        return self._read(session_id=session_id, user_id=user_id, last_n_runs=last_n_runs)
+
+    def _read(
+        self, session_id: str, user_id: Optional[str] = None, last_n_runs: Optional[int] = None
+    ) -> Optional[Session]:
         try:
-            with self.Session() as sess:
+            self.create_runs_table()
+            with self.Session() as sess, sess.begin():
                 stmt = select(self.table).where(self.table.c.session_id == session_id)
                 if user_id:
                     stmt = stmt.where(self.table.c.user_id == user_id)
                 result = sess.execute(stmt).fetchone()
+                if result is None:
+                    return None
+                row = dict(result._mapping)
+                if self.runs_table is not None:
+                    row["memory"] = self._read_runs(sess, session_id, row["memory"], last_n_runs)
                 if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None
+                    return AgentSession.from_dict(row)
                 elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None
+                    return TeamSession.from_dict(row)
                 elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None
+                    return WorkflowSession.from_dict(row)
         except Exception as e:
             if "does not exist" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -321,6 +420,7 @@ class PostgresStorage(Storage):
             List[Session]: List of Session objects matching the criteria.
         """
         try:
+            self.create_runs_table()
             with self.Session() as sess, sess.begin():
                 # get all sessions
                 stmt = select(self.table)
@@ -338,12 +438,15 @@ class PostgresStorage(Storage):
                 # execute query
                 rows = sess.execute(stmt).fetchall()
                 if rows is not None:
+                    mappings = [row._mapping for row in rows]
+                    if self.runs_table is not None:
+                        mappings = self._attach_runs(sess, mappings)
                     if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [AgentSession.from_dict(mapping) for mapping in mappings]  # type: ignore
                     elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [TeamSession.from_dict(mapping) for mapping in mappings]  # type: ignore
                     else:
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                        return [WorkflowSession.from_dict(mapping) for mapping in mappings]  # type: ignore
                 else:
                     return []
         except Exception as e:
@@ -387,10 +490,237 @@ class PostgresStorage(Storage):
                         sess.commit()
                         self._schema_up_to_date = True
                         log_info("Schema upgrade completed successfully")
+            if self.runs_table is not None and self.table_exists():
+                self.migrate_runs()
+                self._schema_up_to_date = True
         except Exception as e:
             logger.error(f"Error during schema upgrade: {e}")
             raise
 
+    def migrate_runs(self) -> int:
+        """
+        Move the runs and messages stored in the memory column of existing sessions to their tables.
+        Sessions are also migrated one at a time when they are read, so this is optional.
+
+        Returns:
+            int: The number of sessions migrated.
+        """
+        if self.runs_table is None:
+            log_warning("Runs are not normalized, set normalize_runs=True to migrate them.")
+            return 0
+
+        self.create_runs_table()
+        with self.Session() as sess:
+            session_ids = [
+                row[0]
+                for row in sess.execute(
+                    select(self.table.c.session_id).where(self.table.c.memory.is_not(None))
+                ).fetchall()
+            ]
+
+        migrated = 0
+        for session_id in session_ids:
+            with self.Session() as sess, sess.begin():
+                memory = sess.execute(select(self.table.c.memory).where(self.table.c.session_id == session_id)).scalar()
+                if isinstance(memory, dict) and self.is_denormalized(memory):
+                    self._move_runs(sess, session_id, memory)
+                    migrated += 1
+        log_info(f"Migrated the runs of {migrated} sessions to {self.runs_table.fullname}")
+        return migrated
+
+    @staticmethod
+    def get_run_id(run: Dict[str, Any]) -> str:
+        """
+        Get the id a run is stored under: its run_id, or a hash of its content if it has none.
+        """
+        run_id = run.get("run_id") or (run.get("response") or {}).get("run_id")
+        if run_id is None:
+            run_id = hashlib.md5(json.dumps(run, sort_keys=True, default=str).encode()).hexdigest()
+        return str(run_id)
+
+    @staticmethod
+    def split_memory(
+        memory: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Split a session's memory into what the memory column keeps, its runs and the messages of the messages table.
+        The leading system messages stay in the memory column, since agents replace them in place. The
+        messages_offset set by read_last_runs() is dropped, it is only used when writing the messages.
+
+        Returns:
+            Tuple: The memory for the memory column, the runs or None if the memory has no list of runs,
+                and the messages to store in the messages table.
+        """
+        runs: Optional[List[Dict[str, Any]]] = memory["runs"] if isinstance(memory.get("runs"), list) else None
+        column = {k: v for k, v in memory.items() if (k != "runs" or runs is None) and k != "messages_offset"}
+        messages: List[Dict[str, Any]] = []
+        if isinstance(memory.get("messages"), list):
+            num_system = 0
+            for message in memory["messages"]:
+                if not isinstance(message, dict) or message.get("role") not in ("system", "developer"):
+                    break
+                num_system += 1
+            column["messages"] = memory["messages"][:num_system]
+            messages = memory["messages"][num_system:]
+        return column, runs, messages
+
+    @classmethod
+    def is_denormalized(cls, memory: Dict[str, Any]) -> bool:
+        """
+        Check if a memory column still holds runs or messages that belong in their tables.
+        """
+        _, runs, messages = cls.split_memory(memory)
+        return runs is not None or len(messages) > 0
+
+    def _write_runs(self, sess: SqlSession, session_id: str, runs: List[Dict[str, Any]]) -> None:
+        """
+        Insert new runs of a session and update the ones whose content changed, leaving the others untouched.
+        """
+        assert self.runs_table is not None
+        # The last version of each run wins, in the order the runs were added
+        values = list(
+            {
+                run_id: {"session_id": session_id, "run_id": run_id, "run_data": run}
+                for run_id, run in ((self.get_run_id(run), run) for run in runs)
+            }.values()
+        )
+        for i in range(0, len(values), 500):
+            stmt = postgresql.insert(self.runs_table).values(values[i : i + 500])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id", "run_id"],
+                set_=dict(run_data=stmt.excluded.run_data, updated_at=int(time.time())),
+                where=self.runs_table.c.run_data != stmt.excluded.run_data,
+            )
+            sess.execute(stmt)
+
+    def _write_messages(
+        self, sess: SqlSession, session_id: str, messages: List[Dict[str, Any]], offset: int = 0
+    ) -> None:
+        """
+        Append the messages of a session that are not stored yet. Stored messages are never rewritten.
+
+        Args:
+            messages: The messages of the session after the leading system messages.
+            offset: The number of stored messages before the first of `messages`. A session read with all its
+                messages starts at 0, a session read with read_last_runs() starts after all stored messages.
+        """
+        assert self.messages_table is not None
+        table = self.messages_table
+        num_stored = sess.execute(select(func.count()).where(table.c.session_id == session_id)).scalar() or 0
+        values = [
+            {"session_id": session_id, "message_data": message} for message in messages[max(num_stored - offset, 0) :]
+        ]
+        for i in range(0, len(values), 500):
+            sess.execute(postgresql.insert(table).values(values[i : i + 500]))
+
+    def _move_runs(self, sess: SqlSession, session_id: str, memory: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Move the runs and messages kept in a session's memory column to their tables.
+
+        Returns:
+            Dict[str, Any]: The memory without runs and with only the leading system messages.
+        """
+        assert self.runs_table is not None
+        memory, legacy_runs, legacy_messages = self.split_memory(memory)
+        if legacy_runs:
+            # Runs already in the runs table are newer than the ones in the memory column
+            stmt = select(self.runs_table.c.run_id).where(self.runs_table.c.session_id == session_id)
+            existing = {row[0] for row in sess.execute(stmt).fetchall()}
+            legacy_runs = [run for run in legacy_runs if self.get_run_id(run) not in existing]
+            if len(legacy_runs) > 0:
+                self._write_runs(sess, session_id, legacy_runs)
+        if len(legacy_messages) > 0:
+            self._write_messages(sess, session_id, legacy_messages)
+        sess.execute(update(self.table).where(self.table.c.session_id == session_id).values(memory=memory))
+        return memory
+
+    def _read_runs(
+        self, sess: SqlSession, session_id: str, memory: Optional[Dict[str, Any]], last_n_runs: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load the runs and messages of a session into its memory, migrating those still kept in the memory column.
+
+        Returns:
+            Optional[Dict[str, Any]]: The memory with all runs and messages if `last_n_runs` is None. Otherwise the
+                memory with the last `last_n_runs` runs, only the leading system messages and a messages_offset
+                with the number of messages not loaded, which tells upsert() that the messages after them are new.
+        """
+        assert self.runs_table is not None and self.messages_table is not None
+        if memory is not None and not isinstance(memory.get("runs", []), list):
+            return memory
+        if memory is not None and self.is_denormalized(memory):
+            memory = self._move_runs(sess, session_id, memory)
+
+        stmt = (
+            select(self.runs_table.c.run_data)
+            .where(self.runs_table.c.session_id == session_id)
+            .order_by(self.runs_table.c.id.desc())
+        )
+        if last_n_runs is not None:
+            stmt = stmt.limit(last_n_runs)
+        runs = [row[0] for row in sess.execute(stmt).fetchall()][::-1]
+        table = self.messages_table
+        messages: List[Dict[str, Any]] = []
+        num_not_loaded = 0
+        if last_n_runs is None:
+            stmt = select(table.c.message_data).where(table.c.session_id == session_id).order_by(table.c.id)
+            messages = [row[0] for row in sess.execute(stmt).fetchall()]
+        else:
+            stmt = select(func.count()).where(table.c.session_id == session_id)
+            num_not_loaded = sess.execute(stmt).scalar() or 0
+        if memory is None and len(runs) == 0 and len(messages) == 0 and num_not_loaded == 0:
+            return None
+
+        memory = {**(memory or {}), "runs": runs}
+        if len(messages) > 0:
+            memory["messages"] = memory.get("messages", []) + messages
+        if last_n_runs is not None:
+            memory["messages_offset"] = num_not_loaded
+        return memory
+
+    def _attach_runs(self, sess: SqlSession, mappings: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Add all runs and messages of each session to its memory, after any still kept in the memory column.
+        """
+        assert self.runs_table is not None and self.messages_table is not None
+        session_ids = [mapping["session_id"] for mapping in mappings]
+        runs: Dict[str, List[Dict[str, Any]]] = {}
+        messages: Dict[str, List[Dict[str, Any]]] = {}
+        for i in range(0, len(session_ids), 500):
+            stmt = (
+                select(self.runs_table.c.session_id, self.runs_table.c.run_data)
+                .where(self.runs_table.c.session_id.in_(session_ids[i : i + 500]))
+                .order_by(self.runs_table.c.id)
+            )
+            for session_id, run_data in sess.execute(stmt).fetchall():
+                runs.setdefault(session_id, []).append(run_data)
+            stmt = (
+                select(self.messages_table.c.session_id, self.messages_table.c.message_data)
+                .where(self.messages_table.c.session_id.in_(session_ids[i : i + 500]))
+                .order_by(self.messages_table.c.id)
+            )
+            for session_id, message_data in sess.execute(stmt).fetchall():
+                messages.setdefault(session_id, []).append(message_data)
+
+        rows = []
+        for mapping in mappings:
+            row = dict(mapping)
+            memory = row["memory"]
+            session_runs = runs.get(row["session_id"], [])
+            session_messages = messages.get(row["session_id"], [])
+            if memory is None and (session_runs or session_messages):
+                memory = {"runs": session_runs}
+                if session_messages:
+                    memory["messages"] = session_messages
+                row["memory"] = memory
+            elif memory is not None and isinstance(memory.get("runs", []), list):
+                memory = {**memory, "runs": memory.get("runs", []) + session_runs}
+                if session_messages:
+                    memory["messages"] = memory.get("messages", []) + session_messages
+                row["memory"] = memory
+            rows.append(row)
+        return rows
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """
         Insert or update an Session in the database.
@@ -406,8 +736,26 @@ class PostgresStorage(Storage):
         if self.auto_upgrade_schema and not self._schema_up_to_date:
             self.upgrade_schema()
 
+        # With normalized runs the runs and messages go to their tables and the memory column keeps the rest
+        memory = session.memory
+        runs: Optional[List[Dict[str, Any]]] = None
+        messages: List[Dict[str, Any]] = []
+        messages_offset = 0
+        if self.runs_table is not None and memory is not None:
+            messages_offset = memory.get("messages_offset") or 0
+            memory, runs, messages = self.split_memory(memory)
+
         try:
+            self.create_runs_table()
             with self.Session() as sess, sess.begin():
+                if self.runs_table is not None:
+                    # Move runs and messages still kept in the memory column before it is overwritten
+                    stored_memory = sess.execute(
+                        select(self.table.c.memory).where(self.table.c.session_id == session.session_id)
+                    ).scalar()
+                    if isinstance(stored_memory, dict) and self.is_denormalized(stored_memory):
+                        self._move_runs(sess, session.session_id, stored_memory)
+
                 # Create an insert statement
                 if self.mode == "agent":
                     stmt = postgresql.insert(self.table).values(
@@ -415,7 +763,7 @@ class PostgresStorage(Storage):
                         agent_id=session.agent_id,  # type: ignore
                         team_session_id=session.team_session_id,  # type: ignore
                         user_id=session.user_id,
-                        memory=session.memory,
+                        memory=memory,
                         agent_data=session.agent_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -428,7 +776,7 @@ class PostgresStorage(Storage):
                             agent_id=session.agent_id,  # type: ignore
                             team_session_id=session.team_session_id,  # type: ignore
                             user_id=session.user_id,
-                            memory=session.memory,
+                            memory=memory,
                             agent_data=session.agent_data,  # type: ignore
                             session_data=session.session_data,
                             extra_data=session.extra_data,
@@ -441,7 +789,7 @@ class PostgresStorage(Storage):
                         team_id=session.team_id,  # type: ignore
                         user_id=session.user_id,
                         team_session_id=session.team_session_id,  # type: ignore
-                        memory=session.memory,
+                        memory=memory,
                         team_data=session.team_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -454,7 +802,7 @@ class PostgresStorage(Storage):
                             team_id=session.team_id,  # type: ignore
                             user_id=session.user_id,
                             team_session_id=session.team_session_id,  # type: ignore
-                            memory=session.memory,
+                            memory=memory,
                             team_data=session.team_data,  # type: ignore
                             session_data=session.session_data,
                             extra_data=session.extra_data,
@@ -466,7 +814,7 @@ class PostgresStorage(Storage):
                         session_id=session.session_id,
                         workflow_id=session.workflow_id,  # type: ignore
                         user_id=session.user_id,
-                        memory=session.memory,
+                        memory=memory,
                         workflow_data=session.workflow_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -478,7 +826,7 @@ class PostgresStorage(Storage):
                         set_=dict(
                             workflow_id=session.workflow_id,  # type: ignore
                             user_id=session.user_id,
-                            memory=session.memory,
+                            memory=memory,
                             workflow_data=session.workflow_data,  # type: ignore
                             session_data=session.session_data,
                             extra_data=session.extra_data,
@@ -487,6 +835,10 @@ class PostgresStorage(Storage):
                     )
 
                 sess.execute(stmt)
+                if runs:
+                    self._write_runs(sess, session.session_id, runs)
+                if len(messages) > 0:
+                    self._write_messages(sess, session.session_id, messages, offset=messages_offset)
         except Exception as e:
             if create_and_retry and not self.table_exists():
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -499,6 +851,8 @@ class PostgresStorage(Storage):
                     "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
                 )
                 return None
+        if runs is not None:
+            return self.read_last_runs(session_id=session.session_id, last_n_runs=len(runs))
         return self.read(session_id=session.session_id)
 
     def delete_session(self, session_id: Optional[str] = None):
@@ -516,10 +870,14 @@ class PostgresStorage(Storage):
             return
 
         try:
+            self.create_runs_table()
             with self.Session() as sess, sess.begin():
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.runs_table is not None and self.messages_table is not None:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    sess.execute(self.messages_table.delete().where(self.messages_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -535,9 +893,16 @@ class PostgresStorage(Storage):
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
             self.table.drop(self.db_engine, checkfirst=True)
+            if self.runs_table is not None and self.messages_table is not None:
+                self.runs_table.drop(self.db_engine, checkfirst=True)
+                self.messages_table.drop(self.db_engine, checkfirst=True)
+                self._runs_table_created = False
             # Clear metadata to ensure indexes are recreated properly
             self.metadata = MetaData(schema=self.schema)
             self.table = self.get_table()
+            if self.runs_table is not None:
+                self.runs_table = self.get_runs_table()
+                self.messages_table = self.get_messages_table()
 
     def __deepcopy__(self, memo):
         """
@@ -558,7 +923,7 @@ class PostgresStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "messages_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
             elif k in {"db_engine", "SqlSession"}:
@@ -570,5 +935,7 @@ class PostgresStorage(Storage):
         copied_obj.metadata = MetaData(schema=copied_obj.schema)
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table() if copied_obj.normalize_runs else None
+        copied_obj.messages_table = copied_obj.get_messages_table() if copied_obj.normalize_runs else None
 
         return copied_obj
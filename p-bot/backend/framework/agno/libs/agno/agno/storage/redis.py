@@ -1,7 +1,7 @@
 import json
 import time
 from dataclasses import asdict
-from typing import List, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional
 
 from agno.storage.base import Storage
 from agno.storage.session import Session
@@ -17,6 +17,9 @@ except ImportError:
 
 
 class RedisStorage(Storage):
+    # Session fields that sessions can be listed by
+    index_fields = ("user_id", "agent_id", "team_id", "workflow_id")
+
     def __init__(
         self,
         prefix: str,
@@ -29,6 +32,10 @@ class RedisStorage(Storage):
         """
         Initialize Redis storage for sessions.
 
+        Sessions are listed through an index kept next to them: a set of session ids per user_id and per
+        agent / team / workflow id, and a hash with the indexed fields of each session. Listing the sessions
+        of a user only reads that user's sessions, with one MGET per batch.
+
         Args:
             prefix (str): Prefix for Redis keys to namespace the sessions
             host (str): Redis host address
@@ -46,12 +53,104 @@ class RedisStorage(Storage):
             password=password,
             decode_responses=True,  # Automatically decode responses to str
         )
+        # Set once the index is known to cover every session
+        self._index_ready = False
         log_debug(f"Created RedisStorage with prefix: '{self.prefix}'")
 
     def _get_key(self, session_id: str) -> str:
         """Generate Redis key for a session."""
         return f"{self.prefix}:{session_id}"
 
+    def _get_index_key(self, *parts: str) -> str:
+        """Generate Redis key for the session index. It is outside the `{prefix}:*` namespace of sessions."""
+        return ":".join([f"{self.prefix}_index", *parts])
+
+    def _get_index_sets(self, fields: Dict[str, Any]) -> List[str]:
+        """Get the keys of the index sets a session with these fields belongs to."""
+        keys = [self._get_index_key("all")]
+        for field in self.index_fields:
+            if fields.get(field) is not None:
+                keys.append(self._get_index_key(field, str(fields[field])))
+        return keys
+
+    def _index_session(self, pipeline: Any, session_id: str, data: Dict[str, Any], previous: Optional[str]) -> None:
+        """Queue the index updates for a session on a pipeline."""
+        fields = {field: data.get(field) for field in self.index_fields if data.get(field) is not None}
+        index_sets = self._get_index_sets(fields)
+        if previous is not None:
+            for key in set(self._get_index_sets(self.deserialize(previous))) - set(index_sets):
+                pipeline.srem(key, session_id)
+        for key in index_sets:
+            pipeline.sadd(key, session_id)
+        pipeline.hset(self._get_index_key("fields"), session_id, self.serialize(fields))
+
+    def rebuild_index(self) -> int:
+        """
+        Build the session index from the stored sessions, e.g. for sessions written before it existed.
+
+        Returns:
+            int: The number of sessions indexed.
+        """
+        count = 0
+        self._delete_index()
+        keys: List[str] = []
+        for key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+            keys.append(key)
+            if len(keys) == 500:
+                count += self._index_keys(keys)
+                keys = []
+        count += self._index_keys(keys)
+        self.redis_client.set(self._get_index_key("ready"), "1")
+        self._index_ready = True
+        log_info(f"Indexed {count} sessions with prefix: {self.prefix}")
+        return count
+
+    def _index_keys(self, keys: List[str]) -> int:
+        """Index the sessions stored under a batch of keys."""
+        if len(keys) == 0:
+            return 0
+        pipeline = self.redis_client.pipeline()
+        count = 0
+        for value in self.redis_client.mget(keys):
+            if value is None:
+                continue
+            data = self.deserialize(value)  # type: ignore
+            self._index_session(pipeline, data["session_id"], data, None)
+            count += 1
+        pipeline.execute()
+        return count
+
+    def _delete_index(self) -> None:
+        """Delete every key of the session index."""
+        for key in self.redis_client.scan_iter(match=f"{self.prefix}_index:*"):
+            self.redis_client.delete(key)
+        self._index_ready = False
+
+    def _get_indexed_session_ids(self, user_id: Optional[str], entity_id: Optional[str]) -> List[str]:
+        """Get the ids of the sessions matching the filters from the index."""
+        if not self._index_ready:
+            if self.redis_client.get(self._get_index_key("ready")) is None:
+                self.rebuild_index()
+            self._index_ready = True
+
+        keys = [self._get_index_key("all")]
+        if user_id or entity_id:
+            keys = []
+            if user_id:
+                keys.append(self._get_index_key("user_id", user_id))
+            if entity_id:
+                keys.append(self._get_index_key(f"{self.mode}_id", entity_id))
+        session_ids = self.redis_client.sinter(keys) if len(keys) > 1 else self.redis_client.smembers(keys[0])
+        return sorted(session_ids)  # type: ignore
+
+    def _get_many(self, session_ids: List[str]) -> Iterable[Dict[str, Any]]:
+        """Fetch and deserialize sessions with one MGET per batch, skipping missing ones."""
+        for i in range(0, len(session_ids), 500):
+            values = self.redis_client.mget([self._get_key(session_id) for session_id in session_ids[i : i + 500]])
+            for value in values:
+                if value is not None:
+                    yield self.deserialize(value)  # type: ignore
+
     def serialize(self, data: dict) -> str:
         """Serialize data to JSON string."""
         return json.dumps(data, ensure_ascii=False)
@@ -97,89 +196,33 @@ class RedisStorage(Storage):
 
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """Get all session IDs, optionally filtered by user_id and/or entity_id."""
-        session_ids = []
         try:
-            # Get all keys matching the prefix pattern
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                if user_id or entity_id:
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            session_ids.append(data["session_id"])
-                    elif user_id and data["user_id"] == user_id:
-                        session_ids.append(data["session_id"])
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                else:
-                    # No filters applied, add all session_ids
-                    session_ids.append(data["session_id"])
-
+            return self._get_indexed_session_ids(user_id, entity_id)
         except Exception as e:
             logger.error(f"Error getting session IDs: {e}")
-
-        return session_ids
+        return []
 
     def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
         """Get all sessions, optionally filtered by user_id and/or entity_id."""
         sessions: List[Session] = []
         try:
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                if user_id or entity_id:
-                    _session: Optional[Session] = None
-
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            _session = TeamSession.from_dict(data)
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            _session = WorkflowSession.from_dict(data)
-                    elif user_id and data["user_id"] == user_id:
-                        if self.mode == "agent":
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team":
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow":
-                            _session = WorkflowSession.from_dict(data)
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSession.from_dict(data)
-
-                    if _session:
-                        sessions.append(_session)
-                else:
-                    _session = None
-                    # No filters applied, add all sessions
-                    if self.mode == "agent":
-                        _session = AgentSession.from_dict(data)
-                    elif self.mode == "team":
-                        _session = TeamSession.from_dict(data)
-                    elif self.mode == "workflow":
-                        _session = WorkflowSession.from_dict(data)
-                    if _session:
-                        sessions.append(_session)
+            session_ids = self._get_indexed_session_ids(user_id, entity_id)
+            for data in self._get_many(session_ids):
+                # The index is updated with the session, check the filters in case another writer got in between
+                if user_id and data.get("user_id") != user_id:
+                    continue
+                if entity_id and data.get(f"{self.mode}_id") != entity_id:
+                    continue
+
+                _session: Optional[Session] = None
+                if self.mode == "agent":
+                    _session = AgentSession.from_dict(data)
+                elif self.mode == "team":
+                    _session = TeamSession.from_dict(data)
+                elif self.mode == "workflow":
+                    _session = WorkflowSession.from_dict(data)
+                if _session:
+                    sessions.append(_session)
 
         except Exception as e:
             logger.error(f"Error getting all sessions: {e}")
@@ -195,7 +238,12 @@ class RedisStorage(Storage):
                 data["created_at"] = data["updated_at"]
 
             key = self._get_key(session.session_id)
-            self.redis_client.set(key, self.serialize(data))
+            previous = self.redis_client.hget(self._get_index_key("fields"), session.session_id)
+            # Write the session and its index entries together
+            pipeline = self.redis_client.pipeline()
+            pipeline.set(key, self.serialize(data))
+            self._index_session(pipeline, session.session_id, data, previous)  # type: ignore
+            pipeline.execute()
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -207,7 +255,14 @@ class RedisStorage(Storage):
             return
         try:
             key = self._get_key(session_id)
-            self.redis_client.delete(key)
+            previous = self.redis_client.hget(self._get_index_key("fields"), session_id)
+            pipeline = self.redis_client.pipeline()
+            if previous is not None:
+                for index_key in self._get_index_sets(self.deserialize(previous)):  # type: ignore
+                    pipeline.srem(index_key, session_id)
+                pipeline.hdel(self._get_index_key("fields"), session_id)
+            pipeline.delete(key)
+            pipeline.execute()
             log_debug(f"Deleted session: {session_id}")
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
@@ -218,6 +273,7 @@ class RedisStorage(Storage):
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
                 self.redis_client.delete(key)
+            self._delete_index()
             log_info(f"Dropped all sessions with prefix: {self.prefix}")
         except Exception as e:
             logger.error(f"Error dropping sessions: {e}")
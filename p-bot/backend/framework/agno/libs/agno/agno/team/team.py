@@ -1,8 +1,12 @@
 import asyncio
 import json
 from collections import ChainMap, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import wait as wait_futures
 from dataclasses import asdict, dataclass, replace
 from os import getenv
+from time import monotonic
 from typing import (
     Any,
     AsyncIterator,
@@ -146,6 +150,11 @@ class Team:
     enable_agentic_context: bool = False
     # If True, send all previous member interactions to members
     share_member_interactions: bool = False
+    # In collaborate mode, the most members run at the same time by a synchronous run. None runs all members at once,
+    # except when streaming: streamed runs only run members in parallel if this is above 1.
+    max_member_workers: Optional[int] = None
+    # In collaborate mode, seconds to wait for the members of a synchronous run before returning without the slow ones
+    member_timeout: Optional[float] = None
     # If True, add a tool to get information about the team members
     get_member_information_tool: bool = False
     # Add a tool to search the knowledge base (aka Agentic RAG)
@@ -250,6 +259,8 @@ class Team:
         references_format: Literal["json", "yaml"] = "json",
         enable_agentic_context: bool = False,
         share_member_interactions: bool = False,
+        max_member_workers: Optional[int] = None,
+        member_timeout: Optional[float] = None,
         get_member_information_tool: bool = False,
         search_knowledge: bool = True,
         read_team_history: bool = False,
@@ -313,6 +324,8 @@ class Team:
 
         self.enable_agentic_context = enable_agentic_context
         self.share_member_interactions = share_member_interactions
+        self.max_member_workers = max_member_workers
+        self.member_timeout = member_timeout
         self.get_member_information_tool = get_member_information_tool
         self.search_knowledge = search_knowledge
         self.read_team_history = read_team_history
@@ -389,6 +402,9 @@ class Team:
 
         self._formatter: Optional[SafeFormatter] = None
 
+        # Member runs that outlived member_timeout and still use their member, by id of the member
+        self._abandoned_member_runs: Dict[int, Future] = {}
+
     def _set_team_id(self) -> str:
         if self.team_id is None:
             self.team_id = str(uuid4())
@@ -525,7 +541,12 @@ class Team:
         files: Optional[Sequence[File]] = None,
         **kwargs: Any,
     ) -> Union[TeamRunResponse, Iterator[TeamRunResponse]]:
-        """Run the Team and return the response."""
+        """Run the Team and return the response.
+
+        In collaborate mode with stream=True the members run one after another and their output is streamed as it
+        is generated. Set max_member_workers above 1 to run them in parallel instead, in which case each member's
+        output is yielded in full once it is done, in member order.
+        """
 
         retries = retries or 3
         if retries < 1:
@@ -4873,51 +4894,8 @@ class Team:
             if team_member_interactions_str:
                 member_agent_task += f"\n\n{team_member_interactions_str}"
 
-            for member_agent_index, member_agent in enumerate(self.members):
-                if stream:
-                    member_agent_run_response_stream = member_agent.run(
-                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
-                    )
-                    for member_agent_run_response_chunk in member_agent_run_response_stream:
-                        check_if_run_cancelled(member_agent_run_response_chunk)
-                        if member_agent_run_response_chunk.content is not None:
-                            yield member_agent_run_response_chunk.content
-                        elif (
-                            member_agent_run_response_chunk.tools is not None
-                            and len(member_agent_run_response_chunk.tools) > 0
-                        ):
-                            yield ",".join([tool.get("content", "") for tool in member_agent_run_response_chunk.tools])
-                else:
-                    member_agent_run_response = member_agent.run(
-                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
-                    )
-
-                    check_if_run_cancelled(member_agent_run_response)
-
-                    if member_agent_run_response.content is None and (
-                        member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
-                    ):
-                        yield f"Agent {member_agent.name}: No response from the member agent."
-                    elif isinstance(member_agent_run_response.content, str):
-                        if len(member_agent_run_response.content.strip()) > 0:
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content}"
-                        elif member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0:
-                            yield f"Agent {member_agent.name}: {','.join([tool.get('content', '') for tool in member_agent_run_response.tools])}"
-                    elif issubclass(type(member_agent_run_response.content), BaseModel):
-                        try:
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
-                        except Exception as e:
-                            yield f"Agent {member_agent.name}: Error - {str(e)}"
-                    else:
-                        try:
-                            import json
-
-                            yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"
-                        except Exception as e:
-                            yield f"Agent {member_agent.name}: Error - {str(e)}"
-
+            def record_member_run(member_name: str, member_agent: Union[Agent, "Team"]) -> None:
                 # Update the memory
-                member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
                 if isinstance(self.memory, TeamMemory):
                     self.memory = cast(TeamMemory, self.memory)
                     self.memory.add_interaction_to_team_context(
@@ -4941,6 +4919,39 @@ class Team:
                 # Update the team state
                 self._update_team_state(member_agent.run_response)  # type: ignore
 
+            if stream and (self.max_member_workers is None or self.max_member_workers == 1):
+                # Members run one after another, so their output can be streamed
+                for member_agent_index, member_agent in enumerate(self.members):
+                    self._wait_for_abandoned_member_run(member_agent)
+                    member_agent_run_response_stream = member_agent.run(
+                        member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=True
+                    )
+                    for member_agent_run_response_chunk in member_agent_run_response_stream:
+                        check_if_run_cancelled(member_agent_run_response_chunk)
+                        if member_agent_run_response_chunk.content is not None:
+                            yield member_agent_run_response_chunk.content
+                        elif (
+                            member_agent_run_response_chunk.tools is not None
+                            and len(member_agent_run_response_chunk.tools) > 0
+                        ):
+                            yield ",".join([tool.get("content", "") for tool in member_agent_run_response_chunk.tools])
+
+                    member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                    record_member_run(member_name, member_agent)
+            else:
+                # Run the members concurrently, and report and record their results in member order
+                for member_agent_index, member_agent, member_agent_run_response, error in self._run_members_in_parallel(
+                    member_agent_task, images=images, videos=videos, audio=audio, files=files
+                ):
+                    member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
+                    if member_agent_run_response is None:
+                        yield f"Agent {member_name}: {error}"
+                        continue
+
+                    check_if_run_cancelled(member_agent_run_response)
+                    yield self._get_member_response_str(member_name, member_agent_run_response)
+                    record_member_run(member_name, member_agent)
+
             # Afterward, switch back to the team logger
             use_team_logger()
 
@@ -5013,6 +5024,7 @@ class Team:
                 current_index = member_agent_index  # Create a reference to the current index
 
                 async def run_member_agent(agent=current_agent, idx=current_index) -> str:
+                    await asyncio.to_thread(self._wait_for_abandoned_member_run, agent)
                     response = await agent.arun(
                         member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
                     )
@@ -5082,6 +5094,82 @@ class Team:
 
         return run_member_agents_func
 
+    def _run_members_in_parallel(
+        self,
+        member_agent_task: str,
+        images: Optional[List[Image]] = None,
+        videos: Optional[List[Video]] = None,
+        audio: Optional[List[Audio]] = None,
+        files: Optional[List[File]] = None,
+    ) -> Iterator[Tuple[int, Union[Agent, "Team"], Optional[Union[RunResponse, TeamRunResponse]], Optional[str]]]:
+        """Run all members on a task on a bounded thread pool.
+
+        Yields (index, member, run response, error) in member order, each as soon as it and the members before it
+        are done. A member that fails or is not done within member_timeout yields an error instead of a run response,
+        and the other members still yield their results. Members still waiting for a worker are cancelled once the
+        caller stops iterating, while a member that is already running finishes in the background and is ignored.
+        The next run of such a member waits for it to finish, so a member never runs twice at the same time.
+        """
+        max_workers = len(self.members)
+        if self.max_member_workers is not None:
+            max_workers = max(1, min(self.max_member_workers, max_workers))
+
+        def run_member(member: Union[Agent, "Team"]) -> Union[RunResponse, TeamRunResponse]:
+            self._wait_for_abandoned_member_run(member)
+            return member.run(  # type: ignore
+                member_agent_task, images=images, videos=videos, audio=audio, files=files, stream=False
+            )
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-team-member")
+        try:
+            futures = [executor.submit(run_member, member) for member in self.members]
+            # The timeout includes the time spent waiting for a free worker
+            deadline = monotonic() + self.member_timeout if self.member_timeout is not None else None
+            for member_index, (member, future) in enumerate(zip(self.members, futures)):
+                try:
+                    timeout = max(0.0, deadline - monotonic()) if deadline is not None else None
+                    response = cast(Union[RunResponse, TeamRunResponse], future.result(timeout=timeout))
+                    yield member_index, member, response, None
+                except FuturesTimeoutError:
+                    if not future.cancel():
+                        self._abandoned_member_runs[id(member)] = future
+                    log_warning(f"Member {member.name} did not respond within {self.member_timeout} seconds")
+                    yield member_index, member, None, f"No response within {self.member_timeout} seconds."
+                except (RunCancelledException, KeyboardInterrupt):
+                    raise
+                except Exception as e:
+                    log_warning(f"Member {member.name} failed: {e}")
+                    yield member_index, member, None, f"Error - {str(e)}"
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _wait_for_abandoned_member_run(self, member: Union[Agent, "Team"]) -> None:
+        """Wait for a run of the member that an earlier run stopped waiting for after member_timeout."""
+        future = self._abandoned_member_runs.pop(id(member), None)
+        if future is not None and not future.done():
+            log_warning(f"Waiting for member {member.name} to finish a run that timed out")
+            wait_futures([future])
+
+    def _get_member_response_str(self, member_name: str, response: Union[RunResponse, TeamRunResponse]) -> str:
+        if response.content is None and (response.tools is None or len(response.tools) == 0):
+            return f"Agent {member_name}: No response from the member agent."
+        elif isinstance(response.content, str):
+            if len(response.content.strip()) > 0:
+                return f"Agent {member_name}: {response.content}"
+            elif response.tools is not None and len(response.tools) > 0:
+                return f"Agent {member_name}: {','.join([tool.get('content', '') for tool in response.tools])}"
+        elif issubclass(type(response.content), BaseModel):
+            try:
+                return f"Agent {member_name}: {response.content.model_dump_json(indent=2)}"  # type: ignore
+            except Exception as e:
+                return f"Agent {member_name}: Error - {str(e)}"
+        else:
+            try:
+                return f"Agent {member_name}: {json.dumps(response.content, indent=2)}"
+            except Exception as e:
+                return f"Agent {member_name}: Error - {str(e)}"
+        return f"Agent {member_name}: No Response"
+
     def get_transfer_task_function(
         self,
         session_id: str,
@@ -6166,9 +6254,14 @@ class Team:
     # Logging
     ###########################################################################
 
-    def _create_run_data(self) -> Dict[str, Any]:
-        """Create and return the run data dictionary."""
+    def _create_run_data(self) -> Callable[[], Dict[str, Any]]:
+        """Snapshot the run, and return a function that creates the run data dictionary from it.
+
+        The next run replaces rather than changes the objects in the snapshot, so the function can serialize them
+        on the API dispatcher thread.
+        """
         run_response_format = "text"
+        run_response = cast(TeamRunResponse, self.run_response)
         if self.response_model is not None:
             run_response_format = "json"
         elif self.markdown:
@@ -6176,23 +6269,28 @@ class Team:
 
         functions = {}
         if self.model is not None and self.model._functions is not None:
-            functions = {
-                f_name: func.to_dict() for f_name, func in self.model._functions.items() if isinstance(func, Function)
+            functions = dict(self.model._functions)
+        run_input = self.run_input
+        monitoring = self.monitoring
+
+        def run_data() -> Dict[str, Any]:
+            data: Dict[str, Any] = {
+                "functions": {
+                    f_name: func.to_dict() for f_name, func in functions.items() if isinstance(func, Function)
+                },
+                "metrics": run_response.metrics,
             }
 
-        run_data: Dict[str, Any] = {
-            "functions": functions,
-            "metrics": self.run_response.metrics,  # type: ignore
-        }
+            if monitoring:
+                data.update(
+                    {
+                        "run_input": run_input,
+                        "run_response": run_response.to_dict(),
+                        "run_response_format": run_response_format,
+                    }
+                )
 
-        if self.monitoring:
-            run_data.update(
-                {
-                    "run_input": self.run_input,
-                    "run_response": self.run_response.to_dict(),  # type: ignore
-                    "run_response_format": run_response_format,
-                }
-            )
+            return data
 
         return run_data
 
@@ -6255,71 +6353,73 @@ class Team:
             created_at=int(time()),
         )
 
-    def _log_team_run(self, session_id: str, user_id: Optional[str] = None) -> None:
-        if not self.telemetry and not self.monitoring:
-            return
+    def _get_event_session(self, session_id: str, user_id: Optional[str] = None) -> TeamSession:
+        """Get the session sent with API events.
 
-        from agno.api.team import TeamRunCreate, create_team_run
+        Telemetry only sends the model and timestamps of the session, so its memory is not serialized for it.
+        """
+        if self.team_session is not None:
+            return self.team_session
+        if self.monitoring:
+            return self._get_team_session(session_id=session_id, user_id=user_id)
 
-        try:
-            run_data = self._create_run_data()
-            team_session: TeamSession = self.team_session or self._get_team_session(
-                session_id=session_id, user_id=user_id
-            )
+        from time import time
 
-            create_team_run(
-                run=TeamRunCreate(
-                    run_id=self.run_id,  # type: ignore
-                    run_data=run_data,
-                    team_session_id=team_session.team_session_id,
-                    session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
-                ),
-                monitor=self.monitoring,
-            )
-        except Exception as e:
-            log_debug(f"Could not create team event: {e}")
+        return TeamSession(
+            session_id=session_id,
+            team_id=self.team_id,
+            user_id=user_id,
+            team_session_id=self.team_session_id,
+            team_data=self._get_team_data(),
+            created_at=int(time()),
+        )
 
-    async def _alog_team_run(self, session_id: str, user_id: Optional[str] = None) -> None:
+    def _log_team_run(self, session_id: str, user_id: Optional[str] = None) -> None:
         if not self.telemetry and not self.monitoring:
             return
 
-        from agno.api.team import TeamRunCreate, acreate_team_run
+        from agno.api.team import TeamRunCreate, queue_team_run
 
         try:
             run_data = self._create_run_data()
-            team_session: TeamSession = self.team_session or self._get_team_session(
-                session_id=session_id, user_id=user_id
-            )
-
-            await acreate_team_run(
-                run=TeamRunCreate(
-                    run_id=self.run_id,
-                    run_data=run_data,
+            team_session = self._get_event_session(session_id=session_id, user_id=user_id)
+            run_id = cast(str, self.run_id)
+            monitoring = self.monitoring
+
+            queue_team_run(
+                run_id=run_id,
+                run=lambda: TeamRunCreate(
+                    run_id=run_id,
+                    run_data=run_data(),
+                    team_session_id=team_session.team_session_id,
                     session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
+                    team_data=team_session.to_dict() if monitoring else team_session.telemetry_data(),
                 ),
-                monitor=self.monitoring,
+                monitor=monitoring,
             )
         except Exception as e:
             log_debug(f"Could not create team event: {e}")
 
+    async def _alog_team_run(self, session_id: str, user_id: Optional[str] = None) -> None:
+        # Sending happens on the background dispatcher, so there is nothing to await
+        self._log_team_run(session_id=session_id, user_id=user_id)
+
     def _log_team_session(self, session_id: str, user_id: Optional[str] = None):
         if not (self.telemetry or self.monitoring):
             return
 
-        from agno.api.team import TeamSessionCreate, upsert_team_session
+        from agno.api.team import TeamSessionCreate, queue_team_session
 
         try:
-            team_session: TeamSession = self.team_session or self._get_team_session(
-                session_id=session_id, user_id=user_id
-            )
-            upsert_team_session(
-                session=TeamSessionCreate(
+            team_session = self._get_event_session(session_id=session_id, user_id=user_id)
+            monitoring = self.monitoring
+            queue_team_session(
+                session_id=team_session.session_id,
+                session=lambda: TeamSessionCreate(
                     session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
+                    team_data=team_session.to_dict() if monitoring else team_session.telemetry_data(),
                 ),
-                monitor=self.monitoring,
+                monitor=monitoring,
             )
         except Exception as e:
             log_debug(f"Could not create team monitor: {e}")
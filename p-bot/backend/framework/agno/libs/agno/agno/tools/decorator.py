@@ -29,6 +29,8 @@ def tool(
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    max_concurrency: Optional[int] = None,
+    concurrency_group: Optional[str] = None,
 ) -> Callable[[F], Function]: ...
 
 
@@ -53,6 +55,8 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         cache_results: bool - If True, enable caching of function results
         cache_dir: Optional[str] - Directory to store cache files
         cache_ttl: int - Time-to-live for cached results in seconds
+        max_concurrency: Optional[int] - Maximum number of calls running at the same time in concurrent tool calls
+        concurrency_group: Optional[str] - Tools with the same concurrency group share the max_concurrency limit
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -86,6 +90,8 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "max_concurrency",
+            "concurrency_group",
         }
     )
 
@@ -0,0 +1,152 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import cpu_count, getenv
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from agno.tools.function import Function, FunctionCall
+from agno.utils.log import log_warning
+
+# Maximum number of tool calls running at the same time across all Models in the process
+DEFAULT_MAX_TOOL_WORKERS = min(32, (cpu_count() or 1) + 4)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_limits: Dict[str, "ConcurrencyLimit"] = {}
+_limits_lock = threading.Lock()
+_worker_state = threading.local()
+
+T = TypeVar("T")
+
+
+def _mark_worker() -> None:
+    _worker_state.is_tool_worker = True
+
+
+class ConcurrencyLimit:
+    """
+    Limits how many calls of a concurrency group run on the tool executor at the same time.
+
+    Calls over the limit wait in a queue instead of on a worker thread, and are submitted to the
+    executor as running calls of the group finish, so a limited tool never holds workers that
+    other tool calls could use.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.running = 0
+        self._waiting: Deque[Tuple[Future, Callable[..., Any], Tuple[Any, ...]]] = deque()
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ConcurrencyLimit":
+        # A copied Function or Toolkit calls the same tools, so it keeps the same limit
+        return self
+
+    def submit(self, executor: ThreadPoolExecutor, fn: Callable[..., Any], *args: Any) -> Future:
+        """Returns a future for fn(*args), which is run on the executor once the group is below its limit."""
+        future: Future = Future()
+        with self._lock:
+            if self.running >= self.limit:
+                self._waiting.append((future, fn, args))
+                return future
+            self.running += 1
+        self._start(executor, future, fn, args)
+        return future
+
+    def _start(
+        self, executor: ThreadPoolExecutor, future: Future, fn: Callable[..., Any], args: Tuple[Any, ...]
+    ) -> None:
+        if not future.set_running_or_notify_cancel():
+            self._finish(executor)
+            return
+        try:
+            task = executor.submit(fn, *args)
+        except BaseException as e:
+            future.set_exception(e)
+            self._finish(executor)
+            return
+        task.add_done_callback(lambda done: self._done(executor, future, done))
+
+    def _done(self, executor: ThreadPoolExecutor, future: Future, task: Future) -> None:
+        exception = task.exception()
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(task.result())
+        self._finish(executor)
+
+    def _finish(self, executor: ThreadPoolExecutor) -> None:
+        # Hand the slot of a finished call to the next waiting call
+        with self._lock:
+            if not self._waiting:
+                self.running -= 1
+                return
+            future, fn, args = self._waiting.popleft()
+        self._start(executor, future, fn, args)
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    """
+    Returns the thread pool that runs tool calls concurrently, shared by all Models in the process.
+
+    The pool is created on first use with AGNO_MAX_TOOL_WORKERS threads, or DEFAULT_MAX_TOOL_WORKERS if unset.
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                max_workers = int(getenv("AGNO_MAX_TOOL_WORKERS", DEFAULT_MAX_TOOL_WORKERS))
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="agno-tool", initializer=_mark_worker
+                )
+    return _executor
+
+
+def in_tool_worker() -> bool:
+    """
+    Returns True if called from a thread of the tool executor.
+
+    Tool calls started from inside another tool call, e.g. by an Agent used as a tool, run sequentially
+    so they never wait on workers of the same bounded pool.
+    """
+    return getattr(_worker_state, "is_tool_worker", False)
+
+
+def get_concurrency_limit(function: Function) -> Optional[ConcurrencyLimit]:
+    """
+    Returns the limit on how many calls of a function run at the same time, or None if it has no limit.
+
+    Functions with the same concurrency_group share one limit in the process, created with the max_concurrency of
+    the first of them to run. Other functions have a limit of their own, shared by the functions of a Toolkit.
+    """
+    if function.max_concurrency is None:
+        return None
+
+    with _limits_lock:
+        if function._concurrency_limit is None:
+            group = function.concurrency_group
+            if group is None:
+                function._concurrency_limit = ConcurrencyLimit(function.max_concurrency)
+            else:
+                if group not in _limits:
+                    _limits[group] = ConcurrencyLimit(function.max_concurrency)
+                elif _limits[group].limit != function.max_concurrency:
+                    log_warning(
+                        f"Function {function.name} has max_concurrency={function.max_concurrency}, but its concurrency "
+                        f"group {group} already has a limit of {_limits[group].limit}, which is kept"
+                    )
+                function._concurrency_limit = _limits[group]
+        return function._concurrency_limit
+
+
+def submit_tool_calls(fn: Callable[[FunctionCall], T], function_calls: Sequence[FunctionCall]) -> List["Future[T]"]:
+    """
+    Runs fn(function_call) for each function call on the tool executor, within the limits of their functions.
+    """
+    executor = get_tool_executor()
+    limits = [get_concurrency_limit(function_call.function) for function_call in function_calls]
+    return [
+        executor.submit(fn, function_call) if limit is None else limit.submit(executor, fn, function_call)
+        for function_call, limit in zip(function_calls, limits)
+    ]
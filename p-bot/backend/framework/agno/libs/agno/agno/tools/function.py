@@ -74,9 +74,18 @@ class Function(BaseModel):
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
 
+    # Concurrency configuration, used when the Model runs tool calls concurrently
+    # Maximum number of calls of this function running at the same time.
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+    # Functions with the same concurrency group share the max_concurrency limit across the process.
+    # Without a group the limit applies to this Function, or to all functions of its Toolkit.
+    concurrency_group: Optional[str] = None
+
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
     _agent: Optional[Any] = None
+    # The ConcurrencyLimit of the function, shared with the other functions of its Toolkit or concurrency group
+    _concurrency_limit: Optional[Any] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump(exclude_none=True, include={"name", "description", "parameters", "strict"})
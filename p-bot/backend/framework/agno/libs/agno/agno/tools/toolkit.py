@@ -1,6 +1,7 @@
 from collections import OrderedDict
 from typing import Any, Callable, Dict, Optional
 
+from agno.tools.executor import ConcurrencyLimit
 from agno.tools.function import Function
 from agno.utils.log import log_debug, logger
 
@@ -14,6 +15,7 @@ class Toolkit:
         cache_results: bool = False,
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
     ):
         """Initialize a new Toolkit.
 
@@ -24,6 +26,8 @@ class Toolkit:
             cache_results (bool): Enable in-memory caching of function results.
             cache_ttl (int): Time-to-live for cached results in seconds.
             cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
+            max_concurrency (Optional[int]): Maximum number of calls of the toolkit's functions running at the same
+                time when tool calls run concurrently. The limit is shared by all functions of the toolkit.
         """
         self.name: str = name
         self.functions: Dict[str, Function] = OrderedDict()
@@ -32,6 +36,11 @@ class Toolkit:
         self.cache_results: bool = cache_results
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
+        self.max_concurrency: Optional[int] = max_concurrency
+        # The limit shared by the functions of this toolkit, not by other toolkits with the same name
+        self._concurrency_limit: Optional[ConcurrencyLimit] = (
+            ConcurrencyLimit(max_concurrency) if max_concurrency is not None else None
+        )
 
     def register(self, function: Callable[..., Any], sanitize_arguments: bool = True, name: Optional[str] = None):
         """Register a function with the toolkit.
@@ -50,7 +59,9 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                max_concurrency=self.max_concurrency,
             )
+            f._concurrency_limit = self._concurrency_limit
             self.functions[f.name] = f
             log_debug(f"Function: {f.name} registered with {self.name}")
         except Exception as e:
@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import threading
 from time import sleep
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
@@ -10,6 +11,14 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_BACKOFF_FACTOR = 2  # Exponential backoff: 1, 2, 4, 8...
 
+DEFAULT_ASYNC_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+
+# Shared async clients. An httpx.AsyncClient is bound to the event loop it first ran on,
+# so clients are kept per loop and per set of connection limits.
+_async_clients: Dict[asyncio.AbstractEventLoop, Dict[Tuple, httpx.AsyncClient]] = {}
+_async_clients_lock = threading.Lock()
+_async_client_stats = {"clients_created": 0, "clients_closed": 0, "requests": 0, "connections_opened": 0}
+
 
 def fetch_with_retry(
     url: str,
@@ -69,3 +78,77 @@ async def async_fetch_with_retry(
             raise
 
     raise httpx.RequestError(f"Failed to fetch {url} after {max_retries} attempts")
+
+
+async def _trace_connections(event_name: str, info: Dict[str, Any]) -> None:
+    """httpcore trace callback that counts newly opened connections."""
+    if event_name in ("connection.connect_tcp.complete", "connection.connect_unix_socket.complete"):
+        _async_client_stats["connections_opened"] += 1
+
+
+async def _count_request(request: httpx.Request) -> None:
+    """Request hook that counts requests and enables connection tracing."""
+    _async_client_stats["requests"] += 1
+    request.extensions["trace"] = _trace_connections
+
+
+def get_async_http_client(limits: Optional[httpx.Limits] = None) -> httpx.AsyncClient:
+    """
+    Returns the shared httpx.AsyncClient for the running event loop.
+
+    Reusing one client keeps connections and TLS sessions alive across requests.
+    Called outside a running event loop, a new unshared client is returned.
+
+    Args:
+        limits (Optional[httpx.Limits]): Connection limits. Defaults to DEFAULT_ASYNC_LIMITS.
+
+    Returns:
+        httpx.AsyncClient: The async HTTP client.
+    """
+    limits = limits or DEFAULT_ASYNC_LIMITS
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return httpx.AsyncClient(limits=limits)
+
+    key = (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry)
+    with _async_clients_lock:
+        # Forget clients of loops that have been closed, e.g. by asyncio.run()
+        for closed_loop in [other for other in _async_clients if other.is_closed()]:
+            _async_client_stats["clients_closed"] += len(_async_clients.pop(closed_loop))
+
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=limits, event_hooks={"request": [_count_request]})
+            clients[key] = client
+            _async_client_stats["clients_created"] += 1
+        return client
+
+
+async def aclose_async_http_clients() -> None:
+    """Close the shared async HTTP clients of the running event loop. Call this on shutdown."""
+    with _async_clients_lock:
+        clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+    _async_client_stats["clients_closed"] += len(clients)
+
+
+def async_http_client_stats() -> Dict[str, Any]:
+    """
+    Returns connection reuse statistics for the shared async HTTP clients.
+
+    Returns:
+        Dict[str, Any]: Client, request and connection counters.
+    """
+    requests = _async_client_stats["requests"]
+    reused = max(0, requests - _async_client_stats["connections_opened"])
+    with _async_clients_lock:
+        open_clients = sum(len(clients) for clients in _async_clients.values())
+    return {
+        **_async_client_stats,
+        "open_clients": open_clients,
+        "connections_reused": reused,
+        "reuse_rate": reused / requests if requests else 0.0,
+    }
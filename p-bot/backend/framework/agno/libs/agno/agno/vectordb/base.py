@@ -1,5 +1,7 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from hashlib import md5
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 
@@ -34,6 +36,25 @@ class VectorDb(ABC):
     def id_exists(self, id: str) -> bool:
         raise NotImplementedError
 
+    def content_hash(self, document: Document) -> str:
+        """Returns the hash that identifies a document by its content"""
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        return md5(cleaned_content.encode()).hexdigest()
+
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """Returns the subset of the given content hashes that are stored, in as few queries as possible"""
+        raise NotImplementedError
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        raise NotImplementedError
+
+    def delete_ids(self, ids: List[str]) -> None:
+        """Deletes the documents with the given content hashes"""
+        raise NotImplementedError
+
+    async def async_delete_ids(self, ids: List[str]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         raise NotImplementedError
@@ -63,6 +84,23 @@ class VectorDb(ABC):
     ) -> List[Document]:
         raise NotImplementedError
 
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Search for several queries at once and return the results of each query, in order.
+
+        Vector dbs that can probe their index with many query vectors at once override this;
+        the default runs search() once per query.
+        """
+        return [self.search(query, limit=limit, filters=filters) for query in queries]
+
+    async def async_search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        return list(
+            await asyncio.gather(*(self.async_search(query, limit=limit, filters=filters) for query in queries))
+        )
+
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         raise NotImplementedError
 
@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -97,16 +97,38 @@ class ChromaDb(VectorDb):
             logger.warning("Client not initialized")
             return False
 
+        # Documents are stored with the hash of their content as id
+        return len(self.ids_exist([self.content_hash(document)])) > 0
+
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """Check which of the given ids exist in the collection, in a single lookup.
+        Args:
+            ids (List[str]): Content hashes of the documents to check.
+        Returns:
+            Set[str]: The ids that exist in the collection.
+        """
+        if not self.client or not ids:
+            return set()
+
         try:
             collection: Collection = self.client.get_collection(name=self.collection_name)
-            collection_data: GetResult = collection.get(include=["documents"])  # type: ignore
-            existing_documents = collection_data.get("documents", [])
-            cleaned_content = document.content.replace("\x00", "\ufffd")
-            if cleaned_content in existing_documents:  # type: ignore
-                return True
+            collection_data: GetResult = collection.get(ids=ids, include=[])  # type: ignore
+            return set(collection_data.get("ids", []))
         except Exception as e:
-            logger.error(f"Document does not exist: {e}")
-        return False
+            logger.error(f"Error checking if documents exist: {e}")
+        return set()
+
+    def delete_ids(self, ids: List[str]) -> None:
+        """Delete the documents with the given ids from the collection.
+        Args:
+            ids (List[str]): Content hashes of the documents to delete.
+        """
+        if not self.client or not ids:
+            return
+
+        collection: Collection = self.client.get_collection(name=self.collection_name)
+        collection.delete(ids=ids)
+        log_debug(f"Deleted {len(ids)} documents from collection: {self.collection_name}")
 
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
@@ -140,8 +162,8 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        self.embedder.embed_documents(documents)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -177,8 +199,8 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        self.embedder.embed_documents(documents)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -1,6 +1,7 @@
+import asyncio
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import lancedb
@@ -204,6 +205,63 @@ class LanceDb(VectorDb):
             self.table = self.connection.open_table(name=self.table_name)
         return self.doc_exists(document)
 
+    def ids_exist(self, ids: List[str], batch_size: int = 1000) -> Set[str]:
+        """
+        Check which of the given document ids exist, with one scan per chunk of ids
+
+        Args:
+            ids (List[str]): Content hashes of the documents to check
+            batch_size (int): Number of ids to check per query
+
+        Returns:
+            Set[str]: The ids that exist in the table
+        """
+        existing: Set[str] = set()
+        if self.table is None or not ids:
+            return existing
+        for i in range(0, len(ids), batch_size):
+            chunk = ids[i : i + batch_size]
+            id_list = ", ".join(f"'{doc_id}'" for doc_id in chunk)
+            try:
+                result = (
+                    self.table.search()
+                    .where(f"{self._id} IN ({id_list})")
+                    .select([self._id])
+                    .limit(len(chunk))
+                    .to_arrow()
+                )
+                existing.update(result.column(self._id).to_pylist())
+            except Exception as e:
+                # Search sometimes fails with stale cache data, it means the docs don't exist
+                log_debug(f"Error checking ids: {e}")
+        return existing
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        if self.connection:
+            self.table = self.connection.open_table(name=self.table_name)
+        return self.ids_exist(ids)
+
+    def delete_ids(self, ids: List[str], batch_size: int = 1000) -> None:
+        """
+        Delete the documents with the given ids
+
+        Args:
+            ids (List[str]): Content hashes of the documents to delete
+            batch_size (int): Number of ids to delete per query
+        """
+        if self.table is None or not ids:
+            return
+        for i in range(0, len(ids), batch_size):
+            chunk = ids[i : i + batch_size]
+            id_list = ", ".join(f"'{doc_id}'" for doc_id in chunk)
+            self.table.delete(f"{self._id} IN ({id_list})")
+        log_debug(f"Deleted {len(ids)} documents")
+
+    async def async_delete_ids(self, ids: List[str]) -> None:
+        if self.connection:
+            self.table = self.connection.open_table(name=self.table_name)
+        self.delete_ids(ids)
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the database.
@@ -219,8 +277,8 @@ class LanceDb(VectorDb):
         log_info(f"Inserting {len(documents)} documents")
         data = []
 
+        self.embedder.embed_documents(documents)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -269,8 +327,8 @@ class LanceDb(VectorDb):
         data = []
 
         # Prepare documents for insertion
+        await self.embedder.async_embed_documents(documents)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -358,6 +416,58 @@ class LanceDb(VectorDb):
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for several queries with one batch embedding request and one multi-vector query.
+        Keyword and hybrid search run once per query.
+
+        Args:
+            queries (List[str]): Queries to search for
+            limit (int): Maximum number of results to return per query
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search
+
+        Returns:
+            List[List[Document]]: The results for each query, in order
+        """
+        if self.search_type != SearchType.vector:
+            return super().search_many(queries, limit=limit, filters=filters)
+        if not queries:
+            return []
+        if self.connection:
+            self.table = self.connection.open_table(name=self.table_name)
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return [[] for _ in queries]
+
+        query_embeddings = self.embedder.get_embeddings_batched(queries)
+        results = self.table.search(
+            query=query_embeddings,
+            vector_column_name=self._vector_col,
+        ).limit(limit)
+
+        if self.nprobes:
+            results.nprobes(self.nprobes)
+
+        results = results.to_pandas()
+
+        # A single query vector is searched without the query_index column
+        if "query_index" not in results.columns:
+            results["query_index"] = 0
+        search_results: List[List[Document]] = []
+        for query_index, query in enumerate(queries):
+            documents = self._build_search_results(results[results["query_index"] == query_index])
+            if self.reranker:
+                documents = self.reranker.rerank(query=query, documents=documents)
+            search_results.append(documents)
+        return search_results
+
+    async def async_search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        return await asyncio.to_thread(self.search_many, queries, limit, filters)
+
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
@@ -194,8 +194,8 @@ class Milvus(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents")
+        self.embedder.embed_documents(documents)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -216,9 +216,10 @@ class Milvus(VectorDb):
         """Insert documents asynchronously with controlled concurrency."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
 
+        await self.embedder.async_embed_documents(documents)
+
         async def process_document(document):
             # Same processing code as before
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -258,8 +259,8 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         log_debug(f"Upserting {len(documents)} documents")
+        self.embedder.embed_documents(documents)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -279,8 +280,9 @@ class Milvus(VectorDb):
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_debug(f"Upserting {len(documents)} documents asynchronously")
 
+        await self.embedder.async_embed_documents(documents)
+
         async def process_document(document):
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -387,6 +387,7 @@ class MongoDb(VectorDb):
         log_info(f"Inserting {len(documents)} documents")
         collection = self._get_collection()
 
+        self.embedder.embed_documents(documents)
         prepared_docs = []
         for document in documents:
             try:
@@ -411,6 +412,7 @@ class MongoDb(VectorDb):
         log_info(f"Upserting {len(documents)} documents")
         collection = self._get_collection()
 
+        self.embedder.embed_documents(documents)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -556,7 +558,8 @@ class MongoDb(VectorDb):
 
     def prepare_doc(self, document: Document) -> Dict[str, Any]:
         """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+        if document.embedding is None:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
@@ -601,6 +604,7 @@ class MongoDb(VectorDb):
         log_info(f"Inserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
 
+        await self.embedder.async_embed_documents(documents)
         prepared_docs = []
         for document in documents:
             try:
@@ -625,6 +629,7 @@ class MongoDb(VectorDb):
         log_info(f"Upserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
 
+        await self.embedder.async_embed_documents(documents)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
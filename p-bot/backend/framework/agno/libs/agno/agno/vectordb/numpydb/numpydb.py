@@ -0,0 +1,498 @@
+import asyncio
+import json
+import threading
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+
+# Marks a metadata key that a row does not have
+_MISSING = object()
+
+
+class NumpyDb(VectorDb):
+    """
+    NumpyDb is an embedded, in-process vector store for small to medium corpora.
+
+    Vectors live in a contiguous float32 matrix saved as a memory-mapped `.npy` file, and
+    the documents' content and metadata in a JSON Lines file next to it. Searches score every
+    (pre-filtered) row in one matrix product and pick the top results with argpartition.
+
+    Args:
+        table_name: Name of the table; the files are `<table_name>.npy` and `<table_name>.jsonl`.
+        path: Directory holding the table files.
+        embedder: The embedder to use when embedding the document contents.
+        distance: The distance metric to use when searching for documents.
+        reranker: The reranker to use when reranking documents.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        path: str = "tmp/numpydb",
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        reranker: Optional[Reranker] = None,
+    ):
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        # Taken from the first inserted embedding if the embedder does not declare it
+        self.dimensions: Optional[int] = self.embedder.dimensions
+
+        self.table_name: str = table_name
+        self.path: Path = Path(path)
+        self.vectors_file: Path = self.path / f"{table_name}.npy"
+        self.payloads_file: Path = self.path / f"{table_name}.jsonl"
+        self.distance: Distance = distance
+        self.reranker: Optional[Reranker] = reranker
+
+        # Rows [0, len(rows)) of the matrix are in use, the rest is spare capacity
+        self._vectors: Optional[np.memmap] = None
+        self._norms: Optional[np.ndarray] = None
+        self._rows: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        # Row indices matching a metadata filter, cleared whenever rows change
+        self._filter_cache: Dict[str, np.ndarray] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def _load(self) -> None:
+        """Open the table files, if they exist."""
+        if self._loaded:
+            return
+        if self.payloads_file.exists() and self.vectors_file.exists():
+            with self.payloads_file.open() as f:
+                header = json.loads(f.readline())
+                self._rows = [json.loads(line) for line in f if line.strip()]
+            self.dimensions = header.get("dimensions") or self.dimensions
+            self._vectors = np.load(self.vectors_file, mmap_mode="r+")
+            self._positions = {row["id"]: i for i, row in enumerate(self._rows)}
+            self._norms = np.linalg.norm(self._vectors[: len(self._rows)], axis=1)
+            log_debug(f"Opened NumpyDb table '{self.table_name}' with {len(self._rows)} documents")
+        self._loaded = True
+
+    def _save_payloads(self) -> None:
+        """Write the payload file, replacing the old one only once the new one is complete."""
+        tmp_file = self.payloads_file.with_suffix(".jsonl.tmp")
+        with tmp_file.open("w") as f:
+            f.write(json.dumps({"dimensions": self.dimensions, "distance": self.distance.value}) + "\n")
+            for row in self._rows:
+                f.write(json.dumps(row) + "\n")
+        tmp_file.replace(self.payloads_file)
+
+    def _append_payloads(self, rows: List[Dict[str, Any]]) -> None:
+        """Append new rows to the payload file."""
+        with self.payloads_file.open("a") as f:
+            f.write("".join(json.dumps(row) + "\n" for row in rows))
+
+    def _allocate(self, capacity: int) -> None:
+        """Create or grow the memory-mapped matrix to hold at least `capacity` rows."""
+        if self.dimensions is None:
+            raise ValueError("Embedder.dimensions must be set or inferred before inserting.")
+        count = len(self._rows)
+        new_capacity = max(capacity, 1024)
+        if self._vectors is not None:
+            if self._vectors.shape[0] >= capacity:
+                return
+            # Double so appends stay amortized O(1)
+            new_capacity = max(capacity, self._vectors.shape[0] * 2)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.path / f"{self.table_name}.tmp.npy"
+        vectors = np.lib.format.open_memmap(
+            tmp_file, mode="w+", dtype=np.float32, shape=(new_capacity, self.dimensions)
+        )
+        if self._vectors is not None and count > 0:
+            vectors[:count] = self._vectors[:count]
+        vectors.flush()
+        del vectors
+        self._vectors = None
+        tmp_file.replace(self.vectors_file)
+        self._vectors = np.load(self.vectors_file, mmap_mode="r+")
+        log_debug(f"Allocated {new_capacity} rows for NumpyDb table '{self.table_name}'")
+
+    def create(self) -> None:
+        """Create the table files if they do not exist."""
+        with self._lock:
+            self._load()
+            if self.exists():
+                return
+            log_info(f"Creating table: {self.table_name}")
+            self._rows, self._positions = [], {}
+            self._norms = np.zeros(0, dtype=np.float32)
+            if self.dimensions is not None:
+                self._allocate(0)
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._save_payloads()
+
+    async def async_create(self) -> None:
+        await asyncio.to_thread(self.create)
+
+    def doc_exists(self, document: Document) -> bool:
+        """
+        Validating if the document exists or not
+
+        Args:
+            document (Document): Document to validate
+        """
+        return self.id_exists(self.content_hash(document))
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return self.doc_exists(document)
+
+    def name_exists(self, name: str) -> bool:
+        with self._lock:
+            self._load()
+            return any(row["name"] == name for row in self._rows)
+
+    async def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        with self._lock:
+            self._load()
+            return id in self._positions
+
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        with self._lock:
+            self._load()
+            return {doc_id for doc_id in ids if doc_id in self._positions}
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        return self.ids_exist(ids)
+
+    def _write(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Store embedded documents, replacing documents with the same content."""
+        with self._lock:
+            self._load()
+            documents = [document for document in documents if document.embedding]
+            if not documents:
+                log_debug("No new data to insert")
+                return
+            if self.dimensions is None:
+                self.dimensions = len(documents[0].embedding)  # type: ignore
+            for document in documents:
+                if len(document.embedding) != self.dimensions:  # type: ignore
+                    raise ValueError(f"Expected {self.dimensions} dimensions, got {len(document.embedding)}")  # type: ignore
+
+            new_positions: List[int] = []
+            new_rows: List[Dict[str, Any]] = []
+            replaced = False
+            for document in documents:
+                cleaned_content = document.content.replace("\x00", "\ufffd")
+                doc_id = md5(cleaned_content.encode()).hexdigest()
+                row = {
+                    "id": doc_id,
+                    "name": document.name,
+                    "meta_data": document.meta_data,
+                    "filters": filters,
+                    "content": cleaned_content,
+                    "usage": document.usage,
+                }
+                position = self._positions.get(doc_id)
+                if position is None:
+                    position = len(self._rows) + len(new_rows)
+                    self._positions[doc_id] = position
+                    new_rows.append(row)
+                elif position >= len(self._rows):
+                    # Same content twice in this batch
+                    new_rows[position - len(self._rows)] = row
+                else:
+                    self._rows[position] = row
+                    replaced = True
+                new_positions.append(position)
+                log_debug(f"Parsed document: {document.name} ({document.meta_data})")
+
+            self._allocate(len(self._rows) + len(new_rows))
+            self._rows.extend(new_rows)
+            matrix = np.asarray([document.embedding for document in documents], dtype=np.float32)
+            self._vectors[new_positions] = matrix  # type: ignore
+            self._vectors.flush()  # type: ignore
+
+            norms = self._norms if self._norms is not None else np.zeros(0, dtype=np.float32)
+            if len(norms) < len(self._rows):
+                norms = np.concatenate([norms, np.zeros(len(self._rows) - len(norms), dtype=np.float32)])
+            norms[new_positions] = np.linalg.norm(matrix, axis=1)
+            self._norms = norms
+            self._filter_cache.clear()
+
+            if replaced or not self.payloads_file.exists():
+                self._save_payloads()
+            else:
+                self._append_payloads(new_rows)
+            log_debug(f"Inserted {len(documents)} documents")
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Insert documents into the table.
+
+        Args:
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters stored with the documents, usable when searching
+        """
+        if len(documents) <= 0:
+            log_info("No documents to insert")
+            return
+        log_info(f"Inserting {len(documents)} documents")
+        self.embedder.embed_documents(documents)
+        self._write(documents, filters)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        if len(documents) <= 0:
+            log_info("No documents to insert")
+            return
+        log_info(f"Inserting {len(documents)} documents")
+        await self.embedder.async_embed_documents(documents)
+        await asyncio.to_thread(self._write, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Documents are keyed by their content hash, so inserting replaces existing documents"""
+        self.insert(documents, filters)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await self.async_insert(documents, filters)
+
+    def _candidates(self, filters: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Row indices whose meta_data or insert filters match every filter, or None for all rows."""
+        if not filters:
+            return None
+
+        candidates: Optional[np.ndarray] = None
+        for key, value in filters.items():
+            cache_key = json.dumps([key, value], sort_keys=True, default=str)
+            matching = self._filter_cache.get(cache_key)
+            if matching is None:
+                matching = np.fromiter(
+                    (
+                        i
+                        for i, row in enumerate(self._rows)
+                        if (row.get("meta_data") or {}).get(key, (row.get("filters") or {}).get(key, _MISSING)) == value
+                    ),
+                    dtype=np.int64,
+                )
+                self._filter_cache[cache_key] = matching
+            candidates = matching if candidates is None else np.intersect1d(candidates, matching, assume_unique=True)
+        return candidates
+
+    def search_vector(
+        self, query_embedding: List[float], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Find the documents closest to an embedding.
+
+        Args:
+            query_embedding (List[float]): The embedding to search with
+            limit (int): Number of search results to return
+            filters (Optional[Dict[str, Any]]): Only consider documents whose metadata has these values
+        """
+        return self.search_vectors([query_embedding], limit=limit, filters=filters)[0]
+
+    def search_vectors(
+        self, query_embeddings: List[List[float]], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Find the documents closest to each of several embeddings, scored with matrix products.
+
+        Args:
+            query_embeddings (List[List[float]]): The embeddings to search with
+            limit (int): Number of search results to return per embedding
+            filters (Optional[Dict[str, Any]]): Only consider documents whose metadata has these values
+
+        Returns:
+            List[List[Document]]: The results for each embedding, in order
+        """
+        with self._lock:
+            self._load()
+            count = len(self._rows)
+            if self._vectors is None or self._norms is None or count == 0 or limit <= 0 or not query_embeddings:
+                return [[] for _ in query_embeddings]
+
+            candidates = self._candidates(filters)
+            if candidates is not None and len(candidates) == 0:
+                return [[] for _ in query_embeddings]
+            vectors = self._vectors[:count] if candidates is None else self._vectors[candidates]
+            norms = self._norms if candidates is None else self._norms[candidates]
+
+            queries = np.asarray(query_embeddings, dtype=np.float32)
+            k = min(limit, len(vectors))
+            # Score the queries in blocks to bound the size of the score matrix
+            top = np.concatenate(
+                [self._top_k(queries[start : start + 256], vectors, norms, k) for start in range(0, len(queries), 256)]
+            )
+
+            search_results: List[List[Document]] = []
+            for query_top in top:
+                documents: List[Document] = []
+                for i in query_top:
+                    position = int(i) if candidates is None else int(candidates[i])
+                    row = self._rows[position]
+                    documents.append(
+                        Document(
+                            id=row["id"],
+                            name=row["name"],
+                            meta_data=row["meta_data"],
+                            content=row["content"],
+                            embedder=self.embedder,
+                            embedding=self._vectors[position].tolist(),
+                            usage=row["usage"],
+                        )
+                    )
+                search_results.append(documents)
+            return search_results
+
+    def _top_k(self, queries: np.ndarray, vectors: np.ndarray, norms: np.ndarray, k: int) -> np.ndarray:
+        """Returns the indices of the k best scoring vectors for each query, best first."""
+        dot = queries @ vectors.T
+        if self.distance == Distance.cosine:
+            scores = dot / np.maximum(np.outer(np.linalg.norm(queries, axis=1), norms), 1e-12)
+        elif self.distance == Distance.l2:
+            # Squared L2 distance, negated so that higher is better
+            scores = -(norms**2 - 2 * dot + np.einsum("ij,ij->i", queries, queries)[:, None])
+        else:
+            scores = dot
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        return np.take_along_axis(top, np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1), axis=1)
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Search for documents in the table.
+
+        Args:
+            query (str): Query to search for
+            limit (int): Number of search results to return
+            filters (Optional[Dict[str, Any]]): Only consider documents whose metadata has these values
+        """
+        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        search_results = self.search_vector(query_embedding, limit=limit, filters=filters)
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        return search_results
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        return await asyncio.to_thread(self.search, query, limit, filters)
+
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for several queries with one batch embedding request and one matrix product.
+
+        Args:
+            queries (List[str]): Queries to search for
+            limit (int): Number of search results to return per query
+            filters (Optional[Dict[str, Any]]): Only consider documents whose metadata has these values
+
+        Returns:
+            List[List[Document]]: The results for each query, in order
+        """
+        if not queries:
+            return []
+        query_embeddings = self.embedder.get_embeddings_batched(queries)
+        search_results = self.search_vectors(query_embeddings, limit=limit, filters=filters)
+        if self.reranker:
+            search_results = [
+                self.reranker.rerank(query=query, documents=documents)
+                for query, documents in zip(queries, search_results)
+            ]
+        return search_results
+
+    async def async_search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        return await asyncio.to_thread(self.search_many, queries, limit, filters)
+
+    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+        return self.search(query, limit=limit)
+
+    def delete_ids(self, ids: List[str]) -> None:
+        """
+        Delete the documents with the given ids
+
+        Args:
+            ids (List[str]): Content hashes of the documents to delete
+        """
+        with self._lock:
+            self._load()
+            positions = {self._positions[doc_id] for doc_id in ids if doc_id in self._positions}
+            if not positions or self._vectors is None:
+                return
+            keep = [i for i in range(len(self._rows)) if i not in positions]
+            # Compact the remaining rows to the front of the matrix
+            self._vectors[: len(keep)] = self._vectors[keep]
+            self._vectors.flush()
+            self._rows = [self._rows[i] for i in keep]
+            self._positions = {row["id"]: i for i, row in enumerate(self._rows)}
+            self._norms = self._norms[keep]  # type: ignore
+            self._filter_cache.clear()
+            self._save_payloads()
+            log_debug(f"Deleted {len(positions)} documents")
+
+    async def async_delete_ids(self, ids: List[str]) -> None:
+        await asyncio.to_thread(self.delete_ids, ids)
+
+    def drop(self) -> None:
+        """Delete the table files."""
+        with self._lock:
+            if self.exists():
+                log_debug(f"Deleting table: {self.table_name}")
+            self._vectors = None
+            self._norms = None
+            self._rows, self._positions = [], {}
+            self._filter_cache.clear()
+            self.vectors_file.unlink(missing_ok=True)
+            self.payloads_file.unlink(missing_ok=True)
+            self._loaded = False
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def exists(self) -> bool:
+        return self.payloads_file.exists()
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def get_count(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._rows)
+
+    def optimize(self) -> None:
+        pass
+
+    def delete(self) -> bool:
+        """Remove every document but keep the table."""
+        with self._lock:
+            self._load()
+            self._rows, self._positions = [], {}
+            self._norms = np.zeros(0, dtype=np.float32)
+            self._filter_cache.clear()
+            if self.exists():
+                self._save_payloads()
+            return True
@@ -1,15 +1,16 @@
 from hashlib import md5
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Set, Union, cast
 
 try:
+    from sqlalchemy import cast as sql_cast
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
     from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import bindparam, desc, func, select, text
-    from sqlalchemy.types import DateTime, String
+    from sqlalchemy.sql.expression import bindparam, delete, desc, func, literal, select, text, true, union_all
+    from sqlalchemy.types import DateTime, Integer, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install using `pip install sqlalchemy psycopg`")
 
@@ -262,6 +263,43 @@ class PgVector(VectorDb):
         """
         return self._record_exists(self.table.c.id, id)
 
+    def ids_exist(self, ids: List[str], batch_size: int = 1000) -> Set[str]:
+        """
+        Check which of the given content hashes exist in the table, with one query per batch.
+
+        Args:
+            ids (List[str]): The content hashes to check.
+            batch_size (int): Number of content hashes to check per query.
+
+        Returns:
+            Set[str]: The content hashes that exist in the table.
+        """
+        existing: Set[str] = set()
+        try:
+            with self.Session() as sess, sess.begin():
+                for i in range(0, len(ids), batch_size):
+                    stmt = select(self.table.c.content_hash).where(
+                        self.table.c.content_hash.in_(ids[i : i + batch_size])
+                    )
+                    existing.update(row[0] for row in sess.execute(stmt))
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+        return existing
+
+    def delete_ids(self, ids: List[str], batch_size: int = 1000) -> None:
+        """
+        Delete the documents with the given content hashes.
+
+        Args:
+            ids (List[str]): The content hashes of the documents to delete.
+            batch_size (int): Number of content hashes to delete per query.
+        """
+        with self.Session() as sess, sess.begin():
+            for i in range(0, len(ids), batch_size):
+                stmt = delete(self.table).where(self.table.c.content_hash.in_(ids[i : i + batch_size]))
+                sess.execute(stmt)
+        log_debug(f"Deleted {len(ids)} documents from table '{self.table.fullname}'.")
+
     def _clean_content(self, content: str) -> str:
         """
         Clean the content by replacing null characters.
@@ -296,9 +334,17 @@ class PgVector(VectorDb):
                     try:
                         # Prepare documents for insertion
                         batch_records = []
+                        # Embed the whole batch at once; documents it missed are retried one by one
+                        for doc in batch_docs:
+                            doc.embedding = None
+                        try:
+                            self.embedder.embed_documents(batch_docs)
+                        except Exception as e:
+                            logger.error(f"Error embedding batch starting at index {i}: {e}")
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
+                                if doc.embedding is None:
+                                    doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -360,9 +406,17 @@ class PgVector(VectorDb):
                     try:
                         # Prepare documents for upserting
                         batch_records = []
+                        # Embed the whole batch at once; documents it missed are retried one by one
+                        for doc in batch_docs:
+                            doc.embedding = None
+                        try:
+                            self.embedder.embed_documents(batch_docs)
+                        except Exception as e:
+                            logger.error(f"Error embedding batch starting at index {i}: {e}")
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
+                                if doc.embedding is None:
+                                    doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -518,6 +572,127 @@ class PgVector(VectorDb):
             logger.error(f"Error during vector search: {e}")
             return []
 
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for several queries at once. Vector search embeds all queries in one batch and probes the
+        index for all of them in one statement; keyword and hybrid search run once per query.
+
+        Args:
+            queries (List[str]): The search queries.
+            limit (int): Maximum number of results to return per query.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[List[Document]]: The matching documents for each query, in order.
+        """
+        if self.search_type == SearchType.vector:
+            return self.vector_search_many(queries=queries, limit=limit, filters=filters)
+        return super().search_many(queries, limit=limit, filters=filters)
+
+    def vector_search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Perform vector similarity searches for several queries with one statement, using a LATERAL join
+        from the query embeddings to the nearest rows of the table.
+
+        Args:
+            queries (List[str]): The search queries.
+            limit (int): Maximum number of results to return per query.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[List[Document]]: The matching documents for each query, in order.
+        """
+        search_results: List[List[Document]] = [[] for _ in queries]
+        if not queries:
+            return search_results
+        try:
+            query_embeddings = self.embedder.get_embeddings_batched(queries)
+
+            # One row per query: its position and its embedding
+            query_rows = union_all(
+                *[
+                    select(
+                        literal(query_index, Integer).label("query_index"),
+                        sql_cast(literal(query_embedding, Vector(self.dimensions)), Vector(self.dimensions)).label(
+                            "query_embedding"
+                        ),
+                    )
+                    for query_index, query_embedding in enumerate(query_embeddings)
+                ]
+            ).subquery("queries")
+
+            # Distance from each row to the query embedding of the outer row
+            if self.distance == Distance.l2:
+                distance = self.table.c.embedding.l2_distance(query_rows.c.query_embedding)
+            elif self.distance == Distance.cosine:
+                distance = self.table.c.embedding.cosine_distance(query_rows.c.query_embedding)
+            elif self.distance == Distance.max_inner_product:
+                distance = self.table.c.embedding.max_inner_product(query_rows.c.query_embedding)
+            else:
+                logger.error(f"Unknown distance metric: {self.distance}")
+                return search_results
+
+            nearest = select(
+                self.table.c.id,
+                self.table.c.name,
+                self.table.c.meta_data,
+                self.table.c.content,
+                self.table.c.embedding,
+                self.table.c.usage,
+                distance.label("distance"),
+            )
+            if filters is not None:
+                nearest = nearest.where(self.table.c.filters.contains(filters))
+            nearest_rows = nearest.order_by(distance).limit(limit).lateral("nearest")
+
+            stmt = (
+                select(query_rows.c.query_index, nearest_rows)
+                .select_from(query_rows.join(nearest_rows, true()))
+                .order_by(query_rows.c.query_index, nearest_rows.c.distance)
+            )
+            log_debug(f"Vector search many query: {stmt}")
+
+            try:
+                with self.Session() as sess, sess.begin():
+                    if self.vector_index is not None:
+                        if isinstance(self.vector_index, Ivfflat):
+                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
+                        elif isinstance(self.vector_index, HNSW):
+                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                    results = sess.execute(stmt).fetchall()
+            except Exception as e:
+                logger.error(f"Error performing semantic search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                self.create()
+                return search_results
+
+            for result in results:
+                search_results[result.query_index].append(
+                    Document(
+                        id=result.id,
+                        name=result.name,
+                        meta_data=result.meta_data,
+                        content=result.content,
+                        embedder=self.embedder,
+                        embedding=result.embedding,
+                        usage=result.usage,
+                    )
+                )
+
+            if self.reranker:
+                search_results = [
+                    self.reranker.rerank(query=query, documents=documents)
+                    for query, documents in zip(queries, search_results)
+                ]
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during vector search: {e}")
+            return search_results
+
     def enable_prefix_matching(self, query: str) -> str:
         """
         Preprocess the query for prefix matching.
@@ -234,8 +234,8 @@ class PineconeDb(VectorDb):
         """
 
         vectors = []
+        self.embedder.embed_documents(documents)
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             data_to_upsert = {
                 "id": document.id,
@@ -1,5 +1,6 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
 
 try:
     from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
@@ -176,6 +177,64 @@ class Qdrant(VectorDb):
         )
         return len(collection_points) > 0
 
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """
+        Check which of the given document ids exist, in a single request
+
+        Args:
+            ids (List[str]): Content hashes of the documents to check
+
+        Returns:
+            Set[str]: The ids that exist in the collection
+        """
+        if not self.client or not ids:
+            return set()
+        points = self.client.retrieve(
+            collection_name=self.collection,
+            ids=ids,  # type: ignore
+            with_payload=False,
+            with_vectors=False,
+        )
+        # Qdrant returns hex ids in UUID form
+        return {UUID(str(point.id)).hex for point in points}
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        """Check which of the given document ids exist asynchronously."""
+        if not ids:
+            return set()
+        points = await self.async_client.retrieve(
+            collection_name=self.collection,
+            ids=ids,  # type: ignore
+            with_payload=False,
+            with_vectors=False,
+        )
+        return {UUID(str(point.id)).hex for point in points}
+
+    def delete_ids(self, ids: List[str]) -> None:
+        """
+        Delete the documents with the given ids
+
+        Args:
+            ids (List[str]): Content hashes of the documents to delete
+        """
+        if not self.client or not ids:
+            return
+        self.client.delete(
+            collection_name=self.collection,
+            points_selector=models.PointIdsList(points=ids),  # type: ignore
+        )
+        log_debug(f"Deleted {len(ids)} documents")
+
+    async def async_delete_ids(self, ids: List[str]) -> None:
+        """Delete the documents with the given ids asynchronously."""
+        if not ids:
+            return
+        await self.async_client.delete(
+            collection_name=self.collection,
+            points_selector=models.PointIdsList(points=ids),  # type: ignore
+        )
+        log_debug(f"Deleted {len(ids)} documents asynchronously")
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -229,8 +288,8 @@ class Qdrant(VectorDb):
         """
         log_debug(f"Inserting {len(documents)} documents")
         points = []
+        self.embedder.embed_documents(documents)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             points.append(
@@ -255,7 +314,6 @@ class Qdrant(VectorDb):
         log_debug(f"Inserting {len(documents)} documents asynchronously")
 
         async def process_document(document):
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             log_debug(f"Inserted document asynchronously: {document.name} ({document.meta_data})")
@@ -272,6 +330,8 @@ class Qdrant(VectorDb):
 
         import asyncio
 
+        await self.embedder.async_embed_documents(documents)
+
         # Process all documents in parallel
         points = await asyncio.gather(*[process_document(doc) for doc in documents])
 
@@ -317,21 +377,7 @@ class Qdrant(VectorDb):
             limit=limit,
         )
 
-        # Build search results
-        search_results: List[Document] = []
-        for result in results:
-            if result.payload is None:
-                continue
-            search_results.append(
-                Document(
-                    name=result.payload["name"],
-                    meta_data=result.payload["meta_data"],
-                    content=result.payload["content"],
-                    embedder=self.embedder,
-                    embedding=result.vector,  # type: ignore
-                    usage=result.payload["usage"],
-                )
-            )
+        search_results = self._build_search_results(results)
 
         if self.reranker:
             search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -355,7 +401,14 @@ class Qdrant(VectorDb):
             limit=limit,
         )
 
-        # Build search results
+        search_results = self._build_search_results(results)
+
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        return search_results
+
+    def _build_search_results(self, results: Any) -> List[Document]:
         search_results: List[Document] = []
         for result in results:
             if result.payload is None:
@@ -370,12 +423,55 @@ class Qdrant(VectorDb):
                     usage=result.payload["usage"],
                 )
             )
+        return search_results
 
-        if self.reranker:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
+    def _query_requests(self, queries: List[str], limit: int) -> List[models.QueryRequest]:
+        query_embeddings = self.embedder.get_embeddings_batched(queries)
+        return [
+            models.QueryRequest(query=query_embedding, limit=limit, with_payload=True, with_vector=True)
+            for query_embedding in query_embeddings
+        ]
 
+    def _rerank_many(self, queries: List[str], search_results: List[List[Document]]) -> List[List[Document]]:
+        if self.reranker:
+            return [
+                self.reranker.rerank(query=query, documents=documents)
+                for query, documents in zip(queries, search_results)
+            ]
         return search_results
 
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for several queries with one batch embedding request and one batched query.
+
+        Args:
+            queries (List[str]): Queries to search for
+            limit (int): Number of search results to return per query
+            filters (Optional[Dict[str, Any]]): Filters to apply while searching
+
+        Returns:
+            List[List[Document]]: The results for each query, in order
+        """
+        if not queries:
+            return []
+        responses = self.client.query_batch_points(
+            collection_name=self.collection, requests=self._query_requests(queries, limit)
+        )
+        return self._rerank_many(queries, [self._build_search_results(response.points) for response in responses])
+
+    async def async_search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Search for several queries asynchronously with one batched query."""
+        if not queries:
+            return []
+        responses = await self.async_client.query_batch_points(
+            collection_name=self.collection, requests=self._query_requests(queries, limit)
+        )
+        return self._rerank_many(queries, [self._build_search_results(response.points) for response in responses])
+
     def drop(self) -> None:
         if self.exists():
             log_debug(f"Deleting collection: {self.collection}")
@@ -172,8 +172,8 @@ class SingleStore(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            self.embedder.embed_documents(documents)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -215,8 +215,8 @@ class SingleStore(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            self.embedder.embed_documents(documents)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
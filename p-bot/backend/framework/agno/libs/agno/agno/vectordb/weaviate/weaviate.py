@@ -248,8 +248,8 @@ class Weaviate(VectorDb):
         log_debug(f"Inserting {len(documents)} documents into Weaviate.")
         collection = self.get_client().collections.get(self.collection)
 
+        self.embedder.embed_documents(documents)
         for document in documents:
-            document.embed(embedder=self.embedder)
             if document.embedding is None:
                 logger.error(f"Document embedding is None: {document.name}")
                 continue
@@ -288,11 +288,12 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
-            # Process documents first
+            # Embed all documents in batches first
+            await self.embedder.async_embed_documents(documents)
+
+            # Then build the objects to insert
             for document in documents:
                 try:
-                    # Embed document
-                    document.embed(embedder=self.embedder)
                     if document.embedding is None:
                         logger.error(f"Document embedding is None: {document.name}")
                         continue
@@ -352,8 +353,8 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
+            await self.embedder.async_embed_documents(documents)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     logger.error(f"Document embedding is None: {document.name}")
                     continue
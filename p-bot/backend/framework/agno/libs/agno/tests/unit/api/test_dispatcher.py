@@ -0,0 +1,123 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from agno.api.dispatcher import ApiEventDispatcher
+
+
+class RecordingClient:
+    """Stands in for the httpx client and records the posted events"""
+
+    def __init__(self, status_code: int = 200, release: threading.Event = None):
+        self.posts = []
+        self.status_code = status_code
+        self.release = release
+        self.closed = False
+
+    def post(self, route, json):
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        self.posts.append((route, json))
+        return SimpleNamespace(status_code=self.status_code)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def client():
+    return RecordingClient()
+
+
+@pytest.fixture
+def dispatcher(client):
+    dispatcher = ApiEventDispatcher(flush_interval=0.05, client_factory=lambda: client)
+    yield dispatcher
+    dispatcher.shutdown(timeout=1)
+
+
+def test_flush_sends_events_in_order(dispatcher, client):
+    """Test that queued events are sent in submission order"""
+    for i in range(5):
+        assert dispatcher.submit("/runs", {"run": i})
+
+    assert dispatcher.flush(timeout=5)
+    assert [payload["run"] for _, payload in client.posts] == [0, 1, 2, 3, 4]
+    assert dispatcher.stats()["sent"] == 5
+
+
+def test_events_with_same_key_are_coalesced(dispatcher, client):
+    """Test that a queued event is replaced by a newer one with the same key"""
+    release = threading.Event()
+    client.release = release
+
+    # The first event is picked up by the background thread and blocks it, the others wait in the queue
+    dispatcher.submit("/runs", {"run": "first"}, key="first")
+    dispatcher.submit("/runs", {"run": 1}, key="run-1")
+    dispatcher.submit("/runs", {"run": 2}, key="run-1")
+    release.set()
+
+    assert dispatcher.flush(timeout=5)
+    assert [payload["run"] for _, payload in client.posts] == ["first", 2]
+    assert dispatcher.stats()["coalesced"] == 1
+
+
+def test_full_queue_drops_events():
+    """Test that submitting to a full queue drops the event instead of blocking"""
+    release = threading.Event()
+    client = RecordingClient(release=release)
+    dispatcher = ApiEventDispatcher(max_queue_size=2, batch_size=1, flush_interval=0, client_factory=lambda: client)
+
+    results = [dispatcher.submit("/runs", {"run": i}) for i in range(10)]
+    release.set()
+    dispatcher.shutdown(timeout=5)
+
+    stats = dispatcher.stats()
+    assert results.count(False) == stats["dropped"] > 0
+    assert stats["sent"] == len(client.posts) == results.count(True)
+    assert client.closed
+
+
+def test_failed_events_are_counted():
+    """Test that error responses count as failures"""
+    client = RecordingClient(status_code=500)
+    dispatcher = ApiEventDispatcher(flush_interval=0, client_factory=lambda: client)
+    dispatcher.submit("/runs", {"run": 1})
+    dispatcher.shutdown(timeout=5)
+
+    assert dispatcher.stats()["failed"] == 1
+    assert not dispatcher.submit("/runs", {"run": 2})
+
+
+def test_agent_run_is_queued(monkeypatch):
+    """Test that the agent run log goes through the dispatcher"""
+    from agno.api import agent as agent_api
+    from agno.api.schemas.agent import AgentRunCreate
+
+    submitted = []
+    monkeypatch.setattr(agent_api.agno_cli_settings, "api_enabled", True)
+    monkeypatch.setattr(agent_api.api_dispatcher, "submit", lambda *args, **kwargs: submitted.append((args, kwargs)))
+
+    agent_api.queue_agent_run(run_id="run-1", run=lambda: AgentRunCreate(run_id="run-1", session_id="session-1"))
+
+    (route, payload), kwargs = submitted[0]
+    assert payload()["run"]["run_id"] == "run-1"
+    assert kwargs["key"] == (route, "run-1")
+
+
+def test_payload_factory_runs_on_dispatcher_thread(client):
+    """Test that a payload function is called when the event is sent, and not for a replaced event"""
+    threads = []
+
+    def payload(run):
+        threads.append(threading.current_thread())
+        return {"run": run}
+
+    dispatcher = ApiEventDispatcher(flush_interval=0.05, client_factory=lambda: client)
+    dispatcher.submit("/runs", lambda: payload(1), key="run-1")
+    dispatcher.submit("/runs", lambda: payload(2), key="run-1")
+    dispatcher.shutdown(timeout=5)
+
+    assert client.posts == [("/runs", {"run": 2})]
+    assert threads == [dispatcher._thread]
@@ -0,0 +1,134 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+from agno.document import Document
+from agno.embedder.base import Embedder, split_usage, sum_usage
+from agno.embedder.openai import OpenAIEmbedder
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Embedder that records every request it makes."""
+
+    dimensions: int = 3
+    requests: List[List[str]] = field(default_factory=list)
+    fail_batches: bool = False
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.requests.append([text])
+        return [float(len(text))] * 3, {"prompt_tokens": 1, "total_tokens": 1}
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if self.fail_batches:
+            raise RuntimeError("batch endpoint unavailable")
+        self.requests.append(list(texts))
+        return [[float(len(text))] * 3 for text in texts], {"prompt_tokens": len(texts), "total_tokens": len(texts)}
+
+
+def make_documents(count: int, size: int = 10) -> List[Document]:
+    return [Document(content=f"{i:0{size}d}") for i in range(count)]
+
+
+def test_batches_respect_batch_size():
+    """Test that batches never hold more than batch_size texts"""
+    embedder = CountingEmbedder(batch_size=4)
+    assert embedder.get_batches(["a"] * 10) == [(0, 4), (4, 8), (8, 10)]
+
+
+def test_batches_respect_token_budget():
+    """Test that batches are cut before they exceed max_batch_tokens"""
+    embedder = CountingEmbedder(batch_size=100, max_batch_tokens=30)
+    texts = ["x" * 40] * 5  # 11 estimated tokens each
+    assert embedder.get_batches(texts) == [(0, 2), (2, 4), (4, 5)]
+
+
+def test_oversized_text_gets_its_own_batch():
+    """Test that a text larger than the token budget is still embedded"""
+    embedder = CountingEmbedder(max_batch_tokens=5)
+    assert embedder.get_batches(["x" * 100, "y"]) == [(0, 1), (1, 2)]
+
+
+def test_embed_documents_makes_one_request_per_batch():
+    """Test that documents are embedded in order with one request per batch"""
+    embedder = CountingEmbedder(batch_size=10, max_concurrency=3)
+    documents = make_documents(25)
+
+    embedder.embed_documents(documents)
+
+    assert sorted(len(request) for request in embedder.requests) == [5, 10, 10]
+    for document in documents:
+        assert document.embedding == [float(len(document.content))] * 3
+        assert document.usage is not None
+
+
+def test_async_embed_documents():
+    """Test the async variant embeds every document"""
+    embedder = CountingEmbedder(batch_size=10)
+    documents = make_documents(15)
+
+    asyncio.run(embedder.async_embed_documents(documents))
+
+    assert len(embedder.requests) == 2
+    assert all(document.embedding is not None for document in documents)
+
+
+def test_failed_batch_falls_back_to_single_requests():
+    """Test that a failing batch request is retried one document at a time"""
+    embedder = CountingEmbedder(fail_batches=True)
+    documents = make_documents(3)
+
+    embedder.embed_documents(documents)
+
+    assert embedder.requests == [[document.content] for document in documents]
+    assert all(document.embedding is not None for document in documents)
+
+
+def test_default_batch_embeds_one_text_at_a_time():
+    """Test the base implementation for embedders without a batch API"""
+    embedder = MagicMock(spec=Embedder)
+    embedder.get_embedding_and_usage.side_effect = [([1.0], {"total_tokens": 2}), ([2.0], {"total_tokens": 3})]
+
+    embeddings, usage = Embedder.get_embeddings_and_usage(embedder, ["a", "b"])
+
+    assert embeddings == [[1.0], [2.0]]
+    assert usage == {"total_tokens": 5}
+
+
+def test_usage_helpers():
+    """Test summing and splitting usage dictionaries"""
+    assert sum_usage([{"total_tokens": 2, "model": "m"}, None, {"total_tokens": 3}]) == {
+        "total_tokens": 5,
+        "model": "m",
+    }
+    assert sum_usage([None, None]) is None
+    assert split_usage({"total_tokens": 30, "model": "m"}, [1, 2]) == [
+        {"total_tokens": 10, "model": "m"},
+        {"total_tokens": 20, "model": "m"},
+    ]
+    assert split_usage(None, [1, 2]) == [None, None]
+
+
+def test_openai_embedder_sends_one_request_for_many_texts():
+    """Test that OpenAIEmbedder embeds a batch in a single API call, in input order"""
+    client = MagicMock()
+    response = MagicMock()
+    response.data = [MagicMock(index=1, embedding=[0.2]), MagicMock(index=0, embedding=[0.1])]
+    response.usage.model_dump.return_value = {"prompt_tokens": 4, "total_tokens": 4}
+    client.embeddings.create.return_value = response
+
+    embedder = OpenAIEmbedder(openai_client=client)
+    embeddings, usage = embedder.get_embeddings_and_usage(["first", "second"])
+
+    client.embeddings.create.assert_called_once()
+    assert client.embeddings.create.call_args.kwargs["input"] == ["first", "second"]
+    assert embeddings == [[0.1], [0.2]]
+    assert usage == {"prompt_tokens": 4, "total_tokens": 4}
+
+
+def test_embed_no_documents():
+    """Test that embedding an empty list makes no requests"""
+    embedder = CountingEmbedder()
+    embedder.embed_documents([])
+    assert embedder.requests == []
@@ -0,0 +1,131 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.embedder.cached import CachedEmbedder
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Embedder that records every text it embeds."""
+
+    id: str = "counting"
+    dimensions: int = 3
+    embedded: List[str] = field(default_factory=list)
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.embedded.append(text)
+        return [float(len(text)), 0.5, -1.0], {"total_tokens": 1}
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 0.5, -1.0] for text in texts], {"total_tokens": len(texts)}
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    return str(tmp_path / "cache" / "embeddings.db")
+
+
+def test_repeated_query_is_embedded_once():
+    """Test that the in-memory tier answers repeated queries"""
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+
+    first = embedder.get_embedding("where is my deposit?")
+    second, usage = embedder.get_embedding_and_usage("where is my deposit?")
+
+    assert first == second == [20.0, 0.5, -1.0]
+    assert usage is None
+    assert inner.embedded == ["where is my deposit?"]
+    assert embedder.stats()["memory_hits"] == 1
+    assert embedder.stats()["misses"] == 1
+
+
+def test_cache_survives_restart(db_file):
+    """Test that a new CachedEmbedder on the same file makes no embedding calls"""
+    documents = [Document(content=f"chunk {i}") for i in range(5)]
+    CachedEmbedder(embedder=CountingEmbedder(), db_file=db_file).embed_documents(documents)
+
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner, db_file=db_file)
+    reloaded = [Document(content=f"chunk {i}") for i in range(5)]
+    embedder.embed_documents(reloaded)
+
+    assert inner.embedded == []
+    assert [document.embedding for document in reloaded] == [document.embedding for document in documents]
+    assert embedder.stats()["disk_hits"] == 5
+
+
+def test_only_new_documents_are_embedded(db_file):
+    """Test that a batch mixing cached and new documents only embeds the new ones"""
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner, db_file=db_file)
+    embedder.embed_documents([Document(content="old")])
+
+    documents = [Document(content="old"), Document(content="new"), Document(content="new")]
+    asyncio.run(embedder.async_embed_documents(documents))
+
+    assert inner.embedded == ["old", "new"]
+    assert all(document.embedding is not None for document in documents)
+    assert documents[0].usage is None
+
+
+def test_duplicate_texts_are_embedded_once():
+    """Test that identical texts in one request are sent to the embedder once"""
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+
+    embeddings, usage = embedder.get_embeddings_and_usage(["a", "bb", "a"])
+
+    assert inner.embedded == ["a", "bb"]
+    assert embeddings == [[1.0, 0.5, -1.0], [2.0, 0.5, -1.0], [1.0, 0.5, -1.0]]
+    assert usage == {"total_tokens": 2}
+
+
+def test_key_includes_embedder_and_dimensions(db_file):
+    """Test that different models and dimensions sharing a file do not share embeddings"""
+    CachedEmbedder(embedder=CountingEmbedder(), db_file=db_file).get_embedding("text")
+
+    other_model = CountingEmbedder(id="other")
+    CachedEmbedder(embedder=other_model, db_file=db_file).get_embedding("text")
+    other_dimensions = CountingEmbedder(dimensions=8)
+    CachedEmbedder(embedder=other_dimensions, db_file=db_file).get_embedding("text")
+
+    assert other_model.embedded == ["text"]
+    assert other_dimensions.embedded == ["text"]
+
+
+def test_memory_tier_is_bounded():
+    """Test that the in-memory tier drops the least recently used embeddings"""
+    embedder = CachedEmbedder(embedder=CountingEmbedder(), max_memory_entries=2)
+    embedder.get_embeddings_and_usage(["a", "b", "c"])
+
+    assert embedder.stats()["memory_entries"] == 2
+
+
+def test_failed_embeddings_are_not_cached():
+    """Test that empty embeddings are not stored"""
+
+    @dataclass
+    class FailingEmbedder(CountingEmbedder):
+        def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+            self.embedded.append(text)
+            return [], None
+
+    inner = FailingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+    embedder.get_embedding("text")
+    embedder.get_embedding("text")
+
+    assert inner.embedded == ["text", "text"]
+
+
+def test_requires_embedder():
+    """Test that a CachedEmbedder must wrap an embedder"""
+    with pytest.raises(ValueError):
+        CachedEmbedder()
@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.embedder.base import Embedder
+from agno.knowledge.text import TextKnowledgeBase
+from agno.vectordb.lancedb import LanceDb
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Embedder that records every text it embeds."""
+
+    dimensions: int = 4
+    embedded: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text)), 1.0, 0.0, 0.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.embedded.append(text)
+        return self.get_embedding(text), None
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    corpus_dir = tmp_path / "corpus"
+    corpus_dir.mkdir()
+    for name in ["deposit", "repairs", "notice"]:
+        (corpus_dir / f"{name}.txt").write_text(f"Everything a tenant should know about {name}.")
+    return corpus_dir
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbedder()
+
+
+@pytest.fixture
+def knowledge_base(tmp_path, corpus, embedder):
+    vector_db = LanceDb(uri=str(tmp_path / "lancedb"), table_name="tenancy", embedder=embedder)
+    return TextKnowledgeBase(path=corpus, vector_db=vector_db, manifest_file=tmp_path / "manifest.json")
+
+
+def test_unchanged_corpus_is_not_reloaded(knowledge_base, embedder):
+    """Test that a second load of an unchanged corpus embeds and inserts nothing"""
+    knowledge_base.load()
+    assert len(embedder.embedded) == 3
+
+    knowledge_base.load()
+    assert len(embedder.embedded) == 3
+    assert knowledge_base.vector_db.get_count() == 3
+
+
+def test_only_changes_are_synced(knowledge_base, embedder, corpus):
+    """Test that edited files are re-embedded and removed content is deleted"""
+    knowledge_base.load()
+    embedder.embedded.clear()
+
+    (corpus / "repairs.txt").write_text("Landlords must fix a broken boiler quickly.")
+    (corpus / "notice.txt").unlink()
+    knowledge_base.load()
+
+    assert embedder.embedded == ["Landlords must fix a broken boiler quickly."]
+    assert knowledge_base.vector_db.get_count() == 2
+
+
+def test_first_sync_skips_documents_already_stored(tmp_path, knowledge_base, embedder):
+    """Test that a missing manifest falls back to a bulk existence check"""
+    knowledge_base.load()
+    (tmp_path / "manifest.json").unlink()
+    embedder.embedded.clear()
+
+    knowledge_base.load()
+
+    assert embedder.embedded == []
+    assert knowledge_base.vector_db.get_count() == 3
+
+
+def test_skip_existing_without_manifest(tmp_path, corpus, embedder):
+    """Test that skip_existing uses the bulk existence check"""
+    vector_db = LanceDb(uri=str(tmp_path / "lancedb"), table_name="tenancy", embedder=embedder)
+    knowledge_base = TextKnowledgeBase(path=corpus, vector_db=vector_db)
+    knowledge_base.load()
+    knowledge_base.load()
+
+    assert len(embedder.embedded) == 3
+    assert vector_db.get_count() == 3
+
+
+@pytest.mark.asyncio
+async def test_async_load_syncs_changes(knowledge_base, embedder, corpus):
+    """Test that aload diffs the corpus against the manifest too"""
+    await knowledge_base.aload()
+    embedder.embedded.clear()
+
+    (corpus / "deposit.txt").unlink()
+    await knowledge_base.aload()
+
+    assert embedder.embedded == []
+    assert knowledge_base.vector_db.get_count() == 2
@@ -3,8 +3,10 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from agno.embedder.base import Embedder
 from agno.memory.v2 import MemoryManager, SessionSummarizer
 from agno.memory.v2.db.schema import MemoryRow
+from agno.memory.v2.db.sqlite import SqliteMemoryDb
 from agno.memory.v2.memory import Memory
 from agno.memory.v2.schema import SessionSummary, UserMemory
 from agno.models.message import Message
@@ -435,6 +437,100 @@ def test_search_user_memories_first_n(memory_with_model):
 
 
 # Run and Messages Tests
+class KeywordEmbedder(Embedder):
+    """Embeds a text by which keywords it mentions"""
+
+    keywords = ["name", "football", "london", "coffee"]
+
+    def __init__(self):
+        super().__init__(dimensions=len(self.keywords))
+        self.texts = []
+
+    def get_embedding(self, text):
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text):
+        self.texts.append(text)
+        return [1.0 if keyword in text.lower() else 0.0 for keyword in self.keywords] + [0.1], None
+
+
+def test_search_user_memories_semantic():
+    embedder = KeywordEmbedder()
+    memory = Memory(embedder=embedder)
+    memory.memories = {
+        "test_user": {
+            "memory1": UserMemory(memory="The user's name is John"),
+            "memory2": UserMemory(memory="The user plays football on Sundays"),
+        }
+    }
+    memory.add_user_memory(UserMemory(memory="The user lives in London", memory_id="memory3"), user_id="test_user")
+
+    results = memory.search_user_memories(query="Where in London?", retrieval_method="semantic", user_id="test_user")
+    assert [m.memory for m in results] == [
+        "The user lives in London",
+        "The user's name is John",
+        "The user plays football on Sundays",
+    ]
+    results = memory.search_user_memories(
+        query="Any football?", retrieval_method="semantic", limit=1, user_id="test_user"
+    )
+    assert [m.memory for m in results] == ["The user plays football on Sundays"]
+
+    # Memories are embedded once, the queries each time
+    assert sorted(embedder.texts) == sorted(
+        [
+            "The user lives in London",
+            "The user's name is John",
+            "The user plays football on Sundays",
+            "Where in London?",
+            "Any football?",
+        ]
+    )
+
+    # Replaced and deleted memories are updated in the index
+    memory.replace_user_memory("memory2", UserMemory(memory="The user drinks coffee"), user_id="test_user")
+    memory.delete_user_memory("memory3", user_id="test_user")
+    results = memory.search_user_memories(query="coffee", retrieval_method="semantic", user_id="test_user")
+    assert [m.memory for m in results] == ["The user drinks coffee", "The user's name is John"]
+
+    with pytest.raises(ValueError):
+        memory.search_user_memories(retrieval_method="semantic", user_id="test_user")
+
+
+def test_search_user_memories_semantic_with_db():
+    db = SqliteMemoryDb()
+    db.create()
+    writer = Memory(db=db, embedder=KeywordEmbedder())
+    writer.add_user_memory(UserMemory(memory="The user's name is John"), user_id="test_user")
+    writer.add_user_memory(UserMemory(memory="The user lives in London"), user_id="test_user")
+    writer.add_user_memory(UserMemory(memory="Another user likes coffee"), user_id="other_user")
+
+    # Embeddings are stored with the memories, a reader does not embed them again
+    embedder = KeywordEmbedder()
+    reader = Memory(db=db, embedder=embedder)
+    results = reader.search_user_memories(query="london", retrieval_method="semantic", limit=1, user_id="test_user")
+    assert [m.memory for m in results] == ["The user lives in London"]
+    assert embedder.texts == ["london"]
+    assert "other_user" not in reader.memories
+
+    # Later searches pick up memories written and deleted elsewhere
+    coffee_id = writer.add_user_memory(UserMemory(memory="The user drinks coffee"), user_id="test_user")
+    london_id = [memory_id for memory_id, m in writer.memories["test_user"].items() if "London" in m.memory][0]
+    writer.delete_user_memory(london_id, user_id="test_user")
+    with patch.object(SqliteMemoryDb, "read_memories") as read_memories:
+        results = reader.search_user_memories(query="coffee", retrieval_method="semantic", user_id="test_user")
+        read_memories.assert_not_called()
+    assert [m.memory for m in results] == ["The user drinks coffee", "The user's name is John"]
+    assert coffee_id in reader.memories["test_user"]
+    assert london_id not in reader.memories["test_user"]
+    assert embedder.texts == ["london", "coffee"]
+
+    # Nothing was deleted since, so the ids are not read again
+    with patch.object(SqliteMemoryDb, "read_memory_ids") as read_memory_ids:
+        reader.search_user_memories(query="coffee", retrieval_method="semantic", user_id="test_user")
+        read_memory_ids.assert_not_called()
+
+
 def test_add_run(memory_with_model, sample_run_response):
     session_id = "test_session"
 
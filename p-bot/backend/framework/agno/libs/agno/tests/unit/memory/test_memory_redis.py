@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Dict
 from unittest.mock import ANY, MagicMock, patch
 
@@ -35,6 +36,26 @@ def mock_redis_client():
         client.delete.side_effect = mock_delete
         client.ping.return_value = True
 
+        # Sorted sets, as used by the per-user memory indexes
+        sorted_sets: Dict[str, Dict[str, float]] = {}
+
+        def mock_zadd(key, mapping, gt=False):
+            scores = sorted_sets.setdefault(key, {})
+            for member, score in mapping.items():
+                if not gt or member not in scores or score > scores[member]:
+                    scores[member] = score
+
+        def mock_zrangebyscore(key, min_score, max_score):
+            scores = sorted_sets.get(key, {})
+            return [member for member, score in sorted(scores.items(), key=lambda x: x[1]) if score >= min_score]
+
+        client.zadd.side_effect = mock_zadd
+        client.zrem.side_effect = lambda key, *members: [sorted_sets.get(key, {}).pop(m, None) for m in members]
+        client.zrange.side_effect = lambda key, start, end: list(sorted_sets.get(key, {}))
+        client.zrangebyscore.side_effect = mock_zrangebyscore
+        client.zcard.side_effect = lambda key: len(sorted_sets.get(key, {}))
+        client.mget.side_effect = lambda keys: [mock_data.get(key) for key in keys]
+
         # Mock scan_iter to return keys
         client.scan_iter.side_effect = lambda match, count=None: [
             k for k in mock_data.keys() if k.startswith(match.replace("*", ""))
@@ -141,6 +162,51 @@ def test_read_memories(memory_db, mock_redis_client):
     assert sorted_asc[0].id == "1"  # Oldest first
 
 
+def test_read_memories_updated_since(memory_db, mock_redis_client):
+    """Test reading a user's changed memories through their index."""
+    with patch("time.time", return_value=1000):
+        memory_db.upsert_memory(MemoryRow(id="1", user_id="user1", memory={"memory": "Memory 1"}))
+        memory_db.upsert_memory(MemoryRow(id="3", user_id="user2", memory={"memory": "Memory 3"}))
+    with patch("time.time", return_value=2000):
+        memory_db.upsert_memory(MemoryRow(id="2", user_id="user1", memory={"memory": "Memory 2"}))
+
+    memories = memory_db.read_memories_updated_since(user_id="user1")
+    assert [m.id for m in memories] == ["1", "2"]
+    assert memories[1].last_updated == datetime(1970, 1, 1, 0, 33, 20)
+    mock_redis_client.scan_iter.reset_mock()
+    mock_redis_client.get.reset_mock()
+
+    memories = memory_db.read_memories_updated_since(user_id="user1", updated_since=datetime(1970, 1, 1, 0, 20))
+    assert [m.id for m in memories] == ["2"]
+
+    assert sorted(memory_db.read_memory_ids(user_id="user1")) == ["1", "2"]
+    assert memory_db.count_memories(user_id="user1") == 2
+
+    memory_db.delete_memory("1")
+    assert memory_db.read_memory_ids(user_id="user1") == ["2"]
+    assert memory_db.count_memories(user_id="user1") == 1
+
+    # Once indexed, only the index of the user is read, never every memory in the db
+    mock_redis_client.scan_iter.assert_not_called()
+    mock_redis_client.get.assert_called_once_with("test_memory:1")
+
+
+def test_index_memories_stored_before_indexing(memory_db, mock_redis_client):
+    """Test that memories stored without an index are indexed on first read."""
+    mock_redis_client.set(
+        "test_memory:1", '{"id": "1", "user_id": "user1", "memory": {"memory": "Old"}, "updated_at": 1000}'
+    )
+
+    memories = memory_db.read_memories_updated_since(user_id="user1")
+    assert [m.id for m in memories] == ["1"]
+    assert memory_db.count_memories(user_id="user1") == 1
+
+    # A new instance finds the index already built
+    mock_redis_client.scan_iter.reset_mock()
+    assert RedisMemoryDb(prefix="test_memory").read_memory_ids(user_id="user1") == ["1"]
+    mock_redis_client.scan_iter.assert_not_called()
+
+
 def test_delete_memory(memory_db, mock_redis_client):
     """Test deleting a memory."""
     # Set up test data
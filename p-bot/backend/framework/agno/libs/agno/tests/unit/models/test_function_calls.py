@@ -0,0 +1,187 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponseEvent
+from agno.tools.executor import get_concurrency_limit
+from agno.tools.function import Function, FunctionCall
+from agno.tools.toolkit import Toolkit
+
+
+def make_function(name: str, delay: float, **kwargs) -> Function:
+    def entrypoint(city: str) -> str:
+        time.sleep(delay)
+        return f"{name}:{city}"
+
+    function = Function(name=name, entrypoint=entrypoint, **kwargs)
+    function.process_entrypoint()
+    return function
+
+
+def make_calls(function: Function, cities: List[str]) -> List[FunctionCall]:
+    return [FunctionCall(function=function, arguments={"city": city}, call_id=f"call_{city}") for city in cities]
+
+
+def run_calls(model: OpenAIChat, function_calls: List[FunctionCall]):
+    results: List[Message] = []
+    events = [response.event for response in model.run_function_calls(function_calls, results)]
+    return results, events
+
+
+@pytest.fixture
+def model():
+    return OpenAIChat(id="gpt-4o", api_key="test", concurrent_tool_calls=True)
+
+
+def test_concurrent_tool_calls_keep_order(model):
+    slow = make_function("slow_weather", delay=0.3)
+    fast = make_function("fast_weather", delay=0.0)
+    function_calls = make_calls(slow, ["Paris"]) + make_calls(fast, ["Rome", "Oslo"])
+
+    start_time = time.perf_counter()
+    results, events = run_calls(model, function_calls)
+
+    assert time.perf_counter() - start_time < 0.6
+    assert [result.content for result in results] == ["slow_weather:Paris", "fast_weather:Rome", "fast_weather:Oslo"]
+    assert [result.tool_call_id for result in results] == ["call_Paris", "call_Rome", "call_Oslo"]
+    assert (
+        events == [ModelResponseEvent.tool_call_started.value] * 3 + [ModelResponseEvent.tool_call_completed.value] * 3
+    )
+
+
+def test_concurrent_tool_calls_are_opt_in():
+    model = OpenAIChat(id="gpt-4o", api_key="test")
+    function = make_function("sequential_weather", delay=0.2)
+
+    start_time = time.perf_counter()
+    results, events = run_calls(model, make_calls(function, ["Paris", "Rome"]))
+
+    assert time.perf_counter() - start_time >= 0.4
+    assert [result.content for result in results] == ["sequential_weather:Paris", "sequential_weather:Rome"]
+    assert events[:2] == [ModelResponseEvent.tool_call_started.value, ModelResponseEvent.tool_call_completed.value]
+
+
+def test_max_concurrency_limits_function_calls(model):
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def entrypoint(city: str) -> str:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return city
+
+    function = Function(name="limited_weather", entrypoint=entrypoint, max_concurrency=2)
+    function.process_entrypoint()
+
+    results, _ = run_calls(model, make_calls(function, ["Paris", "Rome", "Oslo", "Lima", "Kyiv", "Baku"]))
+
+    assert [result.content for result in results] == ["Paris", "Rome", "Oslo", "Lima", "Kyiv", "Baku"]
+    assert max_running == 2
+
+
+def test_toolkit_max_concurrency_is_shared_by_its_functions():
+    toolkit = Toolkit(name="weather_tools", max_concurrency=3)
+    toolkit.register(lambda city: city, name="forecast")
+    toolkit.register(lambda city: city, name="history")
+
+    forecast, history = toolkit.functions.values()
+    assert forecast.max_concurrency == history.max_concurrency == 3
+    assert get_concurrency_limit(forecast) is get_concurrency_limit(history)
+
+    other = Toolkit(name="weather_tools", max_concurrency=1)
+    other.register(lambda city: city, name="forecast")
+    assert get_concurrency_limit(other.functions["forecast"]) is not get_concurrency_limit(forecast)
+
+
+def test_functions_with_the_same_name_have_their_own_limits():
+    search = make_function("search", delay=0, max_concurrency=8)
+    other_search = make_function("search", delay=0, max_concurrency=1)
+
+    assert get_concurrency_limit(search).limit == 8
+    assert get_concurrency_limit(other_search).limit == 1
+    assert get_concurrency_limit(search).limit == 8
+
+
+def test_concurrent_tool_calls_respect_tool_call_limit(model):
+    model.tool_call_limit = 2
+    calls = 0
+
+    def entrypoint(city: str) -> str:
+        nonlocal calls
+        calls += 1
+        return city
+
+    function = Function(name="counted_weather", entrypoint=entrypoint)
+    function.process_entrypoint()
+
+    results, _ = run_calls(model, make_calls(function, ["Paris", "Rome", "Oslo"]))
+
+    assert [result.content for result in results] == ["Paris", "Rome"]
+    assert calls == 2
+    assert model.tool_choice == "none"
+
+
+def test_limited_calls_do_not_hold_workers(model):
+    from agno.tools.executor import get_tool_executor
+
+    limited = make_function("serial_weather", delay=0.1, max_concurrency=1)
+    calls = make_calls(limited, [f"City {i}" for i in range(get_tool_executor()._max_workers + 3)])
+    limited_run = threading.Thread(target=run_calls, args=(model, calls))
+    limited_run.start()
+    time.sleep(0.05)
+
+    # Calls waiting for the limited tool are queued, so other tool calls still get a worker at once
+    other = make_function("free_weather", delay=0.05)
+    start_time = time.perf_counter()
+    results, _ = run_calls(
+        OpenAIChat(id="gpt-4o", api_key="test", concurrent_tool_calls=True), make_calls(other, ["Rome", "Oslo"])
+    )
+    elapsed = time.perf_counter() - start_time
+    limited_run.join()
+
+    assert [result.content for result in results] == ["free_weather:Rome", "free_weather:Oslo"]
+    assert elapsed < 0.1
+
+
+def test_concurrency_group_shares_one_limit(model):
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def entrypoint(city: str) -> str:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return city
+
+    forecast = Function(name="group_forecast", entrypoint=entrypoint, max_concurrency=1, concurrency_group="met")
+    history = Function(name="group_history", entrypoint=entrypoint, max_concurrency=1, concurrency_group="met")
+    forecast.process_entrypoint()
+    history.process_entrypoint()
+
+    run_calls(model, make_calls(forecast, ["Paris", "Rome"]) + make_calls(history, ["Oslo", "Lima"]))
+
+    assert max_running == 1
+
+
+def test_concurrency_group_keeps_its_first_limit():
+    forecast = make_function("forecast", delay=0, max_concurrency=3, concurrency_group="climate")
+    history = make_function("history", delay=0, max_concurrency=1, concurrency_group="climate")
+
+    assert get_concurrency_limit(forecast).limit == 3
+    assert get_concurrency_limit(history) is get_concurrency_limit(forecast)
+    assert get_concurrency_limit(forecast).limit == 3
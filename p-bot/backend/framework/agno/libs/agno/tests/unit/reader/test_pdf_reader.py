@@ -156,3 +156,75 @@ def test_pdf_reader_empty_pdf():
     documents = reader.read(empty_pdf)
 
     assert len(documents) == 0
+
+
+def make_text_pdf(page_texts) -> bytes:
+    """Build a minimal PDF with one line of text per page"""
+    page_count = len(page_texts)
+    font_id = 3 + 2 * page_count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % (3 + 2 * i) for i in range(page_count)), page_count),
+    ]
+    for i, text in enumerate(page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode()
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 %d 0 R >> >> >>" % (4 + 2 * i, font_id)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+
+@pytest.fixture
+def local_pdf_path(tmp_path) -> Path:
+    pdf_path = tmp_path / "Lease Guide.pdf"
+    pdf_path.write_bytes(make_text_pdf([f"Clause {i}" for i in range(1, 11)]))
+    return pdf_path
+
+
+def test_pdf_reader_process_pool(local_pdf_path):
+    reader = PDFReader(chunk=False, num_workers=2, pages_per_task=3)
+    documents = reader.read(str(local_pdf_path))
+
+    assert documents == PDFReader(chunk=False).read(str(local_pdf_path))
+    assert [doc.meta_data["page"] for doc in documents] == list(range(1, 11))
+    assert documents[0].name == "Lease_Guide"
+    assert documents[3].content.strip() == "Clause 4"
+
+
+def test_pdf_reader_iter_read_streams_page_groups(local_pdf_path):
+    reader = PDFReader(chunk=False, num_workers=2, pages_per_task=4, max_pending_tasks=1)
+    batches = list(reader.iter_read(local_pdf_path.open("rb")))
+
+    assert [[doc.meta_data["page"] for doc in batch] for batch in batches] == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_process_pool_async(local_pdf_path):
+    reader = PDFReader(num_workers=2)
+    documents = await reader.async_read(local_pdf_path)
+
+    assert len(documents) == 10
+    assert all("chunk" in doc.meta_data for doc in documents)
+
+
+def test_pdf_knowledge_base_streams_with_process_pool(local_pdf_path):
+    from agno.knowledge.pdf import PDFKnowledgeBase
+
+    knowledge_base = PDFKnowledgeBase(path=local_pdf_path.parent, reader=PDFReader(num_workers=2, pages_per_task=5))
+    document_lists = list(knowledge_base.document_lists)
+
+    assert [len(documents) for documents in document_lists] == [5, 5]
@@ -174,3 +174,45 @@ def test_workflow_storage_filtering(workflow_storage: JsonStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_session_manifest(agent_storage: JsonStorage, temp_dir: Path):
+    for i in range(4):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="agent-1" if i < 2 else "agent-2",
+                user_id="user-1" if i % 2 == 0 else "user-2",
+            )
+        )
+    assert (temp_dir / JsonStorage.manifest_name).exists()
+    assert sorted(agent_storage.get_all_session_ids(user_id="user-1")) == ["session-0", "session-2"]
+    assert agent_storage.get_all_session_ids(user_id="user-2", entity_id="agent-2") == ["session-3"]
+
+    # Upserting an unchanged session does not grow the manifest
+    size = (temp_dir / JsonStorage.manifest_name).stat().st_size
+    agent_storage.upsert(AgentSession(session_id="session-0", agent_id="agent-1", user_id="user-1", memory={"a": 1}))
+    assert (temp_dir / JsonStorage.manifest_name).stat().st_size == size
+
+    # Moving a session to another user and deleting one
+    agent_storage.upsert(AgentSession(session_id="session-0", agent_id="agent-1", user_id="user-2"))
+    agent_storage.delete_session("session-3")
+    assert [s.session_id for s in agent_storage.get_all_sessions(user_id="user-1")] == ["session-2"]
+    assert sorted(agent_storage.get_all_session_ids(user_id="user-2")) == ["session-0", "session-1"]
+
+    # Other storages see the changes, and files removed by hand drop out of the listing
+    other_storage = JsonStorage(dir_path=temp_dir)
+    assert sorted(other_storage.get_all_session_ids()) == ["session-0", "session-1", "session-2"]
+    (temp_dir / "session-1.json").unlink()
+    assert sorted(other_storage.get_all_session_ids()) == ["session-0", "session-2"]
+    agent_storage.upsert(AgentSession(session_id="session-4", agent_id="agent-2", user_id="user-1"))
+    assert sorted(other_storage.get_all_session_ids(user_id="user-1")) == ["session-2", "session-4"]
+
+    # A missing manifest is rebuilt from the session files
+    (temp_dir / JsonStorage.manifest_name).unlink()
+    assert sorted(JsonStorage(dir_path=temp_dir).get_all_session_ids()) == ["session-0", "session-2", "session-4"]
+    assert sorted(agent_storage.get_all_session_ids()) == ["session-0", "session-2", "session-4"]
+
+    agent_storage.drop()
+    assert not (temp_dir / JsonStorage.manifest_name).exists()
+    assert agent_storage.get_all_session_ids() == []
@@ -272,3 +272,27 @@ def test_mode_switching():
                     storage.mode = "workflow"
                     assert storage.mode == "workflow"
                     mock_get_table.assert_called_once()
+
+
+def test_normalized_runs_upsert(mock_engine, mock_session):
+    """Test that with normalized runs the memory column is written without the runs."""
+    with patch("agno.storage.postgres.scoped_session", return_value=mock_session[0]):
+        with patch("agno.storage.postgres.inspect", return_value=MagicMock()):
+            storage = PostgresStorage(table_name="agent_sessions", db_engine=mock_engine, normalize_runs=True)
+    assert storage.runs_table is not None
+    assert storage.runs_table.fullname == "ai.agent_sessions_runs"
+
+    storage.create_runs_table = MagicMock()
+    storage.read_last_runs = MagicMock()
+    mock_session[1].execute.return_value.scalar.return_value = {"summary": "short"}
+    session = AgentSession(
+        session_id="test-session", agent_id="test-agent", memory={"summary": "short", "runs": [{"run_id": "run-1"}]}
+    )
+    storage.upsert(session)
+
+    statements = [call.args[0] for call in mock_session[1].execute.call_args_list]
+    session_insert = next(stmt for stmt in statements if getattr(stmt, "table", None) is storage.table)
+    runs_insert = next(stmt for stmt in statements if getattr(stmt, "table", None) is storage.runs_table)
+    assert session_insert.compile().params["memory"] == {"summary": "short"}
+    assert runs_insert.compile().params["run_id_m0"] == "run-1"
+    storage.read_last_runs.assert_called_once_with(session_id="test-session", last_n_runs=1)
@@ -39,6 +39,31 @@ def mock_redis_client():
             k for k in mock_data.keys() if k.startswith(match.replace("*", ""))
         ]
 
+        # Sets and hashes used by the session index, kept in the same store
+        client.mget.side_effect = lambda keys: [mock_data.get(key) for key in keys]
+        client.sadd.side_effect = lambda key, member: mock_data.setdefault(key, set()).add(member)
+        client.srem.side_effect = lambda key, member: mock_data.get(key, set()).discard(member)
+        client.smembers.side_effect = lambda key: set(mock_data.get(key, set()))
+        client.sinter.side_effect = lambda keys: set.intersection(*(mock_data.get(key, set()) for key in keys))
+        client.hget.side_effect = lambda key, field: mock_data.get(key, {}).get(field)
+        client.hset.side_effect = lambda key, field, value: mock_data.setdefault(key, {}).update({field: value})
+        client.hdel.side_effect = lambda key, field: mock_data.get(key, {}).pop(field, None)
+
+        # Pipelines queue commands and run them on the client when executed
+        def mock_pipeline():
+            pipeline = MagicMock()
+            commands = []
+            for name in ("set", "delete", "sadd", "srem", "hset", "hdel"):
+                setattr(
+                    pipeline,
+                    name,
+                    lambda *args, name=name: commands.append((name, args)),
+                )
+            pipeline.execute.side_effect = lambda: [getattr(client, name)(*args) for name, args in commands]
+            return pipeline
+
+        client.pipeline.side_effect = mock_pipeline
+
         # Return the mock Redis instance when Redis.Redis() is called
         mock_redis.return_value = client
         yield client
@@ -345,3 +370,39 @@ def test_get_all_session_ids(agent_storage, mock_redis_client):
     # Test combined filtering
     filtered_session_ids = agent_storage.get_all_session_ids(user_id="user-1", entity_id="agent-1")
     assert len(filtered_session_ids) == 1
+
+
+def test_session_index(agent_storage, mock_redis_client):
+    """Test that listing sessions reads only the indexed sessions that match."""
+    for i in range(4):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="agent-1" if i < 2 else "agent-2",
+                user_id="user-1" if i % 2 == 0 else "user-2",
+            )
+        )
+
+    # The first listing builds the index once, as there may be sessions written before it existed
+    assert agent_storage.get_all_session_ids(user_id="user-1") == ["session-0", "session-2"]
+    assert agent_storage.get_all_session_ids(user_id="user-1", entity_id="agent-2") == ["session-2"]
+
+    # Only the sessions of the user are fetched, with one MGET and no scan
+    mock_redis_client.scan_iter.reset_mock()
+    mock_redis_client.mget.reset_mock()
+    sessions = agent_storage.get_all_sessions(user_id="user-2")
+    assert [s.session_id for s in sessions] == ["session-1", "session-3"]
+    mock_redis_client.mget.assert_called_once_with(["test_agent:session-1", "test_agent:session-3"])
+    mock_redis_client.scan_iter.assert_not_called()
+
+    # Moving a session to another user updates the index
+    agent_storage.upsert(AgentSession(session_id="session-0", agent_id="agent-1", user_id="user-2"))
+    assert agent_storage.get_all_session_ids(user_id="user-1") == ["session-2"]
+    assert agent_storage.get_all_session_ids(user_id="user-2") == ["session-0", "session-1", "session-3"]
+
+    agent_storage.delete_session("session-3")
+    assert agent_storage.get_all_session_ids(user_id="user-2") == ["session-0", "session-1"]
+    assert agent_storage.get_all_session_ids() == ["session-0", "session-1", "session-2"]
+
+    agent_storage.drop()
+    assert agent_storage.get_all_session_ids() == []
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Generator
 
 import pytest
+from sqlalchemy import select
 
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.workflow import WorkflowSession
@@ -193,3 +194,129 @@ def test_workflow_storage_filtering(workflow_storage: SqliteStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_normalized_runs(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), normalize_runs=True)
+    runs = [{"run_id": f"run-{i}", "content": f"answer {i}"} for i in range(10)]
+    storage.upsert(AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": runs}))
+
+    # Only the last runs are loaded
+    session = storage.read_last_runs("test-session", last_n_runs=3)
+    assert session is not None
+    assert [run["run_id"] for run in session.memory["runs"]] == ["run-7", "run-8", "run-9"]
+
+    # Writing the loaded runs and a new one appends the new run and keeps the older ones
+    session.memory["runs"].append({"run_id": "run-10", "content": "answer 10"})
+    session.memory["runs"][0]["content"] = "edited"
+    saved_session = storage.upsert(session)
+    assert [run["run_id"] for run in saved_session.memory["runs"]] == ["run-7", "run-8", "run-9", "run-10"]
+
+    session = storage.read("test-session")
+    assert [run["run_id"] for run in session.memory["runs"]] == [f"run-{i}" for i in range(11)]
+    assert session.memory["runs"][7]["content"] == "edited"
+    assert len(storage.get_all_sessions()[0].memory["runs"]) == 11
+
+    # The memory column no longer holds the runs
+    with storage.SqlSession() as sess:
+        memory = sess.execute(select(storage.table.c.memory)).scalar()
+    assert memory == {}
+
+    storage.delete_session("test-session")
+    assert storage.read("test-session") is None
+    assert storage.read_last_runs("test-session", last_n_runs=3) is None
+
+
+def test_normalized_runs_migration(temp_db_path: Path):
+    legacy_storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path))
+    runs = [{"run_id": f"run-{i}"} for i in range(5)]
+    for session_id in ["session-1", "session-2"]:
+        legacy_storage.upsert(
+            AgentSession(session_id=session_id, agent_id="test-agent", memory={"runs": runs, "summary": "short"})
+        )
+
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), normalize_runs=True)
+
+    # A session written without being read first keeps its earlier runs
+    storage.upsert(AgentSession(session_id="session-1", agent_id="test-agent", memory={"runs": [{"run_id": "run-5"}]}))
+    session = storage.read("session-1")
+    assert [run["run_id"] for run in session.memory["runs"]] == [f"run-{i}" for i in range(6)]
+
+    # The remaining sessions are migrated in one go
+    assert storage.migrate_runs() == 1
+    session = storage.read_last_runs("session-2", last_n_runs=2)
+    assert session.memory == {
+        "summary": "short",
+        "runs": [{"run_id": "run-3"}, {"run_id": "run-4"}],
+        "messages_offset": 0,
+    }
+
+
+def test_normalized_messages(temp_db_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), normalize_runs=True)
+    system_message = {"role": "system", "content": "Be brief", "created_at": 1}
+    messages = [{"role": "user", "content": f"question {i}", "created_at": 2} for i in range(3)]
+    # The same message twice is stored twice
+    messages.append(dict(messages[-1]))
+    memory = {"runs": [{"run_id": "run-0"}], "messages": [system_message, *messages]}
+    storage.upsert(AgentSession(session_id="test-session", agent_id="test-agent", memory=memory))
+
+    # With the last runs only the system message is loaded
+    session = storage.read_last_runs("test-session", last_n_runs=1)
+    assert session.memory["messages"] == [system_message]
+    assert session.memory["messages_offset"] == 4
+
+    # Writing the session back appends the new messages only
+    new_message = {"role": "user", "content": "question 3", "created_at": 3}
+    session.memory["messages"].append(new_message)
+    storage.upsert(session)
+    session = storage.read("test-session")
+    assert session.memory["messages"] == [system_message, *messages, new_message]
+    assert storage.get_all_sessions()[0].memory["messages"] == [system_message, *messages, new_message]
+
+    # Writing every message again stores nothing twice
+    storage.upsert(session)
+    assert storage.read("test-session").memory["messages"] == [system_message, *messages, new_message]
+
+    # A session read with its last runs can be written more than once
+    session = storage.read_last_runs("test-session", last_n_runs=1)
+    session.memory["messages"].append(new_message)
+    storage.upsert(session)
+    session.memory["messages"].append(new_message)
+    storage.upsert(session)
+    assert storage.read("test-session").memory["messages"] == [system_message, *messages, *[new_message] * 3]
+
+    # The memory column only keeps the system message
+    with storage.SqlSession() as sess:
+        stored_memory = sess.execute(select(storage.table.c.memory)).scalar()
+    assert stored_memory == {"messages": [system_message]}
+
+    # Messages kept in the memory column are moved to the messages table
+    legacy_storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path))
+    legacy_storage.upsert(AgentSession(session_id="legacy-session", agent_id="test-agent", memory=memory))
+    session = storage.read_last_runs("legacy-session", last_n_runs=1)
+    assert session.memory == {"runs": [{"run_id": "run-0"}], "messages": [system_message], "messages_offset": 4}
+    assert storage.read("legacy-session").memory["messages"] == [system_message, *messages]
+
+
+def test_normalized_messages_session_metrics(temp_db_path: Path):
+    from agno.agent import Agent, AgentMemory
+    from agno.models.message import Message, MessageMetrics
+
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), normalize_runs=True)
+    for _ in range(3):
+        agent = Agent(storage=storage, memory=AgentMemory(), num_history_runs=1)
+        agent.read_from_storage(session_id="test-session")
+        messages = [
+            Message(role="user", content="question"),
+            Message(role="assistant", content="answer", metrics=MessageMetrics(input_tokens=10, output_tokens=2)),
+        ]
+        agent.memory.add_messages(messages=messages)
+        agent.session_metrics = agent.get_session_metrics(agent.memory, messages)
+        agent.write_to_storage(session_id="test-session")
+
+    # Each agent only loaded the system messages, yet the session metrics count every run
+    assert agent.session_metrics.input_tokens == 30
+    session = storage.read("test-session")
+    assert len(session.memory["messages"]) == 6
+    assert session.session_data["session_metrics"]["output_tokens"] == 6
@@ -1,9 +1,14 @@
+import threading
+import time
 import uuid
 
 import pytest
 
 from agno.agent import Agent
+from agno.memory.v2.memory import Memory
 from agno.models.openai import OpenAIChat
+from agno.run.response import RunResponse
+from agno.run.team import TeamRunResponse
 from agno.team.team import Team
 from agno.tools.duckduckgo import DuckDuckGoTools
 from agno.tools.yfinance import YFinanceTools
@@ -80,3 +85,118 @@ def test_get_member_id():
     assert Team(members=[inner_team])._get_member_id(inner_team) == "123"
     inner_team = Team(name="Test Team", team_id=str(uuid.uuid4()), members=[member])
     assert Team(members=[inner_team])._get_member_id(inner_team) == "test-team"
+
+
+def slow_agent(name, delay, content=None, error=None, running=None):
+    """An agent whose run sleeps, then answers or raises, tracking how many agents run at once"""
+    agent = Agent(name=name)
+
+    def run(message, **kwargs):
+        if running is not None:
+            with running["lock"]:
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+        try:
+            time.sleep(delay)
+            if error is not None:
+                raise error
+            agent.run_response = RunResponse(content=content)
+            return agent.run_response
+        finally:
+            if running is not None:
+                with running["lock"]:
+                    running["now"] -= 1
+
+    agent.run = run  # type: ignore
+    return agent
+
+
+def run_collaborate_team(team):
+    team.memory = Memory()
+    team.run_response = TeamRunResponse()
+    function = team.get_run_member_agents_function(session_id="test-session")
+    start_time = time.perf_counter()
+    results = list(function.entrypoint(task_description="Review the tenancy agreement"))
+    return results, time.perf_counter() - start_time
+
+
+def test_run_member_agents_in_parallel():
+    members = [slow_agent("Slow", 0.4, "first"), slow_agent("Fast", 0.1, "second"), slow_agent("Mid", 0.2, "third")]
+    team = Team(name="Collaborate Team", mode="collaborate", members=members)
+
+    results, elapsed = run_collaborate_team(team)
+
+    # Results are in member order, not completion order
+    assert results == ["Agent Slow: first", "Agent Fast: second", "Agent Mid: third"]
+    assert elapsed < 0.65
+    assert [r.content for r in team.run_response.member_responses] == ["first", "second", "third"]
+
+
+def test_run_member_agents_partial_results():
+    members = [
+        slow_agent("Hanging", 2.0, "too late"),
+        slow_agent("Broken", 0.05, error=RuntimeError("model unavailable")),
+        slow_agent("Working", 0.05, "done"),
+    ]
+    team = Team(name="Collaborate Team", mode="collaborate", members=members, member_timeout=0.3)
+
+    results, elapsed = run_collaborate_team(team)
+
+    assert results == [
+        "Agent Hanging: No response within 0.3 seconds.",
+        "Agent Broken: Error - model unavailable",
+        "Agent Working: done",
+    ]
+    assert elapsed < 1.0
+    assert [r.content for r in team.run_response.member_responses] == ["done"]
+
+
+def test_run_member_agents_max_workers():
+    running = {"lock": threading.Lock(), "now": 0, "max": 0}
+    members = [slow_agent(f"Agent {i}", 0.05, str(i), running=running) for i in range(5)]
+    team = Team(name="Collaborate Team", mode="collaborate", members=members, max_member_workers=2)
+
+    results, _ = run_collaborate_team(team)
+
+    assert results == [f"Agent Agent {i}: {i}" for i in range(5)]
+    assert running["max"] == 2
+
+
+def test_run_member_agents_waits_for_timed_out_member():
+    running = {"lock": threading.Lock(), "now": 0, "max": 0}
+    members = [slow_agent("Hanging", 0.4, "late", running=running)]
+    team = Team(name="Collaborate Team", mode="collaborate", members=members, member_timeout=0.1)
+
+    results, _ = run_collaborate_team(team)
+    assert results == ["Agent Hanging: No response within 0.1 seconds."]
+
+    # The next run does not start the member while its timed out run still uses it
+    team.member_timeout = None
+    results, elapsed = run_collaborate_team(team)
+    assert results == ["Agent Hanging: late"]
+    assert running["max"] == 1
+    assert elapsed > 0.5
+
+
+def test_run_member_agents_streams_by_default():
+    def streaming_agent(name, chunks):
+        agent = Agent(name=name)
+
+        def run(message, stream=False, **kwargs):
+            assert stream
+            agent.run_response = RunResponse(content="".join(chunks))
+            return iter([RunResponse(content=chunk) for chunk in chunks])
+
+        agent.run = run  # type: ignore
+        return agent
+
+    members = [streaming_agent("First", ["The deposit ", "is protected."]), streaming_agent("Second", ["Agreed."])]
+    team = Team(name="Collaborate Team", mode="collaborate", members=members)
+    team.memory = Memory()
+    team.run_response = TeamRunResponse()
+    function = team.get_run_member_agents_function(session_id="test-session", stream=True)
+
+    results = list(function.entrypoint(task_description="Review the tenancy agreement"))
+
+    assert results == ["The deposit ", "is protected.", "Agreed."]
+    assert [r.content for r in team.run_response.member_responses] == ["The deposit is protected.", "Agreed."]
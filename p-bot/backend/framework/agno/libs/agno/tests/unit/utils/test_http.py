@@ -0,0 +1,97 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agno.models.openai import OpenAIChat
+from agno.models.openai.like import OpenAILike
+from agno.utils.http import aclose_async_http_clients, async_http_client_stats, get_async_http_client
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hello"}, "finish_reason": "stop"}],
+}
+
+
+class CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps(COMPLETION).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """Fixture to run a local keep-alive server that answers chat completions"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_client_shared_within_event_loop():
+    """Test that one client is shared per event loop and replaced once closed"""
+    client = get_async_http_client()
+    assert get_async_http_client() is client
+
+    await aclose_async_http_clients()
+    assert client.is_closed
+    assert get_async_http_client() is not client
+    await aclose_async_http_clients()
+
+
+def test_client_per_event_loop():
+    """Test that separate event loops get separate clients"""
+
+    async def get_client():
+        return get_async_http_client()
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_models_share_http_client():
+    """Test that OpenAI-compatible models use the same connection pool"""
+    openai_client = OpenAIChat(api_key="test").get_async_client()
+    like_client = OpenAILike(api_key="test", base_url="http://localhost/v1").get_async_client()
+
+    assert openai_client._client is get_async_http_client()
+    assert like_client._client is get_async_http_client()
+    await aclose_async_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused(server_url):
+    """Test that repeated requests go over a kept-alive connection"""
+    model = OpenAIChat(api_key="test", base_url=server_url, max_retries=0)
+    before = async_http_client_stats()
+
+    for _ in range(5):
+        response = await model.get_async_client().chat.completions.create(
+            model="gpt-4o", messages=[{"role": "user", "content": "Hi"}]
+        )
+        assert response.choices[0].message.content == "Hello"
+
+    after = async_http_client_stats()
+    assert after["requests"] - before["requests"] == 5
+    assert after["connections_opened"] - before["connections_opened"] == 1
+    await aclose_async_http_clients()
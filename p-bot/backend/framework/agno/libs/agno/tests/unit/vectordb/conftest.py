@@ -1,5 +1,5 @@
 from typing import Any, Dict, List
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -22,4 +22,15 @@ def mock_embedder():
     mock_usage: Dict[str, Any] = {"prompt_tokens": 10, "total_tokens": 10}
     mock.get_embedding_and_usage.return_value = (mock_embedding, mock_usage)
 
+    # Mock the batch embedding methods
+    mock.get_embeddings_and_usage.side_effect = lambda texts: ([mock_embedding] * len(texts), mock_usage)
+    mock.get_embeddings_batched.side_effect = lambda texts: [mock_embedding] * len(texts)
+
+    def embed_documents(documents):
+        for document in documents:
+            document.embedding, document.usage = mock_embedding, mock_usage
+
+    mock.embed_documents.side_effect = embed_documents
+    mock.async_embed_documents = AsyncMock(side_effect=embed_documents)
+
     return mock
@@ -181,3 +181,20 @@ def test_multiple_document_operations(chroma_db, sample_documents):
     curry_results = chroma_db.search("curry", limit=1)
     assert len(curry_results) == 1
     assert "curry" in curry_results[0].content.lower()
+
+
+def test_ids_exist(chroma_db, sample_documents):
+    """Test checking many document ids in bulk"""
+    chroma_db.insert(sample_documents[:2])
+    ids = [chroma_db.content_hash(document) for document in sample_documents]
+
+    assert chroma_db.ids_exist(ids) == set(ids[:2])
+
+
+def test_delete_ids(chroma_db, sample_documents):
+    """Test deleting documents by id"""
+    chroma_db.insert(sample_documents)
+    chroma_db.delete_ids([chroma_db.content_hash(sample_documents[0])])
+
+    assert chroma_db.get_count() == 2
+    assert not chroma_db.doc_exists(sample_documents[0])
@@ -168,3 +168,34 @@ def test_bad_vectors_handling(mock_embedder):
         db.drop()
         if os.path.exists(TEST_PATH):
             shutil.rmtree(TEST_PATH)
+
+
+def test_ids_exist(lance_db, sample_documents):
+    """Test checking many document ids in bulk"""
+    lance_db.insert(sample_documents[:2])
+    ids = [lance_db.content_hash(document) for document in sample_documents]
+
+    assert lance_db.ids_exist(ids) == set(ids[:2])
+    assert lance_db.ids_exist([]) == set()
+
+
+def test_delete_ids(lance_db, sample_documents):
+    """Test deleting documents by id"""
+    lance_db.insert(sample_documents)
+    lance_db.delete_ids([lance_db.content_hash(sample_documents[0])])
+
+    assert lance_db.get_count() == 2
+    assert not lance_db.doc_exists(sample_documents[0])
+    assert lance_db.doc_exists(sample_documents[1])
+
+
+def test_search_many(lance_db, sample_documents):
+    """Test that batched search returns the results of each query, in order"""
+    lance_db.insert(sample_documents)
+    queries = ["coconut dishes", "noodles", "curry"]
+
+    results = lance_db.search_many(queries, limit=2)
+    assert len(results) == 3
+    for query, documents in zip(queries, results):
+        expected = lance_db.vector_search(query, limit=2)
+        assert [document.name for document in documents] == [document.name for document in expected]
@@ -0,0 +1,186 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb import NumpyDb
+
+TEST_TABLE = "test_table"
+
+KEYWORDS = ["soup", "noodle", "curry"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds a text by counting a few keywords, so search results are predictable."""
+
+    dimensions: int = 4
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(text.lower().count(keyword)) for keyword in KEYWORDS] + [0.1]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+@pytest.fixture
+def numpy_db(tmp_path):
+    """Fixture to create a NumpyDb instance in a temporary directory"""
+    db = NumpyDb(table_name=TEST_TABLE, path=str(tmp_path), embedder=KeywordEmbedder())
+    db.create()
+    return db
+
+
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    """Fixture to create sample documents"""
+    return [
+        Document(
+            content="Tom Kha Gai is a Thai coconut soup with chicken",
+            meta_data={"cuisine": "Thai", "type": "soup"},
+            name="tom_kha",
+        ),
+        Document(
+            content="Pad Thai is a stir-fried rice noodle dish",
+            meta_data={"cuisine": "Thai", "type": "noodles"},
+            name="pad_thai",
+        ),
+        Document(
+            content="Green curry is a spicy Thai curry with coconut milk",
+            meta_data={"cuisine": "Thai", "type": "curry"},
+            name="green_curry",
+        ),
+    ]
+
+
+def test_create_table(numpy_db):
+    """Test creating a table"""
+    assert numpy_db.exists()
+    assert numpy_db.get_count() == 0
+
+
+def test_insert_and_search(numpy_db, sample_documents):
+    """Test inserting documents and finding the closest one"""
+    numpy_db.insert(sample_documents)
+    assert numpy_db.get_count() == 3
+
+    results = numpy_db.search("a bowl of soup", limit=2)
+    assert len(results) == 2
+    assert results[0].name == "tom_kha"
+    assert results[0].meta_data["type"] == "soup"
+
+
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_distance_metrics(tmp_path, sample_documents, distance):
+    """Test that every distance metric ranks the matching document first"""
+    db = NumpyDb(table_name=TEST_TABLE, path=str(tmp_path), embedder=KeywordEmbedder(), distance=distance)
+    db.create()
+    db.insert(sample_documents)
+
+    assert db.search("curry curry", limit=1)[0].name == "green_curry"
+
+
+def test_search_with_filters(numpy_db, sample_documents):
+    """Test that filters restrict the candidates before scoring"""
+    numpy_db.insert(sample_documents)
+
+    results = numpy_db.search("soup", limit=3, filters={"type": "noodles"})
+    assert [document.name for document in results] == ["pad_thai"]
+    assert numpy_db.search("soup", filters={"type": "dessert"}) == []
+
+
+def test_insert_filters_are_searchable(numpy_db, sample_documents):
+    """Test that filters given on insert can be used when searching"""
+    numpy_db.insert(sample_documents[:1], filters={"source": "menu"})
+    numpy_db.insert(sample_documents[1:])
+
+    results = numpy_db.search("soup", limit=3, filters={"source": "menu"})
+    assert [document.name for document in results] == ["tom_kha"]
+
+
+def test_upsert_replaces_documents(numpy_db, sample_documents):
+    """Test that documents with the same content are replaced, not duplicated"""
+    numpy_db.insert(sample_documents)
+    sample_documents[0].meta_data = {"cuisine": "Thai", "type": "starter"}
+    numpy_db.upsert(sample_documents[:1] * 2)
+
+    assert numpy_db.get_count() == 3
+    assert numpy_db.search("soup", limit=1)[0].meta_data["type"] == "starter"
+
+
+def test_exists_checks(numpy_db, sample_documents):
+    """Test document, name and id existence checks"""
+    numpy_db.insert(sample_documents[:2])
+    ids = [numpy_db.content_hash(document) for document in sample_documents]
+
+    assert numpy_db.doc_exists(sample_documents[0])
+    assert not numpy_db.doc_exists(sample_documents[2])
+    assert numpy_db.name_exists("pad_thai")
+    assert numpy_db.ids_exist(ids) == set(ids[:2])
+
+
+def test_delete_ids(numpy_db, sample_documents):
+    """Test deleting documents by id keeps the others searchable"""
+    numpy_db.insert(sample_documents)
+    numpy_db.delete_ids([numpy_db.content_hash(sample_documents[0])])
+
+    assert numpy_db.get_count() == 2
+    assert not numpy_db.doc_exists(sample_documents[0])
+    assert numpy_db.search("curry", limit=1)[0].name == "green_curry"
+
+
+def test_persistence(tmp_path, numpy_db, sample_documents):
+    """Test that a new instance reads the stored table back"""
+    numpy_db.insert(sample_documents)
+
+    reopened = NumpyDb(table_name=TEST_TABLE, path=str(tmp_path), embedder=KeywordEmbedder())
+    assert reopened.get_count() == 3
+    assert reopened.search("noodle", limit=1)[0].name == "pad_thai"
+
+
+def test_grows_past_initial_capacity(numpy_db):
+    """Test inserting more documents than the initial allocation"""
+    documents = [Document(content=f"soup number {i}") for i in range(1500)]
+    numpy_db.insert(documents)
+
+    assert numpy_db.get_count() == 1500
+    assert len(numpy_db.search("soup", limit=10)) == 10
+
+
+def test_drop_and_delete(numpy_db, sample_documents):
+    """Test clearing and dropping the table"""
+    numpy_db.insert(sample_documents)
+    assert numpy_db.delete()
+    assert numpy_db.get_count() == 0
+
+    numpy_db.drop()
+    assert not numpy_db.exists()
+
+
+@pytest.mark.asyncio
+async def test_async_operations(numpy_db, sample_documents):
+    """Test the async surface"""
+    await numpy_db.async_insert(sample_documents)
+    assert await numpy_db.async_doc_exists(sample_documents[1])
+
+    results = await numpy_db.async_search("curry", limit=1)
+    assert results[0].name == "green_curry"
+
+    await numpy_db.async_drop()
+    assert not await numpy_db.async_exists()
+
+
+def test_search_many(numpy_db, sample_documents):
+    """Test that batched search returns the same results as one search per query"""
+    numpy_db.insert(sample_documents)
+    queries = ["soup", "noodle noodle", "curry", "soup and curry"]
+
+    results = numpy_db.search_many(queries, limit=2, filters={"cuisine": "Thai"})
+    assert len(results) == len(queries)
+    for query, documents in zip(queries, results):
+        expected = numpy_db.search(query, limit=2, filters={"cuisine": "Thai"})
+        assert [document.name for document in documents] == [document.name for document in expected]
+    assert numpy_db.search_many([]) == []
@@ -153,6 +153,18 @@ def test_doc_exists(qdrant_db, sample_documents, mock_qdrant_client):
     assert qdrant_db.doc_exists(sample_documents[0]) is False
 
 
+def test_ids_exist(qdrant_db, sample_documents, mock_qdrant_client):
+    """Test checking many document ids in one request"""
+    ids = [qdrant_db.content_hash(document) for document in sample_documents]
+    # Qdrant returns the ids in UUID form
+    stored_id = "-".join([ids[1][:8], ids[1][8:12], ids[1][12:16], ids[1][16:20], ids[1][20:]])
+    mock_qdrant_client.retrieve.return_value = [Mock(id=stored_id)]
+
+    assert qdrant_db.ids_exist(ids) == {ids[1]}
+    mock_qdrant_client.retrieve.assert_called_once()
+    assert mock_qdrant_client.retrieve.call_args.kwargs["ids"] == ids
+
+
 def test_name_exists(qdrant_db, mock_qdrant_client):
     """Test name existence check"""
     # Test when name exists
@@ -211,6 +223,28 @@ def test_search(qdrant_db, mock_qdrant_client):
         assert kwargs["limit"] == 2
 
 
+def test_search_many(qdrant_db, mock_qdrant_client):
+    """Test that several queries are sent in one batched query"""
+    results = []
+    for name in ["tom_kha", "pad_thai"]:
+        point = Mock()
+        point.payload = {"name": name, "meta_data": {}, "content": name, "usage": None}
+        point.vector = [0.1] * 1024
+        results.append(Mock(points=[point]))
+    mock_qdrant_client.query_batch_points.return_value = results
+
+    documents = qdrant_db.search_many(["soup", "noodles"], limit=3)
+    assert [[document.name for document in query_documents] for query_documents in documents] == [
+        ["tom_kha"],
+        ["pad_thai"],
+    ]
+
+    mock_qdrant_client.query_batch_points.assert_called_once()
+    requests = mock_qdrant_client.query_batch_points.call_args.kwargs["requests"]
+    assert len(requests) == 2
+    assert all(request.limit == 3 for request in requests)
+
+
 def test_get_count(qdrant_db, mock_qdrant_client):
     """Test getting count of documents"""
     count_result = Mock()
@@ -0,0 +1,359 @@
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+import asyncio
+import base64
+import hashlib
+import io
+import os
+import threading
+import uuid
+
+from PIL import Image
+
+from config import (
+    IMAGE_MAX_SIZE,
+    IMAGE_JPEG_QUALITY,
+    IMAGE_WORKERS,
+    IMAGE_USE_PROCESSES,
+    IMAGE_CACHE_MAX_ENTRIES,
+    IMAGE_UPLOAD_MAX_BYTES,
+    IMAGE_UPLOAD_CHUNK_SIZE,
+)
+
+class ImageUploadError(ValueError):
+    """An uploaded file was rejected because it is too large or not an image."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @classmethod
+    def too_large(cls, max_bytes: int) -> "ImageUploadError":
+        """The error for an upload over the size limit."""
+        return cls(f"The uploaded image is larger than {max_bytes / (1024 * 1024):.1f} MB.", 413)
+
+def sniff_image_type(header: bytes) -> Optional[str]:
+    """Get the file extension of an image from its first bytes.
+
+    Args:
+        header: At least the first 12 bytes of the file
+
+    Returns:
+        The extension, or None if the bytes are not a supported image format
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return ".gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    if header[:4] in (b"II*\x00", b"MM\x00*"):
+        return ".tiff"
+    if header.startswith(b"BM"):
+        return ".bmp"
+    return None
+
+def encode_image(data: Union[bytes, str], max_size: int = IMAGE_MAX_SIZE, quality: int = IMAGE_JPEG_QUALITY) -> str:
+    """Shrink an image and encode it as a base64 JPEG.
+
+    Large JPEGs are decoded at a reduced scale with Image.draft, and other
+    formats are shrunk by an integer factor with Image.reduce, so the final
+    LANCZOS resize only works on an image close to the target size.
+
+    This is a plain function of bytes or a path so it can run in a worker process.
+
+    Args:
+        data: The raw image file contents, or the path of the image file
+        max_size: Longest side of the encoded image
+        quality: JPEG quality of the encoded image
+
+    Returns:
+        The base64 encoded JPEG
+    """
+    with Image.open(io.BytesIO(data) if isinstance(data, bytes) else data) as img:
+        if max(img.size) > max_size:
+            # Let the JPEG decoder skip detail we would throw away anyway
+            if img.format == "JPEG":
+                img.draft("RGB", (max_size, max_size))
+            factor = max(img.size) // max_size
+            if factor >= 2:
+                img = img.reduce(factor)
+            if max(img.size) > max_size:
+                ratio = max_size / max(img.size)
+                new_size = tuple(max(1, int(dim * ratio)) for dim in img.size)
+                img = img.resize(new_size, Image.LANCZOS)
+
+        # Convert RGBA to RGB if needed (JPEG doesn't support alpha channel)
+        if img.mode == "RGBA":
+            # Paste on a white background using alpha as mask
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            background.paste(img, mask=img.split()[3])
+            img = background
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=quality)
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+class ImagePreprocessor:
+    """
+    Prepares uploaded images for the vision model off the event loop.
+
+    Decoding, resizing and re-encoding run in a thread or process pool, and
+    the encoded payload is cached by a hash of the file contents, so follow-up
+    questions about the same photo reuse it instead of redoing the work.
+
+    Uploads are streamed to disk in chunks with a size limit and encoded once
+    while saving, so the issue detection agent finds the payload in the cache
+    without reading the file again.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = IMAGE_WORKERS,
+        use_processes: bool = IMAGE_USE_PROCESSES,
+        max_entries: int = IMAGE_CACHE_MAX_ENTRIES,
+        max_size: int = IMAGE_MAX_SIZE,
+        quality: int = IMAGE_JPEG_QUALITY,
+        max_upload_bytes: int = IMAGE_UPLOAD_MAX_BYTES,
+        chunk_size: int = IMAGE_UPLOAD_CHUNK_SIZE,
+    ):
+        """Initialize the image preprocessor.
+
+        Args:
+            max_workers: Number of workers encoding images
+            use_processes: Use a process pool instead of a thread pool
+            max_entries: Maximum number of encoded images kept in memory
+            max_size: Longest side of the encoded images
+            quality: JPEG quality of the encoded images
+            max_upload_bytes: Largest accepted upload
+            chunk_size: Bytes copied to disk at a time when saving an upload
+        """
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
+        self.max_entries = max(1, max_entries)
+        self.max_size = max_size
+        self.quality = quality
+        self.max_upload_bytes = max_upload_bytes
+        self.chunk_size = max(64 * 1024, chunk_size)
+        self._executor: Optional[Executor] = None
+
+        # Content hash -> base64 JPEG
+        self.entries: "OrderedDict[str, str]" = OrderedDict()
+        # Path -> (mtime, size, content hash) so repeat lookups skip reading the file
+        self.path_hashes: "OrderedDict[str, Tuple[float, int, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Counters exposed through stats()
+        self.hits = 0
+        self.misses = 0
+        self.uploads = 0
+        self.upload_bytes = 0
+        self.rejected_uploads = 0
+
+    @property
+    def executor(self) -> Executor:
+        """The worker pool, created on first use."""
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-preprocessing")
+        return self._executor
+
+    @staticmethod
+    def _read_bytes(image_path: str) -> bytes:
+        """Read a whole file."""
+        with open(image_path, "rb") as f:
+            return f.read()
+
+    def _read_file(self, image_path: str) -> Tuple[Optional[bytes], str]:
+        """Hash a file, reading its contents only if they are needed.
+
+        Args:
+            image_path: Path to the image
+
+        Returns:
+            The file contents (None on a cache hit) and their hash
+        """
+        stat = os.stat(image_path)
+        with self._lock:
+            known = self.path_hashes.get(image_path)
+            if known and known[:2] == (stat.st_mtime, stat.st_size) and known[2] in self.entries:
+                return None, known[2]
+
+        data = self._read_bytes(image_path)
+        digest = hashlib.sha256(data).hexdigest()
+        self._remember_path(image_path, stat, digest)
+        return data, digest
+
+    def _remember_path(self, image_path: str, stat: os.stat_result, digest: str) -> None:
+        """Record the content hash of a file so repeat lookups skip reading it."""
+        with self._lock:
+            self.path_hashes[image_path] = (stat.st_mtime, stat.st_size, digest)
+            self.path_hashes.move_to_end(image_path)
+            while len(self.path_hashes) > self.max_entries * 4:
+                self.path_hashes.popitem(last=False)
+
+    def _copy_upload(self, source: BinaryIO, directory: Path, max_bytes: int) -> Tuple[str, str, int]:
+        """Copy an upload to a new file in chunks, checking its type and size.
+
+        Args:
+            source: The uploaded file
+            directory: Directory to save the file in
+            max_bytes: Largest accepted upload
+
+        Returns:
+            The path of the saved file, the hash of its contents and its size
+        """
+        header = source.read(self.chunk_size)
+        extension = sniff_image_type(header)
+        if extension is None:
+            raise ImageUploadError("The uploaded file is not a supported image (JPEG, PNG, GIF, WebP, TIFF or BMP).", 415)
+
+        directory.mkdir(parents=True, exist_ok=True)
+        file_path = directory / f"{uuid.uuid4()}{extension}"
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with open(file_path, "xb") as f:
+                chunk = header
+                while chunk:
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise ImageUploadError.too_large(max_bytes)
+                    hasher.update(chunk)
+                    f.write(chunk)
+                    chunk = source.read(self.chunk_size)
+        except Exception:
+            file_path.unlink(missing_ok=True)
+            raise
+        return str(file_path), hasher.hexdigest(), size
+
+    async def asave_upload(self, upload: Any, directory: Path, max_bytes: Optional[int] = None) -> str:
+        """Stream an uploaded image to disk and prepare it for the vision model.
+
+        The upload is copied in chunks in a worker thread, so it is never held in
+        memory as a whole and the event loop keeps serving other requests. The
+        saved file is decoded and encoded once, and the payload is cached under
+        its path, so a later aprepare of the same path reads nothing from disk.
+
+        Args:
+            upload: The uploaded file (a FastAPI UploadFile)
+            directory: Directory to save the file in
+            max_bytes: Largest accepted upload, defaults to max_upload_bytes
+
+        Returns:
+            The path of the saved image
+
+        Raises:
+            ImageUploadError: If the upload is too large, not an image or cannot be decoded
+        """
+        max_bytes = max_bytes or self.max_upload_bytes
+        try:
+            # Reject uploads that announce a size over the limit before copying anything
+            if (getattr(upload, "size", None) or 0) > max_bytes:
+                raise ImageUploadError.too_large(max_bytes)
+
+            image_path, digest, size = await asyncio.to_thread(self._copy_upload, upload.file, directory, max_bytes)
+            if self._lookup(digest) is None:
+                loop = asyncio.get_running_loop()
+                try:
+                    encoded = await loop.run_in_executor(self.executor, encode_image, image_path, self.max_size, self.quality)
+                except Exception as e:
+                    await asyncio.to_thread(Path(image_path).unlink, True)
+                    raise ImageUploadError("The uploaded image could not be decoded.", 415) from e
+                self._store(digest, encoded)
+        except ImageUploadError:
+            self.rejected_uploads += 1
+            raise
+
+        self._remember_path(image_path, await asyncio.to_thread(os.stat, image_path), digest)
+        self.uploads += 1
+        self.upload_bytes += size
+        return image_path
+
+    def _lookup(self, digest: str) -> Optional[str]:
+        """Get a cached payload and count the lookup."""
+        with self._lock:
+            encoded = self.entries.get(digest)
+            if encoded is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(digest)
+            self.hits += 1
+            return encoded
+
+    def _store(self, digest: str, encoded: str) -> None:
+        """Cache an encoded payload, dropping the least recently used ones."""
+        with self._lock:
+            self.entries[digest] = encoded
+            self.entries.move_to_end(digest)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    async def aprepare(self, image_path: str) -> Optional[str]:
+        """Get the base64 JPEG payload for an image without blocking the event loop.
+
+        Args:
+            image_path: Path to the uploaded image
+
+        Returns:
+            The base64 encoded JPEG, or None if the file is missing
+        """
+        if not os.path.exists(image_path):
+            return None
+
+        data, digest = await asyncio.to_thread(self._read_file, image_path)
+        encoded = self._lookup(digest)
+        if encoded is not None:
+            return encoded
+
+        if data is None:
+            # Evicted between reading and lookup; read it again
+            data = await asyncio.to_thread(self._read_bytes, image_path)
+        loop = asyncio.get_running_loop()
+        encoded = await loop.run_in_executor(self.executor, encode_image, data, self.max_size, self.quality)
+        self._store(digest, encoded)
+        return encoded
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            A dictionary with size, hit and miss counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "workers": self.max_workers,
+            "use_processes": self.use_processes,
+            "uploads": self.uploads,
+            "upload_bytes": self.upload_bytes,
+            "rejected_uploads": self.rejected_uploads,
+        }
+
+# Create a singleton instance
+_image_preprocessor = None
+
+def get_image_preprocessor() -> ImagePreprocessor:
+    """Get the global image preprocessor instance."""
+    global _image_preprocessor
+    if _image_preprocessor is None:
+        _image_preprocessor = ImagePreprocessor()
+    return _image_preprocessor
@@ -2,24 +2,48 @@ import uvicorn
 from fastapi import FastAPI, Body, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import StreamingResponse
 import os
+import asyncio
 from pathlib import Path
+from contextlib import asynccontextmanager
 import datetime
 
 from api import router as api_router
+from api.chat import stream_response
+from agent_manager import AgentManager
 from config import API_PREFIX, ALLOW_ORIGINS, UPLOAD_DIR, VECTOR_DB_PATH, KNOWLEDGE_DIR
 from memory_store import get_memory_store
+from agent_pool import get_agent_pool
+from image_preprocessing import get_image_preprocessor, ImageUploadError
+from tenancy_knowledge import get_tenancy_knowledge
+from agno.api.dispatcher import api_dispatcher
+from agno.utils.http import aclose_async_http_clients, async_http_client_stats
 
 # Create directory structure if it doesn't exist
 os.makedirs(VECTOR_DB_PATH, exist_ok=True)
 os.makedirs(KNOWLEDGE_DIR, exist_ok=True)
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the shared agent pool once at startup instead of per request."""
+    await get_agent_pool().start()
+    yield
+    # Write out any session log records still waiting for the background writer
+    get_memory_store().close()
+    get_image_preprocessor().shutdown()
+    # Close the pooled model API connections shared by all agents
+    await aclose_async_http_clients()
+    # Send agent run telemetry still waiting in the background queue
+    await asyncio.to_thread(api_dispatcher.shutdown)
+
 # Create FastAPI app
 app = FastAPI(
     title="P-Bot API",
     description="API for the P-Bot real estate chatbot with multiple specialized agents",
     version="0.2.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -90,20 +114,22 @@ async def direct_chat_endpoint(req: dict = Body(...)):
         print(f"Session ID: '{session_id}'")
         print(f"Location: '{location}'")
         
-        # Import the agent manager and call process_query
-        try:
-            from agent_manager import AgentManager
-            
-            # Create the agent manager
-            manager = AgentManager()
-            print("AgentManager created successfully")
-            
-            # Process the query
-            result = await manager.process_query(
-                message=message,
-                session_id=session_id,
-                location=location
+        # Stream the response as server-sent events if requested
+        if req.get("streaming"):
+            return StreamingResponse(
+                stream_response(message, session_id, location),
+                media_type="text/event-stream"
             )
+        
+        # Borrow a pre-built agent set and call process_query
+        try:
+            async with get_agent_pool().checkout() as manager:
+                # Process the query
+                result = await manager.process_query(
+                    message=message,
+                    session_id=session_id,
+                    location=location
+                )
             
             print(f"Query processed successfully: {result}")
             return result
@@ -144,7 +170,7 @@ async def direct_sessions_endpoint():
     print("Direct /api/v1/sessions endpoint called")
     try:
         memory_store = get_memory_store()
-        return memory_store.list_sessions()
+        return await memory_store.alist_sessions()
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -159,12 +185,12 @@ async def direct_session_detail_endpoint(session_id: str):
         memory_store = get_memory_store()
         
         # Check if session exists
-        if session_id not in memory_store.sessions:
+        if not memory_store.has_session(session_id):
             from fastapi import HTTPException
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
         
-        session = memory_store.get_session(session_id)
-        messages = memory_store.get_messages(session_id)
+        session = await memory_store.aget_session(session_id)
+        messages = await memory_store.aget_messages(session_id)
         
         return {
             "session_id": session_id,
@@ -186,11 +212,11 @@ async def direct_delete_session_endpoint(session_id: str):
         memory_store = get_memory_store()
         
         # Check if session exists
-        if session_id not in memory_store.sessions:
+        if not memory_store.has_session(session_id):
             from fastapi import HTTPException
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
         
-        memory_store.delete_session(session_id)
+        await memory_store.adelete_session(session_id)
         return {"status": "success", "message": f"Session {session_id} deleted"}
     except Exception as e:
         import traceback
@@ -206,11 +232,11 @@ async def direct_clear_session_messages_endpoint(session_id: str):
         memory_store = get_memory_store()
         
         # Check if session exists
-        if session_id not in memory_store.sessions:
+        if not memory_store.has_session(session_id):
             from fastapi import HTTPException
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
         
-        memory_store.clear_session(session_id)
+        await memory_store.aclear_session(session_id)
         return {"status": "success", "message": f"Messages for session {session_id} cleared"}
     except Exception as e:
         import traceback
@@ -223,29 +249,41 @@ async def direct_chat_with_image_endpoint(
     message: str = Form(...),
     session_id: str = Form(None),
     location: str = Form(None),
+    streaming: bool = Form(False),
     image: UploadFile = File(...)
 ):
     """Direct implementation of the chat-with-image endpoint."""
     print(f"Direct /api/v1/chat-with-image endpoint called with message: {message}, session_id: {session_id}")
     try:
-        from agent_manager import AgentManager
         from uuid import uuid4
         import os
         
         # Ensure session ID
         if not session_id:
             session_id = str(uuid4())
-            
-        # Create a new agent manager
-        manager = AgentManager()
         
-        # Process the query with the image
-        result = await manager.process_query(
-            message=message,
-            session_id=session_id,
-            image_file=image,
-            location=location
-        )
+        # Stream the response as server-sent events if requested
+        if streaming:
+            # Save the upload now, it is closed before the stream runs
+            image_path = await AgentManager.save_uploaded_image(image, session_id)
+            rel_path = os.path.relpath(image_path, UPLOAD_DIR)
+            return StreamingResponse(
+                stream_response(message, session_id, location, image_path=image_path, image_url=f"/uploads/{rel_path.replace(os.sep, '/')}"),
+                media_type="text/event-stream"
+            )
+            
+        # Borrow a pre-built agent set for this request
+        async with get_agent_pool().checkout() as manager:
+            # Process the query with the image
+            result = await manager.process_query(
+                message=message,
+                session_id=session_id,
+                image_file=image,
+                location=location
+            )
+            
+            # Get the saved image path before the manager goes back to the pool
+            image_path = getattr(manager, "last_image_path", None)
         
         # Ensure result contains required fields
         if not isinstance(result, dict):
@@ -257,13 +295,10 @@ async def direct_chat_with_image_endpoint(
                 "router": {"target_agent": "issue_detection", "explanation": "Image processing"}
             }
         
-        # Get the saved image path from the agent_manager if available
-        image_path = getattr(manager, "last_image_path", None)
         image_url = None
         
         if image_path:
             # Convert absolute path to URL path
-            from config import UPLOAD_DIR
             rel_path = os.path.relpath(image_path, UPLOAD_DIR)
             image_url = f"/uploads/{rel_path.replace(os.sep, '/')}"
         
@@ -279,6 +314,10 @@ async def direct_chat_with_image_endpoint(
         }
         
         return response
+    except ImageUploadError as e:
+        # Too large or not an image: tell the client instead of reporting a server error
+        from fastapi import HTTPException
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -320,32 +359,34 @@ async def api_status():
 async def check_agent_manager():
     """Diagnostic endpoint to check if AgentManager and agents are loading properly."""
     try:
-        from agent_manager import AgentManager
-        manager = AgentManager()
-        
-        # Check if we can access the agents
-        agents_info = {}
-        for agent_name, agent in manager.agents.items():
-            agents_info[agent_name] = {
-                "name": agent_name,
-                "type": type(agent).__name__,
-                "attributes": [attr for attr in dir(agent) if not attr.startswith('_')],
-                "status": "loaded"
+        agent_pool = get_agent_pool()
+        async with agent_pool.checkout() as manager:
+            # Check if we can access the agents
+            agents_info = {}
+            for agent_name, agent in manager.agents.items():
+                agents_info[agent_name] = {
+                    "name": agent_name,
+                    "type": type(agent).__name__,
+                    "attributes": [attr for attr in dir(agent) if not attr.startswith('_')],
+                    "status": "loaded"
+                }
+            
+            # Check if the router is initialized
+            router_status = {
+                "exists": hasattr(manager, 'router'),
+                "type": type(manager.router).__name__ if hasattr(manager, 'router') else None,
+                "cache": manager.router.cache.stats() if hasattr(manager, 'router') else None,
+                "speculation": manager.speculation.stats()
             }
         
-        # Check if the router is initialized
-        router_status = {
-            "exists": hasattr(manager, 'router'),
-            "type": type(manager.router).__name__ if hasattr(manager, 'router') else None
-        }
-        
         # Try to load the memory store
         try:
             memory_store = get_memory_store()
             memory_status = {
                 "loaded": True,
                 "type": type(memory_store).__name__,
-                "sessions": list(memory_store.sessions.keys()) if hasattr(memory_store, 'sessions') else []
+                "sessions": [session["session_id"] for session in await memory_store.alist_sessions()],
+                "cached_sessions": len(memory_store.sessions)
             }
         except Exception as memory_err:
             memory_status = {"loaded": False, "error": str(memory_err)}
@@ -357,9 +398,14 @@ async def check_agent_manager():
                 "loaded": True,
                 "type": type(manager).__name__,
                 "agents": agents_info,
-                "router": router_status
+                "router": router_status,
+                "pool": agent_pool.stats()
             },
             "memory_store": memory_status,
+            "image_cache": get_image_preprocessor().stats(),
+            "tenancy_knowledge": get_tenancy_knowledge().stats(),
+            "model_http_clients": async_http_client_stats(),
+            "telemetry": api_dispatcher.stats(),
             "system_info": {
                 "python_path": os.environ.get("PYTHONPATH", "Not set"),
                 "current_dir": os.getcwd()
@@ -389,16 +435,14 @@ async def debug_router_endpoint(req: dict = Body(...)):
         message = req.get("message", "test message")
         session_id = req.get("session_id", "debug-session")
         
-        # Try to import and initialize only the RouterAgent
-        from agents import RouterAgent
-        router = RouterAgent()
-        
-        # Try to determine the route
-        route = await router.determine_route(
-            message=message,
-            has_image=False,
-            session_id=session_id
-        )
+        # Use the router from a pooled agent set
+        async with get_agent_pool().checkout() as manager:
+            # Try to determine the route
+            route = await manager.router.determine_route(
+                message=message,
+                has_image=False,
+                session_id=session_id
+            )
         
         # Return diagnostics
         return {
@@ -422,7 +466,7 @@ async def health_check():
     try:
         # Check memory store functionality
         memory_store = get_memory_store()
-        sessions = memory_store.list_sessions()
+        sessions = await memory_store.alist_sessions()
         
         return {
             "status": "ok",
@@ -1,60 +1,648 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
 import os
 import json
 from pathlib import Path
 import datetime
-import time
 import threading
+import asyncio
+import atexit
+
+from config import (
+    SESSION_STORAGE_MODE,
+    SESSION_FLUSH_INTERVAL,
+    SESSION_CACHE_MAX_ENTRIES,
+    SESSION_CACHE_MAX_MESSAGES,
+    SESSION_LOCK_STRIPES,
+)
+
+class SessionLogWriter:
+    """
+    Background writer for append-only session logs.
+
+    Each session is stored as `<session_id>.jsonl`, one record per line. Callers
+    queue records and return immediately; a daemon thread appends everything
+    queued since the last flush with a single write and fsync per session.
+    A crash therefore loses at most one flush interval of messages. Queued
+    session index records are written after each batch of session records.
+
+    Record types:
+        {"op": "meta", "created_at": ..., "last_updated": ...}
+        {"op": "add", "message": {...}, "last_updated": ...}
+        {"op": "clear", "last_updated": ...}
+    """
+
+    def __init__(self, storage_dir: Path, flush_interval: float = SESSION_FLUSH_INTERVAL):
+        """Initialize and start the background writer.
+
+        Args:
+            storage_dir: Directory holding the session logs
+            flush_interval: Maximum seconds a queued record waits before it is written
+        """
+        self.storage_dir = storage_dir
+        self.flush_interval = flush_interval
+        # Ordered operations per session: ("append", record), ("rewrite", snapshot) or ("delete", None)
+        self._pending: Dict[str, List[Tuple[str, Any]]] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._io_lock = threading.Lock()  # Held while a batch is taken from the queue and written
+        # Index whose queued records are written after every batch, set by the store
+        self.index: Optional["SessionIndex"] = None
+        self._thread = threading.Thread(target=self._run, name="session-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log_path(self, session_id: str) -> Path:
+        """Get the log file path for a session."""
+        return self.storage_dir / f"{session_id}.jsonl"
+
+    def append(self, session_id: str, record: Dict[str, Any]) -> None:
+        """Queue a record to be appended to a session log."""
+        with self._cond:
+            self._pending.setdefault(session_id, []).append(("append", record))
+
+    def rewrite(self, session_id: str, session: Dict[str, Any]) -> None:
+        """Queue a compaction that replaces a session log with a snapshot.
+
+        The snapshot already contains every queued record for the session, so
+        they are dropped in favour of it.
+        """
+        snapshot = {
+            "created_at": session.get("created_at"),
+            "last_updated": session.get("last_updated"),
+            "messages": list(session.get("messages", [])),
+        }
+        with self._cond:
+            self._pending[session_id] = [("rewrite", snapshot)]
+
+    def delete(self, session_id: str) -> None:
+        """Queue removal of a session log, discarding any queued records."""
+        with self._cond:
+            self._pending[session_id] = [("delete", None)]
+
+    def flush_session(self, session_id: str) -> None:
+        """Write everything queued for one session before its log is read back.
+
+        Always waits for the I/O lock: a batch the background thread has already
+        taken from the queue may still hold records for this session.
+        """
+        with self._io_lock:
+            with self._cond:
+                ops = self._pending.pop(session_id, None)
+            if ops:
+                self._apply(session_id, ops)
+
+    def flush(self) -> None:
+        """Write everything queued so far and wait for it to reach the disk."""
+        with self._io_lock:
+            # Taken under the I/O lock, so queued records are always either
+            # still in the queue or being written while the lock is held
+            with self._cond:
+                pending, self._pending = self._pending, {}
+            for session_id, ops in pending.items():
+                try:
+                    self._apply(session_id, ops)
+                except Exception as e:
+                    print(f"Error writing session log {session_id}: {str(e)}")
+                    import traceback
+                    traceback.print_exc()
+            if self.index is not None:
+                try:
+                    self.index.write_queued()
+                except Exception as e:
+                    print(f"Error writing session index: {str(e)}")
+                    import traceback
+                    traceback.print_exc()
+
+    def close(self) -> None:
+        """Stop the background thread after a final flush."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout=5.0)
+        self.flush()
+
+    def _run(self) -> None:
+        """Flush queued records every flush interval until closed."""
+        while True:
+            with self._cond:
+                if not self._closed:
+                    self._cond.wait(timeout=self.flush_interval)
+                if self._closed:
+                    return
+            self.flush()
+
+    def _apply(self, session_id: str, ops: List[Tuple[str, Any]]) -> None:
+        """Apply the queued operations for one session in order."""
+        log_path = self.log_path(session_id)
+        lines = []
+        for op, payload in ops:
+            if op == "append":
+                lines.append(json.dumps(payload))
+                continue
+
+            # Appends queued before a rewrite or delete must land first
+            self._append_lines(log_path, lines)
+            lines = []
+            if op == "rewrite":
+                self._write_snapshot(log_path, payload)
+            elif op == "delete" and log_path.exists():
+                log_path.unlink()
+        self._append_lines(log_path, lines)
+
+    def _append_lines(self, log_path: Path, lines: List[str]) -> None:
+        """Append serialized records to a log with a single write and fsync."""
+        if not lines:
+            return
+        with open(log_path, "a") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_snapshot(self, log_path: Path, snapshot: Dict[str, Any]) -> None:
+        """Atomically replace a log with a compacted snapshot."""
+        tmp_path = log_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps({"op": "meta", "created_at": snapshot["created_at"], "last_updated": snapshot["last_updated"]}) + "\n")
+            for message in snapshot["messages"]:
+                f.write(json.dumps({"op": "add", "message": message, "last_updated": snapshot["last_updated"]}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, log_path)
+
+        # A compacted log supersedes any legacy JSON file for the session
+        legacy_path = log_path.with_suffix(".json")
+        if legacy_path.exists():
+            legacy_path.unlink()
+
+class SessionIndex:
+    """
+    Small on-disk index of session metadata.
+
+    Holds created_at, last_updated and message_count for every session so that
+    listing sessions never has to load message histories. Updates are appended
+    to `_index.jsonl` (last record per session wins) and the file is compacted
+    once it grows well beyond the number of live sessions.
+
+    With `deferred` set, updates only change the in-memory entries and queue
+    their records; the session log writer appends them with its next batch.
+    """
+
+    FILE_NAME = "_index.jsonl"
+
+    def __init__(self, storage_dir: Path, deferred: bool = False):
+        """Initialize the index, loading it from disk if present.
+
+        Args:
+            storage_dir: Directory holding the session files
+            deferred: Queue records for write_queued() instead of writing them on update
+        """
+        self.path = storage_dir / self.FILE_NAME
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.deferred = deferred
+        self._records = 0
+        self._queued: List[Dict[str, Any]] = []
+        self._compact_queued = False
+        self._lock = threading.RLock()
+        self.exists = self.path.exists()
+        if self.exists:
+            self._load()
+
+    def _load(self) -> None:
+        """Replay the index file into memory."""
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._records += 1
+                session_id = record.pop("session_id")
+                if record.pop("deleted", False):
+                    self.entries.pop(session_id, None)
+                else:
+                    self.entries[session_id] = record
+
+    def update(self, session_id: str, session: Dict[str, Any]) -> None:
+        """Record the current metadata of a session.
+
+        Args:
+            session_id: The session identifier
+            session: The session data
+        """
+        entry = {
+            "created_at": session.get("created_at"),
+            "last_updated": session.get("last_updated"),
+            "message_count": len(session.get("messages", [])),
+        }
+        with self._lock:
+            self.entries[session_id] = entry
+            self._append({"session_id": session_id, **entry})
+
+    def remove(self, session_id: str) -> None:
+        """Drop a session from the index.
+
+        Args:
+            session_id: The session identifier
+        """
+        with self._lock:
+            if self.entries.pop(session_id, None) is not None:
+                self._append({"session_id": session_id, "deleted": True})
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get a consistent snapshot of all index entries."""
+        with self._lock:
+            return list(self.entries.items())
+
+    def rewrite(self) -> None:
+        """Atomically replace the index file with one record per live session."""
+        with self._lock:
+            tmp_path = self.path.with_suffix(".jsonl.tmp")
+            with open(tmp_path, "w") as f:
+                for session_id, entry in self.entries.items():
+                    f.write(json.dumps({"session_id": session_id, **entry}) + "\n")
+            os.replace(tmp_path, self.path)
+            self._records = len(self.entries)
+            # The rewritten file already reflects every queued record
+            self._queued = []
+            self._compact_queued = False
+            self.exists = True
+
+    def write_queued(self) -> None:
+        """Write the records queued by deferred updates, compacting the file if due.
+
+        Called by the session log writer after it has written a batch of session records.
+        """
+        with self._lock:
+            if self._compact_queued:
+                self.rewrite()
+                return
+            records, self._queued = self._queued, []
+        if records:
+            with open(self.path, "a") as f:
+                f.write("".join(json.dumps(record) + "\n" for record in records))
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append one record, compacting the file when it has grown too large.
+
+        Must be called with the index lock held.
+        """
+        self._records += 1
+        self.exists = True
+        compact = self._records > 2 * len(self.entries) + 1000
+        if self.deferred:
+            self._queued.append(record)
+            self._compact_queued = self._compact_queued or compact
+            return
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        if compact:
+            self.rewrite()
 
 class SessionMemoryStore:
     """
     A dedicated storage system for managing conversation history across multiple sessions.
     This ensures complete isolation between different conversations.
+    
+    Sessions are loaded from disk on first access and kept in a bounded LRU
+    cache, so startup time and memory do not grow with the number of stored
+    sessions. Session listings are served from a metadata index.
+    
+    Each session is guarded by one of a fixed set of striped locks, so chats in
+    different sessions do not wait for each other. A short-lived cache lock only
+    protects the shared LRU bookkeeping and is never held during disk I/O.
     """
     
-    def __init__(self, storage_dir: str = "session_memory"):
+    # Compact a session log once it holds this many more records than live messages
+    COMPACT_MIN_DEAD_RECORDS = 64
+    
+    def __init__(
+        self,
+        storage_dir: str = "session_memory",
+        storage_mode: str = SESSION_STORAGE_MODE,
+        flush_interval: float = SESSION_FLUSH_INTERVAL,
+        max_cached_sessions: int = SESSION_CACHE_MAX_ENTRIES,
+        max_cached_messages: int = SESSION_CACHE_MAX_MESSAGES,
+        lock_stripes: int = SESSION_LOCK_STRIPES,
+    ):
         """Initialize the session memory store.
         
         Args:
             storage_dir: Directory to store session data
+            storage_mode: "json" to rewrite a JSON file per change, "jsonl" for append-only logs
+            flush_interval: Seconds between background log flushes in "jsonl" mode
+            max_cached_sessions: Maximum number of sessions kept in memory
+            max_cached_messages: Maximum total number of messages kept in memory
+            lock_stripes: Number of locks that sessions are spread across
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
-        self.sessions = {}
-        self._lock = threading.RLock()  # Use a reentrant lock to avoid deadlocks
-        self._load_existing_sessions()
+        self.storage_mode = storage_mode
+        self.max_cached_sessions = max(1, max_cached_sessions)
+        self.max_cached_messages = max_cached_messages
+        # LRU cache of loaded sessions, most recently used last
+        self.sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cached_messages = 0
+        # Number of records in each cached session log, used to decide when to compact
+        self._log_records: Dict[str, int] = {}
+        # Reentrant so that a session operation can call another one on the same session
+        self._session_locks = [threading.RLock() for _ in range(max(1, lock_stripes))]
+        self._cache_lock = threading.RLock()
+        self._writer = SessionLogWriter(self.storage_dir, flush_interval) if storage_mode == "jsonl" else None
+        # In "jsonl" mode index records are written by the log writer, off the request path
+        self._index = SessionIndex(self.storage_dir, deferred=self._writer is not None)
+        if not self._index.exists:
+            self._build_index()
+        elif self._writer:
+            self._reconcile_index()
+        if self._writer:
+            self._writer.index = self._index
+    
+    def _session_lock(self, session_id: str) -> threading.RLock:
+        """Get the lock stripe guarding a session.
+        
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            The lock that must be held while reading or changing the session
+        """
+        return self._session_locks[hash(session_id) % len(self._session_locks)]
+    
+    def _session_files(self) -> Dict[str, Path]:
+        """Find the file holding each stored session, in either storage format.
+        
+        A session stored in both formats, e.g. after SESSION_STORAGE_MODE was
+        changed, is held by the file written last.
+        """
+        files: Dict[str, Path] = {}
+        for file_path in list(self.storage_dir.glob("*.json")) + list(self.storage_dir.glob("*.jsonl")):
+            if file_path.name == SessionIndex.FILE_NAME:
+                continue
+            other = files.get(file_path.stem)
+            if other is None or file_path.stat().st_mtime_ns > other.stat().st_mtime_ns:
+                files[file_path.stem] = file_path
+        return files
+    
+    def _session_file(self, session_id: str) -> Optional[Path]:
+        """Find the file holding a stored session, in either storage format.
         
-    def _load_existing_sessions(self):
-        """Load existing session data from disk."""
-        for file_path in self.storage_dir.glob("*.json"):
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            The session's .json file or log, whichever was written last, or None if neither exists
+        """
+        paths = [
+            path
+            for path in (self.storage_dir / f"{session_id}.json", self.storage_dir / f"{session_id}.jsonl")
+            if path.exists()
+        ]
+        return max(paths, key=lambda path: path.stat().st_mtime_ns) if paths else None
+    
+    def _build_index(self) -> None:
+        """Build the metadata index from the session files on disk.
+        
+        This only runs when no index exists yet, e.g. on the first start after
+        upgrading; sessions are read one at a time and not kept in memory.
+        """
+        for session_id, file_path in self._session_files().items():
             try:
-                session_id = file_path.stem
-                with open(file_path, "r") as f:
-                    session_data = json.load(f)
-                    self.sessions[session_id] = session_data
+                session, _, _ = self._read_session_file(file_path)
+                self._index.entries[session_id] = {
+                    "created_at": session.get("created_at"),
+                    "last_updated": session.get("last_updated"),
+                    "message_count": len(session.get("messages", [])),
+                }
             except Exception as e:
-                print(f"Error loading session {file_path}: {str(e)}")
-                
-    def _acquire_lock(self, timeout=2.0):
-        """Try to acquire the lock with a timeout.
+                print(f"Error indexing session {file_path}: {str(e)}")
+        self._index.rewrite()
+    
+    def _reconcile_index(self) -> None:
+        """Index sessions whose logs reached the disk before their index records did.
+
+        Index records are written after the session records of the same batch, so a
+        crash in between can leave a new session out of the index. Only file names
+        are compared; just the missing sessions are read.
+        """
+        missing = {
+            session_id: file_path
+            for session_id, file_path in self._session_files().items()
+            if session_id not in self._index.entries
+        }
+        for session_id, file_path in missing.items():
+            try:
+                session, _, _ = self._read_session_file(file_path)
+                self._index.update(session_id, session)
+            except Exception as e:
+                print(f"Error indexing session {file_path}: {str(e)}")
+    
+    def _read_session_file(self, file_path: Path) -> Tuple[Dict[str, Any], int, bool]:
+        """Read a session from a legacy JSON file or an append-only log.
         
         Args:
-            timeout: Maximum time to wait for the lock in seconds
+            file_path: Path to the session's .json or .jsonl file
             
         Returns:
-            True if the lock was acquired, False otherwise
+            The session data, the number of log records and whether the log had a torn tail
         """
-        start_time = time.time()
-        while True:
-            if self._lock.acquire(blocking=False):
-                return True
+        if file_path.suffix == ".json":
+            with open(file_path, "r") as f:
+                session = json.load(f)
+            return session, len(session.get("messages", [])) + 1, False
+        
+        session = {"created_at": None, "last_updated": None, "messages": []}
+        records = 0
+        torn = False
+        with open(file_path, "r") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a partial last line
+                    torn = True
+                    continue
+                records += 1
+                op = record.get("op")
+                if op == "meta":
+                    session["created_at"] = record.get("created_at")
+                elif op == "add":
+                    session["messages"].append(record["message"])
+                elif op == "clear":
+                    session["messages"] = []
+                session["last_updated"] = record.get("last_updated", session["last_updated"])
+        
+        session["created_at"] = session["created_at"] or session["last_updated"] or datetime.datetime.now().isoformat()
+        session["last_updated"] = session["last_updated"] or session["created_at"]
+        return session, records, torn
+    
+    def _get_or_create(self, session_id: str) -> Dict[str, Any]:
+        """Get a session from the cache, loading or creating it as needed.
+        
+        Must be called with the session's lock held.
+        
+        Args:
+            session_id: The session identifier
             
-            if time.time() - start_time > timeout:
-                print("Warning: Lock acquisition timed out!")
-                return False
+        Returns:
+            The cached session data
+        """
+        with self._cache_lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                self.sessions.move_to_end(session_id)
+                return session
+        
+        session = self._load_session(session_id)
+        if session is not None:
+            return session
+        
+        session = {
+            "created_at": datetime.datetime.now().isoformat(),
+            "last_updated": datetime.datetime.now().isoformat(),
+            "messages": []
+        }
+        self._cache(session_id, session)
+        if self._writer:
+            self._compact(session_id, session)
+        else:
+            self._save_session(session_id, session)
+        self._index.update(session_id, session)
+        return session
+    
+    def _load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load a session from disk into the cache.
+        
+        Must be called with the session's lock held.
+        
+        Args:
+            session_id: The session identifier
             
-            # Small sleep to avoid CPU spinning
-            time.sleep(0.01)
+        Returns:
+            The session data, or None if it is not stored on disk
+        """
+        if self._writer:
+            # Records still queued for this session must be on disk before it is read back
+            self._writer.flush_session(session_id)
+        file_path = self._session_file(session_id)
+        if file_path is None:
+            return None
+        
+        session, records, torn = self._read_session_file(file_path)
+        self._cache(session_id, session)
+        json_path = self.storage_dir / f"{session_id}.json"
+        log_path = self.storage_dir / f"{session_id}.jsonl"
+        if self._writer:
+            self._log_records[session_id] = records
+            # Compact torn logs, and convert JSON files into logs; the snapshot removes the JSON file
+            if torn or json_path.exists():
+                self._compact(session_id, session)
+        elif log_path.exists():
+            # Convert logs written in "jsonl" mode into JSON files, dropping a log older than the JSON file
+            if file_path == log_path:
+                self._save_session(session_id, session)
+            log_path.unlink()
+        return session
+    
+    def _cache(self, session_id: str, session: Dict[str, Any]) -> None:
+        """Insert a session into the LRU cache and evict the least recently used ones.
+        
+        Args:
+            session_id: The session identifier
+            session: The session data
+        """
+        with self._cache_lock:
+            self.sessions[session_id] = session
+            self._cached_messages += len(session.get("messages", []))
+            self._evict(keep=session_id)
+    
+    def _evict(self, keep: str) -> None:
+        """Evict least recently used sessions until the cache is within budget.
+        
+        Must be called with the cache lock held. Every change is already
+        persisted (or queued for the log writer), so evicted sessions can simply
+        be dropped and reloaded on next access.
+        
+        Args:
+            keep: Session that must stay cached because it is in use
+        """
+        while len(self.sessions) > 1 and (
+            len(self.sessions) > self.max_cached_sessions
+            or self._cached_messages > self.max_cached_messages
+        ):
+            session_id = next(iter(self.sessions))
+            if session_id == keep:
+                self.sessions.move_to_end(session_id)
+                continue
+            session = self.sessions.pop(session_id)
+            self._cached_messages -= len(session.get("messages", []))
+            self._log_records.pop(session_id, None)
+    
+    def _uncache(self, session_id: str) -> None:
+        """Remove a session from the cache.
+        
+        Args:
+            session_id: The session identifier
+        """
+        with self._cache_lock:
+            session = self.sessions.pop(session_id, None)
+            if session is not None:
+                self._cached_messages -= len(session.get("messages", []))
+            self._log_records.pop(session_id, None)
+    
+    def _count_messages(self, session_id: str, session: Dict[str, Any], delta: int) -> None:
+        """Adjust the cached message total after a session changed size.
+        
+        Args:
+            session_id: The session identifier
+            session: The session data that changed
+            delta: Change in the number of messages
+        """
+        with self._cache_lock:
+            # The session may have been evicted while it was being changed
+            if self.sessions.get(session_id) is session:
+                self._cached_messages += delta
+                self._evict(keep=session_id)
+    
+    def _compact(self, session_id: str, session: Dict[str, Any]) -> None:
+        """Queue a background rewrite of a session log down to its live messages.
+        
+        Args:
+            session_id: The session identifier
+            session: The session data
+        """
+        self._writer.rewrite(session_id, session)
+        self._log_records[session_id] = len(session["messages"]) + 1
+    
+    def _maybe_compact(self, session_id: str, session: Dict[str, Any]) -> None:
+        """Compact a session log once dead records outweigh live messages.
+        
+        Args:
+            session_id: The session identifier
+            session: The session data
+        """
+        live = len(session["messages"]) + 1
+        dead = self._log_records.get(session_id, 0) - live
+        if dead >= max(self.COMPACT_MIN_DEAD_RECORDS, live):
+            self._compact(session_id, session)
+    
+    def close(self) -> None:
+        """Flush pending session log records and stop the background writer."""
+        if self._writer:
+            self._writer.close()
+    
+    def has_session(self, session_id: str) -> bool:
+        """Check whether a session exists without loading it.
+        
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            True if the session is stored
+        """
+        return session_id in self._index.entries or session_id in self.sessions
         
     def get_session(self, session_id: str) -> Dict[str, Any]:
         """Get conversation history for a specific session.
@@ -66,26 +654,8 @@ class SessionMemoryStore:
             The session data including conversation history
         """
         try:
-            if not self._acquire_lock(timeout=2.0):
-                # If lock acquisition fails, return a new empty session without saving
-                return {
-                    "created_at": datetime.datetime.now().isoformat(),
-                    "last_updated": datetime.datetime.now().isoformat(),
-                    "messages": []
-                }
-            
-            try:
-                if session_id not in self.sessions:
-                    self.sessions[session_id] = {
-                        "created_at": datetime.datetime.now().isoformat(),
-                        "last_updated": datetime.datetime.now().isoformat(),
-                        "messages": []
-                    }
-                    self._save_session(session_id)
-                return self.sessions[session_id]
-            finally:
-                self._lock.release()
-                
+            with self._session_lock(session_id):
+                return self._get_or_create(session_id)
         except Exception as e:
             # In case of any errors, return a new empty session
             print(f"Error getting session: {str(e)}")
@@ -105,22 +675,66 @@ class SessionMemoryStore:
             message: The message to add with role, content, etc.
         """
         try:
-            if not self._acquire_lock(timeout=2.0):
-                print(f"Warning: Failed to add message to session {session_id} due to lock timeout")
-                return
-            
-            try:
-                session = self.get_session(session_id)
+            with self._session_lock(session_id):
+                session = self._get_or_create(session_id)
                 session["messages"].append(message)
                 session["last_updated"] = datetime.datetime.now().isoformat()
-                self._save_session(session_id)
-            finally:
-                self._lock.release()
+                if self._writer:
+                    # Only the new message is written, by the background writer
+                    self._writer.append(session_id, {"op": "add", "message": message, "last_updated": session["last_updated"]})
+                    self._log_records[session_id] = self._log_records.get(session_id, 0) + 1
+                else:
+                    self._save_session(session_id, session)
+                self._index.update(session_id, session)
+                self._count_messages(session_id, session, 1)
         except Exception as e:
             print(f"Error adding message: {str(e)}")
             import traceback
             traceback.print_exc()
     
+    def get_session_meta(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get a session's metadata from the index without loading it.
+        
+        Args:
+            session_id: The session identifier
+            
+        Returns:
+            created_at, last_updated and message_count, or None if the session does not exist
+        """
+        entry = self._index.entries.get(session_id)
+        return dict(entry) if entry is not None else None
+    
+    def get_snapshot(self, session_id: str, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Get recent messages together with the matching session metadata.
+        
+        Both are read under the session lock, so the metadata describes exactly
+        the session state the messages were taken from.
+        
+        Args:
+            session_id: The session identifier
+            limit: Optional maximum number of messages to return
+            
+        Returns:
+            The messages in chronological order and the session metadata
+        """
+        try:
+            with self._session_lock(session_id):
+                session = self._get_or_create(session_id)
+                messages = session.get("messages", [])
+                meta = {
+                    "created_at": session.get("created_at"),
+                    "last_updated": session.get("last_updated"),
+                    "message_count": len(messages),
+                }
+                if limit is not None and limit > 0 and len(messages) > limit:
+                    return messages[-limit:], meta
+                return list(messages), meta
+        except Exception as e:
+            print(f"Error getting session snapshot: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return [], {}
+    
     def get_messages(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get messages for a specific session, with optional limit.
         
@@ -132,11 +746,12 @@ class SessionMemoryStore:
             List of messages in chronological order
         """
         try:
-            session = self.get_session(session_id)
-            messages = session.get("messages", [])
-            if limit is not None and limit > 0 and len(messages) > limit:
-                return messages[-limit:]
-            return messages
+            with self._session_lock(session_id):
+                messages = self._get_or_create(session_id).get("messages", [])
+                # Return a copy so callers never see a list another request is appending to
+                if limit is not None and limit > 0 and len(messages) > limit:
+                    return messages[-limit:]
+                return list(messages)
         except Exception as e:
             print(f"Error getting messages: {str(e)}")
             import traceback
@@ -150,17 +765,22 @@ class SessionMemoryStore:
             session_id: The session identifier
         """
         try:
-            if not self._acquire_lock(timeout=2.0):
-                print(f"Warning: Failed to clear session {session_id} due to lock timeout")
-                return
-            
-            try:
-                if session_id in self.sessions:
-                    self.sessions[session_id]["messages"] = []
-                    self.sessions[session_id]["last_updated"] = datetime.datetime.now().isoformat()
-                    self._save_session(session_id)
-            finally:
-                self._lock.release()
+            with self._session_lock(session_id):
+                if not self.has_session(session_id):
+                    return
+                
+                session = self._get_or_create(session_id)
+                removed = len(session["messages"])
+                session["messages"] = []
+                session["last_updated"] = datetime.datetime.now().isoformat()
+                if self._writer:
+                    self._writer.append(session_id, {"op": "clear", "last_updated": session["last_updated"]})
+                    self._log_records[session_id] = self._log_records.get(session_id, 0) + 1
+                    self._maybe_compact(session_id, session)
+                else:
+                    self._save_session(session_id, session)
+                self._index.update(session_id, session)
+                self._count_messages(session_id, session, -removed)
         except Exception as e:
             print(f"Error clearing session: {str(e)}")
             import traceback
@@ -173,66 +793,97 @@ class SessionMemoryStore:
             session_id: The session identifier
         """
         try:
-            if not self._acquire_lock(timeout=2.0):
-                print(f"Warning: Failed to delete session {session_id} due to lock timeout")
-                return
-            
-            try:
-                if session_id in self.sessions:
-                    del self.sessions[session_id]
-                    session_file = self.storage_dir / f"{session_id}.json"
-                    if session_file.exists():
-                        session_file.unlink()
-            finally:
-                self._lock.release()
+            with self._session_lock(session_id):
+                if not self.has_session(session_id):
+                    return
+                
+                self._uncache(session_id)
+                self._index.remove(session_id)
+                session_file = self.storage_dir / f"{session_id}.json"
+                if session_file.exists():
+                    session_file.unlink()
+                if self._writer:
+                    self._writer.delete(session_id)
+                else:
+                    # A log left from "jsonl" mode would bring the session back
+                    log_path = self.storage_dir / f"{session_id}.jsonl"
+                    if log_path.exists():
+                        log_path.unlink()
         except Exception as e:
             print(f"Error deleting session: {str(e)}")
             import traceback
             traceback.print_exc()
     
-    def _save_session(self, session_id: str) -> None:
+    def _save_session(self, session_id: str, session: Dict[str, Any]) -> None:
         """Save session data to disk.
         
         Args:
             session_id: The session identifier
+            session: The session data
         """
         try:
             session_file = self.storage_dir / f"{session_id}.json"
             with open(session_file, "w") as f:
-                json.dump(self.sessions[session_id], f, indent=2)
+                json.dump(session, f, indent=2)
         except Exception as e:
             print(f"Error saving session: {str(e)}")
             import traceback
             traceback.print_exc()
     
     def list_sessions(self) -> List[Dict[str, Any]]:
-        """List all active sessions with metadata.
+        """List all stored sessions with metadata.
+        
+        Served from the metadata index, so no message histories are loaded.
         
         Returns:
             List of session metadata
         """
         try:
             result = []
-            if not self._acquire_lock(timeout=2.0):
-                print("Warning: Failed to list sessions due to lock timeout")
-                return result
-            
-            try:
-                for session_id, data in self.sessions.items():
-                    result.append({
-                        "session_id": session_id,
-                        "created_at": data.get("created_at"),
-                        "last_updated": data.get("last_updated"),
-                        "message_count": len(data.get("messages", []))
-                    })
-                return result
-            finally:
-                self._lock.release()
+            for session_id, entry in self._index.items():
+                result.append({
+                    "session_id": session_id,
+                    "created_at": entry.get("created_at"),
+                    "last_updated": entry.get("last_updated"),
+                    "message_count": entry.get("message_count", 0)
+                })
+            return result
         except Exception as e:
             print(f"Error listing sessions: {str(e)}")
             import traceback
             traceback.print_exc()
             return []  # Return empty list on error
+    
+    # Async API for FastAPI handlers: store operations may touch the disk, so
+    # they run in a worker thread instead of blocking the event loop.
+    
+    async def aget_session(self, session_id: str) -> Dict[str, Any]:
+        """Async version of get_session."""
+        return await asyncio.to_thread(self.get_session, session_id)
+    
+    async def aadd_message(self, session_id: str, message: Dict[str, Any]) -> None:
+        """Async version of add_message."""
+        await asyncio.to_thread(self.add_message, session_id, message)
+    
+    async def aget_messages(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Async version of get_messages."""
+        return await asyncio.to_thread(self.get_messages, session_id, limit)
+    
+    async def aget_snapshot(self, session_id: str, limit: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Async version of get_snapshot."""
+        return await asyncio.to_thread(self.get_snapshot, session_id, limit)
+    
+    async def aclear_session(self, session_id: str) -> None:
+        """Async version of clear_session."""
+        await asyncio.to_thread(self.clear_session, session_id)
+    
+    async def adelete_session(self, session_id: str) -> None:
+        """Async version of delete_session."""
+        await asyncio.to_thread(self.delete_session, session_id)
+    
+    async def alist_sessions(self) -> List[Dict[str, Any]]:
+        """Async version of list_sessions."""
+        return await asyncio.to_thread(self.list_sessions)
 
 # Create a singleton instance
 _memory_store = None
@@ -0,0 +1,138 @@
+from typing import Any, Dict, Optional
+from collections import OrderedDict
+import threading
+
+from config import SESSION_CACHE_MAX_ENTRIES
+
+# Rough characters per token, used when a cancelled run left no usage metrics behind
+CHARS_PER_TOKEN = 4
+
+class SpeculationTracker:
+    """
+    Predicts the specialist for speculative execution and tracks its cost.
+
+    The prediction comes from the router's local classifier when the current
+    message carries any routing signal, and from the agent that answered the
+    session's previous turn otherwise. Counters record how often the guess
+    matched the router and how many tokens were spent on cancelled runs.
+    """
+
+    def __init__(self, max_sessions: int = SESSION_CACHE_MAX_ENTRIES):
+        """Initialize the tracker.
+
+        Args:
+            max_sessions: Maximum number of sessions whose last agent is remembered
+        """
+        self.max_sessions = max(1, max_sessions)
+        self.last_agents: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Counters exposed through stats()
+        self.attempts = 0
+        self.hits = 0
+        self.misses = 0
+        self.wasted_tokens = 0
+
+    def predict(self, router: Any, query: str, session_id: str) -> Optional[str]:
+        """Guess which specialist the router will pick.
+
+        Args:
+            router: The RouterAgent whose classifier provides the fast signal
+            query: The user's current message
+            session_id: The session identifier
+
+        Returns:
+            The predicted agent name, or None when there is nothing to go on
+        """
+        classifier = getattr(router, "classifier", None)
+        if classifier is not None:
+            label, _, scores = classifier.classify(query)
+            if scores[label] > 0:
+                return label
+        with self._lock:
+            return self.last_agents.get(session_id)
+
+    def record_route(self, session_id: str, agent_name: str) -> None:
+        """Remember which agent handled the session's latest turn.
+
+        Args:
+            session_id: The session identifier
+            agent_name: The agent the router picked
+        """
+        with self._lock:
+            self.last_agents[session_id] = agent_name
+            self.last_agents.move_to_end(session_id)
+            while len(self.last_agents) > self.max_sessions:
+                self.last_agents.popitem(last=False)
+
+    def record_outcome(self, hit: bool, wasted_tokens: int = 0) -> None:
+        """Count a speculative run.
+
+        Args:
+            hit: Whether the prediction matched the router's decision
+            wasted_tokens: Tokens spent on the run if it was cancelled
+        """
+        with self._lock:
+            self.attempts += 1
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self.wasted_tokens += wasted_tokens
+
+    def stats(self) -> Dict[str, Any]:
+        """Get speculation statistics.
+
+        Returns:
+            A dictionary with attempt, hit, miss and wasted token counters
+        """
+        return {
+            "attempts": self.attempts,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / self.attempts if self.attempts else 0.0,
+            "wasted_tokens": self.wasted_tokens,
+        }
+
+def estimate_wasted_tokens(agent: Any, previous_run_messages: Any, prompt: str) -> int:
+    """Estimate the tokens a cancelled agent run consumed.
+
+    Completed model calls are counted from their usage metrics. The call that
+    was in flight when the run was cancelled is billed for its input, which is
+    estimated from the length of the messages that were sent.
+
+    Args:
+        agent: The BaseAgent whose run was cancelled
+        previous_run_messages: The agno agent's run_messages before the run started
+        prompt: The message the run was started with
+
+    Returns:
+        The estimated number of wasted tokens
+    """
+    run_messages = getattr(getattr(agent, "agent", None), "run_messages", None)
+    if run_messages is None or run_messages is previous_run_messages:
+        # Cancelled before the run built its messages; at most the prompt was sent
+        return len(prompt) // CHARS_PER_TOKEN
+
+    measured = 0
+    for message in run_messages.messages:
+        metrics = getattr(message, "metrics", None)
+        if message.role == "assistant" and metrics is not None and metrics.total_tokens:
+            measured += metrics.total_tokens
+
+    # Unless the last call finished, its input (everything so far) was sent too
+    last = run_messages.messages[-1] if run_messages.messages else None
+    if last is not None and last.role == "assistant" and last.metrics is not None and last.metrics.total_tokens:
+        return measured
+    in_flight_chars = sum(len(message.get_content_string()) for message in run_messages.messages)
+    return measured + in_flight_chars // CHARS_PER_TOKEN
+
+# Create a singleton instance shared by every manager in the agent pool
+_speculation_tracker = None
+
+def get_speculation_tracker() -> SpeculationTracker:
+    """Get the global speculation tracker instance."""
+    global _speculation_tracker
+    if _speculation_tracker is None:
+        _speculation_tracker = SpeculationTracker()
+    return _speculation_tracker
@@ -0,0 +1,209 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from pathlib import Path
+import asyncio
+import threading
+
+import numpy as np
+
+from agno.document import Document
+from agno.document.chunking.document import DocumentChunking
+from agno.embedder.cached import CachedEmbedder
+from agno.embedder.openai import OpenAIEmbedder
+from agno.knowledge.agent import AgentKnowledge
+from agno.vectordb.numpydb import NumpyDb
+from pydantic import Field
+
+from config import (
+    OPENAI_API_KEY,
+    TENANCY_INDEX_DIR,
+    TENANCY_EMBEDDING_MODEL,
+    TENANCY_RETRIEVAL_TOP_K,
+    TENANCY_RETRIEVAL_MIN_SCORE,
+    TENANCY_CHUNK_SIZE,
+)
+
+class TenancyDocuments(AgentKnowledge):
+    """AgentKnowledge over an in-memory list of chunks, loaded as one batch."""
+
+    documents: List[Document] = Field(default_factory=list)
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Yield every chunk in a single list, so they are embedded and inserted together."""
+        if self.documents:
+            yield self.documents
+
+class TenancyKnowledge:
+    """
+    Local retrieval index over the curated tenancy documents.
+
+    Documents are chunked by paragraph and stored in an agno AgentKnowledge
+    backed by an on-disk NumpyDb. Embeddings are cached by content in SQLite,
+    so a restart with unchanged documents makes no embedding calls. Searches
+    report the cosine similarity of each chunk so the agent can decide
+    whether the references are good enough to answer without a web search.
+
+    Every load indexes the current chunks of all documents against a manifest
+    of the chunks already in the index: only new chunks are embedded, and
+    chunks of edited or removed documents are deleted, so outdated legal text
+    is never retrieved.
+    """
+
+    def __init__(
+        self,
+        top_k: int = TENANCY_RETRIEVAL_TOP_K,
+        min_score: float = TENANCY_RETRIEVAL_MIN_SCORE,
+        chunk_size: int = TENANCY_CHUNK_SIZE,
+        index_dir: str = str(TENANCY_INDEX_DIR),
+    ):
+        """Initialize the tenancy knowledge index.
+
+        Args:
+            top_k: Number of chunks returned per search
+            min_score: Similarity of the best chunk needed to answer from the references
+            chunk_size: Maximum characters per chunk
+            index_dir: Directory holding the vector index and embedding cache
+        """
+        self.top_k = max(1, top_k)
+        self.min_score = min_score
+        self.embedder = CachedEmbedder(
+            embedder=OpenAIEmbedder(id=TENANCY_EMBEDDING_MODEL, api_key=OPENAI_API_KEY),
+            db_file=f"{index_dir}/embeddings.db",
+        )
+        self.vector_db = NumpyDb(table_name="tenancy", path=index_dir, embedder=self.embedder)
+        self.manifest_file = Path(index_dir) / "manifest.json"
+        self.knowledge = TenancyDocuments(
+            vector_db=self.vector_db,
+            num_documents=self.top_k,
+            chunking_strategy=DocumentChunking(chunk_size=chunk_size),
+            manifest_file=self.manifest_file,
+        )
+        # Current chunks of every document, by document id
+        self.sources: Dict[str, List[Document]] = {}
+        self._changed = False
+        self._lock = threading.Lock()
+
+        # Counters exposed through stats()
+        self.searches = 0
+        self.confident = 0
+        self.errors = 0
+
+    def add_text(self, id: str, title: str, content: str) -> None:
+        """Add or replace a document, indexed by the next load().
+
+        Args:
+            id: Identifier of the document, such as its file name
+            title: Title of the document
+            content: The document text
+        """
+        document = Document(id=id, name=id, content=content, meta_data={"title": title, "source": id})
+        chunks = self.knowledge.chunking_strategy.chunk(document)
+        with self._lock:
+            self.sources[id] = chunks
+            self._changed = True
+
+    def remove_text(self, id: str) -> None:
+        """Remove a document, so the next load() deletes its chunks from the index.
+
+        Args:
+            id: Identifier of the document
+        """
+        with self._lock:
+            if self.sources.pop(id, None) is not None:
+                self._changed = True
+
+    def load(self) -> int:
+        """Bring the index in line with the current documents.
+
+        New chunks are embedded and inserted, and chunks no longer produced by
+        any document are deleted. An index built before the manifest existed is
+        rebuilt once, from cached embeddings, so it holds no untracked chunks.
+
+        Returns:
+            The number of chunks in the index
+        """
+        with self._lock:
+            if not self._changed:
+                return sum(len(chunks) for chunks in self.sources.values())
+            self.knowledge.documents = [chunk for chunks in self.sources.values() for chunk in chunks]
+            self.knowledge.load(recreate=not self.manifest_file.exists(), skip_existing=True)
+            self._changed = False
+            return len(self.knowledge.documents)
+
+    def is_empty(self) -> bool:
+        """Whether nothing has been indexed."""
+        return not self.vector_db.exists() or self.vector_db.get_count() == 0
+
+    def search(self, query: str) -> List[Tuple[Document, float]]:
+        """Find the chunks closest to a query.
+
+        Args:
+            query: The user's question
+
+        Returns:
+            (chunk, cosine similarity) pairs, best first; empty if retrieval failed
+        """
+        self.searches += 1
+        if self.is_empty():
+            return []
+        try:
+            query_embedding = self.embedder.get_embedding(query)
+            documents = self.vector_db.search_vector(query_embedding, limit=self.top_k)
+        except Exception as e:
+            self.errors += 1
+            print(f"Tenancy knowledge search failed: {str(e)}")
+            return []
+
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query_vector)) or 1.0
+        results = []
+        for document in documents:
+            vector = np.asarray(document.embedding, dtype=np.float32)
+            score = float(vector @ query_vector) / ((float(np.linalg.norm(vector)) or 1.0) * query_norm)
+            results.append((document, score))
+        if results and results[0][1] >= self.min_score:
+            self.confident += 1
+        return results
+
+    async def asearch(self, query: str) -> List[Tuple[Document, float]]:
+        """Find the chunks closest to a query without blocking the event loop."""
+        return await asyncio.to_thread(self.search, query)
+
+    def is_confident(self, results: List[Tuple[Document, float]]) -> bool:
+        """Whether the best chunk is similar enough to answer from the references."""
+        return bool(results) and results[0][1] >= self.min_score
+
+    @staticmethod
+    def format_references(results: List[Tuple[Document, float]]) -> str:
+        """Format search results as numbered references for the prompt."""
+        references = []
+        for i, (document, _) in enumerate(results, start=1):
+            title = document.meta_data.get("title") or document.name
+            references.append(f"[{i}] {title}\n{document.content.strip()}")
+        return "\n\n".join(references)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get retrieval statistics.
+
+        Returns:
+            A dictionary with index size, search and confidence counters
+        """
+        return {
+            "chunks": 0 if self.is_empty() else self.vector_db.get_count(),
+            "searches": self.searches,
+            "confident": self.confident,
+            "web_fallbacks": self.searches - self.confident,
+            "confident_rate": self.confident / self.searches if self.searches else 0.0,
+            "errors": self.errors,
+            "embedding_cache": self.embedder.stats(),
+        }
+
+# Create a singleton instance shared by every tenancy agent in the agent pool
+_tenancy_knowledge = None
+
+def get_tenancy_knowledge() -> TenancyKnowledge:
+    """Get the global tenancy knowledge instance."""
+    global _tenancy_knowledge
+    if _tenancy_knowledge is None:
+        _tenancy_knowledge = TenancyKnowledge()
+    return _tenancy_knowledge
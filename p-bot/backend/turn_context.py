@@ -0,0 +1,186 @@
+from typing import Dict, Optional, Any, Tuple
+from collections import OrderedDict, deque
+import threading
+
+from config import CONTEXT_TURNS, CONTEXT_CHAR_LIMIT, SESSION_CACHE_MAX_ENTRIES
+from memory_store import SessionMemoryStore, get_memory_store
+
+# How many recent messages are searched for an image to reuse on follow-up turns
+IMAGE_LOOKBACK_MESSAGES = 10
+
+class SessionWindow:
+    """Rolling window over the most recent messages of one session."""
+
+    def __init__(self, max_messages: int):
+        """Initialize an empty window.
+
+        Args:
+            max_messages: Number of recent messages to keep
+        """
+        # (role, rendered line) pairs, oldest first
+        self.lines = deque(maxlen=max_messages)
+        # Store metadata the window was last synced to
+        self.message_count = 0
+        self.last_updated = None
+        # Most recent image and the position of its message in the session
+        self.last_image_path = None
+        self.last_image_position = -1
+        # Cached history text, cleared whenever a message is appended
+        self.history_text = None
+
+    def append(self, message: Dict[str, Any]) -> None:
+        """Append a message to the window.
+
+        Args:
+            message: The stored message record
+        """
+        role = message.get("role", "unknown")
+        self.lines.append((role, f'{role.capitalize()}: {message.get("content", "")}\n'))
+        if message.get("image_path"):
+            self.last_image_path = message["image_path"]
+            self.last_image_position = self.message_count
+        self.message_count += 1
+        self.history_text = None
+
+    def get_history_text(self) -> str:
+        """Render the bounded history text for the context window.
+
+        Always includes at least the last CONTEXT_TURNS user turns, and beyond
+        that only as many messages as fit in CONTEXT_CHAR_LIMIT characters.
+
+        Returns:
+            The history lines, oldest first
+        """
+        if self.history_text is None:
+            kept = []
+            char_count = 0
+            turns = 0
+            for role, line in reversed(self.lines):
+                if role == "user":
+                    turns += 1
+                if char_count + len(line) > CONTEXT_CHAR_LIMIT and turns >= CONTEXT_TURNS:
+                    break
+                kept.append(line)
+                char_count += len(line)
+            self.history_text = "".join(reversed(kept))
+        return self.history_text
+
+    def get_last_image_path(self) -> Optional[str]:
+        """Get the most recent image if it was shared within the lookback window."""
+        if self.last_image_position >= self.message_count - IMAGE_LOOKBACK_MESSAGES:
+            return self.last_image_path
+        return None
+
+class TurnContextBuilder:
+    """
+    Builds the per-turn conversation context for AgentManager.
+
+    Keeps a rolling window per session that is updated as messages are added,
+    so a turn normally needs no store reads at all. When the window is missing
+    or out of date (new process, session cleared, messages added elsewhere) it
+    is reseeded from a single snapshot of the session.
+    """
+
+    def __init__(
+        self,
+        memory_store: Optional[SessionMemoryStore] = None,
+        max_sessions: int = SESSION_CACHE_MAX_ENTRIES,
+    ):
+        """Initialize the turn context builder.
+
+        Args:
+            memory_store: Session store to read snapshots from
+            max_sessions: Maximum number of session windows kept in memory
+        """
+        self.memory_store = memory_store or get_memory_store()
+        self.max_sessions = max(1, max_sessions)
+        self.max_messages = CONTEXT_TURNS * 2
+        self.windows: "OrderedDict[str, SessionWindow]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _is_current(self, window: Optional[SessionWindow], meta: Optional[Dict[str, Any]]) -> bool:
+        """Check whether a window matches the store's metadata for its session."""
+        if window is None or meta is None:
+            return False
+        return window.message_count == meta.get("message_count") and window.last_updated == meta.get("last_updated")
+
+    def record(self, session_id: str, message: Dict[str, Any]) -> None:
+        """Append a message that was just added to the store.
+
+        Args:
+            session_id: The session identifier
+            message: The stored message record
+        """
+        meta = self.memory_store.get_session_meta(session_id)
+        with self._lock:
+            window = self.windows.get(session_id)
+            if window is None or meta is None or window.message_count != meta.get("message_count", 0) - 1:
+                # Something else changed the session in between; reseed on next use
+                self.windows.pop(session_id, None)
+                return
+            window.append(message)
+            window.last_updated = meta.get("last_updated")
+
+    def invalidate(self, session_id: str) -> None:
+        """Forget the window for a session.
+
+        Args:
+            session_id: The session identifier
+        """
+        with self._lock:
+            self.windows.pop(session_id, None)
+
+    async def get_turn_context(self, session_id: str) -> Tuple[str, Optional[str]]:
+        """Get the history text and last image for the current turn.
+
+        Args:
+            session_id: The session identifier
+
+        Returns:
+            The bounded history text and the most recent image path, if any
+        """
+        meta = self.memory_store.get_session_meta(session_id)
+        with self._lock:
+            window = self.windows.get(session_id)
+            if self._is_current(window, meta):
+                self.windows.move_to_end(session_id)
+                return window.get_history_text(), window.get_last_image_path()
+
+        window = await self._seed(session_id)
+        return window.get_history_text(), window.get_last_image_path()
+
+    async def _seed(self, session_id: str) -> SessionWindow:
+        """Rebuild a session window from one snapshot of the store.
+
+        Args:
+            session_id: The session identifier
+
+        Returns:
+            The rebuilt window
+        """
+        lookback = max(self.max_messages, IMAGE_LOOKBACK_MESSAGES)
+        messages, meta = await self.memory_store.aget_snapshot(session_id, limit=lookback)
+
+        window = SessionWindow(self.max_messages)
+        # Positions are relative to the whole session, not just the snapshot
+        window.message_count = meta.get("message_count", len(messages)) - len(messages)
+        for message in messages:
+            window.append(message)
+        window.last_updated = meta.get("last_updated")
+
+        with self._lock:
+            self.windows[session_id] = window
+            self.windows.move_to_end(session_id)
+            while len(self.windows) > self.max_sessions:
+                self.windows.popitem(last=False)
+        return window
+
+# Create a singleton instance
+_turn_context_builder = None
+
+def get_turn_context_builder() -> TurnContextBuilder:
+    """Get the global turn context builder instance."""
+    global _turn_context_builder
+    if _turn_context_builder is None:
+        _turn_context_builder = TurnContextBuilder()
+    return _turn_context_builder
@@ -3,8 +3,7 @@ import json
 import os
 from typing import Dict, Any
 
-from agents import TenancyFAQAgent
-from agent_manager import AgentManager
+from tenancy_knowledge import get_tenancy_knowledge
 
 def load_initial_knowledge():
     """Load initial knowledge for the tenancy FAQ agent."""
@@ -17,9 +16,8 @@ def load_initial_knowledge():
         tenancy_knowledge_dir = knowledge_dir / "tenancy"
         os.makedirs(tenancy_knowledge_dir, exist_ok=True)
         
-        # Get the tenancy agent from the manager
-        agent_manager = AgentManager()
-        tenancy_agent = agent_manager.tenancy_faq
+        # The knowledge index is shared by every tenancy agent, so no agent needs to be built here
+        tenancy_knowledge = get_tenancy_knowledge()
         
         # Process JSON knowledge
         sample_knowledge_file = tenancy_knowledge_dir / "sample_tenancy_knowledge.json"
@@ -40,7 +38,7 @@ def load_initial_knowledge():
         knowledge_count = 0
         for doc_id, doc in sample_knowledge.items():
             try:
-                tenancy_agent.add_knowledge_text(
+                tenancy_knowledge.add_text(
                     id=doc_id,
                     title=doc["title"],
                     content=doc["content"]
@@ -68,7 +66,7 @@ def load_initial_knowledge():
                 doc_id = txt_file.stem
                 
                 # Add to knowledge base
-                tenancy_agent.add_knowledge_text(
+                tenancy_knowledge.add_text(
                     id=doc_id,
                     title=title,
                     content=content
@@ -80,8 +78,8 @@ def load_initial_knowledge():
         
         # Load the knowledge into the vector database
         try:
-            tenancy_agent.load_knowledge()
-            print(f"Successfully loaded {knowledge_count} knowledge documents for the tenancy FAQ agent")
+            chunk_count = tenancy_knowledge.load()
+            print(f"Successfully loaded {knowledge_count} knowledge documents ({chunk_count} chunks) for the tenancy FAQ agent")
         except Exception as e:
             print(f"Error loading knowledge into vector database: {str(e)}")
         